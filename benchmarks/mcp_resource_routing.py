@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for MCP resource URI routing.
+
+Compares resolving URIs with a linear scan that compiles each template's
+regex per call (how resources used to be matched) against the compiled,
+prefix-indexed ResourceRouter.
+
+Usage:
+    python benchmarks/mcp_resource_routing.py [--resources 10,100,1000] [--lookups 2000]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from python_a2a.mcp.routing import ResourceRouter, URITemplate
+
+
+def linear_match(templates, uri):
+    """Resolve a URI the old way: scan and build a regex per template."""
+    for template in templates:
+        def replace_param(match):
+            return f"(?P<{match.group(1).split(':')[0]}>[^/]+)"
+
+        pattern = "^" + re.sub(r'{([^{}]+)}', replace_param, template) + "$"
+        match = re.match(pattern, uri)
+        if match:
+            return template, match.groupdict()
+    return None
+
+
+def make_templates(count):
+    """Build per-collection templates like db://collection42/{id}/fields/{field}."""
+    templates = []
+    for i in range(count):
+        if i % 2:
+            templates.append(f"db://collection{i}/{{id}}/fields/{{field}}")
+        else:
+            templates.append(f"files://volume{i}/{{name}}")
+    return templates
+
+
+def make_uris(templates, count):
+    """Build URIs that match random templates."""
+    uris = []
+    for _ in range(count):
+        template = random.choice(templates)
+        uris.append(template.replace("{id}", "1234").replace("{field}", "title").replace("{name}", "report.txt"))
+    return uris
+
+
+def timed(func, uris):
+    """Return the mean time per lookup in microseconds."""
+    start = time.perf_counter()
+    for uri in uris:
+        func(uri)
+    return (time.perf_counter() - start) / len(uris) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resources", default="10,100,1000",
+                        help="Comma-separated numbers of registered templates")
+    parser.add_argument("--lookups", type=int, default=2000, help="Lookups per run")
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"{'templates':>10} {'linear us':>12} {'router us':>12} {'speedup':>9}")
+    for count in (int(n) for n in args.resources.split(",")):
+        templates = make_templates(count)
+        uris = make_uris(templates, args.lookups)
+
+        router = ResourceRouter()
+        for template in templates:
+            router.add(template, template, URITemplate(template))
+
+        # Both must agree before timing
+        for uri in uris[:50]:
+            assert router.resolve(uri)[0] == linear_match(templates, uri)[0]
+
+        linear = timed(lambda uri: linear_match(templates, uri), uris)
+        routed = timed(router.resolve, uris)
+        print(f"{count:>10} {linear:>12.2f} {routed:>12.2f} {linear / routed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
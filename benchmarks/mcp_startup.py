@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for MCP servers.
+
+Measures time-to-first-tool-call for several stdio servers: from an empty
+MCPServerManager until every server has answered one tools/call. Servers
+are started one after another (how start_all used to work) and then
+concurrently. Each stub server sleeps before reading stdin to stand in for
+the start-up cost of an npx or docker server.
+
+Usage:
+    python benchmarks/mcp_startup.py [--servers 1,4,8] [--startup 0.3]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from python_a2a.mcp.server_config import MCPServerManager, ServerConfig
+
+STUB_SERVER = r'''
+import json, sys, time
+
+time.sleep(float(sys.argv[1]))
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    if message["method"] == "initialize":
+        result = {"protocolVersion": "2025-03-26", "serverInfo": {"name": "stub", "version": "1"}, "capabilities": {}}
+    else:
+        result = {"content": [{"type": "text", "text": "ok"}]}
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\n")
+    sys.stdout.flush()
+'''
+
+
+def make_manager(count, startup):
+    """Build a manager with count stub servers."""
+    manager = MCPServerManager()
+    for i in range(count):
+        manager.add_server(f"stub{i}", ServerConfig(
+            command=sys.executable, args=["-c", STUB_SERVER, str(startup)]))
+    return manager
+
+
+async def sequential(manager):
+    """Start each server and make its first call before the next one."""
+    for name in manager.list_configured():
+        client = await manager.start_server(name)
+        await client.call_tool("ping", {})
+
+
+async def concurrent(manager):
+    """Start all servers at once, then make the first calls at once."""
+    clients = await manager.start_all()
+    await asyncio.gather(*(client.call_tool("ping", {}) for client in clients.values()))
+
+
+async def time_to_first_call(strategy, count, startup):
+    """Return seconds until every server has answered one call."""
+    manager = make_manager(count, startup)
+    start = time.perf_counter()
+    try:
+        await strategy(manager)
+        return time.perf_counter() - start
+    finally:
+        await manager.stop_all()
+
+
+async def run(args):
+    print(f"{'servers':>8} {'sequential s':>13} {'concurrent s':>13} {'speedup':>9}")
+    for count in (int(n) for n in args.servers.split(",")):
+        old = await time_to_first_call(sequential, count, args.startup)
+        new = await time_to_first_call(concurrent, count, args.startup)
+        print(f"{count:>8} {old:>13.3f} {new:>13.3f} {old / new:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", default="1,4,8",
+                        help="Comma-separated numbers of servers")
+    parser.add_argument("--startup", type=float, default=0.3,
+                        help="Simulated server start-up time in seconds")
+    args = parser.parse_args()
+    logging.getLogger("python_a2a").setLevel(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for MCP stdio message framing.
+
+Compares splitting a stream of large newline-delimited messages the way
+the stdio transport used to (append each chunk to a bytes buffer, rescan it
+from the start, reslice after every message and parse each message to
+validate it) against the bytearray-based LineFramer, which copies each
+message out once and leaves parsing to the connection.
+
+Usage:
+    python benchmarks/mcp_stdio_framing.py [--sizes 1,10,50] [--messages 3] [--chunk 65536]
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+
+from python_a2a.mcp.framing import LineFramer
+
+
+def make_message(size_mb):
+    """Build a JSON-RPC response carrying a base64 "screenshot" of about size_mb."""
+    data = base64.b64encode(os.urandom(int(size_mb * 1024 * 1024 * 3 / 4))).decode()
+    result = {"content": [{"type": "image", "data": data, "mimeType": "image/png"}]}
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode() + b"\n"
+
+
+def chunks(stream, chunk_size):
+    """Split a byte stream into reads of chunk_size."""
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def bytes_buffer_frames(reads):
+    """Frame messages the old way: bytes concatenation and validate-by-parse."""
+    messages = []
+    buffer = b''
+    for chunk in reads:
+        buffer += chunk
+        while True:
+            newline_pos = buffer.find(b'\n')
+            if newline_pos == -1:
+                break
+            message_bytes = buffer[:newline_pos].rstrip(b'\r')
+            buffer = buffer[newline_pos + 1:]
+            if message_bytes:
+                json.loads(message_bytes.decode('utf-8'))
+                messages.append(message_bytes)
+    return messages
+
+
+def framer_frames(reads):
+    """Frame messages with LineFramer."""
+    framer = LineFramer(max_message_size=256 * 1024 * 1024)
+    messages = []
+    for chunk in reads:
+        messages.extend(framer.feed(chunk))
+    return messages
+
+
+def throughput(func, reads, total_bytes):
+    """Return framing throughput in MB/s."""
+    start = time.perf_counter()
+    func(reads)
+    return total_bytes / (1024 * 1024) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1,10,50",
+                        help="Comma-separated message sizes in MB")
+    parser.add_argument("--messages", type=int, default=3, help="Messages per stream")
+    parser.add_argument("--chunk", type=int, default=65536, help="Bytes per read")
+    args = parser.parse_args()
+
+    print(f"{'size MB':>8} {'bytes MB/s':>12} {'framer MB/s':>12} {'speedup':>9}")
+    for size in (float(n) for n in args.sizes.split(",")):
+        stream = make_message(size) * args.messages
+        reads = chunks(stream, args.chunk)
+
+        # Both must agree before timing
+        assert bytes_buffer_frames(reads) == framer_frames(reads)
+
+        old = throughput(bytes_buffer_frames, reads, len(stream))
+        new = throughput(framer_frames, reads, len(stream))
+        print(f"{size:>8g} {old:>12.1f} {new:>12.1f} {new / old:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
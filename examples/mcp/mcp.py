@@ -282,8 +282,7 @@ class MCPExample:
             
             # Keep server running
             logger.info("MCP server is now running and ready for requests...")
-            while connection.is_initialized:
-                await asyncio.sleep(0.1)  # Shorter sleep for more responsive server
+            await connection.wait_closed()
                 
             logger.warning("Server loop exited - connection no longer initialized")
                 
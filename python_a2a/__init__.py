@@ -6,10 +6,12 @@ A Python library for implementing Google's Agent-to-Agent (A2A) protocol.
 
 __version__ = "0.5.9"
 
-# Setup feature flags
-import sys
+# Public names are loaded on first access (PEP 562), so importing the package
+# or a model does not pull in Flask, FastAPI, LLM SDKs or agent_flow until
+# something that needs them is used.
+import importlib
 import importlib.util
-import warnings
+from typing import Any, Dict, List, Optional, Tuple
 
 # Import basic exceptions first as they're used everywhere
 from .exceptions import (
@@ -24,165 +26,148 @@ from .exceptions import (
     A2AStreamingError,
 )
 
-# All core models - these should be available with basic install
-from .models.base import BaseModel
-from .models.message import Message, MessageRole
-from .models.conversation import Conversation
-from .models.content import (
-    ContentType,
-    TextContent,
-    FunctionParameter,
-    FunctionCallContent,
-    FunctionResponseContent,
-    ErrorContent,
-    Metadata,
-)
-from .models.agent import AgentCard, AgentSkill
-from .models.task import Task, TaskStatus, TaskState
-
-# Core client functionality
-from .client.base import BaseA2AClient
-from .client.http import A2AClient
-from .client.network import AgentNetwork
-from .client.router import AIAgentRouter
-from .client.streaming import StreamingClient
-
-# Core server functionality
-from .server.base import BaseA2AServer
-from .server.a2a_server import A2AServer
-from .server.http import run_server
-
-# Agent discovery functionality
-from .discovery import (
-    AgentRegistry,
-    run_registry,
-    DiscoveryClient,
-    enable_discovery,
-    RegistryAgent,
-)
-
-# Utility functions
-from .utils.formatting import (
-    format_message_as_text,
-    format_conversation_as_text,
-    pretty_print_message,
-    pretty_print_conversation,
-)
-from .utils.validation import (
-    validate_message,
-    validate_conversation,
-    is_valid_message,
-    is_valid_conversation,
-)
-from .utils.conversion import (
-    create_text_message,
-    create_function_call,
-    create_function_response,
-    create_error_message,
-    format_function_params,
-    conversation_to_messages,
-)
-from .utils.decorators import skill, agent
+# Public name -> (module, attribute); an attribute of None is the module itself
+_LAZY_IMPORTS: Dict[str, Tuple[str, Optional[str]]] = {
+    # All core models - these should be available with basic install
+    "BaseModel": (".models.base", "BaseModel"),
+    "Message": (".models.message", "Message"),
+    "MessageRole": (".models.message", "MessageRole"),
+    "Conversation": (".models.conversation", "Conversation"),
+    "ContentType": (".models.content", "ContentType"),
+    "TextContent": (".models.content", "TextContent"),
+    "FunctionParameter": (".models.content", "FunctionParameter"),
+    "FunctionCallContent": (".models.content", "FunctionCallContent"),
+    "FunctionResponseContent": (".models.content", "FunctionResponseContent"),
+    "ErrorContent": (".models.content", "ErrorContent"),
+    "Metadata": (".models.content", "Metadata"),
+    "AgentCard": (".models.agent", "AgentCard"),
+    "AgentSkill": (".models.agent", "AgentSkill"),
+    "Task": (".models.task", "Task"),
+    "TaskStatus": (".models.task", "TaskStatus"),
+    "TaskState": (".models.task", "TaskState"),
+    # Core client functionality
+    "BaseA2AClient": (".client.base", "BaseA2AClient"),
+    "A2AClient": (".client.http", "A2AClient"),
+    "AgentNetwork": (".client.network", "AgentNetwork"),
+    "AIAgentRouter": (".client.router", "AIAgentRouter"),
+    "StreamingClient": (".client.streaming", "StreamingClient"),
+    # Core server functionality
+    "BaseA2AServer": (".server.base", "BaseA2AServer"),
+    "A2AServer": (".server.a2a_server", "A2AServer"),
+    "run_server": (".server.http", "run_server"),
+    # Agent discovery functionality
+    "AgentRegistry": (".discovery", "AgentRegistry"),
+    "run_registry": (".discovery", "run_registry"),
+    "DiscoveryClient": (".discovery", "DiscoveryClient"),
+    "enable_discovery": (".discovery", "enable_discovery"),
+    "RegistryAgent": (".discovery", "RegistryAgent"),
+    # Utility functions
+    "format_message_as_text": (".utils.formatting", "format_message_as_text"),
+    "format_conversation_as_text": (".utils.formatting", "format_conversation_as_text"),
+    "pretty_print_message": (".utils.formatting", "pretty_print_message"),
+    "pretty_print_conversation": (".utils.formatting", "pretty_print_conversation"),
+    "validate_message": (".utils.validation", "validate_message"),
+    "validate_conversation": (".utils.validation", "validate_conversation"),
+    "is_valid_message": (".utils.validation", "is_valid_message"),
+    "is_valid_conversation": (".utils.validation", "is_valid_conversation"),
+    "create_text_message": (".utils.conversion", "create_text_message"),
+    "create_function_call": (".utils.conversion", "create_function_call"),
+    "create_function_response": (".utils.conversion", "create_function_response"),
+    "create_error_message": (".utils.conversion", "create_error_message"),
+    "format_function_params": (".utils.conversion", "format_function_params"),
+    "conversation_to_messages": (".utils.conversion", "conversation_to_messages"),
+    "skill": (".utils.decorators", "skill"),
+    "agent": (".utils.decorators", "agent"),
+    # Workflow components
+    "Flow": (".workflow", "Flow"),
+    "WorkflowContext": (".workflow", "WorkflowContext"),
+    "WorkflowStep": (".workflow", "WorkflowStep"),
+    "QueryStep": (".workflow", "QueryStep"),
+    "MapStep": (".workflow", "MapStep"),
+    "AutoRouteStep": (".workflow", "AutoRouteStep"),
+    "FunctionStep": (".workflow", "FunctionStep"),
+    "ConditionalBranch": (".workflow", "ConditionalBranch"),
+    "ConditionStep": (".workflow", "ConditionStep"),
+    "ParallelStep": (".workflow", "ParallelStep"),
+    "ParallelBuilder": (".workflow", "ParallelBuilder"),
+    "StepType": (".workflow", "StepType"),
+    "QueryTemplate": (".workflow", "QueryTemplate"),
+    # MCP integration
+    "MCPClient": (".mcp.client", "MCPClient"),
+    "MCPError": (".mcp.client", "MCPError"),
+    "MCPConnectionError": (".mcp.client", "MCPConnectionError"),
+    "MCPTimeoutError": (".mcp.client", "MCPTimeoutError"),
+    "MCPToolError": (".mcp.client", "MCPToolError"),
+    "MCPEnabledAgent": (".mcp.agent", "MCPEnabledAgent"),
+    "FastMCP": (".mcp.fastmcp", "FastMCP"),
+    "MCPResponse": (".mcp.fastmcp", "MCPResponse"),
+    "text_response": (".mcp.fastmcp", "text_response"),
+    "error_response": (".mcp.fastmcp", "error_response"),
+    "image_response": (".mcp.fastmcp", "image_response"),
+    "multi_content_response": (".mcp.fastmcp", "multi_content_response"),
+    "MCPContentType": (".mcp.fastmcp", "ContentType"),
+    "FastMCPAgent": (".mcp.integration", "FastMCPAgent"),
+    "A2AMCPAgent": (".mcp.integration", "A2AMCPAgent"),
+    "create_proxy_server": (".mcp.proxy", "create_proxy_server"),
+    "create_fastapi_app": (".mcp.transport", "create_fastapi_app"),
+    # LangChain integration - the interface is available regardless of LangChain
+    "to_a2a_server": (".langchain", "to_a2a_server"),
+    "to_langchain_agent": (".langchain", "to_langchain_agent"),
+    "to_mcp_server": (".langchain", "to_mcp_server"),
+    "to_langchain_tool": (".langchain", "to_langchain_tool"),
+    "LangChainIntegrationError": (".langchain.exceptions", "LangChainIntegrationError"),
+    "LangChainNotInstalledError": (".langchain.exceptions", "LangChainNotInstalledError"),
+    "LangChainToolConversionError": (".langchain.exceptions", "LangChainToolConversionError"),
+    "MCPToolConversionError": (".langchain.exceptions", "MCPToolConversionError"),
+    "LangChainAgentConversionError": (".langchain.exceptions", "LangChainAgentConversionError"),
+    "A2AAgentConversionError": (".langchain.exceptions", "A2AAgentConversionError"),
+}
 
-# Workflow components
-from .workflow import (
-    Flow,
-    WorkflowContext,
-    WorkflowStep,
-    QueryStep,
-    AutoRouteStep,
-    FunctionStep,
-    ConditionalBranch,
-    ConditionStep,
-    ParallelStep,
-    ParallelBuilder,
-    StepType,
-)
+# Optional integrations, by the feature flag that reports whether their
+# dependencies are installed. A flag is resolved by importing its modules.
+_OPTIONAL_IMPORTS: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {
+    # Integration with LLM providers
+    "HAS_LLM_CLIENTS": {
+        "OpenAIA2AClient": (".client.llm", "OpenAIA2AClient"),
+        "OllamaA2AClient": (".client.llm", "OllamaA2AClient"),
+        "AnthropicA2AClient": (".client.llm", "AnthropicA2AClient"),
+    },
+    "HAS_LLM_SERVERS": {
+        "OpenAIA2AServer": (".server.llm", "OpenAIA2AServer"),
+        "OllamaA2AServer": (".server.llm", "OllamaA2AServer"),
+        "AnthropicA2AServer": (".server.llm", "AnthropicA2AServer"),
+        "BedrockA2AServer": (".server.llm", "BedrockA2AServer"),
+    },
+    # Doc generation
+    "HAS_DOCS": {
+        "generate_a2a_docs": (".docs", "generate_a2a_docs"),
+        "generate_html_docs": (".docs", "generate_html_docs"),
+    },
+    # CLI
+    "HAS_CLI": {
+        "cli_main": (".cli", "main"),
+    },
+    # Agent Flow - optional but integrated by default
+    "HAS_AGENT_FLOW_IMPORT": {
+        "engine": (".agent_flow.engine", None),
+        "storage": (".agent_flow.storage", None),
+    },
+}
 
-# MCP integration
-from .mcp.client import (
-    MCPClient,
-    MCPError,
-    MCPConnectionError,
-    MCPTimeoutError,
-    MCPToolError,
-)
-from .mcp.agent import MCPEnabledAgent
-from .mcp.fastmcp import (
-    FastMCP,
-    MCPResponse,
-    text_response,
-    error_response,
-    image_response,
-    multi_content_response,
-    ContentType as MCPContentType,
-)
-from .mcp.integration import FastMCPAgent, A2AMCPAgent
-from .mcp.proxy import create_proxy_server
-from .mcp.transport import create_fastapi_app
+# Modules each optional flag needs, beyond those of its names
+_OPTIONAL_MODULES: Dict[str, Tuple[str, ...]] = {
+    "HAS_AGENT_FLOW_IMPORT": (".agent_flow.models", ".agent_flow.server"),
+}
 
-# LangChain integration - Always import the core functions regardless of LangChain availability
-from .langchain import (
-    to_a2a_server,
-    to_langchain_agent,
-    to_mcp_server,
-    to_langchain_tool,
-)
-from .langchain.exceptions import (
-    LangChainIntegrationError,
-    LangChainNotInstalledError,
-    LangChainToolConversionError,
-    MCPToolConversionError,
-    LangChainAgentConversionError,
-    A2AAgentConversionError,
-)
+_OPTIONAL_NAMES: Dict[str, str] = {
+    name: flag for flag, names in _OPTIONAL_IMPORTS.items() for name in names
+}
 
 HAS_LANGCHAIN = (
     importlib.util.find_spec("langchain") is not None
     or importlib.util.find_spec("langchain_core") is not None
 )
 
-# Optional integration with LLM providers
-# These might not be available if the specific provider packages are not installed
-try:
-    from .client.llm import OpenAIA2AClient, OllamaA2AClient, AnthropicA2AClient
-    from .server.llm import (
-        OpenAIA2AServer,
-        OllamaA2AServer,
-        AnthropicA2AServer,
-        BedrockA2AServer,
-    )
-
-    HAS_LLM_CLIENTS = True
-    HAS_LLM_SERVERS = True
-except ImportError:
-    HAS_LLM_CLIENTS = False
-    HAS_LLM_SERVERS = False
-
-# Optional doc generation
-try:
-    from .docs import generate_a2a_docs, generate_html_docs
-
-    HAS_DOCS = True
-except ImportError:
-    HAS_DOCS = False
-
-# Optional CLI
-try:
-    from .cli import main as cli_main
-
-    HAS_CLI = True
-except ImportError:
-    HAS_CLI = False
-
-# Agent Flow import - optional but integrated by default
-try:
-    from .agent_flow import models, engine, server, storage
-
-    HAS_AGENT_FLOW_IMPORT = True
-except ImportError:
-    HAS_AGENT_FLOW_IMPORT = False
-
 # Set feature flags (all core features should be True)
 HAS_MODELS = True
 HAS_ADVANCED_MODELS = True
@@ -199,8 +184,7 @@ HAS_DISCOVERY = True  # Agent discovery
 HAS_LANGCHAIN_INTEGRATION = True  # Always True since we provide the interface
 HAS_AGENT_FLOW = True  # Agent Flow UI and workflow editor
 
-# Define __all__ for explicit exports
-__all__ = [
+_CORE_ALL = [
     # Version
     "__version__",
     # Exceptions
@@ -268,6 +252,7 @@ __all__ = [
     "WorkflowContext",
     "WorkflowStep",
     "QueryStep",
+    "MapStep",
     "AutoRouteStep",
     "FunctionStep",
     "ConditionalBranch",
@@ -275,6 +260,7 @@ __all__ = [
     "ParallelStep",
     "ParallelBuilder",
     "StepType",
+    "QueryTemplate",
     # MCP
     "MCPClient",
     "MCPError",
@@ -306,18 +292,51 @@ __all__ = [
     "A2AAgentConversionError",
 ]
 
-# Conditionally add LLM clients/servers
-if HAS_LLM_CLIENTS:
-    __all__.extend(["OpenAIA2AClient", "OllamaA2AClient", "AnthropicA2AClient"])
-if HAS_LLM_SERVERS:
-    __all__.extend(
-        ["OpenAIA2AServer", "OllamaA2AServer", "AnthropicA2AServer", "BedrockA2AServer"]
-    )
 
-# Conditionally add docs
-if HAS_DOCS:
-    __all__.extend(["generate_a2a_docs", "generate_html_docs"])
+def _load(module_name: str, attribute: Optional[str]) -> Any:
+    """Import a submodule and get one of its attributes."""
+    module = importlib.import_module(module_name, __name__)
+    return module if attribute is None else getattr(module, attribute)
+
+
+def _feature_available(flag: str) -> bool:
+    """Resolve an optional feature flag by importing its modules."""
+    modules = {module for module, _ in _OPTIONAL_IMPORTS[flag].values()}
+    modules.update(_OPTIONAL_MODULES.get(flag, ()))
+    try:
+        for module_name in sorted(modules):
+            importlib.import_module(module_name, __name__)
+    except ImportError:
+        return False
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    """Load public names on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = _load(*_LAZY_IMPORTS[name])
+    elif name in _OPTIONAL_IMPORTS:
+        value = _feature_available(name)
+    elif name in _OPTIONAL_NAMES:
+        if not __getattr__(_OPTIONAL_NAMES[name]):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = _load(*_OPTIONAL_IMPORTS[_OPTIONAL_NAMES[name]][name])
+    elif name == "__all__":
+        # Depends on which optional integrations are installed
+        value = list(_CORE_ALL)
+        for flag, names in _OPTIONAL_IMPORTS.items():
+            # agent_flow subpackages are reachable but not star-exported
+            if flag != "HAS_AGENT_FLOW_IMPORT" and __getattr__(flag):
+                value.extend(names)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Later lookups find the value without calling back here
+    globals()[name] = value
+    return value
+
 
-# Conditionally add CLI
-if HAS_CLI:
-    __all__.append("cli_main")
+def __dir__() -> List[str]:
+    """List loaded and lazily loaded public names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_OPTIONAL_IMPORTS)
+                  | set(_OPTIONAL_NAMES) | {"__all__"})
@@ -9,6 +9,7 @@ import os
 import sys
 import json
 import argparse
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple, Union
@@ -138,8 +139,9 @@ class AgentFlowCLI:
         )
         agent_discover_parser.add_argument(
             "--base-url", "-b",
-            default="http://localhost",
-            help="Base URL for discovery"
+            nargs="+",
+            default=["http://localhost"],
+            help="Base URLs, hosts or CIDR ranges to scan"
         )
         agent_discover_parser.add_argument(
             "--port-min", "-p",
@@ -346,23 +348,29 @@ class AgentFlowCLI:
         port_range = (args.port_min, args.port_max)
         print(f"Discovering agents on ports {port_range[0]}-{port_range[1]}...")
         
-        agents = self.agent_registry.discover_agents(args.base_url, port_range)
+        async def discover():
+            # Print agents as they are found rather than after the scan
+            count = 0
+            async for agent in self.agent_registry.discover_agents_async(args.base_url, port_range):
+                count += 1
+                print(f"{count}. {agent.name} ({agent.id})")
+                print(f"   URL: {agent.url}")
+                if agent.description:
+                    print(f"   Description: {agent.description}")
+                
+                if agent.skills:
+                    print(f"   Skills: {len(agent.skills)}")
+                
+                print()
+            return count
         
-        if not agents:
+        count = asyncio.run(discover())
+        
+        if not count:
             print("No agents discovered.")
             return
         
-        print(f"Discovered {len(agents)} agents:")
-        for i, agent in enumerate(agents, 1):
-            print(f"{i}. {agent.name} ({agent.id})")
-            print(f"   URL: {agent.url}")
-            if agent.description:
-                print(f"   Description: {agent.description}")
-            
-            if agent.skills:
-                print(f"   Skills: {len(agent.skills)}")
-            
-            print()
+        print(f"Discovered {count} agents.")
     
     # Tool commands
     
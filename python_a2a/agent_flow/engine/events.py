@@ -0,0 +1,120 @@
+"""
+Progress events of workflow executions.
+
+A ``WorkflowExecution`` records node lifecycle changes (queued, running,
+completed, failed, skipped) and its own terminal state in an
+``ExecutionEventBuffer``. Every event gets a sequence number, so a client
+that streams them, for example over Server-Sent Events, receives only what
+changed and can resume after a reconnect from the last sequence it saw
+instead of polling the full execution status.
+"""
+
+import itertools
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+# Event types
+NODE_EVENT = "node"
+EXECUTION_EVENT = "execution"
+
+
+class ExecutionEventBuffer:
+    """
+    Bounded, thread-safe buffer of one execution's events.
+
+    The execution thread emits events while any number of readers wait
+    for the ones after the sequence they last saw. Only the most recent
+    ``max_events`` are kept; a reader that fell further behind can tell
+    from ``first_seq`` and should fetch the full status instead.
+    """
+
+    def __init__(self, max_events: int = 1000):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_events: Maximum number of events kept
+        """
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest event, 0 if there is none."""
+        return self._seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest event kept."""
+        with self._cond:
+            return self._events[0]["seq"] if self._events else self._seq + 1
+
+    @property
+    def closed(self) -> bool:
+        """Whether the execution has finished and no events will follow."""
+        return self._closed
+
+    def emit(self, event_type: str, **data: Any) -> Dict[str, Any]:
+        """
+        Record an event and wake waiting readers.
+
+        Args:
+            event_type: NODE_EVENT or EXECUTION_EVENT
+            **data: Event fields
+
+        Returns:
+            The event, with its ``seq``, ``type`` and ``time``
+        """
+        with self._cond:
+            self._seq += 1
+            event = {"seq": self._seq, "type": event_type, "time": datetime.now().isoformat()}
+            event.update(data)
+            self._events.append(event)
+            self._cond.notify_all()
+        return event
+
+    def close(self) -> None:
+        """Mark the execution finished and release waiting readers."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def since(self, after: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get the kept events after a sequence number.
+
+        Args:
+            after: Sequence number the reader last saw, 0 for all events
+
+        Returns:
+            Events in sequence order
+        """
+        with self._cond:
+            return self._since(after)
+
+    def wait(self, after: int = 0, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait for events after a sequence number.
+
+        Args:
+            after: Sequence number the reader last saw
+            timeout: Seconds to wait, None to wait until an event arrives
+
+        Returns:
+            The new events; empty if the timeout expired or the buffer was
+            closed with nothing newer
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > after or self._closed, timeout)
+            return self._since(after)
+
+    def _since(self, after: int) -> List[Dict[str, Any]]:
+        """Slice the events after a sequence number; the lock must be held."""
+        if not self._events or after >= self._seq:
+            return []
+        start = max(0, after - self._events[0]["seq"] + 1)
+        return list(itertools.islice(self._events, start, None))
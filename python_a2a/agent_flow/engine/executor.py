@@ -18,6 +18,8 @@ from ..models.workflow import (
 )
 from ..models.agent import AgentRegistry, AgentDefinition, AgentStatus
 from ..models.tool import ToolRegistry, ToolDefinition, ToolStatus
+from ..utils.health import STATUS_MAX_AGE
+from .events import EXECUTION_EVENT, NODE_EVENT, ExecutionEventBuffer
 
 
 # Configure logging
@@ -178,7 +180,9 @@ class WorkflowExecution:
     Execution state for a complete workflow.
     
     This manages the execution of a workflow, tracking the state of all nodes,
-    handling message flow, and maintaining execution history.
+    handling message flow, and maintaining execution history. Node lifecycle
+    changes and the final state are recorded in ``events`` for clients that
+    follow progress without polling the full status.
     """
     
     def __init__(
@@ -231,6 +235,9 @@ class WorkflowExecution:
         
         # Execution results
         self.results: Dict[str, Any] = {}
+        
+        # Progress events for streaming clients
+        self.events = ExecutionEventBuffer()
     
     def start(self, input_data: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -263,10 +270,15 @@ class WorkflowExecution:
         if not start_nodes:
             self.status = ExecutionStatus.FAILED
             self.error_message = "Workflow has no start nodes"
+            self._emit_finished()
             return False
         
+        self.events.emit(EXECUTION_EVENT, status=self.status.name)
+        
         # Add start nodes to execution queue
-        self.execution_queue = [node.id for node in start_nodes]
+        self.execution_queue = []
+        for node in start_nodes:
+            self._enqueue(node.id)
         
         # If we have input data, create input messages for start nodes
         if self.input_data:
@@ -307,6 +319,8 @@ class WorkflowExecution:
                         node_execution = self.node_executions[node_id]
                         if node_execution.output_value:
                             self.results[node.name] = node_execution.output_value.content
+                
+                self._emit_finished()
             
             return False
         
@@ -338,6 +352,7 @@ class WorkflowExecution:
         # Start node execution
         node_execution.status = NodeExecutionStatus.RUNNING
         node_execution.start_time = datetime.now()
+        self._emit_node(node, node_execution)
         
         try:
             # Execute the node based on its type
@@ -347,6 +362,7 @@ class WorkflowExecution:
             node_execution.status = NodeExecutionStatus.COMPLETED
             node_execution.end_time = datetime.now()
             self.completed_nodes.add(node_id)
+            self._emit_node(node, node_execution)
             
             # Queue downstream nodes
             for edge in node.outgoing_edges:
@@ -399,14 +415,14 @@ class WorkflowExecution:
                             target_node_id not in self.completed_nodes):
 
                             # Append to execution queue if not already queued
-                            self.execution_queue.append(target_node_id)
+                            self._enqueue(target_node_id)
                             logger.info(f"🔄 Adding output node {target_node.name} to execution queue")
 
                 # For non-output nodes, we use standard processing
                 elif target_node_id not in self.completed_nodes:
                     # Add node to execution queue if not already there
                     if target_node_id not in self.execution_queue:
-                        self.execution_queue.append(target_node_id)
+                        self._enqueue(target_node_id)
                         logger.info(f"Adding node {target_node.name} to execution queue")
 
                     # Create a deep copy of the output value to prevent shared references
@@ -436,6 +452,7 @@ class WorkflowExecution:
             node_execution.status = NodeExecutionStatus.FAILED
             node_execution.end_time = datetime.now()
             node_execution.error_message = str(e)
+            self._emit_node(node, node_execution)
             
             logger.error(f"Failed to execute node {node.name} ({node_id}): {e}")
             
@@ -448,7 +465,7 @@ class WorkflowExecution:
                     
                     # Add error node to execution queue
                     if target_node_id not in self.execution_queue and target_node_id not in self.completed_nodes:
-                        self.execution_queue.append(target_node_id)
+                        self._enqueue(target_node_id)
                     
                     # Pass error message as input
                     error_message = MessageValue(
@@ -466,6 +483,7 @@ class WorkflowExecution:
                 self.status = ExecutionStatus.FAILED
                 self.error_message = f"Node {node.name} failed: {e}"
                 self.end_time = datetime.now()
+                self._emit_finished()
                 return False
             
             return True
@@ -613,6 +631,7 @@ class WorkflowExecution:
             self.status = ExecutionStatus.FAILED
             self.error_message = "Exceeded maximum execution steps"
             self.end_time = datetime.now()
+            self._emit_finished()
             logger.error(f"❌ Workflow execution failed: exceeded maximum steps ({max_steps})")
         elif self.status == ExecutionStatus.COMPLETED:
             logger.info(f"✨ Workflow execution completed successfully in {steps} steps")
@@ -633,6 +652,9 @@ class WorkflowExecution:
             logger.warning("No results were produced by any output nodes")
 
         logger.info(f"Workflow execution completed with status {self.status.name}")
+        # Nothing runs after this; release streaming clients even when the
+        # queue ran dry without every node completing
+        self._emit_finished()
         return self.results
     
     def cancel(self) -> None:
@@ -640,8 +662,60 @@ class WorkflowExecution:
         if self.status == ExecutionStatus.RUNNING:
             self.status = ExecutionStatus.CANCELED
             self.end_time = datetime.now()
+            self._emit_finished()
             logger.info(f"Workflow execution {self.id} canceled")
     
+    def _enqueue(self, node_id: str) -> None:
+        """Append a node to the execution queue and report it queued."""
+        self.execution_queue.append(node_id)
+        node = self.workflow.nodes.get(node_id)
+        if node:
+            self._emit_node(node, status='QUEUED')
+    
+    def _emit_node(
+        self,
+        node: WorkflowNode,
+        execution: Optional[NodeExecution] = None,
+        status: Optional[str] = None
+    ) -> None:
+        """
+        Record a node lifecycle event.
+        
+        Args:
+            node: The node
+            execution: Its execution state, for the status, timing and error
+            status: Status to report when there is no execution state
+        """
+        event = {
+            "node_id": node.id,
+            "ui_node_id": node.config.get('ui_node_id', node.id),
+            "name": node.name,
+            "node_type": node.node_type.name,
+            "status": status or execution.status.name
+        }
+        if execution is not None:
+            if execution.start_time:
+                event["start_time"] = execution.start_time.isoformat()
+            if execution.end_time:
+                event["end_time"] = execution.end_time.isoformat()
+                event["duration_ms"] = round(
+                    (execution.end_time - execution.start_time).total_seconds() * 1000, 3)
+            if execution.error_message and execution.status == NodeExecutionStatus.FAILED:
+                event["error"] = execution.error_message
+        self.events.emit(NODE_EVENT, **event)
+    
+    def _emit_finished(self) -> None:
+        """Record the final execution state and close the event buffer."""
+        if self.events.closed:
+            return
+        self.events.emit(
+            EXECUTION_EVENT,
+            status=self.status.name,
+            error=self.error_message,
+            end_time=self.end_time.isoformat() if self.end_time else None
+        )
+        self.events.close()
+    
     def _get_required_inputs(self, node: WorkflowNode) -> Set[str]:
         """
         Get the set of required input edge IDs for a node.
@@ -1014,8 +1088,8 @@ class WorkflowExecution:
         if not tool:
             raise ValueError(f"Tool with ID {tool_id} not found in registry")
         
-        # Check tool availability
-        if not tool.check_availability():
+        # Check tool availability, trusting a recently refreshed status
+        if not tool.check_availability(max_age=STATUS_MAX_AGE):
             raise RuntimeError(f"Tool is not available: {tool.error_message}")
         
         # Get the input parameters from node configuration and inputs
@@ -1886,6 +1960,26 @@ class WorkflowExecutor:
             
         return status_data
     
+    def get_execution_events(self, execution_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get the progress events of a workflow execution.
+        
+        Args:
+            execution_id: ID of the execution
+            after: Sequence number of the last event already seen
+            
+        Returns:
+            The kept events after ``after``, in sequence order
+            
+        Raises:
+            ValueError: If execution not found
+        """
+        execution = self.executions.get(execution_id)
+        if not execution:
+            raise ValueError(f"Execution {execution_id} not found")
+        
+        return execution.events.since(after)
+    
     def cancel_execution(self, execution_id: str) -> bool:
         """
         Cancel a workflow execution.
@@ -2,16 +2,22 @@
 Agent models for representing and connecting to A2A agents.
 """
 
+import asyncio
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum, auto
-from typing import Dict, List, Optional, Set, Any, Union, Tuple
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Any, Union, Tuple
 
 from python_a2a import (
     AgentCard, AgentSkill, A2AClient, 
     Message, TextContent, MessageRole
 )
+from python_a2a.client.sessions import get_session_pool
+
+from ..utils.discovery import AgentScanner
+from ..utils.health import DEFAULT_MAX_WORKERS, PeriodicRefresher, probe_all
 
 
 class AgentSource(Enum):
@@ -80,17 +86,23 @@ class AgentDefinition:
         self.agent_card: Optional[AgentCard] = None
         self.client: Optional[A2AClient] = None
         self.error_message: Optional[str] = None
+        # When the status was last probed
+        self.last_checked: Optional[datetime] = None
     
-    def connect(self) -> bool:
+    def connect(self, timeout: float = 30) -> bool:
         """
         Connect to the agent and fetch its capabilities.
         
+        Args:
+            timeout: Request timeout in seconds for each agent card endpoint
+            
         Returns:
             True if connection was successful, False otherwise
         """
+        self.last_checked = datetime.now()
         try:
-            # Initialize client
-            self.client = A2AClient(self.url)
+            # Initialize client; pooled sessions keep repeated checks cheap
+            self.client = A2AClient(self.url, timeout=timeout, session_pool=get_session_pool())
             
             # Fetch agent card
             self.agent_card = self.client.get_agent_card()
@@ -156,7 +168,8 @@ class AgentDefinition:
             "updated_at": self.updated_at.isoformat(),
             "metadata": self.metadata,
             "skills": [skill.to_dict() for skill in self.skills],
-            "status": self.status.name
+            "status": self.status.name,
+            "last_checked": self.last_checked.isoformat() if self.last_checked else None
         }
     
     @classmethod
@@ -223,6 +236,9 @@ class AgentRegistry:
     def __init__(self):
         """Initialize the agent registry."""
         self.agents: Dict[str, AgentDefinition] = {}
+        self._refresher: Optional[PeriodicRefresher] = None
+        # Kept across discovery scans for its cache of ports without agents
+        self.scanner = AgentScanner()
     
     def register(self, agent: AgentDefinition) -> None:
         """
@@ -276,99 +292,147 @@ class AgentRegistry:
         """
         return list(self.agents.values())
     
-    def connect_all(self) -> Tuple[int, int]:
+    def connect_all(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = 5.0,
+        only_disconnected: bool = False
+    ) -> Tuple[int, int]:
         """
-        Connect to all agents in the registry.
+        Connect to all agents in the registry concurrently.
         
+        Args:
+            max_workers: Maximum number of agents connected at once
+            timeout: Request timeout in seconds for each agent
+            only_disconnected: Skip agents that are already connected
+            
         Returns:
             Tuple of (successful, failed) connection counts
         """
-        successful = 0
-        failed = 0
+        agents = [
+            agent for agent in list(self.agents.values())
+            if not (only_disconnected and agent.status == AgentStatus.CONNECTED)
+        ]
+        results = probe_all(agents, lambda agent: agent.connect(timeout), max_workers)
+        successful = sum(results)
+        return successful, len(results) - successful
+    
+    def start_refresh(
+        self,
+        interval: float = 30.0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = 5.0
+    ) -> None:
+        """
+        Reconnect all agents periodically in the background.
         
-        for agent in self.agents.values():
-            if agent.connect():
-                successful += 1
-            else:
-                failed += 1
+        Agent statuses are then read from the cache, refreshed every
+        interval, instead of probing each agent on request.
         
-        return successful, failed
+        Args:
+            interval: Seconds between refreshes
+            max_workers: Maximum number of agents connected at once
+            timeout: Request timeout in seconds for each agent
+        """
+        if self._refresher is not None and self._refresher.running:
+            return
+        self._refresher = PeriodicRefresher(
+            lambda: self.connect_all(max_workers, timeout),
+            interval,
+            name="agent-status-refresh"
+        )
+        self._refresher.start()
+    
+    def stop_refresh(self) -> None:
+        """Stop the background refresh."""
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
     
     def disconnect_all(self) -> None:
         """Disconnect from all agents in the registry."""
         for agent in self.agents.values():
             agent.disconnect()
     
-    def discover_agents(self, base_url: str, port_range: Tuple[int, int]) -> List[AgentDefinition]:
+    def discover_agents(
+        self,
+        base_url: Union[str, Iterable[str]],
+        port_range: Tuple[int, int]
+    ) -> List[AgentDefinition]:
         """
         Discover agents running on local ports.
         
+        When called from a running event loop, the scan runs on its own
+        loop in a worker thread and the caller blocks until it finishes;
+        async code should use discover_agents_async instead.
+        
         Args:
-            base_url: Base URL for discovery (e.g., "http://localhost")
+            base_url: Base URL for discovery (e.g., "http://localhost"), or
+                several base URLs, hosts or CIDR ranges
             port_range: Range of ports to scan (start, end)
             
         Returns:
             List of discovered agent definitions
         """
-        import requests
-        from concurrent.futures import ThreadPoolExecutor
-        
-        discovered: List[AgentDefinition] = []
-        start_port, end_port = port_range
+        async def collect() -> List[AgentDefinition]:
+            return [agent async for agent in self.discover_agents_async(base_url, port_range)]
         
-        def check_port(port: int) -> Optional[AgentDefinition]:
-            """Check a single port for an A2A agent."""
-            url = f"{base_url}:{port}"
-            agent_url = f"{url}/agent.json"
-            
-            try:
-                response = requests.get(agent_url, timeout=0.5)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if isinstance(data, dict) and "name" in data and "description" in data:
-                        # Create agent definition
-                        agent = AgentDefinition(
-                            name=data.get("name", f"Agent on port {port}"),
-                            description=data.get("description", ""),
-                            url=url,
-                            agent_source=AgentSource.REMOTE,
-                            agent_type="a2a"
-                        )
-                        
-                        # Add skills if available
-                        if "skills" in data and isinstance(data["skills"], list):
-                            for skill_data in data["skills"]:
-                                if isinstance(skill_data, dict):
-                                    skill = AgentSkill(
-                                        name=skill_data.get("name", ""),
-                                        description=skill_data.get("description", ""),
-                                        tags=skill_data.get("tags", []),
-                                        examples=skill_data.get("examples", [])
-                                    )
-                                    agent.skills.append(skill)
-                        
-                        return agent
-            except:
-                pass
-            
-            return None
-        
-        # Use ThreadPoolExecutor to scan ports in parallel
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(
-                check_port, 
-                range(start_port, end_port + 1)
-            ))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(collect())
+        # asyncio.run cannot be nested in a running loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, collect()).result()
+    
+    async def discover_agents_async(
+        self,
+        targets: Union[str, Iterable[str]],
+        port_range: Tuple[int, int]
+    ) -> AsyncIterator[AgentDefinition]:
+        """
+        Discover and register agents, yielding each one as it is found.
         
-        # Filter out None results
-        discovered = [agent for agent in results if agent is not None]
+        Ports are scanned by the registry's AgentScanner: a TCP connect
+        check comes first, the concurrency is bounded, and ports without
+        an agent are skipped by later scans for a while.
         
-        # Add discovered agents to registry
-        for agent in discovered:
+        Args:
+            targets: Base URLs, host names, IP addresses or CIDR ranges
+            port_range: Range of ports to scan (start, end)
+            
+        Yields:
+            Discovered agent definitions
+        """
+        async for url, data in self.scanner.scan(targets, port_range):
+            agent = self._agent_from_card(url, data)
             self.register(agent)
+            yield agent
+    
+    @staticmethod
+    def _agent_from_card(url: str, data: Dict[str, Any]) -> AgentDefinition:
+        """Create an agent definition from a discovered agent card."""
+        agent = AgentDefinition(
+            name=data.get("name", f"Agent at {url}"),
+            description=data.get("description", ""),
+            url=url,
+            agent_source=AgentSource.REMOTE,
+            agent_type="a2a"
+        )
+        
+        # Add skills if available
+        if "skills" in data and isinstance(data["skills"], list):
+            for skill_data in data["skills"]:
+                if isinstance(skill_data, dict):
+                    skill = AgentSkill(
+                        name=skill_data.get("name", ""),
+                        description=skill_data.get("description", ""),
+                        tags=skill_data.get("tags", []),
+                        examples=skill_data.get("examples", [])
+                    )
+                    agent.skills.append(skill)
         
-        return discovered
+        return agent
     
     def to_dict(self) -> Dict[str, Any]:
         """
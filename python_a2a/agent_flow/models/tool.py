@@ -2,14 +2,41 @@
 Tool models for representing and connecting to MCP tool servers.
 """
 
+import asyncio
 import json
+import random
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import Dict, List, Optional, Set, Any, Union, Tuple, Callable
 
 import requests
 
+from ...client.sessions import get_session_pool
+from ...mcp.validation import compile_schema
+from ..utils.health import DEFAULT_MAX_WORKERS, PeriodicRefresher, probe_all
+
+
+# Defaults for calls to remote tool servers; override per tool in its config
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_RETRIES = 2
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 2.0
+
+# Server responses worth retrying for idempotent tools
+RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+
+class _RetryableError(Exception):
+    """A remote tool call failed in a way that may succeed if repeated."""
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter before retry number attempt."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
 
 class ToolSource(Enum):
     """Source types for tools."""
@@ -72,6 +99,15 @@ class ToolParameter:
         
         return result
     
+    def to_schema(self) -> Dict[str, Any]:
+        """Convert to a JSON schema for the parameter's value."""
+        schema: Dict[str, Any] = {"type": self.type_name}
+        if self.default is not None:
+            schema["default"] = self.default
+        if self.enum_values:
+            schema["enum"] = self.enum_values
+        return schema
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ToolParameter':
         """Create from dictionary representation."""
@@ -116,7 +152,10 @@ class ToolDefinition:
             url: Base URL where the tool server is accessible
             tool_path: Path to access this specific tool (e.g., "tools/calculator")
             tool_source: Source type of the tool
-            config: Configuration parameters for the tool
+            config: Configuration parameters for the tool. Remote tools
+                read connect_timeout and read_timeout (seconds), and
+                idempotent and retries: only idempotent tools are retried
+                after connection errors, timeouts and 429/5xx responses
             created_at: Creation timestamp
             updated_at: Last update timestamp
             metadata: Additional metadata
@@ -134,9 +173,54 @@ class ToolDefinition:
         self.parameters: List[ToolParameter] = []
         self.status = ToolStatus.UNAVAILABLE
         self.error_message: Optional[str] = None
+        # When the status was last probed
+        self.last_checked: Optional[datetime] = None
         
         # Function for custom tools (ToolSource.CUSTOM)
         self.implementation: Optional[Callable] = None
+        
+        # Compiled parameter validator and the parameters it was built from
+        self._validator: Optional[Callable[[Any], Any]] = None
+        self._validator_key: Optional[Tuple] = None
+    
+    def input_schema(self) -> Dict[str, Any]:
+        """
+        Get the JSON schema of the tool's parameters.
+        
+        Returns:
+            Object schema with one property per parameter
+        """
+        return {
+            "type": "object",
+            "properties": {param.name: param.to_schema() for param in self.parameters},
+            "required": [param.name for param in self.parameters if param.required]
+        }
+    
+    def validate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate parameter values against the tool's parameters.
+        
+        The schema is compiled once and only recompiled when the
+        parameter list changes.
+        
+        Args:
+            parameters: Dictionary of parameter values
+            
+        Returns:
+            Parameter values with defaults filled in and safe coercions
+            applied, such as "3" for an integer parameter
+            
+        Raises:
+            ValueError: If a parameter is missing or invalid
+        """
+        key = tuple(
+            (p.name, p.type_name, p.required, id(p.default), len(p.enum_values))
+            for p in self.parameters
+        )
+        if self._validator is None or key != self._validator_key:
+            self._validator = compile_schema(self.input_schema())
+            self._validator_key = key
+        return self._validator(parameters)
     
     def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -153,9 +237,7 @@ class ToolDefinition:
             RuntimeError: If tool execution fails
         """
         # Validate parameters
-        for param in self.parameters:
-            if param.required and param.name not in parameters:
-                raise ValueError(f"Required parameter '{param.name}' missing")
+        parameters = self.validate_parameters(parameters)
         
         # Execute based on source type
         if self.tool_source == ToolSource.CUSTOM and self.implementation:
@@ -167,35 +249,140 @@ class ToolDefinition:
                 raise RuntimeError(f"Tool execution failed: {e}")
         
         elif self.tool_source == ToolSource.REMOTE:
+            return self._call_remote(parameters)
+        
+        else:
+            raise NotImplementedError(f"Execution not implemented for source {self.tool_source}")
+    
+    async def execute_async(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the tool without blocking the event loop.
+        
+        Remote tools are called over the shared aiohttp session with the
+        same timeouts and retries as ``execute``; synchronous custom
+        implementations run in a worker thread.
+        
+        Args:
+            parameters: Dictionary of parameter values
+            
+        Returns:
+            Tool execution result
+            
+        Raises:
+            ValueError: If required parameters are missing
+            RuntimeError: If tool execution fails
+        """
+        parameters = self.validate_parameters(parameters)
+        
+        if self.tool_source == ToolSource.CUSTOM and self.implementation:
             try:
-                # Build full URL
-                full_url = f"{self.url.rstrip('/')}/{self.tool_path.lstrip('/')}"
-                
-                # Make request to the tool server
-                response = requests.post(
-                    full_url,
-                    json=parameters,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                
-                # Parse response
-                result = response.json()
-                return result
+                if asyncio.iscoroutinefunction(self.implementation):
+                    result = await self.implementation(**parameters)
+                else:
+                    result = await asyncio.to_thread(self.implementation, **parameters)
+                return {"success": True, "result": result}
             except Exception as e:
                 self.error_message = str(e)
                 raise RuntimeError(f"Tool execution failed: {e}")
         
+        elif self.tool_source == ToolSource.REMOTE:
+            return await self._call_remote_async(parameters)
+        
         else:
             raise NotImplementedError(f"Execution not implemented for source {self.tool_source}")
     
-    def check_availability(self) -> bool:
+    def _remote_url(self) -> str:
+        """Build the full URL of a remote tool."""
+        return f"{self.url.rstrip('/')}/{self.tool_path.lstrip('/')}"
+    
+    def _attempts(self) -> int:
+        """Number of attempts for a remote call: retries only if idempotent."""
+        if not self.config.get("idempotent", False):
+            return 1
+        return 1 + max(0, int(self.config.get("retries", DEFAULT_RETRIES)))
+    
+    def _timeouts(self) -> Tuple[float, float]:
+        """Connect and read timeouts for a remote call."""
+        return (
+            float(self.config.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+            float(self.config.get("read_timeout", DEFAULT_READ_TIMEOUT))
+        )
+    
+    def _call_remote(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a remote tool over the pooled requests session."""
+        attempts = self._attempts()
+        for attempt in range(attempts):
+            try:
+                try:
+                    response = get_session_pool().session.post(
+                        self._remote_url(),
+                        json=parameters,
+                        timeout=self._timeouts()
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    raise _RetryableError(str(e)) from e
+                if response.status_code in RETRYABLE_STATUS:
+                    raise _RetryableError(f"Server returned status {response.status_code}")
+                response.raise_for_status()
+                return response.json()
+            except _RetryableError as e:
+                if attempt + 1 < attempts:
+                    time.sleep(_retry_delay(attempt))
+                    continue
+                self.error_message = str(e)
+                raise RuntimeError(f"Tool execution failed: {e}")
+            except Exception as e:
+                self.error_message = str(e)
+                raise RuntimeError(f"Tool execution failed: {e}")
+    
+    async def _call_remote_async(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a remote tool over the pooled aiohttp session."""
+        import aiohttp
+        
+        connect_timeout, read_timeout = self._timeouts()
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        attempts = self._attempts()
+        for attempt in range(attempts):
+            try:
+                session = get_session_pool().async_session()
+                try:
+                    async with session.post(self._remote_url(), json=parameters, timeout=timeout) as response:
+                        if response.status in RETRYABLE_STATUS:
+                            raise _RetryableError(f"Server returned status {response.status}")
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    raise _RetryableError(str(e) or type(e).__name__) from e
+            except _RetryableError as e:
+                if attempt + 1 < attempts:
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                self.error_message = str(e)
+                raise RuntimeError(f"Tool execution failed: {e}")
+            except Exception as e:
+                self.error_message = str(e)
+                raise RuntimeError(f"Tool execution failed: {e}")
+    
+    def check_availability(self, timeout: float = 2.0, max_age: Optional[float] = None) -> bool:
         """
         Check if the tool is available.
         
+        Args:
+            timeout: Health check timeout in seconds
+            max_age: Reuse the cached status if it was checked within this
+                many seconds; None to always probe
+        
         Returns:
             True if available, False otherwise
         """
+        if (
+            max_age is not None
+            and self.last_checked is not None
+            and datetime.now() - self.last_checked < timedelta(seconds=max_age)
+        ):
+            return self.status == ToolStatus.AVAILABLE
+        self.last_checked = datetime.now()
+        
         if self.tool_source == ToolSource.CUSTOM:
             # Custom tools are available if they have an implementation
             if self.implementation is not None:
@@ -210,9 +397,9 @@ class ToolDefinition:
             try:
                 # Try to access the tool server
                 base_url = self.url.rstrip('/')
-                response = requests.get(
+                response = get_session_pool().session.get(
                     f"{base_url}/health",
-                    timeout=2.0
+                    timeout=timeout
                 )
                 
                 if response.status_code == 200:
@@ -251,7 +438,8 @@ class ToolDefinition:
             "updated_at": self.updated_at.isoformat(),
             "metadata": self.metadata,
             "parameters": [param.to_dict() for param in self.parameters],
-            "status": self.status.name
+            "status": self.status.name,
+            "last_checked": self.last_checked.isoformat() if self.last_checked else None
         }
     
     @classmethod
@@ -313,6 +501,7 @@ class ToolRegistry:
     def __init__(self):
         """Initialize the tool registry."""
         self.tools: Dict[str, ToolDefinition] = {}
+        self._refresher: Optional[PeriodicRefresher] = None
     
     def register(self, tool: ToolDefinition) -> None:
         """
@@ -360,23 +549,60 @@ class ToolRegistry:
         """
         return list(self.tools.values())
     
-    def check_all_availability(self) -> Tuple[int, int]:
+    def check_all_availability(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = 2.0
+    ) -> Tuple[int, int]:
         """
-        Check availability of all tools in the registry.
+        Check availability of all tools in the registry concurrently.
+        
+        Args:
+            max_workers: Maximum number of tools checked at once
+            timeout: Health check timeout in seconds for each tool
         
         Returns:
             Tuple of (available, unavailable) tool counts
         """
-        available = 0
-        unavailable = 0
+        results = probe_all(
+            list(self.tools.values()),
+            lambda tool: tool.check_availability(timeout),
+            max_workers
+        )
+        available = sum(results)
+        return available, len(results) - available
+    
+    def start_refresh(
+        self,
+        interval: float = 30.0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = 2.0
+    ) -> None:
+        """
+        Check all tools periodically in the background.
         
-        for tool in self.tools.values():
-            if tool.check_availability():
-                available += 1
-            else:
-                unavailable += 1
+        Tool statuses are then read from the cache, refreshed every
+        interval, instead of probing each tool on request.
         
-        return available, unavailable
+        Args:
+            interval: Seconds between refreshes
+            max_workers: Maximum number of tools checked at once
+            timeout: Health check timeout in seconds for each tool
+        """
+        if self._refresher is not None and self._refresher.running:
+            return
+        self._refresher = PeriodicRefresher(
+            lambda: self.check_all_availability(max_workers, timeout),
+            interval,
+            name="tool-status-refresh"
+        )
+        self._refresher.start()
+    
+    def stop_refresh(self) -> None:
+        """Stop the background refresh."""
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
     
     def discover_tools(self, mcp_url: str) -> List[ToolDefinition]:
         """
@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple, Union
 
 try:
-    from flask import Flask, request, jsonify, Blueprint, current_app
+    from flask import Flask, Response, request, jsonify, Blueprint, current_app, stream_with_context
     from werkzeug.exceptions import NotFound, BadRequest
 except ImportError:
     raise ImportError("Flask is required to run the API server. Install with: pip install flask")
@@ -25,6 +25,7 @@ from ..models.agent import AgentRegistry, AgentDefinition, AgentSource, AgentSta
 from ..models.tool import ToolRegistry, ToolDefinition, ToolSource, ToolStatus
 from ..engine.executor import WorkflowExecutor
 from ..storage.workflow_storage import WorkflowStorage
+from ..utils.health import STATUS_MAX_AGE
 
 # Import Python A2A server components
 from python_a2a.server.a2a_server import A2AServer
@@ -38,6 +39,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AgentFlowAPI")
 
+# Seconds between keep-alive comments on an idle event stream
+EVENT_STREAM_HEARTBEAT = 15.0
+
+
+def _sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Format one Server-Sent Event."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
 
 def create_app(
     agent_registry: AgentRegistry,
@@ -248,11 +261,12 @@ def create_agent_blueprint():
         registry = current_app.config['AGENT_REGISTRY']
         data = request.json or {}
         
-        base_url = data.get('base_url', "http://localhost")
+        # Base URLs, hosts or CIDR ranges to scan
+        targets = data.get('targets') or data.get('base_url', "http://localhost")
         port_min = data.get('port_min', 8000)
         port_max = data.get('port_max', 9000)
         
-        agents = registry.discover_agents(base_url, (port_min, port_max))
+        agents = registry.discover_agents(targets, (port_min, port_max))
         
         # Convert to serializable format
         result = []
@@ -472,8 +486,8 @@ def create_tool_blueprint():
         
         data = request.json or {}
         
-        # Check availability
-        available = tool.check_availability()
+        # Check availability, trusting a recently refreshed status
+        available = tool.check_availability(max_age=STATUS_MAX_AGE)
         if not available:
             return jsonify({
                 "error": f"Tool is not available: {tool.error_message}"
@@ -924,19 +938,33 @@ def create_workflow_blueprint():
     
     @blueprint.route('/', methods=['GET'])
     def list_workflows():
-        """List all workflows."""
+        """List workflows, most recently updated first.
+        
+        Query parameters ``limit`` and ``offset`` page the results, ``name``
+        filters by name and ``updated_since`` by ISO update time.
+        """
         storage = current_app.config['WORKFLOW_STORAGE']
-        workflows = storage.list_workflows()
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', 0, type=int)
+        workflows = storage.list_workflows(
+            limit=limit if limit is None else max(limit, 0),
+            offset=max(offset, 0),
+            name=request.args.get('name') or None,
+            updated_since=request.args.get('updated_since') or None
+        )
         
         return jsonify(workflows)
     
     @blueprint.route('/<workflow_id>', methods=['GET'])
     def get_workflow(workflow_id):
-        """Get details of a specific workflow."""
+        """Get details of a specific workflow, or of one of its versions."""
         storage = current_app.config['WORKFLOW_STORAGE']
-        workflow = storage.load_workflow(workflow_id)
+        version = request.args.get('version', type=int)
+        workflow = storage.load_workflow(workflow_id, version=version)
         
         if not workflow:
+            if version is not None:
+                return jsonify({"error": f"Version {version} of workflow {workflow_id} not found"}), 404
             return jsonify({"error": f"Workflow {workflow_id} not found"}), 404
         
         # Full workflow details
@@ -944,6 +972,17 @@ def create_workflow_blueprint():
         
         return jsonify(result)
     
+    @blueprint.route('/<workflow_id>/versions', methods=['GET'])
+    def list_workflow_versions(workflow_id):
+        """List the stored versions of a workflow."""
+        storage = current_app.config['WORKFLOW_STORAGE']
+        versions = storage.list_versions(workflow_id)
+        
+        if not versions and not storage.load_workflow(workflow_id):
+            return jsonify({"error": f"Workflow {workflow_id} not found"}), 404
+        
+        return jsonify(versions)
+    
     @blueprint.route('/', methods=['POST'])
     def create_workflow():
         """Create a new workflow."""
@@ -1651,6 +1690,56 @@ def create_execution_blueprint():
         except ValueError:
             return jsonify({"error": f"Execution {execution_id} not found"}), 404
     
+    @blueprint.route('/<execution_id>/events', methods=['GET'])
+    def stream_execution_events(execution_id):
+        """
+        Stream the progress events of an execution as Server-Sent Events.
+        
+        Each event carries its sequence number as the SSE id, so a
+        reconnecting EventSource resumes with ``Last-Event-ID``; other
+        clients pass ``after``. A client that fell behind the kept events
+        first gets a ``snapshot`` event with the full status. The stream
+        ends after the execution's final ``execution`` event.
+        """
+        executor = current_app.config['WORKFLOW_EXECUTOR']
+        execution = executor.get_execution(execution_id)
+        if not execution:
+            return jsonify({"error": f"Execution {execution_id} not found"}), 404
+        
+        try:
+            after = int(request.headers.get('Last-Event-ID') or request.args.get('after', 0))
+        except ValueError:
+            return jsonify({"error": "Last-Event-ID and after must be integers"}), 400
+        
+        buffer = execution.events
+        
+        def generate():
+            seq = after
+            if seq < buffer.first_seq - 1:
+                # Events were dropped; start from the current state
+                seq = buffer.last_seq
+                yield _sse("snapshot", executor.get_execution_status(execution_id), seq)
+            
+            while True:
+                events = buffer.wait(seq, timeout=EVENT_STREAM_HEARTBEAT)
+                for event in events:
+                    seq = event["seq"]
+                    yield _sse(event["type"], event, seq)
+                if not events:
+                    if buffer.closed:
+                        break
+                    yield ": keep-alive\n\n"
+        
+        return Response(
+            stream_with_context(generate()),
+            content_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no"  # Disable Nginx buffering
+            }
+        )
+    
     @blueprint.route('/<execution_id>/cancel', methods=['POST'])
     def cancel_execution(execution_id):
         """Cancel a workflow execution."""
@@ -133,8 +133,9 @@ def create_web_app(
     def server_error(e):
         return render_template('500.html'), 500
     
-    # Start agent monitoring
+    # Start agent monitoring and background tool status refresh
     agent_manager.start_monitoring()
+    tool_registry.start_refresh()
     
     return app
 
@@ -179,4 +180,5 @@ def run_web_server(
             agent_manager.stop_monitoring()
             
             logger.info("Stopping all agent servers")
-            agent_manager.stop_all_servers()
\ No newline at end of file
+            agent_manager.stop_all_servers()
+        tool_registry.stop_refresh()
\ No newline at end of file
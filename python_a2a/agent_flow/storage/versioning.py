@@ -0,0 +1,195 @@
+"""
+Version history for stored workflows.
+
+Each save of a changed workflow adds a version. Most versions are stored as
+a structural delta against the previous one: the top-level fields that
+changed and the nodes and edges that were added, removed or changed.
+Every ``checkpoint_interval`` versions a full snapshot is stored instead,
+so any version is rebuilt from the nearest snapshot at or before it plus
+fewer than ``checkpoint_interval`` deltas. Retention drops whole snapshot
+segments, so the oldest kept version is always a snapshot and nothing has
+to be rewritten.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+# Record kinds
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+# Fields that change on every save and do not make a new version by themselves
+_VOLATILE_FIELDS = {"updated_at"}
+
+# Workflow fields diffed element by element
+_COLLECTIONS = ("nodes", "edges")
+
+
+@dataclass
+class VersionPolicy:
+    """
+    How workflow versions are stored and retained.
+
+    Attributes:
+        checkpoint_interval: Store a full snapshot every this many versions
+        keep_last: Minimum number of recent versions kept per workflow,
+            None to keep every version
+    """
+    checkpoint_interval: int = 10
+    keep_last: Optional[int] = 100
+
+
+def _diff_collection(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Diff two lists of nodes or edges by ID."""
+    old_by_id = {item["id"]: item for item in old}
+    new_by_id = {item["id"]: item for item in new}
+
+    diff: Dict[str, Any] = {}
+    added = [item for item_id, item in new_by_id.items() if item_id not in old_by_id]
+    changed = [
+        item for item_id, item in new_by_id.items()
+        if item_id in old_by_id and old_by_id[item_id] != item
+    ]
+    removed = [item_id for item_id in old_by_id if item_id not in new_by_id]
+    if added:
+        diff["added"] = added
+    if changed:
+        diff["changed"] = changed
+    if removed:
+        diff["removed"] = removed
+    return diff
+
+
+def diff_workflows(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the structural delta between two serialized workflows.
+
+    Args:
+        old: Earlier workflow dictionary, as produced by Workflow.to_dict
+        new: Later workflow dictionary
+
+    Returns:
+        Delta with ``fields`` (changed top-level values), ``removed_fields``
+        and per-collection ``nodes``/``edges`` entries listing added and
+        changed elements and removed IDs; empty sections are omitted
+    """
+    delta: Dict[str, Any] = {}
+
+    fields = {
+        key: value for key, value in new.items()
+        if key not in _COLLECTIONS and old.get(key) != value
+    }
+    if fields:
+        delta["fields"] = fields
+    removed_fields = [key for key in old if key not in new and key not in _COLLECTIONS]
+    if removed_fields:
+        delta["removed_fields"] = removed_fields
+
+    for collection in _COLLECTIONS:
+        diff = _diff_collection(old.get(collection, []), new.get(collection, []))
+        if diff:
+            delta[collection] = diff
+    return delta
+
+
+def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a delta from diff_workflows to a serialized workflow.
+
+    Args:
+        data: Workflow dictionary the delta was computed from
+        delta: The delta
+
+    Returns:
+        A new workflow dictionary; ``data`` is not modified
+    """
+    result = {key: value for key, value in data.items() if key not in delta.get("removed_fields", ())}
+    result.update(delta.get("fields", {}))
+
+    for collection in _COLLECTIONS:
+        diff = delta.get(collection)
+        if not diff:
+            continue
+        items = {item["id"]: item for item in data.get(collection, [])}
+        for item_id in diff.get("removed", ()):
+            items.pop(item_id, None)
+        # Changed elements keep their position, added ones go last
+        for item in diff.get("changed", ()):
+            items[item["id"]] = item
+        for item in diff.get("added", ()):
+            items[item["id"]] = item
+        result[collection] = list(items.values())
+    return result
+
+
+def is_significant(delta: Dict[str, Any]) -> bool:
+    """
+    Check whether a delta changes more than the save timestamp.
+
+    Args:
+        delta: Delta from diff_workflows
+
+    Returns:
+        True if the delta deserves a new version
+    """
+    return any(key != "fields" for key in delta) or any(
+        key not in _VOLATILE_FIELDS for key in delta.get("fields", {}))
+
+
+def needs_snapshot(version: int, last_snapshot: Optional[int], policy: VersionPolicy) -> bool:
+    """
+    Decide whether a new version is stored as a full snapshot.
+
+    Args:
+        version: Number of the new version
+        last_snapshot: Number of the latest stored snapshot, None if none
+        policy: Version policy
+
+    Returns:
+        True to store a snapshot, False to store a delta
+    """
+    return last_snapshot is None or version - last_snapshot >= max(policy.checkpoint_interval, 1)
+
+
+def prune_before(snapshots: Iterable[int], latest: int, policy: VersionPolicy) -> Optional[int]:
+    """
+    Find where retention cuts a workflow's history.
+
+    Args:
+        snapshots: Numbers of the stored snapshot versions
+        latest: Number of the latest version
+        policy: Version policy
+
+    Returns:
+        Version number below which every version can be deleted, or None
+        if nothing is due for deletion
+    """
+    if policy.keep_last is None:
+        return None
+    # Latest snapshot that still leaves keep_last versions from it onwards
+    candidates = [s for s in snapshots if latest - s + 1 >= policy.keep_last]
+    if not candidates:
+        return None
+    return max(candidates)
+
+
+def replay(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Rebuild a workflow from a snapshot and the deltas after it.
+
+    Args:
+        records: Version records in order, each with ``kind`` and ``data``,
+            the first being a snapshot
+
+    Returns:
+        The workflow dictionary of the last record's version
+
+    Raises:
+        ValueError: If the records do not start with a snapshot
+    """
+    if not records or records[0]["kind"] != SNAPSHOT:
+        raise ValueError("Version history does not start with a snapshot")
+    data = records[0]["data"]
+    for record in records[1:]:
+        data = record["data"] if record["kind"] == SNAPSHOT else apply_delta(data, record["data"])
+    return data
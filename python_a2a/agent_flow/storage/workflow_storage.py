@@ -5,10 +5,77 @@ Workflow storage service for persisting workflows.
 import os
 import json
 import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from ..models.workflow import Workflow
+from .versioning import (
+    DELTA, SNAPSHOT, VersionPolicy, diff_workflows, is_significant,
+    needs_snapshot, prune_before, replay
+)
+
+
+def _index_entry(workflow: Workflow) -> Dict[str, Any]:
+    """Build the listing metadata of a workflow."""
+    return {
+        "id": workflow.id,
+        "name": workflow.name,
+        "description": workflow.description,
+        "created_at": workflow.created_at.isoformat(),
+        "updated_at": workflow.updated_at.isoformat(),
+        "version": workflow.version
+    }
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on a file across processes, where fcntl is available."""
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """Write a file so readers see either the old or the new contents."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _version_policy(versioning: Union[VersionPolicy, bool, None]) -> Optional[VersionPolicy]:
+    """Resolve a versioning argument: None for the default policy, False for none."""
+    if versioning is None or versioning is True:
+        return VersionPolicy()
+    return versioning or None
+
+
+def _serialize(workflow: Workflow) -> Dict[str, Any]:
+    """Serialize a workflow to the JSON-compatible form it is stored in."""
+    return json.loads(workflow.to_json())
 
 
 class WorkflowStorage:
@@ -17,7 +84,7 @@ class WorkflowStorage:
     
     This abstract class defines the interface for workflow storage services.
     Implementations should provide mechanisms to save, load, list, and delete
-    workflows.
+    workflows, and may keep a version history of each workflow.
     """
     
     def save_workflow(self, workflow: Workflow) -> str:
@@ -32,21 +99,50 @@ class WorkflowStorage:
         """
         raise NotImplementedError("Storage service must implement save_workflow")
     
-    def load_workflow(self, workflow_id: str) -> Optional[Workflow]:
+    def load_workflow(self, workflow_id: str, version: Optional[int] = None) -> Optional[Workflow]:
         """
         Load a workflow from storage.
         
         Args:
             workflow_id: ID of the workflow to load
+            version: History version number to load, None for the latest
             
         Returns:
             The workflow if found, None otherwise
         """
         raise NotImplementedError("Storage service must implement load_workflow")
     
-    def list_workflows(self) -> List[Dict[str, Any]]:
+    def list_versions(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """
+        List the stored versions of a workflow, oldest first.
+        
+        Args:
+            workflow_id: ID of the workflow
+        
+        Returns:
+            Dictionaries with the ``version`` number, the record ``kind``
+            ("snapshot" or "delta") and ``saved_at``; empty if the storage
+            keeps no history
+        """
+        return []
+    
+    def list_workflows(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name: Optional[str] = None,
+        updated_since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        List all workflows in storage.
+        List workflows in storage, most recently updated first.
+        
+        Args:
+            limit: Maximum number of workflows to return, None for all
+            offset: Number of workflows to skip
+            name: Only include workflows whose name contains this text,
+                ignoring case
+            updated_since: Only include workflows updated at or after this
+                ISO timestamp
         
         Returns:
             List of workflow metadata dictionaries
@@ -64,6 +160,24 @@ class WorkflowStorage:
             True if deleted, False if not found
         """
         raise NotImplementedError("Storage service must implement delete_workflow")
+    
+    @staticmethod
+    def _page(
+        entries: List[Dict[str, Any]],
+        limit: Optional[int],
+        offset: int,
+        name: Optional[str],
+        updated_since: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Sort, filter and paginate workflow metadata held in memory."""
+        if name:
+            needle = name.lower()
+            entries = [e for e in entries if needle in (e.get("name") or "").lower()]
+        if updated_since:
+            entries = [e for e in entries if (e.get("updated_at") or "") >= updated_since]
+        entries = sorted(entries, key=lambda e: e.get("updated_at") or "", reverse=True)
+        end = None if limit is None else offset + limit
+        return entries[offset:end]
 
 
 class FileWorkflowStorage(WorkflowStorage):
@@ -71,25 +185,54 @@ class FileWorkflowStorage(WorkflowStorage):
     File-based storage service for workflows.
     
     This implementation stores workflows as JSON files in a directory.
+    Workflow files are replaced atomically. Listing metadata is kept in
+    memory and persisted as an append-only log, ``index.jsonl``, of put
+    and delete records; each save or delete appends one line instead of
+    rewriting the whole index, and the log is compacted once it holds
+    mostly superseded records. Writers serialize appends and compactions
+    on ``index.lock``, so other processes' changes are picked up on the
+    next listing; without fcntl (on Windows) only writers in one process
+    are serialized.
+    
+    The version history of each workflow is an append-only file of version
+    records in the ``history`` subdirectory.
     """
     
-    def __init__(self, storage_dir: str):
+    # Compact the log when it has this many more records than workflows
+    COMPACT_SLACK = 1000
+    
+    def __init__(self, storage_dir: str, versioning: Union[VersionPolicy, bool, None] = None):
         """
         Initialize file-based workflow storage.
         
         Args:
             storage_dir: Directory to store workflow files
+            versioning: Version history policy; None for the default
+                policy, False to keep no history
         """
         self.storage_dir = storage_dir
+        self.versioning = _version_policy(versioning)
+        self.history_dir = os.path.join(storage_dir, "history")
         
         # Create directory if it doesn't exist
         os.makedirs(storage_dir, exist_ok=True)
-        
-        # Create index file if it doesn't exist
-        self.index_file = os.path.join(storage_dir, "index.json")
-        if not os.path.exists(self.index_file):
-            with open(self.index_file, "w") as f:
-                json.dump({"workflows": []}, f)
+        if self.versioning:
+            os.makedirs(self.history_dir, exist_ok=True)
+        self._history_lock = threading.Lock()
+        
+        self.index_file = os.path.join(storage_dir, "index.jsonl")
+        self.lock_file = os.path.join(storage_dir, "index.lock")
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._records = 0
+        self._offset = 0
+        # (st_dev, st_ino) of the log read so far; compaction replaces it
+        self._identity: Optional[Tuple[int, int]] = None
+        
+        with _file_lock(self.lock_file):
+            if not os.path.exists(self.index_file):
+                self._migrate_legacy_index()
+        self._read_index()
     
     def save_workflow(self, workflow: Workflow) -> str:
         """
@@ -105,29 +248,36 @@ class FileWorkflowStorage(WorkflowStorage):
         workflow.updated_at = datetime.now()
         
         # Serialize workflow to JSON
-        workflow_data = workflow.to_dict()
+        workflow_data = _serialize(workflow)
         workflow_id = workflow.id
         
+        if self.versioning:
+            with self._history_lock:
+                self._record_version(workflow_id, workflow_data)
+        
         # Save workflow file
         file_path = os.path.join(self.storage_dir, f"{workflow_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(workflow_data, f, indent=2, default=str)
+        _atomic_write(file_path, json.dumps(workflow_data, indent=2, default=str))
         
         # Update index
-        self._update_index(workflow)
+        self._append_index({"op": "put", "workflow": _index_entry(workflow)})
         
         return workflow_id
     
-    def load_workflow(self, workflow_id: str) -> Optional[Workflow]:
+    def load_workflow(self, workflow_id: str, version: Optional[int] = None) -> Optional[Workflow]:
         """
         Load a workflow from a file.
         
         Args:
             workflow_id: ID of the workflow to load
+            version: History version number to load, None for the latest
             
         Returns:
             The workflow if found, None otherwise
         """
+        if version is not None:
+            return self._load_version(workflow_id, version)
+        
         file_path = os.path.join(self.storage_dir, f"{workflow_id}.json")
         
         if not os.path.exists(file_path):
@@ -143,21 +293,35 @@ class FileWorkflowStorage(WorkflowStorage):
             print(f"Error loading workflow {workflow_id}: {e}")
             return None
     
-    def list_workflows(self) -> List[Dict[str, Any]]:
+    def list_workflows(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name: Optional[str] = None,
+        updated_since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        List all workflows in the storage directory.
+        List workflows in the storage directory, most recently updated first.
+        
+        Args:
+            limit: Maximum number of workflows to return, None for all
+            offset: Number of workflows to skip
+            name: Only include workflows whose name contains this text,
+                ignoring case
+            updated_since: Only include workflows updated at or after this
+                ISO timestamp
         
         Returns:
             List of workflow metadata dictionaries
         """
         try:
-            with open(self.index_file, "r") as f:
-                index_data = json.load(f)
-            
-            return index_data.get("workflows", [])
+            with self._lock:
+                self._read_index()
+                entries = list(self._index.values())
         except Exception as e:
             print(f"Error loading workflow index: {e}")
             return []
+        return self._page(entries, limit, offset, name, updated_since)
     
     def delete_workflow(self, workflow_id: str) -> bool:
         """
@@ -177,127 +341,272 @@ class FileWorkflowStorage(WorkflowStorage):
         try:
             # Remove file
             os.remove(file_path)
+            with self._history_lock:
+                try:
+                    os.remove(self._history_file(workflow_id))
+                except FileNotFoundError:
+                    pass
             
             # Update index
-            self._remove_from_index(workflow_id)
+            self._append_index({"op": "delete", "id": workflow_id})
             
             return True
         except Exception as e:
             print(f"Error deleting workflow {workflow_id}: {e}")
             return False
     
-    def _update_index(self, workflow: Workflow) -> None:
+    def list_versions(self, workflow_id: str) -> List[Dict[str, Any]]:
         """
-        Update the workflow index.
+        List the stored versions of a workflow, oldest first.
         
         Args:
-            workflow: The workflow to index
+            workflow_id: ID of the workflow
+        
+        Returns:
+            Dictionaries with the ``version`` number, the record ``kind``
+            and ``saved_at``
         """
+        return [
+            {"version": r["version"], "kind": r["kind"], "saved_at": r["saved_at"]}
+            for r in self._read_history(workflow_id)
+        ]
+    
+    def _history_file(self, workflow_id: str) -> str:
+        """Get the path of a workflow's version history."""
+        return os.path.join(self.history_dir, f"{workflow_id}.jsonl")
+    
+    def _read_history(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """Read a workflow's version records, oldest first."""
         try:
-            # Load current index
-            with open(self.index_file, "r") as f:
-                index_data = json.load(f)
-            
-            workflows = index_data.get("workflows", [])
-            
-            # Check if workflow is already in index
-            found = False
-            for i, entry in enumerate(workflows):
-                if entry.get("id") == workflow.id:
-                    # Update existing entry
-                    workflows[i] = {
-                        "id": workflow.id,
-                        "name": workflow.name,
-                        "description": workflow.description,
-                        "created_at": workflow.created_at.isoformat(),
-                        "updated_at": workflow.updated_at.isoformat(),
-                        "version": workflow.version
-                    }
-                    found = True
-                    break
-            
-            if not found:
-                # Add new entry
-                workflows.append({
-                    "id": workflow.id,
-                    "name": workflow.name,
-                    "description": workflow.description,
-                    "created_at": workflow.created_at.isoformat(),
-                    "updated_at": workflow.updated_at.isoformat(),
-                    "version": workflow.version
-                })
-            
-            # Save updated index
-            with open(self.index_file, "w") as f:
-                json.dump({"workflows": workflows}, f, indent=2)
-        
+            with open(self._history_file(workflow_id), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        records = []
+        # A partially written last line is not a version yet
+        for line in data[:data.rfind(b"\n") + 1].splitlines():
+            if line.strip():
+                records.append(json.loads(line))
+        return records
+    
+    def _record_version(self, workflow_id: str, workflow_data: Dict[str, Any]) -> None:
+        """Add a version to a workflow's history if its content changed."""
+        policy = self.versioning
+        records = self._read_history(workflow_id)
+        snapshots = [r["version"] for r in records if r["kind"] == SNAPSHOT]
+        latest = records[-1]["version"] if records else 0
+        version = latest + 1
+        
+        previous = self._replay_to(records, latest) if records else None
+        delta = diff_workflows(previous, workflow_data) if previous is not None else None
+        if delta is not None and not is_significant(delta):
+            return
+        record = {"version": version, "saved_at": workflow_data.get("updated_at")}
+        if delta is None or needs_snapshot(version, snapshots[-1] if snapshots else None, policy):
+            record.update(kind=SNAPSHOT, data=workflow_data)
+            snapshots.append(version)
+        else:
+            record.update(kind=DELTA, data=delta)
+        
+        path = self._history_file(workflow_id)
+        line = json.dumps(record, default=str) + "\n"
+        cut = prune_before(snapshots, version, policy)
+        if cut is not None and records and records[0]["version"] < cut:
+            # Drop whole segments before a snapshot; nothing is rebased
+            kept = [r for r in records if r["version"] >= cut] + [record]
+            _atomic_write(path, "".join(json.dumps(r, default=str) + "\n" for r in kept))
+        else:
+            with open(path, "a") as f:
+                f.write(line)
+    
+    @staticmethod
+    def _replay_to(records: List[Dict[str, Any]], version: int) -> Optional[Dict[str, Any]]:
+        """Rebuild one version from the records holding it."""
+        start = None
+        for i, record in enumerate(records):
+            if record["version"] > version:
+                break
+            if record["kind"] == SNAPSHOT:
+                start = i
+            if record["version"] == version:
+                return replay(records[start:i + 1]) if start is not None else None
+        return None
+    
+    def _load_version(self, workflow_id: str, version: int) -> Optional[Workflow]:
+        """Load one version of a workflow from its history."""
+        try:
+            data = self._replay_to(self._read_history(workflow_id), version)
+            return Workflow.from_dict(data) if data is not None else None
         except Exception as e:
-            print(f"Error updating workflow index: {e}")
+            print(f"Error loading workflow {workflow_id} version {version}: {e}")
+            return None
     
-    def _remove_from_index(self, workflow_id: str) -> None:
-        """
-        Remove a workflow from the index.
-        
-        Args:
-            workflow_id: ID of the workflow to remove
-        """
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one index log record to the in-memory index."""
+        if record.get("op") == "put":
+            entry = record["workflow"]
+            self._index[entry["id"]] = entry
+        elif record.get("op") == "delete":
+            self._index.pop(record.get("id"), None)
+        self._records += 1
+    
+    def _read_index(self) -> None:
+        """Apply index records appended since the last read."""
         try:
-            # Load current index
-            with open(self.index_file, "r") as f:
-                index_data = json.load(f)
-            
-            workflows = index_data.get("workflows", [])
-            
-            # Filter out the workflow
-            workflows = [w for w in workflows if w.get("id") != workflow_id]
-            
-            # Save updated index
-            with open(self.index_file, "w") as f:
-                json.dump({"workflows": workflows}, f, indent=2)
-        
+            f = open(self.index_file, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self._offset:
+                # A new file, compacted by this or another process; read
+                # it again from the start
+                self._index.clear()
+                self._records = 0
+                self._offset = 0
+                self._identity = identity
+            if stat.st_size == self._offset:
+                return
+            f.seek(self._offset)
+            data = f.read()
+        # Leave a partially written last line for the next read
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                try:
+                    self._apply(json.loads(line))
+                except (ValueError, KeyError) as e:
+                    print(f"Skipping corrupt workflow index record: {e}")
+        self._offset += end
+    
+    def _append_index(self, record: Dict[str, Any]) -> None:
+        """Append a record to the index log, compacting it when needed."""
+        line = (json.dumps(record, default=str) + "\n").encode()
+        try:
+            # The file lock keeps other processes from appending to a log
+            # that is being replaced by a compaction
+            with self._lock, _file_lock(self.lock_file):
+                self._read_index()
+                # One write of one line in append mode, so concurrent
+                # writers do not interleave records
+                fd = os.open(self.index_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+                self._read_index()
+                if self._records > len(self._index) + self.COMPACT_SLACK:
+                    self._compact()
         except Exception as e:
             print(f"Error updating workflow index: {e}")
+    
+    def _compact(self) -> None:
+        """Rewrite the index log with one put record per workflow; the file lock must be held."""
+        lines = [
+            json.dumps({"op": "put", "workflow": entry}, default=str) + "\n"
+            for entry in self._index.values()
+        ]
+        text = "".join(lines)
+        _atomic_write(self.index_file, text)
+        stat = os.stat(self.index_file)
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._records = len(lines)
+        self._offset = len(text.encode())
+    
+    def _migrate_legacy_index(self) -> None:
+        """Convert an index.json written by earlier versions to the log."""
+        legacy_file = os.path.join(self.storage_dir, "index.json")
+        entries: List[Dict[str, Any]] = []
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, "r") as f:
+                    entries = json.load(f).get("workflows", [])
+            except Exception as e:
+                print(f"Error loading workflow index: {e}")
+        text = "".join(
+            json.dumps({"op": "put", "workflow": entry}, default=str) + "\n"
+            for entry in entries if isinstance(entry, dict) and "id" in entry
+        )
+        _atomic_write(self.index_file, text)
 
 
 class SqliteWorkflowStorage(WorkflowStorage):
     """
     SQLite-based storage service for workflows.
     
-    This implementation stores workflows in an SQLite database.
+    This implementation stores workflows in an SQLite database. Each thread
+    reuses one connection, the database runs in WAL mode so listings do
+    not wait for writers, and listing metadata is kept in indexed columns
+    so pages are read without loading the workflow documents. Version
+    history is kept in the ``workflow_versions`` table and written in the
+    same transaction as the workflow.
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, versioning: Union[VersionPolicy, bool, None] = None):
         """
         Initialize SQLite-based workflow storage.
         
         Args:
             db_path: Path to the SQLite database file
+            versioning: Version history policy; None for the default
+                policy, False to keep no history
         """
         self.db_path = db_path
+        self.versioning = _version_policy(versioning)
+        self._local = threading.local()
         
         # Initialize database
         self._init_db()
     
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create workflows table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS workflows (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            description TEXT,
-            data TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            version TEXT
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        conn = self._connection()
+        with conn:
+            # Create workflows table
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS workflows (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                description TEXT,
+                data TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                version TEXT
+            )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_updated_at ON workflows (updated_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_name ON workflows (name COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_version ON workflows (version)")
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS workflow_versions (
+                workflow_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                saved_at TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (workflow_id, version)
+            )
+            ''')
     
     def save_workflow(self, workflow: Workflow) -> str:
         """
@@ -316,38 +625,23 @@ class SqliteWorkflowStorage(WorkflowStorage):
         workflow_data = workflow.to_json()
         workflow_id = workflow.id
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Check if workflow exists
-        cursor.execute(
-            "SELECT id FROM workflows WHERE id = ?",
-            (workflow_id,)
-        )
-        
-        if cursor.fetchone():
-            # Update existing workflow
-            cursor.execute(
-                """
-                UPDATE workflows 
-                SET name = ?, description = ?, data = ?, updated_at = ?, version = ? 
-                WHERE id = ?
-                """,
-                (
-                    workflow.name,
-                    workflow.description,
-                    workflow_data,
-                    workflow.updated_at.isoformat(),
-                    workflow.version,
-                    workflow_id
-                )
-            )
-        else:
-            # Insert new workflow
-            cursor.execute(
+        conn = self._connection()
+        with conn:
+            # Take the write lock up front so concurrent saves of a workflow
+            # cannot number two versions the same
+            conn.execute("BEGIN IMMEDIATE")
+            if self.versioning:
+                self._record_version(conn, workflow_id, json.loads(workflow_data))
+            conn.execute(
                 """
                 INSERT INTO workflows (id, name, description, data, created_at, updated_at, version)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    name = excluded.name,
+                    description = excluded.description,
+                    data = excluded.data,
+                    updated_at = excluded.updated_at,
+                    version = excluded.version
                 """,
                 (
                     workflow_id,
@@ -360,31 +654,31 @@ class SqliteWorkflowStorage(WorkflowStorage):
                 )
             )
         
-        conn.commit()
-        conn.close()
-        
         return workflow_id
     
-    def load_workflow(self, workflow_id: str) -> Optional[Workflow]:
+    def load_workflow(self, workflow_id: str, version: Optional[int] = None) -> Optional[Workflow]:
         """
         Load a workflow from the database.
         
         Args:
             workflow_id: ID of the workflow to load
+            version: History version number to load, None for the latest
             
         Returns:
             The workflow if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if version is not None:
+            try:
+                data = self._replay_to(self._connection(), workflow_id, version)
+                return Workflow.from_dict(data) if data is not None else None
+            except Exception as e:
+                print(f"Error loading workflow {workflow_id} version {version}: {e}")
+                return None
         
-        cursor.execute(
+        row = self._connection().execute(
             "SELECT data FROM workflows WHERE id = ?",
             (workflow_id,)
-        )
-        
-        row = cursor.fetchone()
-        conn.close()
+        ).fetchone()
         
         if not row:
             return None
@@ -397,39 +691,45 @@ class SqliteWorkflowStorage(WorkflowStorage):
             print(f"Error loading workflow {workflow_id}: {e}")
             return None
     
-    def list_workflows(self) -> List[Dict[str, Any]]:
+    def list_workflows(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name: Optional[str] = None,
+        updated_since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        List all workflows in the database.
+        List workflows in the database, most recently updated first.
+        
+        Args:
+            limit: Maximum number of workflows to return, None for all
+            offset: Number of workflows to skip
+            name: Only include workflows whose name contains this text,
+                ignoring case
+            updated_since: Only include workflows updated at or after this
+                ISO timestamp
         
         Returns:
             List of workflow metadata dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT id, name, description, created_at, updated_at, version 
-            FROM workflows
-            ORDER BY updated_at DESC
-            """
-        )
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        workflows = []
-        for row in rows:
-            workflows.append({
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "created_at": row[3],
-                "updated_at": row[4],
-                "version": row[5]
-            })
-        
-        return workflows
+        conditions = []
+        params: List[Any] = []
+        if name:
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if updated_since:
+            conditions.append("updated_at >= ?")
+            params.append(updated_since)
+        
+        query = "SELECT id, name, description, created_at, updated_at, version FROM workflows"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        
+        rows = self._connection().execute(query, params).fetchall()
+        return [dict(row) for row in rows]
     
     def delete_workflow(self, workflow_id: str) -> bool:
         """
@@ -441,24 +741,85 @@ class SqliteWorkflowStorage(WorkflowStorage):
         Returns:
             True if deleted, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM workflows WHERE id = ?",
+                (workflow_id,)
+            )
+            conn.execute(
+                "DELETE FROM workflow_versions WHERE workflow_id = ?",
+                (workflow_id,)
+            )
         
-        cursor.execute(
-            "SELECT id FROM workflows WHERE id = ?",
-            (workflow_id,)
-        )
+        return cursor.rowcount > 0
+    
+    def list_versions(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """
+        List the stored versions of a workflow, oldest first.
         
-        if not cursor.fetchone():
-            conn.close()
-            return False
+        Args:
+            workflow_id: ID of the workflow
         
-        cursor.execute(
-            "DELETE FROM workflows WHERE id = ?",
+        Returns:
+            Dictionaries with the ``version`` number, the record ``kind``
+            and ``saved_at``
+        """
+        rows = self._connection().execute(
+            "SELECT version, kind, saved_at FROM workflow_versions WHERE workflow_id = ? ORDER BY version",
             (workflow_id,)
-        )
-        
-        conn.commit()
-        conn.close()
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    @staticmethod
+    def _replay_to(conn: sqlite3.Connection, workflow_id: str, version: int) -> Optional[Dict[str, Any]]:
+        """Rebuild one version from the nearest snapshot at or before it."""
+        rows = conn.execute(
+            """
+            SELECT version, kind, data FROM workflow_versions
+            WHERE workflow_id = ? AND version <= ? AND version >= (
+                SELECT MAX(version) FROM workflow_versions
+                WHERE workflow_id = ? AND version <= ? AND kind = ?
+            )
+            ORDER BY version
+            """,
+            (workflow_id, version, workflow_id, version, SNAPSHOT)
+        ).fetchall()
+        if not rows or rows[-1]["version"] != version:
+            return None
+        return replay([{"kind": row["kind"], "data": json.loads(row["data"])} for row in rows])
+    
+    def _record_version(self, conn: sqlite3.Connection, workflow_id: str, workflow_data: Dict[str, Any]) -> None:
+        """Add a version to a workflow's history if its content changed."""
+        policy = self.versioning
+        snapshots = [row[0] for row in conn.execute(
+            "SELECT version FROM workflow_versions WHERE workflow_id = ? AND kind = ? ORDER BY version",
+            (workflow_id, SNAPSHOT)
+        )]
+        latest = conn.execute(
+            "SELECT MAX(version) FROM workflow_versions WHERE workflow_id = ?",
+            (workflow_id,)
+        ).fetchone()[0] or 0
+        version = latest + 1
+        
+        previous = self._replay_to(conn, workflow_id, latest) if latest else None
+        delta = diff_workflows(previous, workflow_data) if previous is not None else None
+        if delta is not None and not is_significant(delta):
+            return
+        if delta is None or needs_snapshot(version, snapshots[-1] if snapshots else None, policy):
+            kind, data = SNAPSHOT, workflow_data
+            snapshots.append(version)
+        else:
+            kind, data = DELTA, delta
         
-        return True
\ No newline at end of file
+        conn.execute(
+            "INSERT INTO workflow_versions (workflow_id, version, kind, saved_at, data) VALUES (?, ?, ?, ?, ?)",
+            (workflow_id, version, kind, workflow_data.get("updated_at"), json.dumps(data, default=str))
+        )
+        cut = prune_before(snapshots, version, policy)
+        if cut is not None:
+            # Drop whole segments before a snapshot; nothing is rebased
+            conn.execute(
+                "DELETE FROM workflow_versions WHERE workflow_id = ? AND version < ?",
+                (workflow_id, cut)
+            )
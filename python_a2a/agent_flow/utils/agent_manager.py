@@ -552,11 +552,9 @@ class AgentManager:
                     # Remove from running servers
                     del self.running_servers[server_id]
             
-            # Check agent connections
-            for agent in self.registry.list_agents():
-                if agent.status != AgentStatus.CONNECTED:
-                    # Try to reconnect
-                    agent.connect()
+            # Refresh all agent connections concurrently, so reads use
+            # cached statuses
+            self.registry.connect_all()
             
             # Sleep until next check
             for _ in range(interval):
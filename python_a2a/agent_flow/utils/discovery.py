@@ -0,0 +1,231 @@
+"""
+Asynchronous port scanning for A2A agents.
+
+Discovery probes every port in a range on one or more hosts for an
+``/agent.json`` card. An ``AgentScanner`` does this on one event loop: a
+cheap TCP connect to each port comes first, and only open ports get an HTTP
+request. A fixed number of workers bounds the concurrency, and agents are
+yielded as they are found. Ports that turned out closed or not to serve an
+agent are remembered for a while, so repeated scans skip them.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# A host to scan: (scheme, host)
+Target = Tuple[str, str]
+
+
+def expand_targets(specs: Union[str, Iterable[str]]) -> List[Target]:
+    """
+    Expand host specifications into hosts to scan.
+
+    Args:
+        specs: Base URLs ("http://localhost"), host names, IP addresses or
+            CIDR ranges ("192.168.1.0/28"), or a list of them
+
+    Returns:
+        (scheme, host) pairs, defaulting to http
+    """
+    if isinstance(specs, str):
+        specs = [specs]
+
+    targets: List[Target] = []
+    for spec in specs:
+        spec = spec.strip().rstrip("/")
+        scheme = "http"
+        if "://" in spec:
+            parsed = urlparse(spec)
+            scheme, spec = parsed.scheme, parsed.hostname or ""
+        if "/" in spec:
+            network = ipaddress.ip_network(spec, strict=False)
+            hosts = list(network.hosts()) or [network.network_address]
+            targets.extend((scheme, str(host)) for host in hosts)
+        elif spec:
+            targets.append((scheme, spec))
+    return targets
+
+
+def _url(scheme: str, host: str, port: int) -> str:
+    """Build the base URL of a port, bracketing IPv6 addresses."""
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{scheme}://{host}:{port}"
+
+
+def is_agent_card(data: Any) -> bool:
+    """Check whether a JSON document looks like an A2A agent card."""
+    return isinstance(data, dict) and "name" in data and "description" in data
+
+
+class AgentScanner:
+    """
+    Scans host and port ranges for A2A agent cards.
+
+    The negative cache outlives a single scan, so keep one scanner per
+    registry or application.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 256,
+        connect_timeout: float = 0.3,
+        http_timeout: float = 1.0,
+        negative_ttl: float = 60.0
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            max_concurrency: Maximum number of ports probed at once
+            connect_timeout: Seconds to wait for a TCP connection
+            http_timeout: Seconds to wait for the agent card of an open port
+            negative_ttl: Seconds to skip a port that had no agent, 0 to
+                disable the negative cache
+        """
+        self.max_concurrency = max_concurrency
+        self.connect_timeout = connect_timeout
+        self.http_timeout = http_timeout
+        self.negative_ttl = negative_ttl
+        # (host, port) -> time until which the port is skipped
+        self._negative: Dict[Tuple[str, int], float] = {}
+        self.stats = {"probed": 0, "skipped": 0, "open": 0, "found": 0}
+
+    def clear_cache(self) -> None:
+        """Forget all ports remembered as having no agent."""
+        self._negative.clear()
+
+    def _skip(self, host: str, port: int) -> bool:
+        """Check whether a port is in the negative cache."""
+        expiry = self._negative.get((host, port))
+        if expiry is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        del self._negative[(host, port)]
+        return False
+
+    def _remember_dead(self, host: str, port: int) -> None:
+        """Add a port to the negative cache."""
+        if self.negative_ttl > 0:
+            self._negative[(host, port)] = time.monotonic() + self.negative_ttl
+
+    async def _is_open(self, host: str, port: int) -> bool:
+        """Check whether a TCP connection to the port succeeds."""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), self.connect_timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    async def _fetch_card(self, session: Any, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and check the agent card served at a base URL."""
+        import aiohttp
+
+        try:
+            async with session.get(
+                f"{url}/agent.json",
+                timeout=aiohttp.ClientTimeout(total=self.http_timeout)
+            ) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+        return data if is_agent_card(data) else None
+
+    async def _probe(self, session: Any, scheme: str, host: str, port: int) -> Optional[Dict[str, Any]]:
+        """Probe one port, returning its agent card if it serves one."""
+        if self._skip(host, port):
+            self.stats["skipped"] += 1
+            return None
+        self.stats["probed"] += 1
+
+        card = None
+        if await self._is_open(host, port):
+            self.stats["open"] += 1
+            card = await self._fetch_card(session, _url(scheme, host, port))
+        if card is None:
+            self._remember_dead(host, port)
+        else:
+            self.stats["found"] += 1
+        return card
+
+    async def scan(
+        self,
+        targets: Union[str, Iterable[str]],
+        ports: Union[Tuple[int, int], Iterable[int]]
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Scan hosts for agents, yielding each one as it is found.
+
+        Args:
+            targets: Base URLs, host names, IP addresses or CIDR ranges
+            ports: Inclusive (start, end) port range, or ports to scan
+
+        Yields:
+            (base URL, agent card data) for each agent found
+        """
+        import aiohttp
+
+        if isinstance(ports, tuple) and len(ports) == 2:
+            ports = range(ports[0], ports[1] + 1)
+        ports = list(ports)
+        hosts = expand_targets(targets)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        found: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def produce():
+            for scheme, host in hosts:
+                for port in ports:
+                    await queue.put((scheme, host, port))
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def work():
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    scheme, host, port = item
+                    card = await self._probe(session, scheme, host, port)
+                    if card is not None:
+                        await found.put((_url(scheme, host, port), card))
+            finally:
+                await found.put(done)
+
+        workers = max(1, min(self.max_concurrency, len(hosts) * len(ports)))
+        # One session per scan; its connection limit matches the workers
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=workers))
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(work()) for _ in range(workers))
+        try:
+            remaining = workers
+            while remaining:
+                item = await found.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            # Also stops the producer if the workers exited early and left
+            # it blocked on a full queue
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await session.close()
@@ -0,0 +1,113 @@
+"""
+Concurrent status checks for agents and tools.
+
+Registries hold many remote agents and tool servers. Probing them one at a
+time makes the cost of a refresh the sum of every target's latency and
+timeout. ``probe_all`` probes targets in parallel with a bounded number of
+workers, and ``PeriodicRefresher`` repeats a refresh in the background so
+the UI reads cached statuses instead of probing on demand.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a cached status is trusted before it is probed again on use
+STATUS_MAX_AGE = 30.0
+
+# Default number of targets probed at once
+DEFAULT_MAX_WORKERS = 16
+
+
+def probe_all(
+    targets: Iterable[T],
+    probe: Callable[[T], bool],
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[bool]:
+    """
+    Probe targets concurrently.
+
+    Each probe enforces its own timeout; a probe that raises counts as a
+    failure.
+
+    Args:
+        targets: Agents or tools to probe
+        probe: Probes one target and returns whether it is healthy
+        max_workers: Maximum number of probes running at once
+
+    Returns:
+        The probe results in target order
+    """
+    targets = list(targets)
+    if not targets:
+        return []
+
+    def safe_probe(target: T) -> bool:
+        try:
+            return bool(probe(target))
+        except Exception as e:
+            logger.debug(f"Probe of {target!r} failed: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as executor:
+        return list(executor.map(safe_probe, targets))
+
+
+class PeriodicRefresher:
+    """
+    Runs a refresh function in a background thread at a fixed interval.
+    """
+
+    def __init__(self, refresh: Callable[[], Any], interval: float, name: str = "status-refresh"):
+        """
+        Initialize the refresher.
+
+        Args:
+            refresh: Function that refreshes the cached statuses
+            interval: Seconds between the end of one refresh and the next
+            name: Name of the background thread
+        """
+        self.refresh = refresh
+        self.interval = interval
+        self.name = name
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start refreshing; the first refresh runs immediately."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop refreshing.
+
+        Args:
+            timeout: Seconds to wait for a refresh in progress to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Refresh until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception(f"Status refresh '{self.name}' failed")
+            self._stop.wait(self.interval)
@@ -3,11 +3,9 @@ Client implementations for the A2A protocol.
 """
 
 # Import and re-export client classes for easy access
-from .base import BaseA2AClient
+from .base import BaseA2AClient, get_sync_executor, set_sync_executor
 from .http import A2AClient
-
-# Import LLM-specific clients
-from .llm import OpenAIA2AClient, OllamaA2AClient, AnthropicA2AClient
+from .sessions import HTTPSessionPool, get_session_pool
 
 # Import enhanced components
 from .network import AgentNetwork
@@ -17,7 +15,11 @@ from .streaming import StreamingClient
 # Make everything available at the client level
 __all__ = [
     "BaseA2AClient",
+    "get_sync_executor",
+    "set_sync_executor",
     "A2AClient",
+    "HTTPSessionPool",
+    "get_session_pool",
     "OpenAIA2AClient",
     "OllamaA2AClient",
     "AnthropicA2AClient",
@@ -25,3 +27,16 @@ __all__ = [
     "AIAgentRouter",
     "StreamingClient",
 ]
+
+# LLM-specific clients import their provider SDKs, so load them on first use
+_LLM_CLIENTS = ("OpenAIA2AClient", "OllamaA2AClient", "AnthropicA2AClient")
+
+
+def __getattr__(name):
+    """Load LLM-specific clients on first access (PEP 562)."""
+    if name in _LLM_CLIENTS:
+        from . import llm
+        value = getattr(llm, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,92 @@
 Base client for interacting with A2A-compatible agents.
 """
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Optional, AsyncGenerator, Any, Union, Dict, Callable
 
-from ..models.message import Message
+from ..models.message import Message, MessageRole
+from ..models.content import TextContent
 from ..models.conversation import Conversation
 from ..models.task import Task
 
+# Default number of threads for running blocking clients from async code
+DEFAULT_SYNC_WORKERS = 64
+
+_sync_executor: Optional[Executor] = None
+# Whether _sync_executor was created here, and is shut down when replaced
+_sync_executor_owned = False
+_sync_executor_lock = threading.Lock()
+
+
+def get_sync_executor() -> Executor:
+    """
+    Get the executor used to run blocking client calls from async code.
+    
+    A dedicated thread pool of ``DEFAULT_SYNC_WORKERS`` threads is created on
+    first use unless one was configured with ``set_sync_executor``. Using a
+    dedicated pool keeps slow agent calls from exhausting the event loop's
+    default executor.
+    
+    Returns:
+        The shared executor
+    """
+    global _sync_executor, _sync_executor_owned
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_SYNC_WORKERS,
+                    thread_name_prefix="a2a-sync-client"
+                )
+                _sync_executor_owned = True
+    return _sync_executor
+
+
+def set_sync_executor(executor: Union[Executor, int, None]) -> None:
+    """
+    Configure the executor used to run blocking client calls from async code.
+    
+    A thread pool created here, including the default one, is shut down
+    without waiting when it is replaced; a given executor stays owned by
+    the caller.
+    
+    Args:
+        executor: An executor, a number of worker threads for a new thread
+            pool, or None to go back to the default pool
+    """
+    global _sync_executor, _sync_executor_owned
+    owned = isinstance(executor, int)
+    if owned:
+        executor = ThreadPoolExecutor(
+            max_workers=executor,
+            thread_name_prefix="a2a-sync-client"
+        )
+    with _sync_executor_lock:
+        previous, previous_owned = _sync_executor, _sync_executor_owned
+        _sync_executor, _sync_executor_owned = executor, owned
+    if previous_owned and previous is not executor:
+        # Calls already submitted still run to completion
+        previous.shutdown(wait=False)
+
+
+async def run_in_sync_executor(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking function in the shared sync-client executor.
+    
+    Args:
+        func: Blocking function to call
+        *args: Positional arguments for the function
+        
+    Returns:
+        The function's result
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_sync_executor(), func, *args)
+
 
 class BaseA2AClient(ABC):
     """
@@ -19,8 +98,15 @@ class BaseA2AClient(ABC):
     
     All client implementations should inherit from this class and implement the
     `send_message` and `send_conversation` methods.
+    
+    Clients with a non-blocking transport should override the ``*_async``
+    methods and set ``native_async`` to True. Otherwise the async methods run
+    the blocking versions in the shared sync-client executor.
     """
     
+    # Whether the async methods are implemented without blocking threads
+    native_async = False
+    
     @abstractmethod
     def send_message(self, message: Message) -> Message:
         """
@@ -86,8 +172,8 @@ class BaseA2AClient(ABC):
         """
         Send a message to an A2A-compatible agent asynchronously.
         
-        Default implementation that wraps the synchronous send_message
-        in an asynchronous interface.
+        Default implementation that runs the synchronous send_message
+        in the shared sync-client executor.
         
         Args:
             message: The A2A message to send
@@ -95,17 +181,14 @@ class BaseA2AClient(ABC):
         Returns:
             The agent's response
         """
-        # Default implementation runs sync version in executor
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_message, message)
+        return await run_in_sync_executor(self.send_message, message)
     
     async def send_conversation_async(self, conversation: Conversation) -> Conversation:
         """
         Send a conversation to an A2A-compatible agent asynchronously.
         
-        Default implementation that wraps the synchronous send_conversation
-        in an asynchronous interface.
+        Default implementation that runs the synchronous send_conversation
+        in the shared sync-client executor.
         
         Args:
             conversation: The conversation to send
@@ -113,10 +196,71 @@ class BaseA2AClient(ABC):
         Returns:
             The updated conversation with the agent's response
         """
-        # Default implementation runs sync version in executor
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_conversation, conversation)
+        return await run_in_sync_executor(self.send_conversation, conversation)
+    
+    async def ask_async(self, query: Union[str, Message]) -> str:
+        """
+        Send a text query asynchronously and return the text response.
+        
+        Clients without a native async transport that provide their own
+        ``ask`` have it run in the shared sync-client executor, so their
+        response formatting is preserved.
+        
+        Args:
+            query: Text query or message to send
+            
+        Returns:
+            Text response from the agent
+        """
+        if not self.native_async and hasattr(self, "ask"):
+            return await run_in_sync_executor(self.ask, query)
+        
+        if isinstance(query, str):
+            query = Message(
+                content=TextContent(text=query),
+                role=MessageRole.USER
+            )
+        response = await self.send_message_async(query)
+        return self._response_text(response)
+    
+    def _response_text(self, response: Optional[Message]) -> str:
+        """
+        Extract a text representation from a response message.
+        
+        Args:
+            response: Response message from the agent
+            
+        Returns:
+            Text for the response
+        """
+        if response and hasattr(response, "content"):
+            content_type = getattr(response.content, "type", None)
+            
+            if content_type == "text":
+                return response.content.text
+            elif content_type == "error":
+                return f"Error: {response.content.message}"
+            elif content_type == "function_response":
+                return f"Function '{response.content.name}' returned: {json.dumps(response.content.response, indent=2)}"
+            elif content_type == "function_call":
+                params = {p.name: p.value for p in response.content.parameters}
+                return f"Function call '{response.content.name}' with parameters: {json.dumps(params, indent=2)}"
+            elif response.content is not None:
+                return str(response.content)
+        
+        # If text extraction from standard format failed, check for Google A2A format
+        if response:
+            try:
+                # Try to access parts directly
+                google_format = response.to_google_a2a()
+                if "parts" in google_format:
+                    for part in google_format["parts"]:
+                        if part.get("type") == "text" and "text" in part:
+                            return part["text"]
+            except:
+                pass
+        
+        return "No text response"
     
     async def stream_task(
         self, 
@@ -166,7 +310,6 @@ class BaseA2AClient(ABC):
             The updated task with the agent's response
         """
         from ..models.task import TaskStatus, TaskState
-        from ..models.message import MessageRole, TextContent
         
         # Default implementation extracts message from task and uses send_message
         message_data = task.message or {}
@@ -19,6 +19,7 @@ from ..models.content import (
 from ..models.agent import AgentCard, AgentSkill
 from ..models.task import Task, TaskStatus, TaskState
 from .base import BaseA2AClient
+from .sessions import HTTPSessionPool
 from ..exceptions import A2AConnectionError, A2AResponseError, A2AStreamingError
 
 logger = logging.getLogger(__name__)
@@ -27,8 +28,12 @@ logger = logging.getLogger(__name__)
 class A2AClient(BaseA2AClient):
     """Client for interacting with HTTP-based A2A-compatible agents"""
     
+    # The async methods use aiohttp instead of blocking threads
+    native_async = True
+    
     def __init__(self, endpoint_url: str, headers: Optional[Dict[str, str]] = None, 
-                 timeout: int = 30, google_a2a_compatible: bool = False):
+                 timeout: int = 30, google_a2a_compatible: bool = False,
+                 session_pool: Optional[HTTPSessionPool] = None):
         """
         Initialize a client with an agent endpoint URL
         
@@ -37,10 +42,13 @@ class A2AClient(BaseA2AClient):
             headers: Optional HTTP headers to include in requests
             timeout: Request timeout in seconds
             google_a2a_compatible: Whether to use Google A2A format by default (not normally needed)
+            session_pool: Pooled HTTP sessions to reuse connections across
+                requests and clients; by default each request connects anew
         """
         self.endpoint_url = endpoint_url.rstrip("/")
         self.headers = headers or {}
         self.timeout = timeout
+        self.session_pool = session_pool
         self._use_google_a2a = google_a2a_compatible
         self._protocol_detected = google_a2a_compatible  # True after we've detected the protocol type
         
@@ -70,6 +78,14 @@ class A2AClient(BaseA2AClient):
                 version="unknown"
             )
             
+    @property
+    def _http(self):
+        """The pooled requests session, or the requests module itself."""
+        session_pool = getattr(self, "session_pool", None)
+        if session_pool is not None:
+            return session_pool.session
+        return requests
+    
     def get_agent_card(self) -> AgentCard:
         """
         Get the agent card for this client.
@@ -135,7 +151,7 @@ class A2AClient(BaseA2AClient):
                 headers["Accept"] = "application/json"
                 
                 # Make the request
-                response = requests.get(card_url, headers=headers, timeout=self.timeout)
+                response = self._http.get(card_url, headers=headers, timeout=self.timeout)
                 response.raise_for_status()
                 
                 # Check content type to handle HTML responses
@@ -240,19 +256,12 @@ class A2AClient(BaseA2AClient):
         # No clear indication, use the current setting
         return self._use_google_a2a
     
-    def send_message(self, message: Message) -> Message:
+    def _message_endpoints(self) -> List[str]:
         """
-        Send a message to an A2A-compatible agent and get a response
+        Get the endpoints to try when sending a message, in order.
         
-        Args:
-            message: The A2A message to send
-            
         Returns:
-            The agent's response as an A2A message
-            
-        Raises:
-            A2AConnectionError: If connection to the agent fails
-            A2AResponseError: If the agent returns an invalid response
+            List of endpoint URLs
         """
         # Try endpoints in a more logical order with fewer variations
         base_url = self.endpoint_url.rstrip("/")
@@ -266,10 +275,162 @@ class A2AClient(BaseA2AClient):
             endpoints_to_try.append(f"{base_url}/tasks/send")
         
         # Deduplicate endpoints
-        endpoints_to_try = list(dict.fromkeys(endpoints_to_try))
+        return list(dict.fromkeys(endpoints_to_try))
+    
+    def _message_from_task(self, result: Task, message: Message) -> Optional[Message]:
+        """
+        Convert the first usable artifact part of a task result to a message.
+        
+        Args:
+            result: Task returned by the agent
+            message: The message the task was created from
+            
+        Returns:
+            Response message, or None if the task has no usable parts
+        """
+        if result.artifacts and len(result.artifacts) > 0:
+            for artifact in result.artifacts:
+                if "parts" in artifact:
+                    parts = artifact["parts"]
+                    for part in parts:
+                        if part.get("type") == "text":
+                            return Message(
+                                content=TextContent(text=part.get("text", "")),
+                                role=MessageRole.AGENT,
+                                parent_message_id=message.message_id,
+                                conversation_id=message.conversation_id
+                            )
+                        elif part.get("type") == "function_response":
+                            return Message(
+                                content=FunctionResponseContent(
+                                    name=part.get("name", ""),
+                                    response=part.get("response", {})
+                                ),
+                                role=MessageRole.AGENT,
+                                parent_message_id=message.message_id,
+                                conversation_id=message.conversation_id
+                            )
+                        elif part.get("type") == "function_call":
+                            # Convert parameters to FunctionParameter objects
+                            params = []
+                            for param in part.get("parameters", []):
+                                params.append(FunctionParameter(
+                                    name=param.get("name", ""),
+                                    value=param.get("value", "")
+                                ))
+                            
+                            return Message(
+                                content=FunctionCallContent(
+                                    name=part.get("name", ""),
+                                    parameters=params
+                                ),
+                                role=MessageRole.AGENT,
+                                parent_message_id=message.message_id,
+                                conversation_id=message.conversation_id
+                            )
+                        elif part.get("type") == "error":
+                            return Message(
+                                content=ErrorContent(message=part.get("message", "")),
+                                role=MessageRole.AGENT,
+                                parent_message_id=message.message_id,
+                                conversation_id=message.conversation_id
+                            )
+        
+        return None
+    
+    def _google_message_request(self, message: Message) -> Dict[str, Any]:
+        """
+        Build a Google A2A ``message/send`` JSON-RPC request for a message.
+        
+        Args:
+            message: The message to send
+            
+        Returns:
+            JSON-RPC request data
+        """
+        # Get the message in Google A2A format
+        message_data = message.to_google_a2a()
+        
+        # Ensure messageId is at the top level
+        if "metadata" in message_data and "message_id" in message_data["metadata"]:
+            message_data["messageId"] = message_data["metadata"]["message_id"]
+        
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "message/send",
+            "params": {
+                "message": message_data
+            }
+        }
+    
+    def _message_from_data(
+        self,
+        response_data: Dict[str, Any],
+        google_request: bool = False
+    ) -> Message:
+        """
+        Parse a message response, detecting the Google A2A format.
+        
+        Args:
+            response_data: Parsed JSON response
+            google_request: Whether the request was sent in Google A2A format,
+                which relaxes the format detection
+            
+        Returns:
+            The agent's response as an A2A message
+        """
+        # Check for clear Google A2A format markers
+        if ("parts" in response_data and isinstance(response_data.get("parts"), list) and
+            "role" in response_data and (google_request or "content" not in response_data)):
+            # Response is in Google A2A format
+            self._use_google_a2a = True
+            self._protocol_detected = True
+            return Message.from_google_a2a(response_data)
+        
+        # Standard format
+        return Message.from_dict(response_data)
+    
+    def _conversation_from_data(self, response_data: Dict[str, Any]) -> Conversation:
+        """
+        Parse a conversation response, detecting the Google A2A format.
+        
+        Args:
+            response_data: Parsed JSON response
+            
+        Returns:
+            The updated conversation
+        """
+        # Check if the response is in Google A2A format
+        if "messages" in response_data and isinstance(response_data["messages"], list):
+            if (response_data["messages"] and 
+                "parts" in response_data["messages"][0] and 
+                isinstance(response_data["messages"][0].get("parts"), list)):
+                # Response is in Google A2A format
+                self._use_google_a2a = True
+                self._protocol_detected = True
+                return Conversation.from_google_a2a(response_data)
+        
+        # Standard format
+        return Conversation.from_dict(response_data)
+    
+    def send_message(self, message: Message) -> Message:
+        """
+        Send a message to an A2A-compatible agent and get a response
+        
+        Args:
+            message: The A2A message to send
+            
+        Returns:
+            The agent's response as an A2A message
+            
+        Raises:
+            A2AConnectionError: If connection to the agent fails
+            A2AResponseError: If the agent returns an invalid response
+        """
+        endpoints_to_try = self._message_endpoints()
         
         # First try A2A protocol style with tasks
-        task_response = None
         for endpoint in endpoints_to_try:
             try:
                 # Create a task from the message
@@ -283,57 +444,7 @@ class A2AClient(BaseA2AClient):
                 self.endpoint_url = endpoint
                 
                 # Convert the task result back to a message
-                if result.artifacts and len(result.artifacts) > 0:
-                    for artifact in result.artifacts:
-                        if "parts" in artifact:
-                            parts = artifact["parts"]
-                            for part in parts:
-                                if part.get("type") == "text":
-                                    task_response = Message(
-                                        content=TextContent(text=part.get("text", "")),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "function_response":
-                                    task_response = Message(
-                                        content=FunctionResponseContent(
-                                            name=part.get("name", ""),
-                                            response=part.get("response", {})
-                                        ),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "function_call":
-                                    # Convert parameters to FunctionParameter objects
-                                    params = []
-                                    for param in part.get("parameters", []):
-                                        params.append(FunctionParameter(
-                                            name=param.get("name", ""),
-                                            value=param.get("value", "")
-                                        ))
-                                    
-                                    task_response = Message(
-                                        content=FunctionCallContent(
-                                            name=part.get("name", ""),
-                                            parameters=params
-                                        ),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "error":
-                                    task_response = Message(
-                                        content=ErrorContent(message=part.get("message", "")),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
+                task_response = self._message_from_task(result, message)
                         
                 # If we got a response, return it
                 if task_response is not None:
@@ -349,7 +460,7 @@ class A2AClient(BaseA2AClient):
             for endpoint in endpoints_to_try:
                 try:
                     # Standard python_a2a format
-                    response = requests.post(
+                    response = self._http.post(
                         endpoint,
                         json=message.to_dict(),
                         headers=self.headers,
@@ -385,16 +496,7 @@ class A2AClient(BaseA2AClient):
                         # Check if response has clear Google A2A format indicators
                         response_data = response.json()
                         
-                        # Check for clear Google A2A format markers
-                        if ("parts" in response_data and isinstance(response_data.get("parts"), list) and
-                            "role" in response_data and not "content" in response_data):
-                            # Response is in Google A2A format
-                            self._use_google_a2a = True
-                            self._protocol_detected = True
-                            return Message.from_google_a2a(response_data)
-                        else:
-                            # Standard format
-                            return Message.from_dict(response_data)
+                        return self._message_from_data(response_data)
                     except ValueError as e:
                         # Try to get plain text if JSON parsing fails
                         try:
@@ -420,23 +522,9 @@ class A2AClient(BaseA2AClient):
         if self._use_google_a2a or self._protocol_detected:
             for endpoint in endpoints_to_try:
                 try:
-                    # Get the message in Google A2A format
-                    message_data = message.to_google_a2a()
+                    request_data = self._google_message_request(message)
                     
-                    # Ensure messageId is at the top level
-                    if "metadata" in message_data and "message_id" in message_data["metadata"]:
-                        message_data["messageId"] = message_data["metadata"]["message_id"]
-                    
-                    request_data = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "message/send",
-                        "params": {
-                            "message": message_data
-                        }
-                    }
-                    
-                    response = requests.post(
+                    response = self._http.post(
                         endpoint,
                         json=request_data,
                         headers=self.headers,
@@ -457,17 +545,7 @@ class A2AClient(BaseA2AClient):
                     try:
                         response_data = response.json()
                         
-                        # Check for Google A2A format response
-                        if ("parts" in response_data and 
-                            isinstance(response_data.get("parts"), list) and 
-                            "role" in response_data):
-                            # Google A2A format response
-                            self._use_google_a2a = True
-                            self._protocol_detected = True
-                            return Message.from_google_a2a(response_data)
-                        else:
-                            # Standard format response
-                            return Message.from_dict(response_data)
+                        return self._message_from_data(response_data, google_request=True)
                     except Exception:
                         # Try to handle plain text response
                         try:
@@ -525,7 +603,7 @@ class A2AClient(BaseA2AClient):
         if not self._use_google_a2a:
             for endpoint in endpoints_to_try:
                 try:
-                    response = requests.post(
+                    response = self._http.post(
                         endpoint,
                         json=conversation.to_dict(),
                         headers=self.headers,
@@ -560,18 +638,7 @@ class A2AClient(BaseA2AClient):
                     try:
                         response_data = response.json()
                         
-                        # Check if the response is in Google A2A format
-                        if "messages" in response_data and isinstance(response_data["messages"], list):
-                            if (response_data["messages"] and 
-                                "parts" in response_data["messages"][0] and 
-                                isinstance(response_data["messages"][0].get("parts"), list)):
-                                # Response is in Google A2A format
-                                self._use_google_a2a = True
-                                self._protocol_detected = True
-                                return Conversation.from_google_a2a(response_data)
-                        
-                        # Standard format
-                        return Conversation.from_dict(response_data)
+                        return self._conversation_from_data(response_data)
                     except Exception:
                         # Try to extract text content if JSON parsing fails
                         try:
@@ -603,7 +670,7 @@ class A2AClient(BaseA2AClient):
             for endpoint in endpoints_to_try:
                 try:
                     # Google A2A format
-                    response = requests.post(
+                    response = self._http.post(
                         endpoint,
                         json=conversation.to_google_a2a(),
                         headers=self.headers,
@@ -624,18 +691,7 @@ class A2AClient(BaseA2AClient):
                     try:
                         response_data = response.json()
                         
-                        # Check if the response is in Google A2A format
-                        if "messages" in response_data and isinstance(response_data["messages"], list):
-                            if (response_data["messages"] and 
-                                "parts" in response_data["messages"][0] and 
-                                isinstance(response_data["messages"][0].get("parts"), list)):
-                                # Response is in Google A2A format
-                                self._use_google_a2a = True
-                                self._protocol_detected = True
-                                return Conversation.from_google_a2a(response_data)
-                        
-                        # Standard format
-                        return Conversation.from_dict(response_data)
+                        return self._conversation_from_data(response_data)
                     except Exception:
                         # Try to extract text content if JSON parsing fails
                         try:
@@ -691,34 +747,7 @@ class A2AClient(BaseA2AClient):
         response = self.send_message(message)
         
         # Extract text from response
-        if response and hasattr(response, "content"):
-            content_type = getattr(response.content, "type", None)
-            
-            if content_type == "text":
-                return response.content.text
-            elif content_type == "error":
-                return f"Error: {response.content.message}"
-            elif content_type == "function_response":
-                return f"Function '{response.content.name}' returned: {json.dumps(response.content.response, indent=2)}"
-            elif content_type == "function_call":
-                params = {p.name: p.value for p in response.content.parameters}
-                return f"Function call '{response.content.name}' with parameters: {json.dumps(params, indent=2)}"
-            elif response.content is not None:
-                return str(response.content)
-        
-        # If text extraction from standard format failed, check for Google A2A format
-        if response:
-            try:
-                # Try to access parts directly
-                google_format = response.to_google_a2a()
-                if "parts" in google_format:
-                    for part in google_format["parts"]:
-                        if part.get("type") == "text" and "text" in part:
-                            return part["text"]
-            except:
-                pass
-        
-        return "No text response"
+        return self._response_text(response)
     
     def _create_task(self, message):
         """
@@ -743,77 +772,56 @@ class A2AClient(BaseA2AClient):
             message=message.to_dict() if isinstance(message, Message) else message
         )
     
-    def _send_task(self, task, endpoint_override=None):
+    def _task_request(self, task: Task) -> Dict[str, Any]:
         """
-        Send a task to the agent
+        Build a ``tasks/send`` JSON-RPC request for a task.
         
         Args:
             task: The task to send
-            endpoint_override: Optional override for the endpoint URL
             
         Returns:
-            The updated task with the agent's response
+            JSON-RPC request data
         """
-        # Use the override if provided, otherwise use the standard endpoint
-        base_url = endpoint_override if endpoint_override else self.endpoint_url
-        base_url = base_url.rstrip("/")
-        
-        # Prepare JSON-RPC request
-        request_data = {
+        return {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "tasks/send",
             "params": task.to_dict()
         }
+    
+    def _task_endpoints(self, base_url: str) -> List[str]:
+        """
+        Get the endpoints to try when sending a task, in order.
         
-        # Try endpoints in order of preference
-        task_endpoints = []
+        Args:
+            base_url: Agent endpoint URL
+            
+        Returns:
+            List of endpoint URLs
+        """
+        base_url = base_url.rstrip("/")
         
         # If the base URL already ends with a task-related path, use it directly
         if base_url.endswith(("/tasks/send", "/a2a/tasks/send")):
-            task_endpoints.append(base_url)
-        else:
-            # For normal agent endpoints, try task-specific paths
-            task_endpoints.extend([
-                f"{base_url}/tasks/send",
-                f"{base_url}/a2a/tasks/send"
-            ])
+            return [base_url]
         
-        last_error = None
-        for endpoint in task_endpoints:
-            try:
-                response = requests.post(
-                    endpoint,
-                    json=request_data,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Check for content type and parse response
-                content_type = response.headers.get("Content-Type", "").lower()
-                if "application/json" in content_type:
-                    response_data = response.json()
-                else:
-                    # Try to parse as JSON anyway
-                    try:
-                        response_data = response.json()
-                    except json.JSONDecodeError:
-                        raise ValueError("Response is not valid JSON")
-                
-                # If we reach here, the request succeeded
-                break
-                    
-            except Exception as e:
-                last_error = e
-                continue
-        else:
-            # All task endpoints failed
-            if last_error:
-                raise last_error
-            else:
-                raise A2AConnectionError("No task endpoints available")
+        # For normal agent endpoints, try task-specific paths
+        return [
+            f"{base_url}/tasks/send",
+            f"{base_url}/a2a/tasks/send"
+        ]
+    
+    def _task_from_response(self, task: Task, response_data: Dict[str, Any]) -> Task:
+        """
+        Convert a ``tasks/send`` response to a task.
         
+        Args:
+            task: The task that was sent
+            response_data: Parsed JSON response
+            
+        Returns:
+            The updated task with the agent's response
+        """
         # Parse the response
         result = response_data.get("result", {})
         
@@ -859,6 +867,59 @@ class A2AClient(BaseA2AClient):
             task.status = TaskStatus(state=TaskState.COMPLETED)
             return task
     
+    def _send_task(self, task, endpoint_override=None):
+        """
+        Send a task to the agent
+        
+        Args:
+            task: The task to send
+            endpoint_override: Optional override for the endpoint URL
+            
+        Returns:
+            The updated task with the agent's response
+        """
+        # Use the override if provided, otherwise use the standard endpoint
+        base_url = endpoint_override if endpoint_override else self.endpoint_url
+        request_data = self._task_request(task)
+        task_endpoints = self._task_endpoints(base_url)
+        
+        last_error = None
+        for endpoint in task_endpoints:
+            try:
+                response = self._http.post(
+                    endpoint,
+                    json=request_data,
+                    headers=self.headers,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                
+                # Check for content type and parse response
+                content_type = response.headers.get("Content-Type", "").lower()
+                if "application/json" in content_type:
+                    response_data = response.json()
+                else:
+                    # Try to parse as JSON anyway
+                    try:
+                        response_data = response.json()
+                    except json.JSONDecodeError:
+                        raise ValueError("Response is not valid JSON")
+                
+                # If we reach here, the request succeeded
+                break
+                    
+            except Exception as e:
+                last_error = e
+                continue
+        else:
+            # All task endpoints failed
+            if last_error:
+                raise last_error
+            else:
+                raise A2AConnectionError("No task endpoints available")
+        
+        return self._task_from_response(task, response_data)
+    
     def get_task(self, task_id, history_length=0):
         """
         Get a task by ID
@@ -889,7 +950,7 @@ class A2AClient(BaseA2AClient):
         
         for endpoint in endpoints:
             try:
-                response = requests.post(
+                response = self._http.post(
                     endpoint,
                     json=request_data,
                     headers=self.headers,
@@ -969,7 +1030,7 @@ class A2AClient(BaseA2AClient):
         
         for endpoint in endpoints:
             try:
-                response = requests.post(
+                response = self._http.post(
                     endpoint,
                     json=request_data,
                     headers=self.headers,
@@ -1046,29 +1107,140 @@ class A2AClient(BaseA2AClient):
         """
         Send a message to an A2A-compatible agent asynchronously.
         
+        Follows the same endpoint and protocol negotiation as
+        ``send_message`` using non-blocking HTTP requests.
+        
         Args:
             message: The A2A message to send
             
         Returns:
             The agent's response as an A2A message
         """
-        # Implement async version of send_message using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_message, message)
+        endpoints_to_try = self._message_endpoints()
+        
+        async with self._create_aiohttp_session() as session:
+            # First try A2A protocol style with tasks
+            for endpoint in endpoints_to_try:
+                try:
+                    task = self._create_task(message)
+                    result = await self._send_task_async(task, endpoint, session)
+                    self.endpoint_url = endpoint
+                    
+                    task_response = self._message_from_task(result, message)
+                    if task_response is not None:
+                        return task_response
+                except Exception:
+                    # This endpoint didn't work, try the next one
+                    continue
+            
+            # Then try direct message posting, standard format first
+            if not self._use_google_a2a:
+                for endpoint in endpoints_to_try:
+                    try:
+                        status, body = await self._post_async(session, endpoint, message.to_dict())
+                    except Exception:
+                        continue
+                    self.endpoint_url = endpoint
+                    
+                    if status >= 400:
+                        # If we detected Google A2A format, break to try Google format
+                        if self._detect_protocol_version(body):
+                            break
+                        continue
+                    
+                    try:
+                        return self._message_from_data(json.loads(body))
+                    except ValueError:
+                        if body.strip():
+                            return self._text_response(body.strip(), message)
+                        continue
+            
+            # Try with Google A2A format if needed
+            if self._use_google_a2a or self._protocol_detected:
+                for endpoint in endpoints_to_try:
+                    try:
+                        status, body = await self._post_async(
+                            session, endpoint, self._google_message_request(message))
+                    except Exception:
+                        continue
+                    self.endpoint_url = endpoint
+                    
+                    if status >= 400:
+                        continue
+                    
+                    try:
+                        return self._message_from_data(json.loads(body), google_request=True)
+                    except Exception:
+                        if body.strip():
+                            return self._text_response(body.strip(), message)
+                        continue
+        
+        # If we get here, all endpoints failed
+        return Message(
+            content=ErrorContent(message=f"Failed to communicate with agent at {self.endpoint_url}. Tried multiple endpoint variations."),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
     
     async def send_conversation_async(self, conversation: Conversation) -> Conversation:
         """
         Send a conversation to an A2A-compatible agent asynchronously.
         
+        Follows the same endpoint and protocol negotiation as
+        ``send_conversation`` using non-blocking HTTP requests.
+        
         Args:
             conversation: The conversation to send
             
         Returns:
             The updated conversation with the agent's response
         """
-        # Implement async version of send_conversation using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_conversation, conversation)
+        endpoints_to_try = list(dict.fromkeys([
+            self.endpoint_url,
+            self.endpoint_url.rstrip("/"),
+            f"{self.endpoint_url.rstrip('/')}/a2a",
+        ]))
+        
+        async with self._create_aiohttp_session() as session:
+            for use_google in (False, True):
+                if use_google and not (self._use_google_a2a or self._protocol_detected):
+                    break
+                if not use_google and self._use_google_a2a:
+                    continue
+                
+                payload = conversation.to_google_a2a() if use_google else conversation.to_dict()
+                for endpoint in endpoints_to_try:
+                    try:
+                        status, body = await self._post_async(session, endpoint, payload)
+                    except Exception:
+                        continue
+                    self.endpoint_url = endpoint
+                    
+                    if status >= 400:
+                        if not use_google and self._detect_protocol_version(body):
+                            break
+                        continue
+                    
+                    try:
+                        return self._conversation_from_data(json.loads(body))
+                    except Exception:
+                        text_content = body.strip()
+                        if text_content:
+                            # Add a response message to the conversation
+                            last_message = conversation.messages[-1] if conversation.messages else None
+                            conversation.create_text_message(
+                                text=text_content,
+                                role=MessageRole.AGENT,
+                                parent_message_id=last_message.message_id if last_message else None
+                            )
+                            return conversation
+                        continue
+        
+        # If we get here, all endpoints failed
+        error_msg = f"Failed to communicate with agent at {self.endpoint_url}. Tried multiple endpoint variations."
+        conversation.create_error_message(error_msg)
+        return conversation
     
     async def send_task_async(self, task: Task) -> Task:
         """
@@ -1080,9 +1252,70 @@ class A2AClient(BaseA2AClient):
         Returns:
             The updated task with the agent's response
         """
-        # Implement async version of _send_task using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._send_task, task)
+        async with self._create_aiohttp_session() as session:
+            return await self._send_task_async(task, session=session)
+    
+    async def _send_task_async(self, task: Task, endpoint_override=None, session=None) -> Task:
+        """
+        Send a task to the agent without blocking the event loop.
+        
+        Args:
+            task: The task to send
+            endpoint_override: Optional override for the endpoint URL
+            session: aiohttp session to send the request with
+            
+        Returns:
+            The updated task with the agent's response
+        """
+        base_url = endpoint_override if endpoint_override else self.endpoint_url
+        request_data = self._task_request(task)
+        
+        last_error = None
+        for endpoint in self._task_endpoints(base_url):
+            try:
+                status, body = await self._post_async(session, endpoint, request_data)
+                if status >= 400:
+                    raise A2AConnectionError(f"HTTP error {status}: {body}")
+                try:
+                    response_data = json.loads(body)
+                except json.JSONDecodeError:
+                    raise ValueError("Response is not valid JSON")
+                break
+            except Exception as e:
+                last_error = e
+                continue
+        else:
+            # All task endpoints failed
+            if last_error:
+                raise last_error
+            raise A2AConnectionError("No task endpoints available")
+        
+        return self._task_from_response(task, response_data)
+    
+    async def _post_async(self, session, endpoint: str, data: Dict[str, Any]):
+        """
+        POST JSON data with an aiohttp session.
+        
+        Args:
+            session: aiohttp session
+            endpoint: URL to post to
+            data: JSON payload
+            
+        Returns:
+            Tuple of HTTP status code and response body text
+        """
+        async with session.post(endpoint, json=data, headers=self.headers,
+                                timeout=self._aiohttp_timeout()) as response:
+            return response.status, await response.text()
+    
+    def _text_response(self, text: str, message: Message) -> Message:
+        """Wrap a plain text response in an agent message."""
+        return Message(
+            content=TextContent(text=text),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
     
     async def check_streaming_support(self) -> bool:
         """
@@ -1108,7 +1341,8 @@ class A2AClient(BaseA2AClient):
                 endpoint = f"{self.endpoint_url}/agent.json"
                 try:
                     async with self._create_aiohttp_session() as session:
-                        async with session.get(endpoint, headers=headers) as response:
+                        async with session.get(endpoint, headers=headers,
+                                               timeout=self._aiohttp_timeout()) as response:
                             if response.status == 200:
                                 data = await response.json(content_type=None)
                                 if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
@@ -1117,7 +1351,8 @@ class A2AClient(BaseA2AClient):
                     # Try alternate endpoint
                     endpoint = f"{self.endpoint_url}/a2a/agent.json"
                     async with self._create_aiohttp_session() as session:
-                        async with session.get(endpoint, headers=headers) as response:
+                        async with session.get(endpoint, headers=headers,
+                                               timeout=self._aiohttp_timeout()) as response:
                             if response.status == 200:
                                 data = await response.json(content_type=None)
                                 if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
@@ -1135,7 +1370,7 @@ class A2AClient(BaseA2AClient):
                 # Try the standard endpoint first
                 endpoint = f"{self.endpoint_url}/agent.json"
                 try:
-                    response = requests.get(endpoint, headers=headers, timeout=self.timeout)
+                    response = self._http.get(endpoint, headers=headers, timeout=self.timeout)
                     if response.status_code == 200:
                         data = response.json()
                         if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
@@ -1143,7 +1378,7 @@ class A2AClient(BaseA2AClient):
                 except:
                     # Try alternate endpoint
                     endpoint = f"{self.endpoint_url}/a2a/agent.json"
-                    response = requests.get(endpoint, headers=headers, timeout=self.timeout)
+                    response = self._http.get(endpoint, headers=headers, timeout=self.timeout)
                     if response.status_code == 200:
                         data = response.json()
                         if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
@@ -1157,10 +1392,27 @@ class A2AClient(BaseA2AClient):
         # Default to false if we couldn't determine streaming support
         return False
     
+    def _aiohttp_timeout(self):
+        """
+        Get the timeout of one aiohttp request.
+        
+        Passed on every request, since a pooled session carries the pool's
+        timeout rather than this client's.
+        
+        Returns:
+            An aiohttp.ClientTimeout
+        """
+        import aiohttp
+        return aiohttp.ClientTimeout(total=self.timeout)
+    
     def _create_aiohttp_session(self):
         """
         Create an aiohttp session for async HTTP requests.
         
+        With a session pool, the pool's session for the running loop is
+        borrowed and left open when the ``async with`` block exits; the
+        client's headers and timeout are passed on each request instead.
+        
         Returns:
             An aiohttp session
         
@@ -1169,6 +1421,9 @@ class A2AClient(BaseA2AClient):
         """
         try:
             import aiohttp
+            session_pool = getattr(self, "session_pool", None)
+            if session_pool is not None:
+                return session_pool.borrow_async_session()
             return aiohttp.ClientSession(
                 headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
@@ -1273,7 +1528,8 @@ class A2AClient(BaseA2AClient):
                         response = await session.post(
                             endpoint,
                             json=data,
-                            headers=headers
+                            headers=headers,
+                            timeout=self._aiohttp_timeout()
                         )
                         
                         # If we succeed, break out of the loop
@@ -1493,7 +1749,8 @@ class A2AClient(BaseA2AClient):
                         response = await session.post(
                             endpoint,
                             json=request_data,
-                            headers=headers
+                            headers=headers,
+                            timeout=self._aiohttp_timeout()
                         )
                         
                         # If we succeed, break out of the loop
@@ -0,0 +1,161 @@
+"""
+Shared, pooled HTTP sessions for clients and bridges.
+
+Creating a ``requests`` call or an ``aiohttp.ClientSession`` per request
+pays TCP (and TLS) connection setup every time. An ``HTTPSessionPool``
+keeps one ``requests.Session`` with a sized connection pool for
+synchronous callers and one ``aiohttp.ClientSession`` per event loop for
+async callers, so many clients and tools talking to the same hosts reuse
+their connections.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPSessionPool:
+    """
+    Pooled sync and async HTTP sessions.
+
+    aiohttp sessions are bound to the loop they were created on, so one is
+    kept per running loop and released once that loop is closed. Sessions handed out by the pool are owned by it;
+    callers must not close them.
+    """
+
+    def __init__(self, pool_size: int = 20, timeout: float = 30):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Maximum connections kept open per host
+            timeout: Default request timeout in seconds for async sessions
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session: Optional[requests.Session] = None
+        # Keyed by id(loop): a session references its loop, so the loop is
+        # held weakly here and its session dropped once it is closed or gone
+        self._async_sessions: Dict[int, Tuple["weakref.ref[asyncio.AbstractEventLoop]", Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared requests session, created on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def async_session(self):
+        """
+        Get the aiohttp session for the running event loop.
+
+        Returns:
+            An aiohttp.ClientSession owned by the pool
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+            ImportError: If aiohttp is not installed
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._evict_closed_loops()
+            entry = self._async_sessions.get(id(loop))
+            session = entry[1] if entry is not None and entry[0]() is loop else None
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit_per_host=self.pool_size),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                )
+                self._async_sessions[id(loop)] = (weakref.ref(loop), session)
+        return session
+
+    @contextlib.asynccontextmanager
+    async def borrow_async_session(self):
+        """
+        Borrow the running loop's aiohttp session for code written as
+        ``async with session``; the session is left open on exit.
+
+        Yields:
+            The pooled session
+        """
+        yield self.async_session()
+
+    async def aclose(self) -> None:
+        """Close the running loop's aiohttp session."""
+        with self._lock:
+            entry = self._async_sessions.pop(id(asyncio.get_running_loop()), None)
+        if entry is not None:
+            await entry[1].close()
+
+    def _evict_closed_loops(self) -> None:
+        """Drop and close the sessions of loops that are closed or gone; the lock must be held."""
+        for key, (loop_ref, session) in list(self._async_sessions.items()):
+            loop = loop_ref()
+            if loop is None or loop.is_closed():
+                del self._async_sessions[key]
+                _close_without_loop(session)
+
+    def close(self) -> None:
+        """
+        Close the requests session and the aiohttp sessions of closed loops.
+        Sessions of running loops are closed by ``aclose``.
+        """
+        with self._lock:
+            self._evict_closed_loops()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+def _close_without_loop(session: Any) -> None:
+    """
+    Close an aiohttp session whose event loop has closed.
+
+    With the loop closed, aiohttp only marks the session and its connector
+    closed and never suspends, so the close coroutine is run to completion
+    here without a loop.
+    """
+    closing = session.close()
+    try:
+        closing.send(None)
+    except StopIteration:
+        return
+    except Exception as e:
+        logger.debug(f"Error closing a session of a closed loop: {e}")
+    closing.close()
+
+
+_default_pool: Optional[HTTPSessionPool] = None
+_default_lock = threading.Lock()
+
+
+def get_session_pool() -> HTTPSessionPool:
+    """
+    Get the session pool shared by clients and bridges not given one.
+
+    Returns:
+        The process-wide default pool
+    """
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = HTTPSessionPool()
+    return _default_pool
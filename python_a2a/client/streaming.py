@@ -137,6 +137,9 @@ class StreamingClient(BaseA2AClient):
                 "Install aiohttp for better streaming support."
             )
 
+        # Without aiohttp the async methods fall back to blocking requests
+        self.native_async = self._has_aiohttp
+
         # Flag for checking if the agent supports streaming
         self._supports_streaming = None
 
@@ -29,7 +29,13 @@ except ImportError:
 from .a2a import to_a2a_server, to_langchain_agent
 
 # Import MCP conversions
-from .mcp import to_mcp_server, to_langchain_tool
+from .mcp import to_mcp_server, to_langchain_tool, clear_tool_listing_cache
+
+# Event loop and worker pool for running components
+from .runtime import LangChainRuntime
+
+# Micro-batching of concurrent invocations
+from .batching import BatchPolicy
 
 # Import exceptions
 from .exceptions import (
@@ -48,6 +54,11 @@ __all__ = [
     'to_langchain_agent', # Convert A2A agent to LangChain agent
     'to_mcp_server',     # Convert LangChain tools to MCP server
     'to_langchain_tool',  # Convert MCP tool to LangChain tool
+    'clear_tool_listing_cache',  # Forget cached MCP tool listings
+    
+    # Runtime
+    'LangChainRuntime',
+    'BatchPolicy',
     
     # Exceptions
     'LangChainIntegrationError',
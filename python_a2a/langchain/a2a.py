@@ -11,6 +11,9 @@ from typing import Any, Dict, List, Optional, Union, Callable, Type, Protocol, r
 
 logger = logging.getLogger(__name__)
 
+from .runtime import LangChainRuntime, get_runtime
+from .batching import BatchPolicy, InvocationBatcher, supports_batching
+
 # Import custom exceptions
 from .exceptions import (
     LangChainNotInstalledError,
@@ -85,12 +88,52 @@ class ChainLike(Protocol):
 
 
 class ComponentAdapter:
-    """Base adapter for LangChain components."""
+    """
+    Base adapter for LangChain components.
     
-    def __init__(self, component: Any):
-        """Initialize with a component."""
+    Synchronous component methods run in the runtime's dedicated thread
+    pool, never in the event loop's default executor. When batching is
+    enabled and the component has batch/abatch, adapters that invoke it
+    send their inputs through ``self.batcher``.
+    """
+    
+    def __init__(
+        self,
+        component: Any,
+        runtime: Optional[LangChainRuntime] = None,
+        batching: Union[bool, BatchPolicy, None] = None
+    ):
+        """
+        Initialize with a component.
+        
+        Args:
+            component: LangChain component to adapt
+            runtime: Runtime whose thread pool runs synchronous component
+                methods; defaults to the shared runtime
+            batching: True or a BatchPolicy to combine concurrent
+                invocations into batch calls; None or False to disable
+        """
         self.component = component
+        self.runtime = runtime or get_runtime()
         self.name = self._get_component_name()
+        self.batcher: Optional[InvocationBatcher] = None
+        if batching and supports_batching(component):
+            policy = batching if isinstance(batching, BatchPolicy) else None
+            self.batcher = InvocationBatcher(component, self.runtime, policy)
+    
+    async def _run_sync(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a synchronous component method in the runtime's thread pool."""
+        return await self.runtime.run_sync(func, *args, **kwargs)
+    
+    async def _iterate_sync(self, iterable: Any):
+        """Consume a synchronous stream in the thread pool, one chunk at a time."""
+        iterator = iter(iterable)
+        done = object()
+        while True:
+            chunk = await self._run_sync(next, iterator, done)
+            if chunk is done:
+                break
+            yield chunk
     
     def _get_component_name(self) -> str:
         """Get the name of the component."""
@@ -187,13 +230,13 @@ class InvocableAdapter(ComponentAdapter):
                     # Sync stream_invoke
                     try:
                         # Try with prepared input
-                        for chunk in self.component.stream_invoke(input_data):
+                        async for chunk in self._iterate_sync(self.component.stream_invoke(input_data)):
                             yield self._process_chunk(chunk)
                         return  # Successfully used stream_invoke
                     except (TypeError, ValueError):
                         # Try with simple dictionary input
                         if not isinstance(input_data, dict):
-                            for chunk in self.component.stream_invoke({"input": input_data}):
+                            async for chunk in self._iterate_sync(self.component.stream_invoke({"input": input_data})):
                                 yield self._process_chunk(chunk)
                             return  # Successfully used stream_invoke
             except Exception as e:
@@ -244,13 +287,13 @@ class InvocableAdapter(ComponentAdapter):
                     # Sync stream
                     try:
                         # Try with prepared input
-                        for chunk in self.component.stream(input_data):
+                        async for chunk in self._iterate_sync(self.component.stream(input_data)):
                             yield self._process_chunk(chunk)
                         return  # Successfully used stream
                     except (TypeError, ValueError):
                         # Try with simple dictionary input
                         if not isinstance(input_data, dict):
-                            for chunk in self.component.stream({"input": input_data}):
+                            async for chunk in self._iterate_sync(self.component.stream({"input": input_data})):
                                 yield self._process_chunk(chunk)
                             return  # Successfully used stream
             except Exception as e:
@@ -301,13 +344,13 @@ class InvocableAdapter(ComponentAdapter):
                     # Sync invoke_stream
                     try:
                         # Try with prepared input
-                        for chunk in self.component.invoke_stream(input_data):
+                        async for chunk in self._iterate_sync(self.component.invoke_stream(input_data)):
                             yield self._process_chunk(chunk)
                         return  # Successfully used invoke_stream
                     except (TypeError, ValueError):
                         # Try with simple dictionary input
                         if not isinstance(input_data, dict):
-                            for chunk in self.component.invoke_stream({"input": input_data}):
+                            async for chunk in self._iterate_sync(self.component.invoke_stream({"input": input_data})):
                                 yield self._process_chunk(chunk)
                             return  # Successfully used invoke_stream
             except Exception as e:
@@ -471,6 +514,15 @@ class InvocableAdapter(ComponentAdapter):
         Returns:
             The result from the component
         """
+        # Combine with concurrent invocations when batching
+        if self.batcher is not None:
+            try:
+                return await self.batcher.submit(input_data)
+            except (TypeError, ValueError):
+                if not isinstance(input_data, dict):
+                    return await self.batcher.submit({"input": input_data})
+                raise
+        
         # Check for ainvoke method first (async invoke)
         if hasattr(self.component, "ainvoke") and asyncio.iscoroutinefunction(self.component.ainvoke):
             # Try direct invocation
@@ -494,17 +546,12 @@ class InvocableAdapter(ComponentAdapter):
                 raise
         else:
             # Run synchronously in executor
-            loop = asyncio.get_event_loop()
             try:
-                return await loop.run_in_executor(
-                    None, lambda: self.component.invoke(input_data)
-                )
+                return await self._run_sync(lambda: self.component.invoke(input_data))
             except (TypeError, ValueError):
                 # Fall back to dict format if direct invocation fails
                 if not isinstance(input_data, dict):
-                    return await loop.run_in_executor(
-                        None, lambda: self.component.invoke({"input": input_data})
-                    )
+                    return await self._run_sync(lambda: self.component.invoke({"input": input_data}))
                 raise
     
     def _process_output(self, result: Any) -> str:
@@ -594,10 +641,7 @@ class AgentAdapter(ComponentAdapter):
             if asyncio.iscoroutinefunction(self.component.run):
                 result = await self.component.run(**{input_key: text})
             else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, lambda: self.component.run(**{input_key: text})
-                )
+                result = await self._run_sync(lambda: self.component.run(**{input_key: text}))
             
             # Handle various result formats
             if isinstance(result, str):
@@ -628,7 +672,7 @@ class AgentAdapter(ComponentAdapter):
                     async for chunk in self.component.stream(**{input_key: text}):
                         yield self._extract_chunk_content(chunk) 
                 else:
-                    for chunk in self.component.stream(**{input_key: text}):
+                    async for chunk in self._iterate_sync(self.component.stream(**{input_key: text})):
                         yield self._extract_chunk_content(chunk)
             except Exception as e:
                 logger.exception(f"Error streaming from agent '{self.name}': {e}")
@@ -677,7 +721,13 @@ class RunnableAdapter(ComponentAdapter):
         try:
             # First try invoke/ainvoke for modern LangChain Runnables
             if isinstance(self.component, Runnable) or hasattr(self.component, "invoke"):
-                if hasattr(self.component, "ainvoke") and asyncio.iscoroutinefunction(self.component.ainvoke):
+                if self.batcher is not None:
+                    # Combine with concurrent invocations
+                    try:
+                        result = await self.batcher.submit(text)
+                    except (TypeError, ValueError):
+                        result = await self.batcher.submit({"input": text})
+                elif hasattr(self.component, "ainvoke") and asyncio.iscoroutinefunction(self.component.ainvoke):
                     try:
                         # Try with direct input
                         result = await self.component.ainvoke(text)
@@ -686,16 +736,11 @@ class RunnableAdapter(ComponentAdapter):
                         result = await self.component.ainvoke({"input": text})
                 else:
                     # Use synchronous invoke
-                    loop = asyncio.get_event_loop()
                     try:
-                        result = await loop.run_in_executor(
-                            None, lambda: self.component.invoke(text)
-                        )
+                        result = await self._run_sync(lambda: self.component.invoke(text))
                     except (TypeError, ValueError):
                         # Try with dictionary input
-                        result = await loop.run_in_executor(
-                            None, lambda: self.component.invoke({"input": text})
-                        )
+                        result = await self._run_sync(lambda: self.component.invoke({"input": text}))
                 
                 # Extract result from various formats
                 if isinstance(result, str):
@@ -716,14 +761,11 @@ class RunnableAdapter(ComponentAdapter):
                     result = await self.component.run({"input": text})
             else:
                 # Run synchronously
-                loop = asyncio.get_event_loop()
                 try:
-                    result = await loop.run_in_executor(None, self.component.run, text)
+                    result = await self._run_sync(self.component.run, text)
                 except (TypeError, ValueError):
                     # Try with dictionary input
-                    result = await loop.run_in_executor(
-                        None, lambda: self.component.run({"input": text})
-                    )
+                    result = await self._run_sync(lambda: self.component.run({"input": text}))
             
             # Process result
             if result is None:
@@ -784,7 +826,7 @@ class RunnableAdapter(ComponentAdapter):
                                 yield self._extract_chunk_content(chunk)
                         else:
                             # Sync implementation
-                            for chunk in self.component.stream(text):
+                            async for chunk in self._iterate_sync(self.component.stream(text)):
                                 yield self._extract_chunk_content(chunk)
                         return  # Successfully used stream
                     except (TypeError, ValueError):
@@ -795,7 +837,7 @@ class RunnableAdapter(ComponentAdapter):
                                 yield self._extract_chunk_content(chunk)
                         else:
                             # Sync implementation
-                            for chunk in self.component.stream({"input": text}):
+                            async for chunk in self._iterate_sync(self.component.stream({"input": text})):
                                 yield self._extract_chunk_content(chunk)
                         return  # Successfully used stream
                 except Exception as e:
@@ -910,11 +952,11 @@ class RunnableAdapter(ComponentAdapter):
                     # Sync run_stream
                     try:
                         # Try with direct text
-                        for chunk in self.component.run_stream(text):
+                        async for chunk in self._iterate_sync(self.component.run_stream(text)):
                             yield self._extract_chunk_content(chunk)
                     except (TypeError, ValueError):
                         # Try with dictionary
-                        for chunk in self.component.run_stream({"input": text}):
+                        async for chunk in self._iterate_sync(self.component.run_stream({"input": text})):
                             yield self._extract_chunk_content(chunk)
                 return  # Successfully used run_stream
             except Exception as e:
@@ -987,10 +1029,7 @@ class LLMAdapter(ComponentAdapter):
                 if asyncio.iscoroutinefunction(self.component.predict):
                     result = await self.component.predict(text=text)
                 else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None, lambda: self.component.predict(text=text)
-                    )
+                    result = await self._run_sync(lambda: self.component.predict(text=text))
                 return result if result is not None else ""
             
             # Fall back to generate
@@ -998,10 +1037,7 @@ class LLMAdapter(ComponentAdapter):
                 if asyncio.iscoroutinefunction(self.component.generate):
                     generation = await self.component.generate([text])
                 else:
-                    loop = asyncio.get_event_loop()
-                    generation = await loop.run_in_executor(
-                        None, lambda: self.component.generate([text])
-                    )
+                    generation = await self._run_sync(lambda: self.component.generate([text]))
                 
                 # Extract text from generation
                 if hasattr(generation, "generations") and generation.generations:
@@ -1058,13 +1094,12 @@ class LLMAdapter(ComponentAdapter):
                             else:
                                 yield str(chunk)
                 else:
-                    # Handle synchronous stream method
-                    loop = asyncio.get_event_loop()
-                    # We need to wrap the generator in an async generator
+                    # Handle synchronous stream method, one chunk at a time
+                    # in the worker pool
                     try:
                         # Try the modern parameter format first (text=text)
                         stream_gen = self.component.stream(text=text)
-                        for chunk in stream_gen:
+                        async for chunk in self._iterate_sync(stream_gen):
                             # Extract text from chunk based on its type
                             if isinstance(chunk, str):
                                 yield chunk
@@ -1079,7 +1114,7 @@ class LLMAdapter(ComponentAdapter):
                     except (TypeError, ValueError):
                         # Fall back to direct input
                         stream_gen = self.component.stream(text)
-                        for chunk in stream_gen:
+                        async for chunk in self._iterate_sync(stream_gen):
                             # Extract text from chunk based on its type
                             if isinstance(chunk, str):
                                 yield chunk
@@ -1116,8 +1151,7 @@ class CallableAdapter(ComponentAdapter):
             if asyncio.iscoroutinefunction(self.component.__call__):
                 result = await self.component(text)
             else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, self.component, text)
+                result = await self._run_sync(self.component, text)
             
             # Process result
             if result is None:
@@ -1156,7 +1190,7 @@ class CallableAdapter(ComponentAdapter):
                             yield str(chunk)
                 else:
                     # Handle synchronous stream
-                    for chunk in self.component.stream(text):
+                    async for chunk in self._iterate_sync(self.component.stream(text)):
                         # Extract text from chunk
                         if isinstance(chunk, str):
                             yield chunk
@@ -1221,21 +1255,46 @@ class AdapterRegistry:
         """Register an adapter class."""
         self._adapters.append(adapter_class)
     
-    def get_adapter(self, component: Any) -> Optional[ComponentAdapter]:
+    def get_adapter(
+        self,
+        component: Any,
+        runtime: Optional[LangChainRuntime] = None,
+        batching: Union[bool, BatchPolicy, None] = None
+    ) -> Optional[ComponentAdapter]:
         """Get the first compatible adapter for a component."""
         for adapter_class in self._adapters:
-            adapter = adapter_class(component)
+            adapter = adapter_class(component, runtime, batching)
             if adapter.can_adapt():
                 return adapter
         return None
 
 
-def to_a2a_server(langchain_component: Any):
+def to_a2a_server(
+    langchain_component: Any,
+    runtime: Optional[LangChainRuntime] = None,
+    batching: Union[bool, BatchPolicy, None] = None
+):
     """
     Convert a LangChain component to an A2A server.
     
+    The component runs on the runtime's long-lived event loop, so async
+    components keep their loop-bound clients across requests. Synchronous
+    entry points (handle_message, handle_task) submit work to that loop;
+    handle_message_async and handle_task_async are the async entry points
+    for ASGI hosting, and run natively when the runtime uses the host's
+    loop.
+    
+    With batching enabled, requests that arrive within the policy's wait
+    window are combined into one batch/abatch call of the component; the
+    batch size histogram is available from ``server.batch_metrics()``.
+    
     Args:
         langchain_component: A LangChain component (agent, chain, LLM, etc.)
+        runtime: Event loop and thread pool to run the component on;
+            defaults to a shared runtime with a background loop
+        batching: True or a BatchPolicy to batch concurrent requests for
+            components with batch/abatch; None or False to invoke the
+            component once per request
         
     Returns:
         An A2A server instance that wraps the LangChain component
@@ -1254,7 +1313,7 @@ def to_a2a_server(langchain_component: Any):
         
         # Get adapter for the component
         registry = AdapterRegistry()
-        adapter = registry.get_adapter(langchain_component)
+        adapter = registry.get_adapter(langchain_component, runtime, batching)
         
         if not adapter:
             raise LangChainAgentConversionError(
@@ -1269,6 +1328,7 @@ def to_a2a_server(langchain_component: Any):
                 super().__init__()
                 self.component = component
                 self.adapter = adapter
+                self.runtime = adapter.runtime
                 self.name = adapter.name
                 
             def get_metadata(self):
@@ -1294,6 +1354,22 @@ def to_a2a_server(langchain_component: Any):
                 
                 return metadata
             
+            def batch_metrics(self):
+                """
+                Get batching metrics for the wrapped component.
+                
+                Returns:
+                    Request, batch and error counts and the batch size
+                    histogram, or None if batching is disabled
+                """
+                if self.adapter.batcher is None:
+                    return None
+                return self.adapter.batcher.metrics()
+            
+            def handle_message(self, message):
+                """Handle an incoming A2A message on the runtime's loop."""
+                return self.runtime.run(self.handle_message_async(message))
+            
             async def handle_message_async(self, message):
                 """Handle an incoming A2A message."""
                 # Extract text from message
@@ -1305,7 +1381,7 @@ def to_a2a_server(langchain_component: Any):
                     text = repr(message.content)
                 
                 # Process with adapter
-                result = await self.adapter.process_message(text)
+                result = await self.runtime.call(self.adapter.process_message(text))
                 
                 # Create response message
                 return Message(
@@ -1336,6 +1412,13 @@ def to_a2a_server(langchain_component: Any):
                 else:
                     text = repr(message.content)
                 
+                # The stream is produced on the runtime's loop, whichever
+                # loop the caller iterates it from
+                async for chunk in self.runtime.iterate(self._stream_chunks(text)):
+                    yield chunk
+            
+            async def _stream_chunks(self, text):
+                """Stream response chunks for a text query."""
                 # Check if the adapter has a process_stream method
                 if hasattr(self.adapter, "process_stream"):
                     try:
@@ -1374,7 +1457,7 @@ def to_a2a_server(langchain_component: Any):
                                     yield {"content": str(chunk)}
                         else:
                             # Sync streaming in async context
-                            for chunk in self.component.stream(text):
+                            async for chunk in self.adapter._iterate_sync(self.component.stream(text)):
                                 # Extract text and format as dictionary
                                 if isinstance(chunk, str):
                                     yield {"content": chunk}
@@ -1397,6 +1480,10 @@ def to_a2a_server(langchain_component: Any):
                     yield {"content": result}
             
             def handle_task(self, task):
+                """Process an A2A task on the runtime's loop."""
+                return self.runtime.run(self.handle_task_async(task))
+            
+            async def handle_task_async(self, task):
                 """Process an A2A task."""
                 # Extract text from task
                 message_data = task.message or {}
@@ -1418,7 +1505,7 @@ def to_a2a_server(langchain_component: Any):
                 
                 try:
                     # Process with adapter
-                    result = asyncio.run(self.adapter.process_message(text))
+                    result = await self.runtime.call(self.adapter.process_message(text))
                     
                     # Create response
                     task.artifacts = [{
@@ -1442,12 +1529,18 @@ def to_a2a_server(langchain_component: Any):
         raise LangChainAgentConversionError(f"Failed to convert LangChain component: {str(e)}")
 
 
-def to_langchain_agent(a2a_url):
+def to_langchain_agent(a2a_url, session_pool=None):
     """
     Create a LangChain agent that connects to an A2A agent.
     
+    The agent's client reuses pooled HTTP connections, and its async
+    methods (arun, ainvoke, _acall) use non-blocking HTTP rather than
+    running the blocking client in a thread.
+    
     Args:
         a2a_url: URL of the A2A agent
+        session_pool: Pooled HTTP sessions (an HTTPSessionPool); defaults
+            to the shared pool
         
     Returns:
         A LangChain agent that communicates with the A2A agent
@@ -1461,10 +1554,10 @@ def to_langchain_agent(a2a_url):
     
     try:
         # Import A2A client
-        from python_a2a.client import A2AClient
+        from python_a2a.client import A2AClient, get_session_pool
         
         # Create client to connect to A2A agent
-        client = A2AClient(a2a_url)
+        client = A2AClient(a2a_url, session_pool=session_pool or get_session_pool())
         
         # Create a simple non-Pydantic wrapper
         class A2AAgentWrapper:
@@ -1497,12 +1590,7 @@ def to_langchain_agent(a2a_url):
             
             async def arun(self, query):
                 """Run the agent asynchronously."""
-                query_text = self._extract_query(query)
-                if hasattr(self.client, 'ask_async'):
-                    return await self.client.ask_async(query_text)
-                else:
-                    loop = asyncio.get_event_loop()
-                    return await loop.run_in_executor(None, self.client.ask, query_text)
+                return await self.client.ask_async(self._extract_query(query))
             
             def _call(self, inputs):
                 """Legacy Chain interface."""
@@ -1522,6 +1610,11 @@ def to_langchain_agent(a2a_url):
                 result = self.run(query)
                 return {"output": result}
             
+            async def ainvoke(self, input_data, config=None, **kwargs):
+                """Modern LangChain async interface."""
+                result = await self.arun(input_data)
+                return {"output": result}
+            
             def _extract_query(self, input_data):
                 """Extract query from various input formats."""
                 if isinstance(input_data, str):
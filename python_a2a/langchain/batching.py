@@ -0,0 +1,194 @@
+"""
+Micro-batching for LangChain components served over A2A.
+
+Many LLM and embedding backends handle one ``batch``/``abatch`` call of N
+inputs far more efficiently than N single ``invoke`` calls. An
+``InvocationBatcher`` sits in front of an adapted component: invocations
+submitted on the runtime's loop within ``max_wait_ms`` of each other are
+combined into one batch call (sent early once ``max_batch_size`` inputs
+are waiting), and the results are scattered back to the waiting requests.
+"""
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .runtime import LangChainRuntime
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchPolicy:
+    """
+    How concurrent invocations of a component are batched.
+
+    Attributes:
+        max_batch_size: Maximum number of inputs in one batch call
+        max_wait_ms: Milliseconds the first input of a batch waits for more
+    """
+    max_batch_size: int = 16
+    max_wait_ms: float = 10.0
+
+
+def supports_batching(component: Any) -> bool:
+    """
+    Check whether a component has a batch or abatch method.
+
+    Args:
+        component: LangChain component
+
+    Returns:
+        True if the component can be invoked in batches
+    """
+    return callable(getattr(component, "abatch", None)) or callable(getattr(component, "batch", None))
+
+
+def _accepts_return_exceptions(method: Any) -> bool:
+    """Check whether a batch method takes LangChain's return_exceptions flag."""
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.name == "return_exceptions" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in parameters
+    )
+
+
+class InvocationBatcher:
+    """
+    Combines concurrent invocations of a component into batch calls.
+
+    The component's ``abatch`` is preferred; a synchronous ``batch`` runs
+    in the runtime's thread pool. With LangChain's ``return_exceptions``
+    flag an input that fails only fails its own request; batch methods
+    without it fail every request in the batch.
+    """
+
+    def __init__(
+        self,
+        component: Any,
+        runtime: LangChainRuntime,
+        policy: Optional[BatchPolicy] = None
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            component: Component with a batch or abatch method
+            runtime: Runtime whose thread pool runs a synchronous batch
+            policy: Batch size and wait limits; defaults to BatchPolicy()
+
+        Raises:
+            ValueError: If the component cannot be invoked in batches
+        """
+        if not supports_batching(component):
+            raise ValueError(f"{type(component).__name__} has no batch or abatch method")
+        self.component = component
+        self.runtime = runtime
+        self.policy = policy or BatchPolicy()
+
+        abatch = getattr(component, "abatch", None)
+        self._async = callable(abatch) and asyncio.iscoroutinefunction(abatch)
+        self._method = abatch if self._async else component.batch
+        self._return_exceptions = _accepts_return_exceptions(self._method)
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._stats = {"requests": 0, "batches": 0, "errors": 0}
+        # Number of batches of each size
+        self._batch_sizes: Dict[int, int] = {}
+
+    async def submit(self, input_data: Any) -> Any:
+        """
+        Queue an input for the next batch and wait for its result.
+
+        Args:
+            input_data: Input for the component
+
+        Returns:
+            The component's output for this input
+
+        Raises:
+            Exception: Whatever the component raised for this input, or for
+                the whole batch
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((input_data, future))
+        self._stats["requests"] += 1
+
+        if len(self._pending) >= self.policy.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.policy.max_wait_ms / 1000, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Send the queued inputs now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Send any queued inputs and wait for in-flight batches."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get batching metrics.
+
+        Returns:
+            Request, batch and error counts, and ``batch_sizes``, a
+            histogram mapping each batch size to its number of batches
+        """
+        return dict(self._stats, batch_sizes=dict(sorted(self._batch_sizes.items())))
+
+    async def _call(self, inputs: List[Any]) -> List[Any]:
+        """Invoke the component once for a list of inputs."""
+        kwargs = {"return_exceptions": True} if self._return_exceptions else {}
+        if self._async:
+            return await self._method(inputs, **kwargs)
+        return await self.runtime.run_sync(self._method, inputs, **kwargs)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Make one batch call and resolve the callers' futures."""
+        size = len(batch)
+        self._stats["batches"] += 1
+        self._batch_sizes[size] = self._batch_sizes.get(size, 0) + 1
+
+        try:
+            results = list(await self._call([input_data for input_data, _ in batch]))
+            if len(results) != size:
+                raise RuntimeError(
+                    f"Batch call returned {len(results)} results for {size} inputs")
+        except Exception as e:
+            logger.debug(f"Batch of {size} failed: {e}")
+            results = [e] * size
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                self._stats["errors"] += 1
+            # The caller may have given up waiting
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -8,8 +8,11 @@ import logging
 import asyncio
 import inspect
 import json
-import requests
-from typing import Any, Dict, List, Optional, Union, Callable, Type, get_type_hints
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Type, get_type_hints
+
+from ..client.sessions import HTTPSessionPool, get_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -360,9 +363,20 @@ def to_mcp_server(langchain_tools):
                             except Exception as e:
                                 logger.debug(f"Error analyzing func signature: {e}")
                         
-                        # Try using func directly first if available
+                        # Await a natively async implementation first
                         result = None
-                        if hasattr(current_tool, "func") and callable(current_tool.func):
+                        coroutine = getattr(current_tool, "coroutine", None)
+                        if callable(coroutine):
+                            try:
+                                if isinstance(input_data, dict):
+                                    result = await coroutine(**input_data)
+                                else:
+                                    result = await coroutine(input_data)
+                            except Exception as e:
+                                logger.debug(f"Error using coroutine directly: {e}")
+                        
+                        # Then try using func directly if available
+                        if result is None and hasattr(current_tool, "func") and callable(current_tool.func):
                             loop = asyncio.get_event_loop()
                             try:
                                 if isinstance(input_data, dict):
@@ -450,13 +464,137 @@ def to_mcp_server(langchain_tools):
         raise LangChainToolConversionError(f"Failed to convert LangChain tools: {str(e)}")
 
 
-def to_langchain_tool(mcp_url, tool_name=None):
+# Tool listings per MCP server URL: url -> (expiry time, tools)
+_tool_listings: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_tool_listings_lock = threading.Lock()
+
+
+def get_tool_listing(
+    mcp_url: str,
+    session_pool: Optional[HTTPSessionPool] = None,
+    ttl: float = 60.0
+) -> List[Dict[str, Any]]:
+    """
+    Get the tools of an MCP server, reusing a listing fetched within ttl.
+    
+    Args:
+        mcp_url: URL of the MCP server
+        session_pool: Pooled HTTP sessions; defaults to the shared pool
+        ttl: Seconds a fetched listing stays valid, 0 to always fetch
+        
+    Returns:
+        Tool metadata dictionaries as returned by the server's /tools
+        
+    Raises:
+        MCPToolConversionError: If the listing cannot be fetched
+    """
+    now = time.monotonic()
+    with _tool_listings_lock:
+        entry = _tool_listings.get(mcp_url)
+    if entry is not None and entry[0] > now:
+        return list(entry[1])
+    
+    pool = session_pool or get_session_pool()
+    try:
+        tools_response = pool.session.get(f"{mcp_url}/tools", timeout=pool.timeout)
+        if tools_response.status_code != 200:
+            raise MCPToolConversionError(f"Failed to get tools from MCP server: {tools_response.status_code}")
+        
+        available_tools = tools_response.json()
+        logger.info(f"Found {len(available_tools)} tools on MCP server")
+    except Exception as e:
+        logger.error(f"Error getting tools from MCP server: {e}")
+        raise MCPToolConversionError(f"Failed to get tools from MCP server: {str(e)}")
+    
+    if ttl > 0:
+        with _tool_listings_lock:
+            _tool_listings[mcp_url] = (now + ttl, available_tools)
+    return list(available_tools)
+
+
+def clear_tool_listing_cache(mcp_url: Optional[str] = None) -> None:
+    """
+    Forget cached tool listings.
+    
+    Args:
+        mcp_url: Server whose listing to forget, None for all servers
+    """
+    with _tool_listings_lock:
+        if mcp_url is None:
+            _tool_listings.clear()
+        else:
+            _tool_listings.pop(mcp_url, None)
+
+
+def _tool_arguments(args: Tuple[Any, ...], kwargs: Dict[str, Any], parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build MCP tool arguments from a LangChain tool call's arguments."""
+    # Handle different input patterns
+    if len(args) == 1 and not kwargs:
+        input_value = args[0]
+        
+        # If the input looks like a parameter=value string (for multi-param tools)
+        if '=' in input_value and not input_value.startswith('{'):
+            # Parse simple param=value&param2=value2 format
+            params = {}
+            for pair in input_value.split('&'):
+                if '=' in pair:
+                    k, v = pair.split('=', 1)
+                    params[k.strip()] = v.strip()
+            if params:
+                kwargs = params
+        # Try to detect parameter format based on tool parameters
+        elif parameters and len(parameters) == 1:
+            # Single parameter case - use the parameter name from tool info
+            param_name = parameters[0]["name"]
+            kwargs = {param_name: input_value}
+        else:
+            # Default to 'input' parameter
+            kwargs = {"input": input_value}
+    return kwargs
+
+
+def _tool_response_text(status: int, body: str) -> str:
+    """Turn an MCP tool call's HTTP response into the LangChain tool's output."""
+    if status != 200:
+        return f"Error: HTTP {status} - {body}"
+    
+    # Parse the response
+    result = json.loads(body)
+    
+    # Process error in response
+    if "error" in result:
+        return f"Error: {result['error']}"
+    
+    # Process content in response
+    if "content" in result:
+        content = result.get("content", [])
+        if content and isinstance(content, list) and "text" in content[0]:
+            return content[0]["text"]
+    
+    # If no structured content, return the raw result
+    return str(result)
+
+
+def to_langchain_tool(
+    mcp_url,
+    tool_name=None,
+    session_pool: Optional[HTTPSessionPool] = None,
+    cache_ttl: float = 60.0
+):
     """
     Convert MCP server tool(s) to LangChain tool(s).
     
+    The tools call the server through pooled HTTP sessions, a requests
+    session when run synchronously and an aiohttp session when run
+    asynchronously, so they reuse connections instead of opening one per
+    call. The server's tool listing is cached per URL.
+    
     Args:
         mcp_url: URL of the MCP server
         tool_name: Optional specific tool to convert (if None, converts all tools)
+        session_pool: Pooled HTTP sessions; defaults to the shared pool
+        cache_ttl: Seconds to reuse the server's tool listing, 0 to always
+            fetch it
     
     Returns:
         LangChain tool or list of tools
@@ -478,24 +616,20 @@ def to_langchain_tool(mcp_url, tool_name=None):
     try:
         # Try to import Tool from various possible locations in LangChain
         try:
-            from langchain.tools import Tool
+            from langchain_core.tools import Tool
         except ImportError:
             try:
-                from langchain.agents import Tool
+                from langchain.tools import Tool
             except ImportError:
-                raise ImportError("Cannot import Tool class from LangChain")
+                try:
+                    from langchain.agents import Tool
+                except ImportError:
+                    raise ImportError("Cannot import Tool class from LangChain")
+        
+        pool = session_pool or get_session_pool()
         
         # Get available tools from MCP server
-        try:
-            tools_response = requests.get(f"{mcp_url}/tools")
-            if tools_response.status_code != 200:
-                raise MCPToolConversionError(f"Failed to get tools from MCP server: {tools_response.status_code}")
-            
-            available_tools = tools_response.json()
-            logger.info(f"Found {len(available_tools)} tools on MCP server")
-        except Exception as e:
-            logger.error(f"Error getting tools from MCP server: {e}")
-            raise MCPToolConversionError(f"Failed to get tools from MCP server: {str(e)}")
+        available_tools = get_tool_listing(mcp_url, pool, cache_ttl)
         
         # Filter tools if a specific tool is requested
         if tool_name is not None:
@@ -513,73 +647,45 @@ def to_langchain_tool(mcp_url, tool_name=None):
             
             logger.info(f"Creating LangChain tool for MCP tool: {name}")
             
-            # Create function to call the MCP tool
-            def create_tool_func(tool_name):
+            # Create functions to call the MCP tool over the pooled sessions
+            def create_tool_funcs(tool_name, parameters):
                 # Need this wrapper to properly capture tool_name in closure
+                url = f"{mcp_url}/tools/{tool_name}"
+                
                 def tool_func(*args, **kwargs):
                     """Call MCP tool function"""
                     try:
-                        # Handle different input patterns
-                        if len(args) == 1 and not kwargs:
-                            input_value = args[0]
-                            
-                            # If the input looks like a parameter=value string (for multi-param tools)
-                            if '=' in input_value and not input_value.startswith('{'):
-                                # Parse simple param=value&param2=value2 format
-                                params = {}
-                                for pair in input_value.split('&'):
-                                    if '=' in pair:
-                                        k, v = pair.split('=', 1)
-                                        params[k.strip()] = v.strip()
-                                if params:
-                                    kwargs = params
-                            # Try to detect parameter format based on tool parameters
-                            elif parameters and len(parameters) == 1:
-                                # Single parameter case - use the parameter name from tool info
-                                param_name = parameters[0]["name"]
-                                kwargs = {param_name: input_value}
-                            else:
-                                # Default to 'input' parameter
-                                kwargs = {"input": input_value}
-                        
-                        # Call the MCP tool
-                        response = requests.post(
-                            f"{mcp_url}/tools/{tool_name}",
-                            json=kwargs
+                        response = pool.session.post(
+                            url,
+                            json=_tool_arguments(args, kwargs, parameters),
+                            timeout=pool.timeout
                         )
-                        
-                        if response.status_code != 200:
-                            return f"Error: HTTP {response.status_code} - {response.text}"
-                        
-                        # Parse the response
-                        result = response.json()
-                        
-                        # Process error in response
-                        if "error" in result:
-                            return f"Error: {result['error']}"
-                        
-                        # Process content in response
-                        if "content" in result:
-                            content = result.get("content", [])
-                            if content and isinstance(content, list) and "text" in content[0]:
-                                return content[0]["text"]
-                        
-                        # If no structured content, return the raw result
-                        return str(result)
+                        return _tool_response_text(response.status_code, response.text)
+                    except Exception as e:
+                        logger.exception(f"Error calling MCP tool {tool_name}")
+                        return f"Error calling tool: {str(e)}"
+                
+                async def atool_func(*args, **kwargs):
+                    """Call MCP tool function without blocking the event loop"""
+                    try:
+                        session = pool.async_session()
+                        async with session.post(url, json=_tool_arguments(args, kwargs, parameters)) as response:
+                            return _tool_response_text(response.status, await response.text())
                     except Exception as e:
                         logger.exception(f"Error calling MCP tool {tool_name}")
                         return f"Error calling tool: {str(e)}"
                 
-                return tool_func
+                return tool_func, atool_func
             
             # Create the tool with a function that properly handles tool name in closure
-            tool_func = create_tool_func(name)
+            tool_func, atool_func = create_tool_funcs(name, parameters)
             
-            # Create the LangChain tool
+            # Create the LangChain tool; the coroutine backs its async _arun
             lc_tool = Tool(
                 name=name,
                 description=description,
-                func=tool_func
+                func=tool_func,
+                coroutine=atool_func
             )
             
             # Add metadata if applicable
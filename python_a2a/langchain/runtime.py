@@ -0,0 +1,223 @@
+"""
+Event loop and worker pool for running LangChain components.
+
+LangChain components are driven from synchronous A2A entry points (the
+Flask routes) as well as from async hosts. Running each request under its
+own ``asyncio.run`` creates and tears down an event loop per request and
+breaks async components that cache loop-bound clients such as HTTP
+connection pools. A ``LangChainRuntime`` instead owns one long-lived loop,
+running in a background thread or borrowed from an ASGI host, and a
+dedicated, sized thread pool for the components' synchronous methods.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LangChainRuntime:
+    """
+    Long-lived event loop and thread pool shared by LangChain adapters.
+
+    Without a ``loop``, the runtime starts a daemon thread running its own
+    loop on first use. With one, typically the loop of an ASGI server, work
+    submitted from other threads runs on that loop and async entry points
+    called on it run natively.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the runtime.
+
+        Args:
+            loop: Event loop to run components on, None to start a
+                background loop
+            max_workers: Size of the thread pool for synchronous component
+                methods; defaults to min(32, CPU count + 4)
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._loop = loop
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop, started on first use."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+
+                    def run():
+                        asyncio.set_event_loop(loop)
+                        loop.call_soon(ready.set)
+                        loop.run_forever()
+
+                    self._thread = threading.Thread(
+                        target=run, name="langchain-runtime", daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for synchronous component methods."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="langchain-worker"
+                    )
+        return self._executor
+
+    def _on_loop(self) -> bool:
+        """Check whether the caller is running on the runtime's loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runtime's loop from synchronous code.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the runtime's own loop, which would
+                deadlock; await the coroutine there instead
+            concurrent.futures.TimeoutError: If the timeout expires
+        """
+        if self._on_loop():
+            coro.close()
+            raise RuntimeError("LangChainRuntime.run() cannot be called from the runtime's loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def call(self, coro: Awaitable[Any]) -> Any:
+        """
+        Await a coroutine on the runtime's loop from any loop.
+
+        On the runtime's loop the coroutine is awaited directly; from
+        another loop it is run on the runtime's loop and its result awaited.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        if self._on_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    async def iterate(self, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """
+        Consume an async iterator on the runtime's loop from any loop.
+
+        Args:
+            stream: Async iterator, such as a component's astream()
+
+        Yields:
+            The iterator's items
+        """
+        if self._on_loop():
+            async for item in stream:
+                yield item
+            return
+
+        iterator = stream.__aiter__()
+        done = object()
+
+        async def step():
+            try:
+                return await iterator.__anext__()
+            except StopAsyncIteration:
+                return done
+
+        try:
+            while True:
+                item = await self.call(step())
+                if item is done:
+                    break
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await self.call(aclose())
+
+    async def run_sync(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a synchronous function in the runtime's thread pool.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the background loop, if the runtime started one, and the pool.
+
+        Args:
+            wait: Wait for running work to finish
+        """
+        with self._lock:
+            if self._thread is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                if wait:
+                    self._thread.join()
+                    self._loop.close()
+                self._loop = None
+                self._thread = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+_default_runtime: Optional[LangChainRuntime] = None
+_default_lock = threading.Lock()
+
+
+def get_runtime() -> LangChainRuntime:
+    """
+    Get the runtime shared by LangChain adapters that were not given one.
+
+    Returns:
+        The process-wide default runtime
+    """
+    global _default_runtime
+    if _default_runtime is None:
+        with _default_lock:
+            if _default_runtime is None:
+                _default_runtime = LangChainRuntime()
+    return _default_runtime
@@ -54,6 +54,18 @@ from .server import (
     MCPPrompt
 )
 
+# Handler execution policy (thread/process pools, limits, timeouts)
+from .execution import ToolExecutor
+
+# Client-side JSON-RPC request batching
+from .batching import RequestBatcher
+
+# Out-of-band storage for large binary results
+from .blobs import BlobStore, read_blob
+
+# Result caching and coalescing for idempotent tools
+from .caching import ToolResultCache
+
 # MCP Connection and lifecycle management (new, spec-compliant)
 from .connection import (
     MCPConnection,
@@ -107,6 +119,9 @@ from .server_config import (
     ServerConfig,
     MCPServerRunner, 
     MCPServerManager,
+    MCPServerPool,
+    acquire_server_pool,
+    release_server_pool,
     create_github_config,
     create_filesystem_config
 )
@@ -182,9 +197,14 @@ __all__ = [
     "MCPResource", 
     "MCPPrompt",
     "MCPMessageHandler",
+    "ToolExecutor",
+    "BlobStore",
+    "ToolResultCache",
     
     # Client components
     "MCPClientHandler",
+    "RequestBatcher",
+    "read_blob",
     
     # Content creation helpers
     "create_text_content",
@@ -202,6 +222,9 @@ __all__ = [
     "ServerConfig",
     "MCPServerRunner",
     "MCPServerManager", 
+    "MCPServerPool",
+    "acquire_server_pool",
+    "release_server_pool",
     "create_github_config",
     "create_filesystem_config",
     
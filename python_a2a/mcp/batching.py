@@ -0,0 +1,124 @@
+"""
+Request coalescing for MCP clients.
+
+Concurrent requests submitted within a short window are sent to the server
+as one JSON-RPC batch. Responses are matched back to their callers by
+request id, so many calls can be in flight over a single stdio pipe or
+HTTP session.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RequestBatcher:
+    """
+    Coalesces concurrent requests into JSON-RPC batches.
+
+    The first request starts a timer of ``window`` seconds; every request
+    submitted before it fires joins the same batch. A batch is sent early
+    when it reaches ``max_batch_size``. A batch of one request is sent as a
+    plain request, so servers without batch support keep working for
+    sequential callers.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Awaitable[Any]],
+        send_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        window: float = 0.005,
+        max_batch_size: int = 50
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            send: Sends one request and returns its response
+            send_batch: Sends a list of requests as one batch and returns
+                their responses in request order; an exception in the list
+                fails only that request
+            window: Seconds to wait for more requests before sending a batch
+            max_batch_size: Maximum number of requests in one batch
+        """
+        self._send = send
+        self._send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    async def submit(self, request: Any) -> Any:
+        """
+        Queue a request for the next batch and wait for its response.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            The request's response
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        self.stats["requests"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Send the queued requests now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Send any queued requests and wait for in-flight batches."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Send a batch and resolve the callers' futures."""
+        requests = [request for request, _ in batch]
+        self.stats["batches"] += 1
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+
+        try:
+            if len(requests) == 1:
+                results = [await self._send(requests[0])]
+            else:
+                results = await self._send_batch(requests)
+        except Exception as e:
+            results = [e] * len(batch)
+
+        if len(results) < len(batch):
+            missing = RuntimeError("No response received for batched request")
+            results = list(results) + [missing] * (len(batch) - len(results))
+
+        for (_, future), result in zip(batch, results):
+            # The caller may have given up waiting
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,422 @@
+"""
+Out-of-band storage for large binary MCP results.
+
+Inline image and blob content is base64-encoded into the JSON-RPC message,
+which makes it a third larger and copies it several times on its way to
+the wire. A ``BlobStore`` keeps large payloads out of the message instead:
+the bytes are stored under their SHA-256 digest and the content item is
+replaced with a ``resource_link`` to ``blob://sha256/<digest>``. Clients
+fetch the bytes only when they need them, in chunks over HTTP or straight
+from the store when they share the host.
+"""
+
+import base64
+import binascii
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# URI scheme for stored blobs; the digest follows the prefix
+BLOB_URI_PREFIX = "blob://sha256/"
+
+# Content item types that carry binary data in a "data" field
+BINARY_CONTENT_TYPES = ("image", "audio", "blob")
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def blob_digest(key: str) -> str:
+    """
+    Get the digest from a blob URI or digest.
+
+    Args:
+        key: Blob URI or hex SHA-256 digest
+
+    Returns:
+        Hex SHA-256 digest
+
+    Raises:
+        ValueError: If the key is not a valid blob URI or digest
+    """
+    digest = key[len(BLOB_URI_PREFIX):] if key.startswith(BLOB_URI_PREFIX) else key
+    if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+        raise ValueError(f"Invalid blob reference: {key}")
+    return digest
+
+
+@dataclass
+class BlobInfo:
+    """Metadata for a stored blob."""
+
+    digest: str
+    size: int
+    mime_type: str = "application/octet-stream"
+    created: float = field(default_factory=time.time)
+
+    @property
+    def uri(self) -> str:
+        """Resource URI of the blob."""
+        return BLOB_URI_PREFIX + self.digest
+
+    def to_content(self) -> Dict[str, Any]:
+        """Convert to a resource link content item."""
+        return {
+            "type": "resource_link",
+            "uri": self.uri,
+            "name": self.digest[:16],
+            "mimeType": self.mime_type,
+            "size": self.size
+        }
+
+
+class BlobStore:
+    """
+    Content-addressed store for binary payloads.
+
+    Blobs are kept in memory, or as files in ``directory`` (ideally on a
+    tmpfs such as /dev/shm) and read back through mmap. Identical payloads
+    are stored once. When the store grows beyond ``max_bytes`` the least
+    recently used blobs are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        chunk_size: int = 1024 * 1024
+    ):
+        """
+        Initialize the blob store.
+
+        Args:
+            directory: Directory for blob files, None to keep blobs in memory
+            max_bytes: Maximum total size of stored blobs
+            chunk_size: Default chunk size for streaming reads
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self._blobs: "OrderedDict[str, BlobInfo]" = OrderedDict()
+        self._data: Dict[str, bytes] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"puts": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def __contains__(self, key: str) -> bool:
+        return self.info(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def size(self) -> int:
+        """Total size of stored blobs in bytes."""
+        return self._size
+
+    def put(self, data: BytesLike, mime_type: str = "application/octet-stream") -> BlobInfo:
+        """
+        Store a payload.
+
+        Args:
+            data: Payload bytes
+            mime_type: MIME type of the payload
+
+        Returns:
+            Metadata of the stored blob
+
+        Raises:
+            ValueError: If the payload is larger than the store
+        """
+        size = len(data)
+        if size > self.max_bytes:
+            raise ValueError(f"Blob of {size} bytes exceeds store limit of {self.max_bytes} bytes")
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self.stats["puts"] += 1
+            info = self._blobs.get(digest)
+            if info is not None:
+                self._blobs.move_to_end(digest)
+                return info
+
+            if self.directory is None:
+                self._data[digest] = bytes(data)
+            else:
+                self._write_file(digest, data)
+
+            info = BlobInfo(digest=digest, size=size, mime_type=mime_type)
+            self._blobs[digest] = info
+            self._size += size
+            self._evict()
+            return info
+
+    def info(self, key: str) -> Optional[BlobInfo]:
+        """
+        Get a blob's metadata.
+
+        For a directory store, blob files written by another process on
+        the same host are found as well.
+
+        Args:
+            key: Blob URI or digest
+
+        Returns:
+            Blob metadata, or None if the blob is not stored
+        """
+        digest = blob_digest(key)
+        with self._lock:
+            info = self._blobs.get(digest)
+            if info is not None:
+                self._blobs.move_to_end(digest)
+                return info
+
+        if self.directory is not None:
+            try:
+                size = os.path.getsize(self._path(digest))
+            except OSError:
+                return None
+            return BlobInfo(digest=digest, size=size)
+        return None
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """
+        Get a blob's bytes without copying them.
+
+        Args:
+            key: Blob URI or digest
+
+        Returns:
+            Read-only view of the blob, or None if the blob is not stored
+        """
+        digest = blob_digest(key)
+        if self.directory is None:
+            data = self._data.get(digest)
+            if data is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            with self._lock:
+                if digest in self._blobs:
+                    self._blobs.move_to_end(digest)
+            return memoryview(data)
+
+        try:
+            with open(self._path(digest), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                # The mapping stays valid after the file is closed or evicted
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)) if size else memoryview(b"")
+        except OSError:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return view
+
+    def iter_chunks(
+        self,
+        key: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Read a blob, or a byte range of it, in chunks.
+
+        Args:
+            key: Blob URI or digest
+            start: First byte to read
+            end: Byte after the last one to read, defaults to the blob size
+            chunk_size: Chunk size, defaults to the store's chunk size
+
+        Yields:
+            Consecutive chunks of the blob
+
+        Raises:
+            KeyError: If the blob is not stored
+        """
+        view = self.get(key)
+        if view is None:
+            raise KeyError(key)
+        end = len(view) if end is None else min(end, len(view))
+        chunk_size = chunk_size or self.chunk_size
+        for offset in range(start, end, chunk_size):
+            yield bytes(view[offset:min(offset + chunk_size, end)])
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a blob.
+
+        Args:
+            key: Blob URI or digest
+
+        Returns:
+            True if the blob was stored
+        """
+        digest = blob_digest(key)
+        with self._lock:
+            return self._remove(digest)
+
+    def clear(self) -> None:
+        """Remove all blobs."""
+        with self._lock:
+            for digest in list(self._blobs):
+                self._remove(digest)
+
+    def _evict(self) -> None:
+        """Evict least recently used blobs until the store fits its limit."""
+        while self._size > self.max_bytes and len(self._blobs) > 1:
+            digest = next(iter(self._blobs))
+            self._remove(digest)
+            self.stats["evictions"] += 1
+
+    def _remove(self, digest: str) -> bool:
+        """Remove a blob; the caller holds the lock."""
+        info = self._blobs.pop(digest, None)
+        if info is None:
+            return False
+        self._size -= info.size
+        if self.directory is None:
+            self._data.pop(digest, None)
+        else:
+            try:
+                os.unlink(self._path(digest))
+            except OSError:
+                pass
+        return True
+
+    def _path(self, digest: str) -> str:
+        """Get the file path of a blob."""
+        return os.path.join(self.directory, digest)
+
+    def _write_file(self, digest: str, data: BytesLike) -> None:
+        """Write a blob file atomically so readers never see partial data."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(digest))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def offload_content(
+    content: List[Dict[str, Any]],
+    store: BlobStore,
+    threshold: int
+) -> List[Dict[str, Any]]:
+    """
+    Move large binary content items into a blob store.
+
+    Image, audio and blob items whose payload is at least ``threshold``
+    bytes are replaced by resource links; other items are kept as they are.
+    Payloads may be raw bytes or base64 strings.
+
+    Args:
+        content: Response content items
+        store: Store for the payloads
+        threshold: Minimum payload size in bytes to offload
+
+    Returns:
+        Content items with large payloads replaced by resource links
+    """
+    result = []
+    for item in content:
+        data = item.get("data") if isinstance(item, dict) else None
+        if data is None or item.get("type") not in BINARY_CONTENT_TYPES:
+            result.append(item)
+            continue
+
+        if isinstance(data, str):
+            # Base64 expands 3 bytes to 4 characters
+            if len(data) * 3 // 4 < threshold:
+                result.append(item)
+                continue
+            try:
+                data = base64.b64decode(data, validate=True)
+            except (binascii.Error, ValueError):
+                result.append(item)
+                continue
+        elif len(data) < threshold:
+            result.append(item)
+            continue
+
+        try:
+            info = store.put(data, item.get("mimeType", "application/octet-stream"))
+        except ValueError as e:
+            logger.warning(f"Keeping binary content inline: {e}")
+            result.append(item)
+            continue
+        result.append(info.to_content())
+    return result
+
+
+async def read_blob(
+    link: Union[str, Dict[str, Any]],
+    store: Optional[BlobStore] = None,
+    base_url: Optional[str] = None,
+    timeout: float = 30.0
+) -> bytes:
+    """
+    Fetch the bytes behind a blob resource link.
+
+    The local store is tried first, so a client on the same host as the
+    server reads the payload without going through HTTP. Otherwise the
+    blob is downloaded from the server's ``/blobs`` endpoint. The digest is
+    checked either way.
+
+    Args:
+        link: Resource link content item or blob URI
+        store: Blob store shared with the server, if any
+        base_url: Base URL of the server's HTTP endpoint
+        timeout: HTTP request timeout in seconds
+
+    Returns:
+        Blob bytes
+
+    Raises:
+        ValueError: If the link is invalid or the downloaded bytes do not
+            match the digest
+        KeyError: If the blob is not in the store and no base URL is given
+    """
+    uri = link["uri"] if isinstance(link, dict) else link
+    digest = blob_digest(uri)
+
+    if store is not None:
+        view = store.get(digest)
+        if view is not None:
+            return bytes(view)
+
+    if base_url is None:
+        raise KeyError(uri)
+
+    import httpx
+
+    hasher = hashlib.sha256()
+    chunks = []
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream("GET", f"{base_url.rstrip('/')}/blobs/{digest}") as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                hasher.update(chunk)
+                chunks.append(chunk)
+
+    if hasher.hexdigest() != digest:
+        raise ValueError(f"Downloaded blob does not match its digest: {uri}")
+    return b"".join(chunks)
@@ -0,0 +1,235 @@
+"""
+Result caching and request coalescing for idempotent MCP tools.
+
+Agents often repeat the same read-only tool call, such as reading a file or
+searching a repository, many times within one workflow. A
+``ToolResultCache`` keeps the results of tools declared cacheable for a
+time-to-live, keyed on the tool name and its canonical arguments, and lets
+concurrent identical calls share one in-flight request (single-flight).
+Calls to write tools invalidate the cached results they may have changed.
+
+The same cache is used server-side by FastMCP and MCPServer and
+client-side by the MCP clients and providers.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Invalidation target meaning every cached tool
+ALL_TOOLS = "*"
+
+CacheKey = Tuple[str, str]
+
+
+def canonical_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Serialize tool arguments so equal arguments give equal keys.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        JSON with sorted keys and no insignificant whitespace
+    """
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+class ToolResultCache:
+    """
+    TTL cache with single-flight for tool results.
+
+    Only tools configured with a TTL are cached or coalesced; other calls
+    pass straight through. Each caller gets its own copy of a cached or
+    shared result, so callers may modify it. A result that arrives after one of the invalidations it
+    races with is returned to its callers but not cached.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        invalidates: Optional[Dict[str, Iterable[str]]] = None,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: Seconds to cache the results of each cacheable tool
+            invalidates: For each write tool, the tools whose cached
+                results a call to it invalidates; "*" means all tools
+            max_entries: Maximum number of cached results
+        """
+        self.max_entries = max_entries
+        self._ttls: Dict[str, float] = {}
+        self._invalidates: Dict[str, Set[str]] = {}
+
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        # Bumped on invalidation so racing results are not cached
+        self._generations: Dict[str, int] = {}
+        self._generation_all = 0
+
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0, "evictions": 0}
+
+        for name, ttl in (ttls or {}).items():
+            self.configure(name, ttl=ttl)
+        for name, targets in (invalidates or {}).items():
+            self.configure(name, invalidates=targets)
+
+    def configure(
+        self,
+        name: str,
+        ttl: Optional[float] = None,
+        invalidates: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Set the caching policy of a tool.
+
+        Args:
+            name: Tool name
+            ttl: Seconds to cache the tool's results, None to not cache them
+            invalidates: Tools whose cached results a call to this tool
+                invalidates; "*" means all tools
+        """
+        if ttl:
+            self._ttls[name] = ttl
+        else:
+            self._ttls.pop(name, None)
+
+        if invalidates:
+            targets = {invalidates} if isinstance(invalidates, str) else set(invalidates)
+            self._invalidates[name] = targets
+        elif invalidates is not None:
+            self._invalidates.pop(name, None)
+
+    def is_cacheable(self, name: str) -> bool:
+        """Check whether a tool's results are cached."""
+        return name in self._ttls
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def call(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Call a tool through the cache.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            call: Makes the actual call
+            cacheable: Decides whether a result may be cached, e.g. to skip
+                error results; exceptions are never cached
+
+        Returns:
+            The tool's result, possibly cached or shared with a concurrent
+            identical call; cached and shared results are returned as copies,
+            so callers may modify them
+        """
+        ttl = self._ttls.get(name)
+        if ttl is None:
+            try:
+                return await call()
+            finally:
+                self.record_call(name)
+
+        key = (name, canonical_arguments(arguments))
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+            task = asyncio.ensure_future(self._fill(key, ttl, call, cacheable))
+            self._inflight[key] = task
+        # A cancelled caller must not cancel the call shared with others. The
+        # task's result is also the cached entry, so nobody gets it directly.
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _fill(
+        self,
+        key: CacheKey,
+        ttl: float,
+        call: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Make a call shared by all concurrent callers and cache its result."""
+        name = key[0]
+        generation = (self._generations.get(name, 0), self._generation_all)
+        try:
+            result = await call()
+        finally:
+            self._inflight.pop(key, None)
+
+        current = (self._generations.get(name, 0), self._generation_all)
+        if current == generation and (cacheable is None or cacheable(result)):
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return result
+
+    def record_call(self, name: str) -> None:
+        """
+        Run the invalidations configured for a tool after a call to it.
+
+        Calls made through ``call`` are recorded automatically.
+
+        Args:
+            name: Tool name
+        """
+        targets = self._invalidates.get(name)
+        if not targets:
+            return
+        if ALL_TOOLS in targets:
+            self.invalidate()
+        else:
+            for target in targets:
+                self.invalidate(target)
+
+    def invalidate(self, name: Optional[str] = None, arguments: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Drop cached results.
+
+        Args:
+            name: Tool whose results to drop, None for all tools
+            arguments: Only drop the result for these arguments
+
+        Returns:
+            Number of results dropped
+        """
+        self.stats["invalidations"] += 1
+        if name is None:
+            self._generation_all += 1
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+        self._generations[name] = self._generations.get(name, 0) + 1
+        if arguments is not None:
+            return 1 if self._entries.pop((name, canonical_arguments(arguments)), None) else 0
+
+        keys = [key for key in self._entries if key[0] == name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
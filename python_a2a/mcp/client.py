@@ -6,11 +6,15 @@ using JSON-RPC 2.0 as the wire protocol with support for stdio and SSE transport
 """
 
 import asyncio
+import inspect
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+from .batching import RequestBatcher
+from .caching import ToolResultCache
 from .client_transport import Transport, create_transport
 
 logger = logging.getLogger(__name__)
@@ -72,7 +76,10 @@ class MCPClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         auth: Optional[Dict[str, Any]] = None,
-        tools_ttl: int = 3600
+        tools_ttl: int = 3600,
+        batch_window: float = 0.0,
+        max_batch_size: int = 50,
+        tool_cache: Optional[ToolResultCache] = None
     ):
         """
         Initialize an MCP client.
@@ -86,6 +93,12 @@ class MCPClient:
             retry_delay: Initial delay between retries (legacy, not used)
             auth: Optional authentication configuration (legacy, applied to headers)
             tools_ttl: Time-to-live for tools cache in seconds
+            batch_window: If set, concurrent requests issued within this many
+                seconds are sent together as one JSON-RPC batch
+            max_batch_size: Maximum number of requests in one batch
+            tool_cache: Cache for the results of idempotent tools; calls to
+                tools it does not cache pass through, but still run its
+                invalidations
         """
         # Handle legacy auth parameter
         if auth and headers is None:
@@ -97,9 +110,29 @@ class MCPClient:
         self.transport = create_transport(
             url=server_url,
             command=command,
-            headers=headers
+            headers=headers,
+            timeout=timeout
         )
         
+        # Coalesces concurrent requests into batches when enabled
+        self._batcher = None
+        if batch_window > 0:
+            self._batcher = RequestBatcher(
+                lambda request: self.transport.send_request(request),
+                lambda requests: self.transport.send_batch(requests),
+                window=batch_window,
+                max_batch_size=max_batch_size
+            )
+        
+        # Tool results cached per tool name and arguments
+        self.tool_cache = tool_cache
+        
+        # Chunks of streamed tool calls, by progress token
+        self._progress_queues: Dict[str, asyncio.Queue] = {}
+        self._progress_tokens = itertools.count(1)
+        if hasattr(self.transport, "add_notification_handler"):
+            self.transport.add_notification_handler(self._handle_notification)
+        
         # State
         self.initialized = False
         self.server_info = None
@@ -192,22 +225,55 @@ class MCPClient:
         self.initialized = True
         logger.info(f"Initialized connection to MCP server: {self.server_info.name}")
     
-    async def _send_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a JSON-RPC request and wait for response."""
-        request = {
+    def _build_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a JSON-RPC request with the next id."""
+        return {
             "jsonrpc": "2.0",
             "id": self._next_id(),
             "method": method,
             "params": params
         }
+    
+    async def _send_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a JSON-RPC request and wait for response."""
+        request = self._build_request(method, params)
         
         try:
-            response = await self.transport.send_request(request)
+            # The handshake must complete before anything else is sent
+            if self._batcher is not None and self.initialized:
+                response = await self._batcher.submit(request)
+            else:
+                response = await self.transport.send_request(request)
             return response
         except Exception as e:
             logger.error(f"Error sending request {method}: {e}")
             raise MCPConnectionError(f"Failed to send request: {str(e)}")
     
+    async def _send_batch(self, calls: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Send several JSON-RPC requests as one batch.
+        
+        Args:
+            calls: Method and params for each request
+            
+        Returns:
+            Responses in call order, with an MCPConnectionError in place of
+            each response that could not be received
+        """
+        requests = [self._build_request(method, params) for method, params in calls]
+        
+        try:
+            responses = await self.transport.send_batch(requests)
+        except Exception as e:
+            logger.error(f"Error sending batch of {len(requests)} requests: {e}")
+            raise MCPConnectionError(f"Failed to send batch: {str(e)}")
+        
+        return [
+            MCPConnectionError(f"Failed to send request: {str(response)}")
+            if isinstance(response, BaseException) else response
+            for response in responses
+        ]
+    
     async def _send_notification(self, method: str, params: Dict[str, Any]):
         """Send a JSON-RPC notification (no response expected)."""
         notification = {
@@ -222,8 +288,19 @@ class MCPClient:
             logger.error(f"Error sending notification {method}: {e}")
             raise MCPConnectionError(f"Failed to send notification: {str(e)}")
     
+    async def _handle_notification(self, notification: Dict[str, Any]) -> None:
+        """Route progress notifications to the streamed call they belong to."""
+        if notification.get("method") != "notifications/progress":
+            return
+        params = notification.get("params") or {}
+        queue = self._progress_queues.get(params.get("progressToken"))
+        if queue is not None:
+            queue.put_nowait(params)
+    
     async def close(self):
         """Close the connection to the MCP server."""
+        if self._batcher is not None:
+            await self._batcher.close()
         if self._connected:
             await self.transport.disconnect()
             self._connected = False
@@ -279,8 +356,9 @@ class MCPClient:
         
         Args:
             tool_name: Name of the tool to call
-            stream: Whether to stream the response (not implemented)
-            callback: Callback function for streaming responses (not implemented)
+            stream: Receive the result in chunks as the tool produces them;
+                streamed calls bypass the tool cache
+            callback: Called with each chunk of a streamed result
             **params: Parameters to pass to the tool
             
         Returns:
@@ -289,16 +367,128 @@ class MCPClient:
         # Ensure connected
         await self._ensure_connected()
         
-        # Note: Streaming is not yet implemented in this version
         if stream:
-            logger.warning("Streaming is not yet implemented, using regular call")
+            return await self._stream_tool_call(tool_name, callback, **params)
+        
+        async def call() -> Any:
+            # Send tool call request
+            response = await self._send_request("tools/call", {
+                "name": tool_name,
+                "arguments": params
+            })
+            
+            return self._tool_result(response)
         
-        # Send tool call request
-        response = await self._send_request("tools/call", {
+        if self.tool_cache is not None:
+            return await self.tool_cache.call(tool_name, params, call)
+        return await call()
+    
+    async def stream_tool(self, tool_name: str, **params) -> AsyncIterator[Any]:
+        """
+        Call a tool and yield its result in chunks as they arrive.
+        
+        The call carries a progress token; servers that stream tool output
+        send each chunk as a progress notification with that token. If the
+        server sends no chunks, the complete result is yielded once.
+        
+        Args:
+            tool_name: Name of the tool to call
+            **params: Parameters to pass to the tool
+            
+        Yields:
+            Chunks of the result, in the same form as call_tool results
+            
+        Raises:
+            JSONRPCError: If the server returns an error
+        """
+        await self._ensure_connected()
+        
+        token = f"stream-{next(self._progress_tokens)}"
+        queue: asyncio.Queue = asyncio.Queue()
+        self._progress_queues[token] = queue
+        
+        finished = object()
+        call = asyncio.ensure_future(self._send_request("tools/call", {
             "name": tool_name,
-            "arguments": params
-        })
+            "arguments": params,
+            "_meta": {"progressToken": token}
+        }))
+        call.add_done_callback(lambda _: queue.put_nowait(finished))
         
+        streamed = False
+        try:
+            while True:
+                update = await queue.get()
+                if update is finished:
+                    break
+                content = update.get("content")
+                if content is None and update.get("message"):
+                    content = [{"type": "text", "text": update["message"]}]
+                if content:
+                    streamed = True
+                    yield self._content_result(content)
+            
+            # Raises if the call failed
+            result = self._tool_result(call.result())
+            if not streamed:
+                yield result
+        finally:
+            self._progress_queues.pop(token, None)
+            if not call.done():
+                call.cancel()
+            if self.tool_cache is not None:
+                self.tool_cache.record_call(tool_name)
+    
+    async def call_tools_batch(
+        self,
+        calls: Sequence[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Call several tools in one JSON-RPC batch.
+        
+        Args:
+            calls: Tool calls, each a (tool_name, params) tuple or a dict
+                with "name" and "arguments"
+            return_exceptions: Return a failed call's exception in its
+                place instead of raising it
+            
+        Returns:
+            Results in call order, as returned by call_tool
+        """
+        await self._ensure_connected()
+        
+        batch = []
+        for call in calls:
+            if isinstance(call, dict):
+                name, arguments = call["name"], call.get("arguments", {})
+            else:
+                name, arguments = call
+            batch.append(("tools/call", {"name": name, "arguments": arguments or {}}))
+        
+        if not batch:
+            return []
+        
+        responses = await self._send_batch(batch)
+        if self.tool_cache is not None:
+            for _, call in batch:
+                self.tool_cache.record_call(call["name"])
+        
+        results = []
+        for response in responses:
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                results.append(self._tool_result(response))
+            except MCPError as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        
+        return results
+    
+    def _tool_result(self, response: Dict[str, Any]) -> Any:
+        """Extract a tool call result from a JSON-RPC response."""
         if "error" in response:
             raise JSONRPCError(
                 response["error"]["code"],
@@ -308,8 +498,10 @@ class MCPClient:
         
         # Extract content from response
         result = response.get("result", {})
-        content = result.get("content", [])
-        
+        return self._content_result(result.get("content", []))
+    
+    def _content_result(self, content: List[Dict[str, Any]]) -> Any:
+        """Convert tool result content to the form returned to callers."""
         # If single text content, return just the text
         if len(content) == 1 and content[0].get("type") == "text":
             return content[0].get("text", "")
@@ -423,12 +615,41 @@ class MCPClient:
         """Async context manager exit."""
         await self.close()
     
-    # Legacy method for backward compatibility
-    async def _stream_tool_call(self, tool_name: str, callback: Callable[[str], None], **params) -> str:
-        """Legacy streaming method - not implemented."""
-        logger.warning("Streaming is not implemented in the new MCP client")
-        result = await self.call_tool(tool_name, **params)
-        if isinstance(result, str):
-            callback(result)
-            return result
-        return str(result)
\ No newline at end of file
+    async def _stream_tool_call(
+        self,
+        tool_name: str,
+        callback: Optional[Callable[[Any], Any]],
+        **params
+    ) -> Any:
+        """
+        Stream a tool call through a callback and return the whole result.
+        
+        Args:
+            tool_name: Name of the tool to call
+            callback: Called, or awaited if it returns an awaitable, with
+                each chunk
+            **params: Parameters to pass to the tool
+            
+        Returns:
+            The chunks joined: one string if all chunks are text, otherwise
+            the combined content
+        """
+        chunks = []
+        async for chunk in self.stream_tool(tool_name, **params):
+            chunks.append(chunk)
+            if callback is not None:
+                outcome = callback(chunk)
+                if inspect.isawaitable(outcome):
+                    await outcome
+        
+        if len(chunks) == 1:
+            return chunks[0]
+        if all(isinstance(chunk, str) for chunk in chunks):
+            return "".join(chunks)
+        content = []
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                content.append({"type": "text", "text": chunk})
+            else:
+                content.extend(chunk)
+        return content
\ No newline at end of file
@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, AsyncIterator, List
 import httpx
 
+from .framing import DEFAULT_MAX_MESSAGE_SIZE, read_frames
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,25 @@ class Transport(ABC):
         """
         pass
     
+    async def send_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send several JSON-RPC requests and wait for all responses.
+        
+        Default implementation sends the requests concurrently; transports
+        that can put a JSON-RPC batch on the wire override it.
+        
+        Args:
+            requests: JSON-RPC request objects
+            
+        Returns:
+            Responses in request order; a request that failed has its
+            exception in place of a response
+        """
+        return await asyncio.gather(
+            *(self.send_request(request) for request in requests),
+            return_exceptions=True
+        )
+    
     @abstractmethod
     async def send_notification(self, notification: Dict[str, Any]) -> None:
         """
@@ -59,20 +80,32 @@ class StdioTransport(Transport):
     """
     Stdio transport for MCP.
     
-    Communicates with MCP server via stdin/stdout of a subprocess.
+    Communicates with MCP server via stdin/stdout of a subprocess. Requests
+    are pipelined: any number can be in flight on the pipe, and each
+    caller's future is resolved when the response with its id arrives.
     """
     
-    def __init__(self, command: List[str]):
+    def __init__(
+        self,
+        command: List[str],
+        timeout: float = 30.0,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+    ):
         """
         Initialize stdio transport.
         
         Args:
             command: Command to start the MCP server process
+            timeout: Seconds to wait for a response
+            max_message_size: Maximum size of one message in bytes;
+                larger messages are dropped
         """
         self.command = command
+        self.timeout = timeout
+        self.max_message_size = max_message_size
         self.process = None
         self._read_task = None
-        self._response_queues = {}
+        self._pending: Dict[Any, asyncio.Future] = {}
         self._notification_handlers = []
     
     async def connect(self) -> None:
@@ -101,58 +134,102 @@ class StdioTransport(Transport):
             except asyncio.CancelledError:
                 pass
         
+        self._fail_pending(ConnectionError("MCP server process stopped"))
         logger.info("Stopped MCP server process")
     
     async def _read_output(self):
         """Read JSON-RPC messages from stdout."""
-        while True:
-            try:
-                line = await self.process.stdout.readline()
-                if not line:
-                    break
-                
+        try:
+            # Framed reads instead of readline(), which fails on lines over
+            # the stream's 64 KB limit
+            async for line in read_frames(self.process.stdout, self.max_message_size):
                 try:
-                    message = json.loads(line.decode().strip())
-                    
-                    # Route message based on type
-                    if "id" in message and message["id"] in self._response_queues:
-                        # Response to a request
-                        await self._response_queues[message["id"]].put(message)
-                    elif "method" in message and "id" not in message:
-                        # Notification from server
-                        for handler in self._notification_handlers:
-                            await handler(message)
-                    else:
-                        logger.warning(f"Unhandled message from MCP server: {message}")
+                    message = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Invalid JSON from MCP server: {line[:200]!r}")
+                    continue
+                
+                # A batch response carries several messages
+                messages = message if isinstance(message, list) else [message]
+                for item in messages:
+                    try:
+                        await self._route_message(item)
+                    except Exception as e:
+                        logger.error(f"Error handling message from MCP server: {e}")
                         
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON from MCP server: {line}")
-                    
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error reading from MCP server: {e}")
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading from MCP server: {e}")
+        
+        # Nothing more will arrive, don't leave callers waiting for the timeout
+        self._fail_pending(ConnectionError("MCP server closed its output"))
+    
+    async def _route_message(self, message: Dict[str, Any]) -> None:
+        """Resolve the waiting request or dispatch a notification."""
+        if "id" in message and message["id"] in self._pending:
+            # Response to a request
+            future = self._pending.pop(message["id"])
+            if not future.done():
+                future.set_result(message)
+        elif "method" in message and "id" not in message:
+            # Notification from server
+            for handler in self._notification_handlers:
+                await handler(message)
+        else:
+            logger.warning(f"Unhandled message from MCP server: {message}")
+    
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail all requests still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    async def _write(self, payload: Any, request_ids: List[Any]) -> List[asyncio.Future]:
+        """Register futures for the request ids and write one line."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request_id in request_ids:
+            future = loop.create_future()
+            self._pending[request_id] = future
+            futures.append(future)
+        
+        try:
+            self.process.stdin.write((json.dumps(payload) + "\n").encode())
+            await self.process.stdin.drain()
+        except Exception:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+            raise
+        return futures
     
     async def send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Send request via stdio."""
         request_id = request["id"]
-        self._response_queues[request_id] = asyncio.Queue()
+        future, = await self._write(request, [request_id])
         
         try:
-            # Send request
-            self.process.stdin.write((json.dumps(request) + "\n").encode())
-            await self.process.stdin.drain()
-            
             # Wait for response
-            response = await asyncio.wait_for(
-                self._response_queues[request_id].get(),
-                timeout=30.0
-            )
-            
-            return response
-            
+            return await asyncio.wait_for(future, timeout=self.timeout)
         finally:
-            del self._response_queues[request_id]
+            self._pending.pop(request_id, None)
+    
+    async def send_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Send requests as one JSON-RPC batch via stdio."""
+        request_ids = [request["id"] for request in requests]
+        futures = await self._write(requests, request_ids)
+        
+        try:
+            done, _ = await asyncio.wait(futures, timeout=self.timeout)
+            return [
+                (future.exception() or future.result()) if future in done
+                else asyncio.TimeoutError(f"Request {request_id} timed out")
+                for request_id, future in zip(request_ids, futures)
+            ]
+        finally:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
     
     async def send_notification(self, notification: Dict[str, Any]) -> None:
         """Send notification via stdio."""
@@ -237,6 +314,56 @@ class SSETransport(Transport):
         
         raise Exception(f"No response received for request {request_id}")
     
+    async def send_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send requests as one JSON-RPC batch in a single POST.
+        
+        The server may answer with a JSON array or stream the responses as
+        SSE events, one per response or as an array.
+        """
+        headers = {
+            **self.headers,
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream"
+        }
+        
+        request_ids = [request["id"] for request in requests]
+        responses: Dict[Any, Dict[str, Any]] = {}
+        
+        async def collect(data):
+            for item in data if isinstance(data, list) else [data]:
+                if item.get("id") in request_ids:
+                    responses[item["id"]] = item
+                elif "method" in item and "id" not in item:
+                    for handler in self._notification_handlers:
+                        await handler(item)
+        
+        async with self.client.stream(
+            "POST",
+            self.url,
+            json=requests,
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+            
+            if response.headers.get("content-type", "").startswith("application/json"):
+                await collect(json.loads(await response.aread()))
+            else:
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        try:
+                            await collect(json.loads(line[6:]))
+                        except json.JSONDecodeError:
+                            logger.warning(f"Invalid JSON in SSE data: {line}")
+                        if len(responses) == len(request_ids):
+                            break
+        
+        return [
+            responses.get(request_id)
+            or Exception(f"No response received for request {request_id}")
+            for request_id in request_ids
+        ]
+    
     async def send_notification(self, notification: Dict[str, Any]) -> None:
         """Send notification via SSE."""
         headers = {
@@ -259,7 +386,8 @@ class SSETransport(Transport):
 def create_transport(
     url: Optional[str] = None,
     command: Optional[List[str]] = None,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30.0
 ) -> Transport:
     """
     Create appropriate transport based on parameters.
@@ -268,6 +396,7 @@ def create_transport(
         url: URL for SSE transport
         command: Command for stdio transport
         headers: Optional headers for SSE transport
+        timeout: Seconds to wait for a response on the stdio transport
         
     Returns:
         Transport instance
@@ -276,7 +405,7 @@ def create_transport(
         ValueError: If neither url nor command is provided
     """
     if command:
-        return StdioTransport(command)
+        return StdioTransport(command, timeout)
     elif url:
         return SSETransport(url, headers)
     else:
@@ -7,7 +7,7 @@ JSON-RPC 2.0 compliance, lifecycle management, and transport support.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, Callable
 
 from .protocol import (
     MCPProtocolHandler,
@@ -20,6 +20,8 @@ from .protocol import (
     MCPImplementationInfo,
     MCPCapabilities
 )
+from .batching import RequestBatcher
+from .caching import ToolResultCache
 from .connection import MCPConnection, MCPMessageHandler
 from .transports import StdioTransport, create_stdio_transport
 
@@ -130,7 +132,10 @@ class MCPClient:
         enable_sampling: bool = False,
         enable_roots: bool = False,
         # Connection settings
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        batch_window: float = 0.0,
+        max_batch_size: int = 50,
+        tool_cache: Optional[ToolResultCache] = None
     ):
         """
         Initialize MCP client.
@@ -141,6 +146,12 @@ class MCPClient:
             enable_sampling: Enable sampling capability
             enable_roots: Enable roots capability
             timeout: Request timeout
+            batch_window: If set, concurrent tool calls issued within this
+                many seconds are sent together as one JSON-RPC batch
+            max_batch_size: Maximum number of requests in one batch
+            tool_cache: Cache for the results of idempotent tools; calls to
+                tools it does not cache pass through, but still run its
+                invalidations
         """
         self.name = name
         self.version = version
@@ -162,6 +173,19 @@ class MCPClient:
         # Connection will be set when connecting
         self.connection: Optional[MCPConnection] = None
         
+        # Coalesces concurrent tool calls into batches when enabled
+        self._batcher = None
+        if batch_window > 0:
+            self._batcher = RequestBatcher(
+                lambda request: self.connection.send_request(request),
+                lambda requests: self.connection.send_batch(requests),
+                window=batch_window,
+                max_batch_size=max_batch_size
+            )
+        
+        # Tool results cached per tool name and arguments
+        self.tool_cache = tool_cache
+        
         logger.info(f"Created MCP client: {name} v{version}")
     
     async def connect_stdio(
@@ -210,6 +234,8 @@ class MCPClient:
     
     async def disconnect(self) -> None:
         """Disconnect from MCP server."""
+        if self._batcher is not None:
+            await self._batcher.close()
         if self.connection:
             await self.connection.disconnect()
             self.connection = None
@@ -262,17 +288,85 @@ class MCPClient:
         """
         self._ensure_connected()
         
-        request = self.connection.protocol.create_request("tools/call", {
-            "name": name,
-            "arguments": arguments or {}
-        })
+        async def call() -> Dict[str, Any]:
+            request = self.connection.protocol.create_request("tools/call", {
+                "name": name,
+                "arguments": arguments or {}
+            })
+            
+            # Calls with their own timeout are sent on their own
+            if self._batcher is not None and timeout is None:
+                response = await self._batcher.submit(request)
+            else:
+                response = await self.connection.send_request(request, timeout=timeout)
+            
+            if response.error:
+                raise MCPProtocolError(f"tools/call failed: {response.error.message}")
+            
+            return response.result
+        
+        if self.tool_cache is not None:
+            return await self.tool_cache.call(
+                name, arguments, call,
+                cacheable=lambda result: not (isinstance(result, dict) and result.get("isError"))
+            )
+        return await call()
+    
+    async def call_tools_batch(
+        self,
+        calls: Sequence[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Call several tools in one JSON-RPC batch.
         
-        response = await self.connection.send_request(request, timeout=timeout)
+        Args:
+            calls: Tool calls, each a (name, arguments) tuple or a dict
+                with "name" and "arguments"
+            timeout: Custom timeout for the whole batch
+            return_exceptions: Return a failed call's exception in its
+                place instead of raising it
+            
+        Returns:
+            Tool results in call order
+        """
+        self._ensure_connected()
         
-        if response.error:
-            raise MCPProtocolError(f"tools/call failed: {response.error.message}")
+        requests = []
+        for call in calls:
+            if isinstance(call, dict):
+                name, arguments = call["name"], call.get("arguments")
+            else:
+                name, arguments = call
+            requests.append(self.connection.protocol.create_request("tools/call", {
+                "name": name,
+                "arguments": arguments or {}
+            }))
+        
+        if not requests:
+            return []
+        
+        responses = await self.connection.send_batch(requests, timeout=timeout)
+        if self.tool_cache is not None:
+            for request in requests:
+                self.tool_cache.record_call(request.params["name"])
+        
+        results = []
+        for response in responses:
+            if isinstance(response, Exception):
+                error = response
+            elif response.error:
+                error = MCPProtocolError(f"tools/call failed: {response.error.message}")
+            else:
+                results.append(response.result)
+                continue
+            
+            if not return_exceptions:
+                raise error
+            results.append(error)
         
-        return response.result
+        return results
     
     async def list_resources(self, cursor: Optional[str] = None) -> Dict[str, Any]:
         """
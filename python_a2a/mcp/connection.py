@@ -118,7 +118,10 @@ class MCPConnection:
             legacy_mode=legacy_mode
         )
         
-        # Connection state
+        # Connection state; the events are set whenever the connection is
+        # not waiting for initialization, and whenever it is not usable
+        self._initialization_done = asyncio.Event()
+        self._closed = asyncio.Event()
         self.state = MCPConnectionState.DISCONNECTED
         self._shutdown_event = asyncio.Event()
         self._receive_task: Optional[asyncio.Task] = None
@@ -137,6 +140,24 @@ class MCPConnection:
         
         logger.info(f"Created MCP connection with {implementation_info.name}")
     
+    @property
+    def state(self) -> MCPConnectionState:
+        """Current lifecycle state."""
+        return self._state
+    
+    @state.setter
+    def state(self, state: MCPConnectionState) -> None:
+        self._state = state
+        if state == MCPConnectionState.INITIALIZING:
+            self._initialization_done.clear()
+        else:
+            self._initialization_done.set()
+        if state in (MCPConnectionState.CONNECTING, MCPConnectionState.INITIALIZING,
+                     MCPConnectionState.INITIALIZED, MCPConnectionState.OPERATING):
+            self._closed.clear()
+        else:
+            self._closed.set()
+    
     @property
     def is_initialized(self) -> bool:
         """Check if connection is properly initialized."""
@@ -189,8 +210,21 @@ class MCPConnection:
             self.state = MCPConnectionState.ERROR
             raise MCPConnectionError(f"Client initialization failed: {e}") from e
     
-    async def wait_for_initialization(self) -> None:
-        """Wait for client to initialize this server connection."""
+    async def wait_for_initialization(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for client to initialize this server connection.
+        
+        Returns as soon as the message handler calls
+        complete_initialization(), or the connection fails or closes.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, None to wait forever
+            
+        Raises:
+            MCPConnectionError: If the connection is not waiting for
+                initialization, or closes before it completes
+            MCPTimeoutError: If the timeout expires first
+        """
         if self.state != MCPConnectionState.INITIALIZING:
             raise MCPConnectionError(f"Cannot wait for initialization from state {self.state.value}")
         
@@ -199,9 +233,17 @@ class MCPConnection:
         # the message handler should call complete_initialization()
         logger.info("MCP server waiting for client initialization...")
         
-        # Wait until initialization is complete
-        while self.state == MCPConnectionState.INITIALIZING:
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(self._initialization_done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise MCPTimeoutError(f"Client did not initialize within {timeout}s")
+        
+        if self.state != MCPConnectionState.OPERATING:
+            raise MCPConnectionError(f"Connection {self.state.value} before initialization completed")
+    
+    async def wait_closed(self) -> None:
+        """Wait until the connection fails or is disconnected."""
+        await self._closed.wait()
     
     def complete_initialization(self, peer_info: MCPImplementationInfo, peer_capabilities: MCPCapabilities) -> None:
         """Complete initialization after successful handshake (called by message handler)."""
@@ -267,6 +309,65 @@ class MCPConnection:
         finally:
             self._pending_requests.pop(request_id, None)
     
+    async def send_batch(
+        self,
+        requests: List[JSONRPCRequest],
+        timeout: Optional[float] = None
+    ) -> List[Union[JSONRPCResponse, Exception]]:
+        """
+        Send requests as one JSON-RPC batch and wait for their responses.
+        
+        Responses are matched by id, so the peer may answer with a batch or
+        with individual messages in any order.
+        
+        Args:
+            requests: Requests to send
+            timeout: Optional custom timeout for the whole batch
+            
+        Returns:
+            Responses in request order; a request that timed out has an
+            MCPTimeoutError in place of its response
+        """
+        if not self.is_initialized:
+            raise MCPConnectionError("Connection not initialized")
+        
+        if any(request.is_notification() for request in requests):
+            raise MCPProtocolError("Cannot send notification as request")
+        
+        actual_timeout = timeout if timeout is not None else self.timeout
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            future = loop.create_future()
+            self._pending_requests[request.id] = future
+            futures.append(future)
+        
+        try:
+            await self._send_message(requests)
+            self.stats["requests_sent"] += len(requests)
+            
+            done, _ = await asyncio.wait(futures, timeout=actual_timeout)
+            
+            responses = []
+            for request, future in zip(requests, futures):
+                if future not in done:
+                    self.stats["errors"] += 1
+                    responses.append(MCPTimeoutError(
+                        f"Request {request.id} timed out after {actual_timeout}s"))
+                elif future.cancelled():
+                    responses.append(MCPConnectionError(f"Request {request.id} was cancelled"))
+                elif future.exception() is not None:
+                    self.stats["errors"] += 1
+                    responses.append(future.exception())
+                else:
+                    self.stats["responses_received"] += 1
+                    responses.append(future.result())
+            return responses
+            
+        finally:
+            for request in requests:
+                self._pending_requests.pop(request.id, None)
+    
     async def send_notification(self, notification: JSONRPCRequest) -> None:
         """Send notification (no response expected)."""
         if not self.is_initialized:
@@ -323,13 +424,19 @@ class MCPConnection:
         finally:
             self._pending_requests.pop(request_id, None)
     
-    async def _send_message(self, message: Union[JSONRPCRequest, JSONRPCResponse]) -> None:
-        """Send message via transport."""
+    async def _send_message(
+        self,
+        message: Union[JSONRPCRequest, JSONRPCResponse, List[JSONRPCRequest]]
+    ) -> None:
+        """Send message, or a list of requests as one batch, via transport."""
         if not self.transport.is_connected():
             raise MCPConnectionError("Transport not connected")
         
         try:
-            message_dict = message.to_dict()
+            if isinstance(message, list):
+                message_dict = [item.to_dict() for item in message]
+            else:
+                message_dict = message.to_dict()
             message_json = json.dumps(message_dict)
             message_bytes = message_json.encode("utf-8")
             
@@ -346,37 +453,45 @@ class MCPConnection:
         logger.debug("Started message receive loop")
         
         try:
+            # Disconnecting cancels this task, so receive() is awaited
+            # without a polling timeout
             while not self._shutdown_event.is_set():
                 try:
-                    # Receive message with timeout
-                    message_data = await asyncio.wait_for(
-                        self.transport.receive(),
-                        timeout=1.0  # Short timeout to check shutdown
-                    )
+                    message_data = await self.transport.receive()
                     
                     # Process message
                     await self._process_received_message(message_data)
                     self.stats["messages_received"] += 1
                     
-                except asyncio.TimeoutError:
-                    # Normal timeout, continue loop
+                except MCPTimeoutError:
+                    # An idle transport; only EOF or closure ends the connection
                     continue
                 except Exception as e:
                     logger.error(f"Error receiving message: {e}")
                     self.stats["errors"] += 1
                     
                     # For serious errors, break the loop
-                    if isinstance(e, (ConnectionError, OSError)):
+                    if isinstance(e, (ConnectionError, OSError, MCPConnectionError)):
                         logger.error(f"Breaking receive loop due to connection error: {e}")
+                        self._connection_lost(e)
                         break
                     
         except Exception as e:
             logger.error(f"Receive loop failed: {e}")
-            self.state = MCPConnectionState.ERROR
-            logger.error(f"Connection state changed to ERROR due to receive loop failure")
+            self._connection_lost(e)
         
         logger.debug("Message receive loop ended")
     
+    def _connection_lost(self, error: Exception) -> None:
+        """Fail pending requests and waiters at once when the peer is gone."""
+        if self._shutdown_event.is_set():
+            return
+        self.state = MCPConnectionState.ERROR
+        logger.error("Connection state changed to ERROR due to receive loop failure")
+        for future in self._pending_requests.values():
+            if not future.done():
+                future.set_exception(MCPConnectionError(f"Connection lost: {error}"))
+    
     async def _process_received_message(self, message_data: bytes) -> None:
         """Process received message."""
         try:
@@ -0,0 +1,371 @@
+"""
+Execution policy for MCP tool, resource and prompt handlers.
+
+Synchronous handlers must not run on the event loop: one slow tool would
+stall every other request served by the same server. This module runs them
+on a dedicated, sized thread pool (or a process pool for CPU-bound tools),
+applies per-tool concurrency limits and timeouts, and keeps queue-depth
+metrics.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Supported values for a tool's ``executor`` option
+THREAD = "thread"
+PROCESS = "process"
+
+
+def is_streaming_handler(handler: Callable) -> bool:
+    """Check whether a handler produces its result incrementally as a generator."""
+    return inspect.isasyncgenfunction(handler) or inspect.isgeneratorfunction(handler)
+
+
+class ToolExecutor:
+    """
+    Runs MCP handlers according to their execution options.
+
+    Coroutine handlers are awaited on the event loop. Other handlers run in
+    a dedicated thread pool by default, or in a process pool when registered
+    with ``executor="process"``; such handlers and their arguments must be
+    picklable. A timeout stops waiting for a handler but cannot interrupt a
+    thread that is already running it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        process_workers: Optional[int] = None,
+        thread_name_prefix: str = "mcp-tool"
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of threads for synchronous handlers
+            process_workers: Number of processes for CPU-bound handlers,
+                defaults to the number of CPUs
+            thread_name_prefix: Name prefix for the worker threads
+        """
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.thread_name_prefix = thread_name_prefix
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # Semaphores are bound to a loop, so each loop gets its own limits:
+        # loop -> name -> (size, semaphore)
+        self._limits: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[int, asyncio.Semaphore]]]" = (
+            weakref.WeakKeyDictionary())
+        self._limits_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use."""
+        if self._thread_pool is None:
+            with self._pool_lock:
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix
+                    )
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        if self._process_pool is None:
+            with self._pool_lock:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.process_workers
+                    )
+        return self._process_pool
+
+    async def run(
+        self,
+        name: str,
+        handler: Callable,
+        arguments: Optional[Dict[str, Any]] = None,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Run a handler with the given execution options.
+
+        Args:
+            name: Key for concurrency limits and metrics, usually the tool name
+            handler: Handler function or coroutine function
+            arguments: Keyword arguments for the handler
+            executor: "thread" or "process" for synchronous handlers
+            max_concurrency: Maximum number of concurrent calls for this name
+            timeout: Maximum time in seconds to wait for the handler
+
+        Returns:
+            The handler's result
+
+        Raises:
+            ValueError: If the executor option is not supported
+            asyncio.TimeoutError: If the handler does not finish in time
+        """
+        if executor not in (THREAD, PROCESS):
+            raise ValueError(f"Unsupported executor for {name}: {executor}")
+        arguments = arguments or {}
+
+        limit = self._limit(name, max_concurrency)
+        self._update(name, waiting=1)
+        waiting = True
+        try:
+            if limit is not None:
+                await limit.acquire()
+            self._update(name, waiting=-1, queued=1)
+            waiting = False
+
+            try:
+                coro = self._call(name, handler, arguments, executor)
+                if timeout:
+                    result = await asyncio.wait_for(coro, timeout=timeout)
+                else:
+                    result = await coro
+            except asyncio.TimeoutError:
+                self._update(name, timed_out=1)
+                raise
+            except Exception:
+                self._update(name, failed=1)
+                raise
+            finally:
+                if limit is not None:
+                    limit.release()
+
+            self._update(name, completed=1)
+            return result
+        finally:
+            if waiting:
+                self._update(name, waiting=-1)
+
+    async def stream(
+        self,
+        name: str,
+        handler: Callable,
+        arguments: Optional[Dict[str, Any]] = None,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Run a generator handler, yielding its items as they are produced.
+
+        Async generators run on the event loop; each step of a synchronous
+        generator runs in the thread pool. The call holds its concurrency
+        slot until the generator is exhausted or the consumer stops.
+
+        Args:
+            name: Key for concurrency limits and metrics, usually the tool name
+            handler: Generator function or async generator function
+            arguments: Keyword arguments for the handler
+            executor: Must be "thread"; generators cannot run in a process
+            max_concurrency: Maximum number of concurrent calls for this name
+            timeout: Maximum time in seconds for the whole run
+
+        Yields:
+            The handler's items
+
+        Raises:
+            ValueError: If the executor option is not supported
+            asyncio.TimeoutError: If the handler does not finish in time
+        """
+        if executor != THREAD:
+            raise ValueError(f"Unsupported executor for streaming handler {name}: {executor}")
+        arguments = arguments or {}
+
+        limit = self._limit(name, max_concurrency)
+        self._update(name, waiting=1)
+        waiting = True
+        try:
+            if limit is not None:
+                await limit.acquire()
+            self._update(name, waiting=-1, running=1)
+            waiting = False
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout if timeout else None
+            done = object()
+
+            if inspect.isasyncgenfunction(handler):
+                generator = handler(**arguments)
+
+                async def step():
+                    try:
+                        return await generator.__anext__()
+                    except StopAsyncIteration:
+                        return done
+            else:
+                generator = handler(**arguments)
+
+                def step():
+                    return loop.run_in_executor(self.thread_pool, next, generator, done)
+
+            try:
+                while True:
+                    remaining = None if deadline is None else deadline - loop.time()
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    item = await asyncio.wait_for(step(), timeout=remaining)
+                    if item is done:
+                        break
+                    yield item
+            except asyncio.TimeoutError:
+                self._update(name, timed_out=1)
+                raise
+            except Exception:
+                self._update(name, failed=1)
+                raise
+            finally:
+                self._update(name, running=-1)
+                if limit is not None:
+                    limit.release()
+                await self._close(generator)
+
+            self._update(name, completed=1)
+        finally:
+            if waiting:
+                self._update(name, waiting=-1)
+
+    @staticmethod
+    async def _close(generator: Any) -> None:
+        """Close a generator that may have been stopped early."""
+        try:
+            if inspect.isasyncgen(generator):
+                await generator.aclose()
+            else:
+                generator.close()
+        except (RuntimeError, ValueError) as e:
+            # A synchronous generator still running in a worker after a
+            # timeout cannot be closed; it finishes on its own
+            logger.debug(f"Could not close generator: {e}")
+
+    async def _call(self, name: str, handler: Callable, arguments: Dict[str, Any], executor: str) -> Any:
+        """Invoke a handler on the loop, a thread or a process."""
+        if asyncio.iscoroutinefunction(handler):
+            self._update(name, queued=-1, running=1)
+            try:
+                return await handler(**arguments)
+            finally:
+                self._update(name, running=-1)
+
+        loop = asyncio.get_running_loop()
+        if executor == PROCESS:
+            # Progress inside another process is not observable, so the
+            # call counts as running from submission
+            self._update(name, queued=-1, running=1)
+            try:
+                return await loop.run_in_executor(
+                    self.process_pool, functools.partial(handler, **arguments))
+            finally:
+                self._update(name, running=-1)
+
+        started = threading.Event()
+
+        def call():
+            started.set()
+            self._update(name, queued=-1, running=1)
+            try:
+                return handler(**arguments)
+            finally:
+                self._update(name, running=-1)
+
+        try:
+            return await loop.run_in_executor(self.thread_pool, call)
+        finally:
+            if not started.is_set():
+                # Cancelled or timed out before a worker picked it up
+                self._update(name, queued=-1)
+
+    def _limit(self, name: str, max_concurrency: Optional[int]) -> Optional[asyncio.Semaphore]:
+        """Get the running loop's concurrency limit for a name."""
+        if not max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        limits = self._limits.get(loop)
+        if limits is None:
+            with self._limits_lock:
+                # A semaphore that was waited on references its loop, which
+                # then never leaves the weak dictionary by itself
+                for closed in [other for other in self._limits if other.is_closed()]:
+                    del self._limits[closed]
+                limits = self._limits.setdefault(loop, {})
+        entry = limits.get(name)
+        if entry is None or entry[0] != max_concurrency:
+            # Calls holding a replaced semaphore release it as they finish
+            entry = limits[name] = (max_concurrency, asyncio.Semaphore(max_concurrency))
+        return entry[1]
+
+    def _update(self, name: str, **changes: int) -> None:
+        """Apply counter changes for a name."""
+        with self._stats_lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "waiting": 0,
+                    "queued": 0,
+                    "running": 0,
+                    "completed": 0,
+                    "failed": 0,
+                    "timed_out": 0,
+                    "max_queue_depth": 0
+                }
+            for key, change in changes.items():
+                stats[key] += change
+            depth = stats["waiting"] + stats["queued"]
+            if depth > stats["max_queue_depth"]:
+                stats["max_queue_depth"] = depth
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get execution metrics.
+
+        ``waiting`` counts calls blocked on a per-tool concurrency limit,
+        ``queued`` counts calls submitted to a pool that no worker has
+        picked up yet; their sum is the queue depth.
+
+        Returns:
+            Pool sizes, totals and per-name counters
+        """
+        with self._stats_lock:
+            handlers = {name: dict(stats) for name, stats in self._stats.items()}
+
+        return {
+            "max_workers": self.max_workers,
+            "process_workers": self.process_workers,
+            "queue_depth": sum(s["waiting"] + s["queued"] for s in handlers.values()),
+            "running": sum(s["running"] for s in handlers.values()),
+            "handlers": handlers
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pools.
+
+        Args:
+            wait: Wait for running handlers to finish
+        """
+        with self._pool_lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=wait)
+                self._thread_pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait)
+                self._process_pool = None
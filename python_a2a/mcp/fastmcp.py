@@ -7,18 +7,22 @@ allowing developers to focus on implementing the actual functionality.
 """
 
 import asyncio
-import inspect
 import json
 import logging
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, get_type_hints
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Type, Union
 import pydantic
 from pydantic import BaseModel, Field
 
+from .blobs import BLOB_URI_PREFIX, BlobStore, offload_content
+from .caching import ToolResultCache
 from .client import MCPError, MCPConnectionError, MCPTimeoutError, MCPToolError
+from .execution import ToolExecutor, THREAD, is_streaming_handler
+from .routing import ResourceRouter, URITemplate
+from .validation import SchemaValidationError, compile_schema, schema_from_signature
 
 # Configure logging
 logger = logging.getLogger("python_a2a.mcp.fastmcp")
@@ -50,7 +54,7 @@ class MCPResponse:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation for JSON serialization"""
         return {
-            "content": self.content,
+            "content": [_encode_content(item) for item in self.content],
             "isError": self.is_error
         }
     
@@ -70,7 +74,10 @@ class ToolDefinition:
         name: str, 
         description: str,
         parameters: List[Dict[str, Any]],
-        handler: Callable
+        handler: Callable,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
     ):
         """
         Initialize tool definition.
@@ -79,12 +86,23 @@ class ToolDefinition:
             name: Tool name
             description: Tool description
             parameters: Tool parameters schema
-            handler: Tool handler function
+            handler: Tool handler function; generator handlers stream
+                their result
+            executor: "thread" or "process" for synchronous handlers
+            max_concurrency: Maximum number of concurrent calls
+            timeout: Maximum time in seconds for a call
         """
         self.name = name
         self.description = description
         self.parameters = parameters
         self.handler = handler
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.streaming = is_streaming_handler(handler)
+        
+        # Compiled once so calls are checked before reaching the handler
+        self.validator = compile_schema(parameters)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation for the MCP protocol"""
@@ -121,13 +139,11 @@ class ResourceDefinition:
         self.handler = handler
         self.is_template = is_template
         
-        # Extract template parameters if this is a template
+        # Compile the template once and extract its parameters
+        self.template = URITemplate(uri) if is_template else None
         self.template_params = []
         if is_template:
-            import re
-            # Extract {param} or {param:type} from URI
-            param_matches = re.findall(r'{([^{}:]+)(?::([^{}]+))?}', uri)
-            for name, type_hint in param_matches:
+            for name, type_hint in self.template.variables:
                 self.template_params.append({
                     "name": name,
                     "type": type_hint or "string"
@@ -169,26 +185,15 @@ class ResourceDefinition:
         if not self.is_template:
             return {} if uri == self.uri else None
         
-        # For templates, parse according to the template pattern
-        import re
-        
-        # Convert template to regex pattern
-        pattern = self.uri
-        param_names = []
-        
-        def replace_param(match):
-            param_name = match.group(1).split(':')[0]
-            param_names.append(param_name)
-            return f"(?P<{param_name}>[^/]+)"
-        
-        pattern = re.sub(r'{([^{}]+)}', replace_param, pattern)
-        pattern = f"^{pattern}$"
-        
-        # Try to match
-        match = re.match(pattern, uri)
-        if match:
-            return match.groupdict()
-        return None
+        return self.template.match(uri)
+
+def _encode_content(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Base64-encode raw binary data in a content item for JSON."""
+    data = item.get("data") if isinstance(item, dict) else None
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        return item
+    import base64
+    return {**item, "data": base64.b64encode(data).decode('ascii')}
 
 def _format_response(result: Any) -> MCPResponse:
     """
@@ -255,6 +260,13 @@ def _format_response(result: Any) -> MCPResponse:
             ]
         )
 
+def _merge_responses(responses: List[MCPResponse]) -> MCPResponse:
+    """Combine the chunks of a streamed result into one response."""
+    return MCPResponse(
+        content=[item for response in responses for item in response.content],
+        is_error=any(response.is_error for response in responses)
+    )
+
 def text_response(text: str) -> MCPResponse:
     """
     Create a text response.
@@ -296,7 +308,8 @@ def error_response(message: str) -> MCPResponse:
 
 def image_response(
     data: Union[str, bytes], 
-    mime_type: str = "image/png"
+    mime_type: str = "image/png",
+    encode: bool = True
 ) -> MCPResponse:
     """
     Create an image response.
@@ -304,25 +317,20 @@ def image_response(
     Args:
         data: Image data as base64 string or bytes
         mime_type: Image MIME type
+        encode: Base64-encode bytes now. Pass False from tools of a server
+            with a blob store, so large images are moved out of band
+            without being encoded first; FastMCP encodes any that stay
+            inline.
         
     Returns:
         MCP response with image content
     """
-    import base64
-    
-    # Convert bytes to base64 if necessary
-    if isinstance(data, bytes):
-        data = base64.b64encode(data).decode('utf-8')
-        
-    return MCPResponse(
-        content=[
-            {
-                "type": "image",
-                "data": data,
-                "mimeType": mime_type
-            }
-        ]
-    )
+    item = {
+        "type": "image",
+        "data": data,
+        "mimeType": mime_type
+    }
+    return MCPResponse(content=[_encode_content(item) if encode else item])
 
 def multi_content_response(content_items: List[Dict[str, Any]]) -> MCPResponse:
     """
@@ -348,16 +356,30 @@ class FastMCP:
         name: str, 
         version: str = "1.0.0", 
         description: str = "",
-        dependencies: List[str] = None
+        dependencies: List[str] = None,
+        max_workers: int = 32,
+        process_workers: Optional[int] = None,
+        blob_store: Optional[BlobStore] = None,
+        blob_threshold: int = 256 * 1024
     ):
         """
         Initialize the FastMCP server.
         
+        Synchronous tool and resource handlers run in a dedicated thread
+        pool so they never block the event loop. With a blob store, large
+        image and binary results are stored out of band and returned as
+        ``blob://`` resource links instead of inline base64.
+        
         Args:
             name: Server name
             version: Server version
             description: Server description
             dependencies: List of package dependencies
+            max_workers: Number of threads for synchronous handlers
+            process_workers: Number of processes for tools registered with
+                executor="process" (default: number of CPUs)
+            blob_store: Store for large binary results, None to keep them inline
+            blob_threshold: Minimum payload size in bytes moved to the blob store
         """
         self.name = name
         self.version = version
@@ -367,6 +389,20 @@ class FastMCP:
         # Storage for tools and resources
         self.tools: Dict[str, ToolDefinition] = {}
         self.resources: Dict[str, ResourceDefinition] = {}
+        self._resource_router = ResourceRouter()
+        
+        # Runs handlers off the event loop
+        self.executor = ToolExecutor(
+            max_workers=max_workers,
+            process_workers=process_workers
+        )
+        
+        # Results of tools registered with a cache_ttl
+        self.cache = ToolResultCache()
+        
+        # Out-of-band storage for large binary results
+        self.blob_store = blob_store
+        self.blob_threshold = blob_threshold
         
         # Server metadata
         self.metadata = {
@@ -381,14 +417,31 @@ class FastMCP:
     def tool(
         self, 
         name: Optional[str] = None, 
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        invalidates: Optional[List[str]] = None
     ) -> Callable:
         """
         Decorator to register a tool.
         
+        A handler that is a generator or async generator streams its
+        result: each item it yields is sent as a chunk by stream_tool.
+        
         Args:
             name: Optional tool name (default: function name)
             description: Optional tool description (default: function docstring)
+            executor: Where a synchronous handler runs: "thread" (default) or
+                "process" for CPU-bound tools; process handlers and their
+                arguments must be picklable
+            max_concurrency: Optional limit on concurrent calls of this tool
+            timeout: Optional time limit in seconds for a call
+            cache_ttl: For idempotent tools, seconds to cache results per
+                set of arguments; concurrent identical calls share one run
+            invalidates: Tools whose cached results a call to this tool
+                invalidates, "*" for all
             
         Returns:
             Decorator function
@@ -400,70 +453,20 @@ class FastMCP:
             # Get tool description
             tool_description = description or (func.__doc__ or "").strip()
             
-            # Get parameter information from type hints and docstring
-            sig = inspect.signature(func)
-            type_hints = get_type_hints(func)
-            
-            # Build parameter schema
-            parameters = {
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-            
-            param_docs = {}
-            if func.__doc__:
-                # Extract parameter descriptions from docstring
-                import re
-                param_sections = re.findall(r'Args:(.*?)(?:\n\n|\n\s*Returns:|$)', func.__doc__, re.DOTALL)
-                if param_sections:
-                    param_section = param_sections[0]
-                    param_matches = re.findall(r'\s+(\w+)\s*:\s*(.+?)(?=\n\s+\w+\s*:|$)', param_section, re.DOTALL)
-                    for param_name, param_desc in param_matches:
-                        param_docs[param_name] = param_desc.strip()
-            
-            # Process parameters
-            for param_name, param in sig.parameters.items():
-                if param_name == "self" or param_name == "cls":
-                    continue
-                
-                # Determine parameter type
-                param_type = type_hints.get(param_name, Any)
-                if param_type == str:
-                    json_type = "string"
-                elif param_type == int:
-                    json_type = "integer"
-                elif param_type == float:
-                    json_type = "number"
-                elif param_type == bool:
-                    json_type = "boolean"
-                elif hasattr(param_type, "__origin__") and param_type.__origin__ == list:
-                    json_type = "array"
-                elif hasattr(param_type, "__origin__") and param_type.__origin__ == dict:
-                    json_type = "object"
-                else:
-                    json_type = "string"
-                
-                # Get parameter description
-                param_description = param_docs.get(param_name, "")
-                
-                # Add to schema
-                parameters["properties"][param_name] = {
-                    "type": json_type,
-                    "description": param_description
-                }
-                
-                # Check if required
-                if param.default == inspect.Parameter.empty:
-                    parameters["required"].append(param_name)
+            # Build parameter schema from type hints and docstring
+            parameters = schema_from_signature(func)
             
             # Register the tool
             self.tools[tool_name] = ToolDefinition(
                 name=tool_name,
                 description=tool_description,
                 parameters=parameters,
-                handler=func
+                handler=func,
+                executor=executor,
+                max_concurrency=max_concurrency,
+                timeout=timeout
             )
+            self.cache.configure(tool_name, ttl=cache_ttl, invalidates=invalidates or [])
             
             logger.info(f"Registered tool: {tool_name}")
             
@@ -500,13 +503,15 @@ class FastMCP:
             is_template = "{" in uri and "}" in uri
             
             # Register the resource
-            self.resources[uri] = ResourceDefinition(
+            resource = ResourceDefinition(
                 uri=uri,
                 name=resource_name,
                 description=resource_description,
                 handler=func,
                 is_template=is_template
             )
+            self.resources[uri] = resource
+            self._resource_router.add(uri, resource, resource.template)
             
             logger.info(f"Registered {'template ' if is_template else ''}resource: {uri}")
             
@@ -537,18 +542,93 @@ class FastMCP:
         tool = self.tools[tool_name]
         
         try:
+            params = tool.validator(params or {})
+        except SchemaValidationError as e:
+            return error_response(f"Error calling tool {tool_name}: {e}")
+        
+        async def run() -> MCPResponse:
+            if tool.streaming:
+                return _merge_responses([chunk async for chunk in self._stream_chunks(tool, params)])
+            
             # Call the handler function
-            if asyncio.iscoroutinefunction(tool.handler):
-                result = await tool.handler(**params)
-            else:
-                result = tool.handler(**params)
+            result = await self.executor.run(
+                tool_name,
+                tool.handler,
+                params,
+                executor=tool.executor,
+                max_concurrency=tool.max_concurrency,
+                timeout=tool.timeout
+            )
             
             # Format the response
-            return _format_response(result)
+            return self._offload(_format_response(result))
+        
+        try:
+            return await self.cache.call(
+                tool_name, params, run, cacheable=lambda response: not response.is_error)
+        except asyncio.TimeoutError:
+            logger.error(f"Tool {tool_name} timed out after {tool.timeout}s")
+            return error_response(f"Error calling tool {tool_name}: timed out after {tool.timeout}s")
         except Exception as e:
             logger.error(f"Error calling tool {tool_name}: {e}")
             return error_response(f"Error calling tool {tool_name}: {str(e)}")
     
+    async def stream_tool(self, tool_name: str, params: Dict[str, Any]) -> AsyncIterator[MCPResponse]:
+        """
+        Call a tool by name, yielding its result in chunks as they are produced.
+        
+        Generator handlers yield one chunk per item; other tools yield
+        their whole response as a single chunk. Errors are reported as a
+        final error chunk, as call_tool reports them.
+        
+        Args:
+            tool_name: Tool name
+            params: Tool parameters
+            
+        Yields:
+            Partial tool responses
+            
+        Raises:
+            ValueError: If tool is not found
+        """
+        if tool_name not in self.tools:
+            raise ValueError(f"Tool not found: {tool_name}")
+        
+        tool = self.tools[tool_name]
+        if not tool.streaming:
+            yield await self.call_tool(tool_name, params)
+            return
+        
+        try:
+            params = tool.validator(params or {})
+        except SchemaValidationError as e:
+            yield error_response(f"Error calling tool {tool_name}: {e}")
+            return
+        
+        try:
+            async for chunk in self._stream_chunks(tool, params):
+                yield chunk
+        except asyncio.TimeoutError:
+            logger.error(f"Tool {tool_name} timed out after {tool.timeout}s")
+            yield error_response(f"Error calling tool {tool_name}: timed out after {tool.timeout}s")
+        except Exception as e:
+            logger.error(f"Error calling tool {tool_name}: {e}")
+            yield error_response(f"Error calling tool {tool_name}: {str(e)}")
+        finally:
+            self.cache.record_call(tool_name)
+    
+    async def _stream_chunks(self, tool: ToolDefinition, params: Dict[str, Any]) -> AsyncIterator[MCPResponse]:
+        """Run a generator handler and format each item as a response chunk."""
+        async for item in self.executor.stream(
+            tool.name,
+            tool.handler,
+            params,
+            executor=tool.executor,
+            max_concurrency=tool.max_concurrency,
+            timeout=tool.timeout
+        ):
+            yield self._offload(_format_response(item))
+    
     async def get_resource(self, uri: str) -> MCPResponse:
         """
         Get a resource by URI.
@@ -562,43 +642,63 @@ class FastMCP:
         Raises:
             ValueError: If resource is not found
         """
-        # Check if direct resource match
-        if uri in self.resources:
-            resource = self.resources[uri]
+        if uri.startswith(BLOB_URI_PREFIX) and self.blob_store is not None:
+            return self._read_blob(uri)
+        
+        # Resolve static URIs and templates through the router
+        route = self._resource_router.resolve(uri)
+        if route is not None:
+            resource, params = route
             try:
-                # Call the handler function with no arguments
-                if asyncio.iscoroutinefunction(resource.handler):
-                    result = await resource.handler()
-                else:
-                    result = resource.handler()
+                # Call the handler function with any extracted parameters
+                result = await self.executor.run(
+                    f"resource:{resource.uri}", resource.handler, params)
                 
                 # Format the response
-                return _format_response(result)
+                return self._offload(_format_response(result))
             except Exception as e:
                 logger.error(f"Error getting resource {uri}: {e}")
                 return error_response(f"Error getting resource {uri}: {str(e)}")
         
-        # Check template resources
-        for resource_uri, resource in self.resources.items():
-            if resource.is_template:
-                params = resource.matches_uri(uri)
-                if params is not None:
-                    try:
-                        # Call the handler function with extracted parameters
-                        if asyncio.iscoroutinefunction(resource.handler):
-                            result = await resource.handler(**params)
-                        else:
-                            result = resource.handler(**params)
-                        
-                        # Format the response
-                        return _format_response(result)
-                    except Exception as e:
-                        logger.error(f"Error getting resource {uri}: {e}")
-                        return error_response(f"Error getting resource {uri}: {str(e)}")
-        
         # Resource not found
         raise ValueError(f"Resource not found: {uri}")
     
+    def _offload(self, response: MCPResponse) -> MCPResponse:
+        """
+        Move large binary content of a response to the blob store and
+        base64-encode raw bytes that stay inline.
+        """
+        if not response.content:
+            return response
+        content = response.content
+        if self.blob_store is not None:
+            content = offload_content(content, self.blob_store, self.blob_threshold)
+        response.content = [_encode_content(item) for item in content]
+        return response
+    
+    def _read_blob(self, uri: str) -> MCPResponse:
+        """
+        Read a stored blob as a resource, base64-encoded like other MCP
+        content; same-host callers wanting the raw bytes use read_blob.
+        
+        Raises:
+            ValueError: If the blob is not stored
+        """
+        info = self.blob_store.info(uri)
+        data = self.blob_store.get(uri) if info is not None else None
+        if data is None:
+            raise ValueError(f"Resource not found: {uri}")
+        return MCPResponse(
+            content=[
+                _encode_content({
+                    "type": "blob",
+                    "uri": uri,
+                    "data": data,
+                    "mimeType": info.mime_type
+                })
+            ]
+        )
+    
     def get_tools(self) -> List[Dict[str, Any]]:
         """
         Get all registered tools.
@@ -617,6 +717,22 @@ class FastMCP:
         """
         return [resource.to_dict() for resource in self.resources.values()]
     
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get handler execution metrics, including queue depths.
+        
+        Returns:
+            Execution metrics
+        """
+        metrics = self.executor.metrics()
+        if self.blob_store is not None:
+            metrics["blobs"] = {
+                "count": len(self.blob_store),
+                "bytes": self.blob_store.size,
+                **self.blob_store.stats
+            }
+        return metrics
+    
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get server metadata.
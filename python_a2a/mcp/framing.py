@@ -0,0 +1,140 @@
+"""
+Newline-delimited message framing for MCP stdio transports.
+
+The stdio transport sends one JSON-RPC message per line. Messages such as
+screenshots can be tens of megabytes, so frames are assembled in a single
+growable ``bytearray``: each chunk is scanned for newlines only once, and
+each complete message is copied out exactly once. Messages are not parsed
+here; parsing is left to the single consumer of each frame.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, List
+
+logger = logging.getLogger(__name__)
+
+# Default limit for one message, large enough for screenshots
+DEFAULT_MAX_MESSAGE_SIZE = 50 * 1024 * 1024
+
+# Default number of bytes requested from the stream per read
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class LineFramer:
+    """
+    Splits a byte stream into newline-terminated messages.
+
+    Lines longer than ``max_message_size`` are dropped without being
+    buffered in full: once a partial line exceeds the limit, the framer
+    discards bytes until the next newline. Empty lines are ignored and a
+    trailing carriage return is stripped.
+    """
+
+    def __init__(self, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE):
+        """
+        Initialize the framer.
+
+        Args:
+            max_message_size: Maximum size of one message in bytes
+        """
+        self.max_message_size = max_message_size
+        self._buffer = bytearray()
+        # Bytes of the buffer already known not to contain a newline
+        self._scanned = 0
+        self._discarding = False
+
+        self.stats = {"messages": 0, "bytes": 0, "dropped": 0}
+
+    def __len__(self) -> int:
+        """Number of buffered bytes of the current partial message."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add data from the stream and return the messages it completes.
+
+        Args:
+            data: Bytes read from the stream
+
+        Returns:
+            Complete messages without their line terminators
+        """
+        self.stats["bytes"] += len(data)
+        if self._discarding:
+            newline = data.find(b"\n")
+            if newline == -1:
+                return []
+            self._discarding = False
+            data = memoryview(data)[newline + 1:]
+
+        buffer = self._buffer
+        buffer += data
+
+        messages = []
+        start = 0
+        position = self._scanned
+        while True:
+            newline = buffer.find(b"\n", position)
+            if newline == -1:
+                break
+            end = newline
+            if end > start and buffer[end - 1] == 0x0D:
+                end -= 1
+            if end - start > self.max_message_size:
+                self._drop(end - start)
+            elif end > start:
+                messages.append(bytes(memoryview(buffer)[start:end]))
+            start = position = newline + 1
+
+        # Compact once per chunk rather than once per message
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        self.stats["messages"] += len(messages)
+
+        if len(buffer) > self.max_message_size:
+            self._drop(len(buffer))
+            buffer.clear()
+            self._scanned = 0
+            self._discarding = True
+
+        return messages
+
+    def _drop(self, size: int) -> None:
+        """Record a message dropped for exceeding the size limit."""
+        self.stats["dropped"] += 1
+        logger.error(
+            f"Message exceeds {self.max_message_size} bytes "
+            f"({size}+ bytes), skipping"
+        )
+
+
+async def read_frames(
+    stream: asyncio.StreamReader,
+    max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Yield newline-delimited messages from a stream until EOF.
+
+    The stream is only read while the consumer asks for the next message,
+    so a slow consumer applies backpressure to the writer through the pipe.
+
+    Args:
+        stream: Stream to read from
+        max_message_size: Maximum size of one message in bytes
+        chunk_size: Number of bytes requested per read
+
+    Yields:
+        Complete messages without their line terminators
+    """
+    framer = LineFramer(max_message_size)
+    while True:
+        chunk = await stream.read(chunk_size)
+        if not chunk:
+            if len(framer):
+                logger.warning(f"Discarding {len(framer)} bytes of unterminated message at EOF")
+            return
+        for message in framer.feed(chunk):
+            yield message
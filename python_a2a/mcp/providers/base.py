@@ -13,8 +13,15 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
 
+from ..caching import ALL_TOOLS, ToolResultCache
 from ..clients import MCPClient
-from ..server_config import ServerConfig, MCPServerRunner
+from ..server_config import (
+    ServerConfig,
+    MCPServerRunner,
+    MCPServerPool,
+    acquire_server_pool,
+    release_server_pool
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +37,44 @@ class BaseProvider(ABC):
     Subclasses must implement:
     - _create_config(): Create server configuration
     - _get_provider_name(): Return provider name for logging
+    
+    With ``pool_size`` set, the provider uses a shared pool of warm server
+    processes instead of starting its own; providers with the same
+    configuration share the pool. Only stateless servers should be pooled,
+    since consecutive calls may reach different processes.
+    
+    With ``cache_ttl`` set, results of the read-only tools listed in
+    ``CACHEABLE_TOOLS`` are cached and identical concurrent calls share one
+    request; any call to a tool in ``WRITE_TOOLS`` clears the cache.
     """
     
-    def __init__(self):
-        """Initialize the base provider."""
+    # Read-only tools whose results may be cached
+    CACHEABLE_TOOLS: Tuple[str, ...] = ()
+    
+    # Tools that modify state seen by the cacheable tools
+    WRITE_TOOLS: Tuple[str, ...] = ()
+    
+    def __init__(self, pool_size: Optional[int] = None, cache_ttl: Optional[float] = None):
+        """
+        Initialize the base provider.
+        
+        Args:
+            pool_size: Use a shared pool of up to this many server processes
+            cache_ttl: Cache results of read-only tools for this many seconds
+        """
         self.client: Optional[MCPClient] = None
         self.runner: Optional[MCPServerRunner] = None
+        self.pool: Optional[MCPServerPool] = None
+        self.pool_size = pool_size
         self._connected = False
         
+        self.cache: Optional[ToolResultCache] = None
+        if cache_ttl:
+            self.cache = ToolResultCache(
+                ttls={name: cache_ttl for name in self.CACHEABLE_TOOLS},
+                invalidates={name: [ALL_TOOLS] for name in self.WRITE_TOOLS}
+            )
+        
         # Get provider configuration
         self.config = self._create_config()
         self.provider_name = self._get_provider_name()
@@ -78,7 +115,12 @@ class BaseProvider(ABC):
         logger.info(f"Starting {self.provider_name} MCP server...")
         
         try:
-            self.client = await self.runner.start()
+            if self.pool_size:
+                self.pool = await acquire_server_pool(
+                    self.provider_name, self.config, size=self.pool_size
+                )
+            else:
+                self.client = await self.runner.start()
             self._connected = True
             logger.info(f"Connected to {self.provider_name} MCP server")
         except Exception as e:
@@ -134,7 +176,10 @@ Original error: {error_msg}
     
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
-        if self.runner:
+        if self.pool:
+            await release_server_pool(self.pool)
+            self.pool = None
+        elif self.runner:
             await self.runner.stop()
         self.client = None
         self._connected = False
@@ -143,7 +188,7 @@ Original error: {error_msg}
     @property
     def is_connected(self) -> bool:
         """Check if provider is connected to the MCP server."""
-        return self._connected and self.client is not None
+        return self._connected and (self.client is not None or self.pool is not None)
     
     def _ensure_connected(self) -> None:
         """Ensure provider is connected, raise error if not."""
@@ -159,7 +204,10 @@ Original error: {error_msg}
         """
         self._ensure_connected()
         
-        tools_response = await self.client.list_tools()
+        if self.pool:
+            tools_response = await self.pool.list_tools()
+        else:
+            tools_response = await self.client.list_tools()
         
         # Handle different response formats (some servers return {'tools': [...]})
         if isinstance(tools_response, dict) and 'tools' in tools_response:
@@ -186,8 +234,16 @@ Original error: {error_msg}
         """
         self._ensure_connected()
         
-        # Use the client's built-in timeout support
-        result = await self.client.call_tool(tool_name, arguments or {}, timeout=timeout)
+        async def call() -> Any:
+            # Use the client's built-in timeout support
+            if self.pool:
+                return await self.pool.call_tool(tool_name, arguments or {}, timeout=timeout)
+            return await self.client.call_tool(tool_name, arguments or {}, timeout=timeout)
+        
+        if self.cache is not None:
+            result = await self.cache.call(tool_name, arguments, call)
+        else:
+            result = await call()
         
         # Parse MCP content format if present
         if isinstance(result, dict) and 'content' in result:
@@ -38,15 +38,29 @@ class FilesystemMCPServer(BaseProvider):
     the underlying MCP server lifecycle.
     """
     
+    CACHEABLE_TOOLS = (
+        "read_file", "read_multiple_files", "list_directory", "directory_tree",
+        "search_files", "get_file_info", "list_allowed_directories"
+    )
+    
+    WRITE_TOOLS = (
+        "write_file", "edit_file", "create_directory", "move_file"
+    )
+    
     def __init__(self, 
                  allowed_directories: List[Union[str, Path]],
-                 use_npx: bool = True):
+                 use_npx: bool = True,
+                 pool_size: Optional[int] = None,
+                 cache_ttl: Optional[float] = None):
         """
         Initialize Filesystem provider.
         
         Args:
             allowed_directories: List of directories the server can access
             use_npx: Use NPX to run the server (recommended)
+            pool_size: Share a pool of up to this many warm server processes
+            cache_ttl: Cache read results for this many seconds; writes made
+                through this provider clear the cache
         """
         self.allowed_directories = [str(Path(d).resolve()) for d in allowed_directories]
         self.use_npx = use_npx
@@ -55,7 +69,7 @@ class FilesystemMCPServer(BaseProvider):
             raise ValueError("At least one allowed directory must be specified")
         
         # Initialize base provider
-        super().__init__()
+        super().__init__(pool_size=pool_size, cache_ttl=cache_ttl)
     
     def _create_config(self) -> ServerConfig:
         """Create Filesystem MCP server configuration."""
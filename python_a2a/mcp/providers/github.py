@@ -37,10 +37,29 @@ class GitHubMCPServer(BaseProvider):
     the underlying MCP server lifecycle.
     """
     
+    CACHEABLE_TOOLS = (
+        "get_me", "get_user", "search_repositories", "get_file_contents",
+        "list_branches", "list_commits", "get_commit", "search_code", "list_issues",
+        "get_issue", "get_issue_comments", "search_issues", "list_pull_requests",
+        "get_pull_request", "get_pull_request_files", "get_pull_request_status",
+        "get_pull_request_comments", "get_pull_request_reviews"
+    )
+    
+    WRITE_TOOLS = (
+        "create_repository", "create_or_update_file", "fork_repository",
+        "create_branch", "push_files", "create_issue", "update_issue",
+        "add_issue_comment", "create_pull_request", "update_pull_request",
+        "merge_pull_request", "update_pull_request_branch",
+        "add_pull_request_review_comment", "create_pull_request_review",
+        "request_copilot_review"
+    )
+    
     def __init__(self, 
                  token: Optional[str] = None,
                  use_docker: bool = True,
-                 github_host: Optional[str] = None):
+                 github_host: Optional[str] = None,
+                 pool_size: Optional[int] = None,
+                 cache_ttl: Optional[float] = None):
         """
         Initialize GitHub provider.
         
@@ -48,6 +67,9 @@ class GitHubMCPServer(BaseProvider):
             token: GitHub personal access token (can use env vars)
             use_docker: Use Docker (True) or NPX (False) 
             github_host: GitHub Enterprise host (optional)
+            pool_size: Share a pool of up to this many warm server processes
+            cache_ttl: Cache read results for this many seconds; writes made
+                through this provider clear the cache
         """
         # Get token from parameter or environment
         self.token = token or os.getenv("GITHUB_TOKEN") or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
@@ -60,7 +82,7 @@ class GitHubMCPServer(BaseProvider):
         self.github_host = github_host
         
         # Initialize base provider
-        super().__init__()
+        super().__init__(pool_size=pool_size, cache_ttl=cache_ttl)
     
     def _create_config(self) -> ServerConfig:
         """Create GitHub MCP server configuration."""
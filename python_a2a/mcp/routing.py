@@ -0,0 +1,171 @@
+"""
+Resource URI routing for MCP servers.
+
+Resource templates such as ``files://{path}`` or ``db://users/{id:int}``
+are compiled once at registration time. A ``ResourceRouter`` indexes them
+in a character trie on their literal prefix, so resolving a URI only tries
+the few templates whose prefix the URI starts with instead of every
+registered resource.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# {name} or {name:type} placeholder in a URI template
+_PLACEHOLDER = re.compile(r'{([^{}:]+)(?::([^{}]+))?}')
+
+# Trie node key holding the routes whose literal prefix ends at that node
+_ROUTES = None
+
+
+class URITemplate:
+    """
+    A compiled resource URI template.
+
+    Each placeholder matches one path segment (no ``/``); the literal text
+    between placeholders must match exactly.
+    """
+
+    __slots__ = ("template", "prefix", "variables", "_pattern")
+
+    def __init__(self, template: str):
+        """
+        Compile a URI template.
+
+        Args:
+            template: URI template with {name} or {name:type} placeholders
+        """
+        self.template = template
+        self.variables: List[Tuple[str, Optional[str]]] = []
+
+        parts = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(template):
+            parts.append(re.escape(template[position:match.start()]))
+            parts.append("([^/]+)")
+            self.variables.append((match.group(1), match.group(2)))
+            position = match.end()
+        parts.append(re.escape(template[position:]))
+
+        first = _PLACEHOLDER.search(template)
+        self.prefix = template[:first.start()] if first else template
+        self._pattern = re.compile("".join(parts))
+
+    def match(self, uri: str) -> Optional[Dict[str, str]]:
+        """
+        Match a URI against the template.
+
+        Args:
+            uri: URI to match
+
+        Returns:
+            Extracted parameters if the URI matches, None otherwise
+        """
+        match = self._pattern.fullmatch(uri)
+        if match is None:
+            return None
+        return {name: value for (name, _), value in zip(self.variables, match.groups())}
+
+
+class ResourceRouter:
+    """
+    Resolves URIs to registered resources.
+
+    Static URIs are looked up in a dict. Templates are indexed by literal
+    prefix; when several templates match a URI, the one registered first
+    wins, as with a linear scan over the resources in registration order.
+    """
+
+    def __init__(self):
+        """Initialize an empty router."""
+        self._static: Dict[str, Any] = {}
+        self._templates: Dict[str, Tuple[int, URITemplate, Any]] = {}
+        self._trie: Dict[Any, Any] = {}
+        self._order = 0
+
+    def __len__(self) -> int:
+        return len(self._static) + len(self._templates)
+
+    def add(self, uri: str, target: Any, template: Optional[URITemplate] = None) -> None:
+        """
+        Register a resource.
+
+        Re-registering a URI replaces its target.
+
+        Args:
+            uri: Static URI or URI template
+            target: Object returned when the URI resolves
+            template: Compiled template for template resources, None for
+                static URIs
+        """
+        if template is None:
+            self._static[uri] = target
+            return
+
+        if uri in self._templates:
+            order = self._templates[uri][0]
+        else:
+            order = self._order
+            self._order += 1
+            node = self._trie
+            for char in template.prefix:
+                node = node.setdefault(char, {})
+            node.setdefault(_ROUTES, []).append(uri)
+        self._templates[uri] = (order, template, target)
+
+    def remove(self, uri: str) -> None:
+        """
+        Unregister a resource, if registered.
+
+        Args:
+            uri: Static URI or URI template
+        """
+        if self._static.pop(uri, None) is not None:
+            return
+        entry = self._templates.pop(uri, None)
+        if entry is None:
+            return
+        node = self._trie
+        for char in entry[1].prefix:
+            node = node[char]
+        node[_ROUTES].remove(uri)
+
+    def resolve(self, uri: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """
+        Find the resource for a URI.
+
+        Args:
+            uri: URI to resolve
+
+        Returns:
+            Tuple of target and extracted parameters, or None if no
+            resource matches
+        """
+        target = self._static.get(uri)
+        if target is not None:
+            return target, {}
+
+        # Collect the templates whose literal prefix the URI starts with
+        candidates = []
+        node = self._trie
+        if _ROUTES in node:
+            candidates.extend(node[_ROUTES])
+        for char in uri:
+            node = node.get(char)
+            if node is None:
+                break
+            if _ROUTES in node:
+                candidates.extend(node[_ROUTES])
+
+        best = None
+        for key in candidates:
+            order, template, target = self._templates[key]
+            if best is not None and order > best[0]:
+                continue
+            params = template.match(uri)
+            if params is not None:
+                best = (order, target, params)
+
+        if best is None:
+            return None
+        return best[1], best[2]
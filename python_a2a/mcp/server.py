@@ -11,7 +11,6 @@ Designed for production use by millions of users with robust validation.
 """
 
 import asyncio
-import inspect
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -32,6 +31,10 @@ from .protocol import (
     create_text_content
 )
 from .connection import MCPMessageHandler, MCPConnection
+from .caching import ToolResultCache
+from .execution import ToolExecutor, THREAD, is_streaming_handler
+from .routing import ResourceRouter, URITemplate
+from .validation import SchemaValidationError, compile_schema, schema_from_signature
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,16 @@ class MCPTool:
     handler: Callable
     # Tool annotations for behavior metadata
     annotations: Optional[Dict[str, Any]] = None
+    # Execution options: "thread" or "process" for sync handlers,
+    # concurrent call limit and time limit in seconds
+    executor: str = THREAD
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+    # Compiled input_schema
+    validator: Callable[[Any], Any] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.validator = compile_schema(self.input_schema)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to MCP protocol format."""
@@ -57,48 +70,21 @@ class MCPTool:
             result["annotations"] = self.annotations
         return result
     
-    def validate_arguments(self, arguments: Dict[str, Any]) -> None:
-        """Validate tool arguments against schema."""
-        # Basic validation - could be extended with jsonschema
-        schema = self.input_schema
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate tool arguments against the compiled input schema.
         
-        if schema.get("type") == "object":
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
+        Returns:
+            The arguments with schema defaults filled in and safe
+            coercions applied
             
-            # Check required properties
-            for prop in required:
-                if prop not in arguments:
-                    raise MCPProtocolError(f"Missing required argument: {prop}")
-            
-            # Check argument types
-            for arg_name, arg_value in arguments.items():
-                if arg_name in properties:
-                    prop_schema = properties[arg_name]
-                    expected_type = prop_schema.get("type")
-                    
-                    if expected_type and not self._check_type(arg_value, expected_type):
-                        raise MCPProtocolError(
-                            f"Argument {arg_name} has wrong type, expected {expected_type}"
-                        )
-    
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """Check if value matches expected JSON schema type."""
-        type_map = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None)
-        }
-        
-        expected_python_type = type_map.get(expected_type)
-        if expected_python_type:
-            return isinstance(value, expected_python_type)
-        
-        return True  # Unknown type, accept
+        Raises:
+            MCPProtocolError: If the arguments do not match the schema
+        """
+        try:
+            return self.validator(arguments)
+        except SchemaValidationError as e:
+            raise MCPProtocolError(str(e)) from e
 
 
 @dataclass
@@ -112,6 +98,12 @@ class MCPResource:
     # For template resources
     uri_template: Optional[str] = None
     template_params: Optional[List[Dict[str, Any]]] = None
+    # Compiled uri_template
+    template: Optional[URITemplate] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.uri_template is not None:
+            self.template = URITemplate(self.uri_template)
     
     @property
     def is_template(self) -> bool:
@@ -144,26 +136,7 @@ class MCPResource:
         if not self.is_template:
             return {} if uri == self.uri else None
         
-        # Simple template matching - could be enhanced
-        import re
-        
-        # Convert template to regex
-        pattern = self.uri_template
-        param_names = []
-        
-        def replace_param(match):
-            param_name = match.group(1).split(':')[0]
-            param_names.append(param_name)
-            return f"(?P<{param_name}>[^/]+)"
-        
-        pattern = re.sub(r'{([^{}]+)}', replace_param, pattern)
-        pattern = f"^{pattern}$"
-        
-        match = re.match(pattern, uri)
-        if match:
-            return match.groupdict()
-        
-        return None
+        return self.template.match(uri)
 
 
 @dataclass
@@ -196,7 +169,8 @@ class MCPServerHandler(MCPMessageHandler):
     def __init__(
         self,
         implementation_info: MCPImplementationInfo,
-        capabilities: MCPCapabilities
+        capabilities: MCPCapabilities,
+        executor: Optional[ToolExecutor] = None
     ):
         """
         Initialize server handler.
@@ -204,13 +178,19 @@ class MCPServerHandler(MCPMessageHandler):
         Args:
             implementation_info: Server implementation details
             capabilities: Server capabilities
+            executor: Executor for tool, resource and prompt handlers
         """
         self.implementation_info = implementation_info
         self.capabilities = capabilities
+        self.executor = executor or ToolExecutor()
+        
+        # Results of tools added with a cache_ttl
+        self.cache = ToolResultCache()
         
         # Server state
         self.tools: Dict[str, MCPTool] = {}
         self.resources: Dict[str, MCPResource] = {}
+        self._resource_router = ResourceRouter()
         self.prompts: Dict[str, MCPPrompt] = {}
         
         # Protocol handler
@@ -378,17 +358,22 @@ class MCPServerHandler(MCPMessageHandler):
         
         tool = self.tools[tool_name]
         
-        # Validate arguments
-        tool.validate_arguments(arguments)
+        # Validate arguments before they reach the handler
+        arguments = tool.validate_arguments(arguments)
         
-        try:
-            # Call tool handler
-            if asyncio.iscoroutinefunction(tool.handler):
-                result = await tool.handler(**arguments)
-            else:
-                # Run sync function in thread pool
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, lambda: tool.handler(**arguments))
+        async def run() -> Dict[str, Any]:
+            if is_streaming_handler(tool.handler):
+                return await self._stream_tool(tool, arguments, params.get("_meta") or {})
+            
+            # Call tool handler, sync handlers run in the executor's pools
+            result = await self.executor.run(
+                tool_name,
+                tool.handler,
+                arguments,
+                executor=tool.executor,
+                max_concurrency=tool.max_concurrency,
+                timeout=tool.timeout
+            )
             
             # Format result as content
             content = self._format_tool_result(result)
@@ -397,10 +382,15 @@ class MCPServerHandler(MCPMessageHandler):
                 "content": content,
                 "isError": False
             }
-            
+        
+        try:
+            return await self.cache.call(tool_name, arguments, run)
         except Exception as e:
-            logger.error(f"Tool {tool_name} failed: {e}")
-            error_content = [create_text_content(f"Tool error: {str(e)}").to_dict()]
+            message = str(e)
+            if isinstance(e, asyncio.TimeoutError):
+                message = f"timed out after {tool.timeout}s"
+            logger.error(f"Tool {tool_name} failed: {message}")
+            error_content = [create_text_content(f"Tool error: {message}").to_dict()]
             
             return {
                 "content": error_content,
@@ -443,45 +433,17 @@ class MCPServerHandler(MCPMessageHandler):
         if not uri:
             raise MCPProtocolError("Missing uri parameter")
         
-        # Find matching resource
-        resource = None
-        template_params = {}
-        
-        # Check exact URI match first
-        for res in self.resources.values():
-            if not res.is_template and res.uri == uri:
-                resource = res
-                break
-        
-        # Check template matches
-        if not resource:
-            for res in self.resources.values():
-                if res.is_template:
-                    params_match = res.matches_uri(uri)
-                    if params_match is not None:
-                        resource = res
-                        template_params = params_match
-                        break
-        
-        if not resource:
+        # Find matching resource, exact URIs take precedence over templates
+        route = self._resource_router.resolve(uri)
+        if route is None:
             raise MCPProtocolError(f"Resource not found: {uri}")
+        resource, template_params = route
         
         try:
             # Call resource handler
-            if template_params:
-                if asyncio.iscoroutinefunction(resource.handler):
-                    result = await resource.handler(**template_params)
-                else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None, lambda: resource.handler(**template_params)
-                    )
-            else:
-                if asyncio.iscoroutinefunction(resource.handler):
-                    result = await resource.handler()
-                else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(None, resource.handler)
+            result = await self.executor.run(
+                f"resource:{resource.uri}", resource.handler, template_params
+            )
             
             # Format result as content
             content = self._format_resource_result(result)
@@ -544,13 +506,9 @@ class MCPServerHandler(MCPMessageHandler):
         
         try:
             # Call prompt handler
-            if asyncio.iscoroutinefunction(prompt.handler):
-                result = await prompt.handler(**arguments)
-            else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, lambda: prompt.handler(**arguments)
-                )
+            result = await self.executor.run(
+                f"prompt:{name}", prompt.handler, arguments
+            )
             
             # Format result as messages
             messages = self._format_prompt_result(result)
@@ -564,6 +522,45 @@ class MCPServerHandler(MCPMessageHandler):
             logger.error(f"Prompt {name} failed: {e}")
             raise MCPProtocolError(f"Prompt error: {str(e)}")
     
+    async def _stream_tool(
+        self,
+        tool: MCPTool,
+        arguments: Dict[str, Any],
+        meta: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run a generator tool, sending each chunk as a progress notification.
+        
+        Chunks are only sent when the request carries a progress token;
+        the response always holds the complete content, so clients that do
+        not stream still get the whole result.
+        """
+        token = meta.get("progressToken")
+        connection = getattr(self, "_connection", None)
+        content = []
+        chunks = 0
+        async for item in self.executor.stream(
+            tool.name,
+            tool.handler,
+            arguments,
+            executor=tool.executor,
+            max_concurrency=tool.max_concurrency,
+            timeout=tool.timeout
+        ):
+            chunk = self._format_tool_result(item)
+            content.extend(chunk)
+            chunks += 1
+            if token is not None and connection is not None:
+                await connection.send_notification(self.protocol.create_notification(
+                    "notifications/progress",
+                    {"progressToken": token, "progress": chunks, "content": chunk}
+                ))
+        
+        return {
+            "content": content,
+            "isError": False
+        }
+    
     def _format_tool_result(self, result: Any) -> List[Dict[str, Any]]:
         """Format tool result as MCP content."""
         if isinstance(result, list) and all(isinstance(item, MCPContent) for item in result):
@@ -614,17 +611,33 @@ class MCPServerHandler(MCPMessageHandler):
         description: str,
         input_schema: Dict[str, Any],
         handler: Callable,
-        annotations: Optional[Dict[str, Any]] = None
+        annotations: Optional[Dict[str, Any]] = None,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        invalidates: Optional[List[str]] = None
     ) -> None:
-        """Add a tool to the server."""
+        """
+        Add a tool to the server.
+        
+        Results of a tool with ``cache_ttl`` are cached per set of
+        arguments and concurrent identical calls share one run; calls to a
+        tool with ``invalidates`` drop the cached results of those tools
+        ("*" for all).
+        """
         tool = MCPTool(
             name=name,
             description=description,
             input_schema=input_schema,
             handler=handler,
-            annotations=annotations
+            annotations=annotations,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout
         )
         self.tools[name] = tool
+        self.cache.configure(name, ttl=cache_ttl, invalidates=invalidates or [])
         logger.info(f"Added tool: {name}")
     
     def add_resource(
@@ -648,6 +661,9 @@ class MCPServerHandler(MCPMessageHandler):
             template_params=template_params
         )
         self.resources[uri] = resource
+        self._resource_router.add(
+            resource.uri_template or resource.uri, resource, resource.template
+        )
         logger.info(f"Added resource: {uri}")
     
     def add_prompt(
@@ -683,7 +699,9 @@ class MCPServer:
         description: Optional[str] = None,
         tools_enabled: bool = True,
         resources_enabled: bool = True,
-        prompts_enabled: bool = True
+        prompts_enabled: bool = True,
+        max_workers: int = 32,
+        process_workers: Optional[int] = None
     ):
         """
         Initialize MCP server.
@@ -695,6 +713,9 @@ class MCPServer:
             tools_enabled: Enable tools capability
             resources_enabled: Enable resources capability
             prompts_enabled: Enable prompts capability
+            max_workers: Number of threads for synchronous handlers
+            process_workers: Number of processes for tools registered with
+                executor="process" (default: number of CPUs)
         """
         self.name = name
         self.version = version
@@ -716,7 +737,14 @@ class MCPServer:
         )
         
         # Create handler
-        self.handler = MCPServerHandler(implementation_info, capabilities)
+        self.handler = MCPServerHandler(
+            implementation_info,
+            capabilities,
+            executor=ToolExecutor(
+                max_workers=max_workers,
+                process_workers=process_workers
+            )
+        )
         
         logger.info(f"Created MCP server: {name} v{version}")
     
@@ -725,17 +753,28 @@ class MCPServer:
         name: Optional[str] = None,
         description: Optional[str] = None,
         schema: Optional[Dict[str, Any]] = None,
-        annotations: Optional[Dict[str, Any]] = None
+        annotations: Optional[Dict[str, Any]] = None,
+        executor: str = THREAD,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        invalidates: Optional[List[str]] = None
     ) -> Callable:
-        """Decorator to register a tool."""
+        """
+        Decorator to register a tool.
+        
+        Synchronous handlers run in the server's thread pool, or in its
+        process pool with executor="process" for CPU-bound work. Idempotent
+        tools can set ``cache_ttl`` to cache their results, and write tools
+        ``invalidates`` to drop the cached results they affect.
+        """
         def decorator(func: Callable) -> Callable:
             tool_name = name or func.__name__
             tool_description = description or (func.__doc__ or "").strip()
             
             # Generate schema from function signature if not provided
             if schema is None:
-                sig = inspect.signature(func)
-                input_schema = self._generate_schema_from_signature(sig, func)
+                input_schema = schema_from_signature(func, "Parameter {name}")
             else:
                 input_schema = schema
             
@@ -744,7 +783,12 @@ class MCPServer:
                 description=tool_description,
                 input_schema=input_schema,
                 handler=func,
-                annotations=annotations
+                annotations=annotations,
+                executor=executor,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                cache_ttl=cache_ttl,
+                invalidates=invalidates
             )
             
             return func
@@ -803,54 +847,7 @@ class MCPServer:
         
         return decorator
     
-    def _generate_schema_from_signature(
-        self,
-        sig: 'inspect.Signature',
-        func: Callable
-    ) -> Dict[str, Any]:
-        """Generate JSON schema from function signature."""
-        from typing import get_type_hints
-        
-        type_hints = get_type_hints(func)
-        
-        schema = {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
-        
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "cls"):
-                continue
-            
-            # Get type information
-            param_type = type_hints.get(param_name, str)
-            json_type = self._python_type_to_json_type(param_type)
-            
-            schema["properties"][param_name] = {
-                "type": json_type,
-                "description": f"Parameter {param_name}"
-            }
-            
-            # Check if required
-            if param.default == param.empty:
-                schema["required"].append(param_name)
-        
-        return schema
-    
-    def _python_type_to_json_type(self, python_type: type) -> str:
-        """Convert Python type to JSON schema type."""
-        if python_type == str:
-            return "string"
-        elif python_type == int:
-            return "integer"
-        elif python_type == float:
-            return "number"
-        elif python_type == bool:
-            return "boolean"
-        elif python_type == list:
-            return "array"
-        elif python_type == dict:
-            return "object"
-        else:
-            return "string"  # Default fallback
\ No newline at end of file
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get handler execution metrics, including queue depths."""
+        return self.handler.executor.metrics()
+    
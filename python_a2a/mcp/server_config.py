@@ -16,11 +16,14 @@ import json
 import logging
 import os
 import subprocess
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple, Union
 from pathlib import Path
 
 from .clients import MCPClient, create_stdio_client
+from .protocol import MCPConnectionError
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,10 @@ class ServerConfig:
             "args": self.args,
             "env": self.env
         }
+    
+    def key(self) -> Tuple:
+        """Identity of the server process this configuration starts."""
+        return (self.command, tuple(self.args), tuple(sorted(self.env.items())))
 
 
 class MCPServerRunner:
@@ -144,6 +151,365 @@ class MCPServerRunner:
         return self._running and self.client is not None and self.client.is_connected
 
 
+@dataclass
+class _PoolMember:
+    """A server process in a pool."""
+    runner: MCPServerRunner
+    in_flight: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    starting: bool = True
+
+
+class MCPServerPool:
+    """
+    Pool of warm server processes for one server configuration.
+    
+    Starting a server (Node startup, package resolution) can take seconds,
+    so the pool keeps between ``min_size`` and ``size`` processes running
+    and sends each call to the least busy one. When every process is busy
+    another is started in the background, up to ``size``. A maintenance
+    task pings idle processes every ``health_interval`` seconds, restarts
+    any that died or stopped answering, and stops processes idle for longer
+    than ``idle_timeout`` down to ``min_size``.
+    
+    Pools returned by ``acquire_server_pool`` are shared by every user of
+    the same configuration.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        config: ServerConfig,
+        size: int = 2,
+        min_size: int = 1,
+        idle_timeout: float = 300.0,
+        health_interval: float = 30.0,
+        health_timeout: float = 5.0
+    ):
+        """
+        Initialize a server pool.
+        
+        Args:
+            name: Server name
+            config: Server configuration
+            size: Maximum number of server processes
+            min_size: Number of processes kept running when idle
+            idle_timeout: Seconds before an idle process above min_size is stopped
+            health_interval: Seconds between health checks
+            health_timeout: Seconds to wait for a health check ping
+        """
+        if size < 1 or not 0 <= min_size <= size:
+            raise ValueError(f"Invalid pool size {min_size}..{size} for server {name}")
+        
+        self.name = name
+        self.config = config
+        self.size = size
+        self.min_size = min_size
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        
+        self.members: List[_PoolMember] = []
+        self.stats = {"calls": 0, "started": 0, "restarts": 0, "reaped": 0}
+        self._counter = 0
+        self._users = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._start_task: Optional[asyncio.Task] = None
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @property
+    def is_running(self) -> bool:
+        """Check if the pool has been started and not closed."""
+        return self._start_task is not None and self._start_task.done() and not self._start_task.exception()
+    
+    async def start(self) -> None:
+        """
+        Start the initial server processes.
+        
+        Safe to call concurrently; all callers wait for the same startup.
+        
+        Raises:
+            RuntimeError: If no server process could be started
+        """
+        if self._start_task is None:
+            self._lock = self._lock or asyncio.Lock()
+            self._start_task = asyncio.ensure_future(self._start())
+        try:
+            await asyncio.shield(self._start_task)
+        except Exception:
+            self._start_task = None
+            raise
+    
+    async def _start(self) -> None:
+        """Start min_size processes (at least one) and the maintenance task."""
+        results = await asyncio.gather(
+            *(self._add_member() for _ in range(max(self.min_size, 1))),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if len(errors) == len(results):
+            raise errors[0]
+        for error in errors:
+            logger.warning(f"Server pool {self.name}: a process failed to start: {error}")
+        
+        self._maintenance_task = asyncio.create_task(self._maintain())
+        logger.info(f"Started server pool {self.name} with {len(self.members)} processes")
+    
+    async def close(self) -> None:
+        """Stop all server processes and background tasks."""
+        for task in [self._maintenance_task, *self._tasks]:
+            if task is not None and not task.done():
+                task.cancel()
+        self._maintenance_task = None
+        self._start_task = None
+        
+        members, self.members = self.members, []
+        await asyncio.gather(
+            *(member.runner.stop() for member in members),
+            return_exceptions=True
+        )
+        logger.info(f"Closed server pool {self.name}")
+    
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[MCPClient]:
+        """
+        Borrow the client of the least busy server process.
+        
+        Yields:
+            MCPClient connected to a pooled server
+        """
+        member = await self._select()
+        member.in_flight += 1
+        self.stats["calls"] += 1
+        try:
+            yield member.runner.client
+        except MCPConnectionError:
+            # The process is probably gone; replace it for later calls
+            self._spawn(self._restart(member))
+            raise
+        finally:
+            member.in_flight -= 1
+            member.last_used = time.monotonic()
+    
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Call a tool on the least busy server process.
+        
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            timeout: Custom timeout for this call
+            
+        Returns:
+            Tool result
+        """
+        async with self.client() as client:
+            return await client.call_tool(name, arguments or {}, timeout=timeout)
+    
+    async def list_tools(self) -> Dict[str, Any]:
+        """List the tools of the pooled server."""
+        async with self.client() as client:
+            return await client.list_tools()
+    
+    async def check_health(self) -> None:
+        """
+        Restart dead or unresponsive processes and reap idle ones.
+        
+        Runs every ``health_interval`` seconds; processes with calls in
+        flight are left alone.
+        """
+        now = time.monotonic()
+        for member in list(self.members):
+            if member.starting or member.in_flight:
+                continue
+            
+            if not member.runner.is_running:
+                await self._restart(member)
+                continue
+            
+            if now - member.last_used > self.idle_timeout and self._ready_count() > self.min_size:
+                self.members.remove(member)
+                await member.runner.stop()
+                self.stats["reaped"] += 1
+                logger.info(f"Server pool {self.name}: stopped idle process {member.runner.name}")
+                continue
+            
+            try:
+                await asyncio.wait_for(member.runner.client.ping(), timeout=self.health_timeout)
+            except Exception as e:
+                logger.warning(f"Server pool {self.name}: {member.runner.name} failed health check: {e}")
+                await self._restart(member)
+        
+        while len(self.members) < self.min_size:
+            try:
+                await self._add_member()
+            except Exception as e:
+                logger.error(f"Server pool {self.name}: failed to start process: {e}")
+                break
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            **self.stats,
+            "processes": len(self.members),
+            "ready": self._ready_count(),
+            "in_flight": sum(member.in_flight for member in self.members),
+            "users": self._users
+        }
+    
+    def _ready_count(self) -> int:
+        """Count processes that can take calls."""
+        return sum(1 for member in self.members if not member.starting and member.runner.is_running)
+    
+    async def _select(self) -> _PoolMember:
+        """Pick the least busy running process, starting one if needed."""
+        if self._start_task is None:
+            raise RuntimeError(f"Server pool {self.name} is not started")
+        
+        ready = [m for m in self.members if not m.starting and m.runner.is_running]
+        if not ready:
+            async with self._lock:
+                ready = [m for m in self.members if not m.starting and m.runner.is_running]
+                if not ready:
+                    # Drop dead processes so the replacement fits in the pool
+                    dead = [m for m in self.members if not m.starting]
+                    self.members = [m for m in self.members if m.starting]
+                    await asyncio.gather(
+                        *(m.runner.stop() for m in dead),
+                        return_exceptions=True
+                    )
+                    return await self._add_member()
+        
+        member = min(ready, key=lambda m: m.in_flight)
+        if member.in_flight > 0 and len(self.members) < self.size:
+            # Everything is busy; add capacity without delaying this call.
+            # The slot is taken before returning, so callers in the same
+            # tick see it and do not start processes past the size.
+            self._spawn(self._start_member(self._reserve_member()))
+        return member
+    
+    def _reserve_member(self) -> _PoolMember:
+        """Add a not yet started process to the pool, taking a slot."""
+        self._counter += 1
+        member = _PoolMember(MCPServerRunner(f"{self.name}#{self._counter}", self.config))
+        self.members.append(member)
+        return member
+    
+    async def _add_member(self) -> _PoolMember:
+        """Start a new server process."""
+        return await self._start_member(self._reserve_member())
+    
+    async def _start_member(self, member: _PoolMember) -> _PoolMember:
+        """Start the process of a reserved member."""
+        try:
+            await member.runner.start()
+        except Exception:
+            if member in self.members:
+                self.members.remove(member)
+            raise
+        finally:
+            member.starting = False
+        
+        member.last_used = time.monotonic()
+        self.stats["started"] += 1
+        return member
+    
+    async def _restart(self, member: _PoolMember) -> None:
+        """Replace a dead or unresponsive process."""
+        if member.starting:
+            return
+        member.starting = True
+        try:
+            await member.runner.stop()
+            await member.runner.start()
+            member.last_used = time.monotonic()
+            self.stats["restarts"] += 1
+            logger.info(f"Server pool {self.name}: restarted {member.runner.name}")
+        except Exception as e:
+            logger.error(f"Server pool {self.name}: failed to restart {member.runner.name}: {e}")
+            if member in self.members:
+                self.members.remove(member)
+        finally:
+            member.starting = False
+    
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, logging failures."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        
+        def done(task):
+            self._tasks.discard(task)
+            if not task.cancelled() and task.exception():
+                logger.error(f"Server pool {self.name}: background task failed: {task.exception()}")
+        
+        task.add_done_callback(done)
+    
+    async def _maintain(self) -> None:
+        """Run health checks periodically."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Server pool {self.name}: health check failed: {e}")
+
+
+# Pools shared by all users of the same server configuration
+_shared_pools: Dict[Tuple, MCPServerPool] = {}
+
+
+async def acquire_server_pool(name: str, config: ServerConfig, **options) -> MCPServerPool:
+    """
+    Get the shared, started pool for a server configuration.
+    
+    Every caller with the same command, arguments and environment gets the
+    same pool; release it with ``release_server_pool`` when done. A larger
+    ``size`` than the pool already has grows it.
+    
+    Args:
+        name: Server name
+        config: Server configuration
+        **options: MCPServerPool options for a new pool
+        
+    Returns:
+        The started pool
+    """
+    key = config.key()
+    pool = _shared_pools.get(key)
+    if pool is None:
+        pool = _shared_pools[key] = MCPServerPool(name, config, **options)
+    elif options.get("size", 0) > pool.size:
+        pool.size = options["size"]
+    
+    pool._users += 1
+    try:
+        await pool.start()
+    except Exception:
+        await release_server_pool(pool)
+        raise
+    return pool
+
+
+async def release_server_pool(pool: MCPServerPool) -> None:
+    """
+    Release a pool from ``acquire_server_pool``; the last user closes it.
+    
+    Args:
+        pool: Pool to release
+    """
+    pool._users -= 1
+    if pool._users <= 0:
+        if _shared_pools.get(pool.config.key()) is pool:
+            del _shared_pools[pool.config.key()]
+        await pool.close()
+
+
 class MCPServerManager:
     """
     Manages multiple MCP servers.
@@ -158,7 +524,10 @@ class MCPServerManager:
     def __init__(self):
         """Initialize the server manager."""
         self.servers: Dict[str, MCPServerRunner] = {}
+        self.pools: Dict[str, MCPServerPool] = {}
         self._configs: Dict[str, ServerConfig] = {}
+        # Starts in progress, shared by concurrent callers
+        self._starting: Dict[str, asyncio.Task] = {}
     
     def add_server(self, name: str, config: Union[ServerConfig, Dict[str, Any]]):
         """
@@ -228,11 +597,59 @@ class MCPServerManager:
             logger.info(f"Server {name} is already running")
             return self.servers[name].client
         
-        runner = MCPServerRunner(name, self._configs[name])
-        client = await runner.start()
-        self.servers[name] = runner
+        task = self._starting.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._start_runner(name))
+            self._starting[name] = task
+        return await asyncio.shield(task)
+    
+    async def _start_runner(self, name: str) -> MCPClient:
+        """Start a server's runner; shared by concurrent start_server calls."""
+        try:
+            runner = MCPServerRunner(name, self._configs[name])
+            client = await runner.start()
+            self.servers[name] = runner
+            return client
+        finally:
+            self._starting.pop(name, None)
+    
+    async def get_pool(self, name: str, size: int = 2, **options) -> MCPServerPool:
+        """
+        Get a pool of warm processes for a server.
+        
+        The pool is shared with providers and other managers that use the
+        same server configuration.
         
-        return client
+        Args:
+            name: Server name
+            size: Maximum number of server processes
+            **options: Other MCPServerPool options
+            
+        Returns:
+            The started pool
+            
+        Raises:
+            KeyError: If server not configured
+        """
+        if name not in self._configs:
+            raise KeyError(f"Server {name} not configured")
+        
+        if name not in self.pools:
+            self.pools[name] = await acquire_server_pool(
+                name, self._configs[name], size=size, **options
+            )
+        return self.pools[name]
+    
+    async def close_pool(self, name: str):
+        """
+        Release a server's pool.
+        
+        Args:
+            name: Server name
+        """
+        pool = self.pools.pop(name, None)
+        if pool is not None:
+            await release_server_pool(pool)
     
     async def stop_server(self, name: str):
         """
@@ -249,29 +666,47 @@ class MCPServerManager:
         """
         Start all configured servers.
         
+        Servers are started concurrently, so startup takes about as long as
+        the slowest server rather than the sum of all of them.
+        
         Returns:
-            Dictionary mapping server names to clients
+            Dictionary mapping server names to clients of the servers that
+            started
         """
-        clients = {}
+        names = list(self._configs)
+        results = await asyncio.gather(
+            *(self.start_server(name) for name in names),
+            return_exceptions=True
+        )
         
-        for name in self._configs:
-            try:
-                client = await self.start_server(name)
-                clients[name] = client
-            except Exception as e:
-                logger.error(f"Failed to start server {name}: {e}")
+        clients = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to start server {name}: {result}")
+            else:
+                clients[name] = result
         
         return clients
     
     async def stop_all(self):
-        """Stop all running servers."""
-        server_names = list(self.servers.keys())
+        """Stop all running servers and release their pools."""
+        names = list(self.servers.keys())
+        results = await asyncio.gather(
+            *(self.stop_server(name) for name in names),
+            return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error stopping server {name}: {result}")
         
-        for name in server_names:
-            try:
-                await self.stop_server(name)
-            except Exception as e:
-                logger.error(f"Error stopping server {name}: {e}")
+        names = list(self.pools.keys())
+        results = await asyncio.gather(
+            *(self.close_pool(name) for name in names),
+            return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error closing pool {name}: {result}")
     
     def get_client(self, name: str) -> Optional[MCPClient]:
         """
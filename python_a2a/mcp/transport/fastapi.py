@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..fastmcp import FastMCP, MCPResponse
@@ -55,6 +56,12 @@ def create_fastapi_app(mcp_server: FastMCP) -> FastAPI:
         """Get MCP server metadata"""
         return mcp_server.get_metadata()
     
+    # Handler execution metrics endpoint
+    @app.get("/metrics")
+    async def get_metrics():
+        """Get handler execution and queue-depth metrics"""
+        return mcp_server.get_metrics()
+    
     # List tools endpoint
     @app.get("/tools")
     async def list_tools():
@@ -70,13 +77,22 @@ def create_fastapi_app(mcp_server: FastMCP) -> FastAPI:
     # Call tool endpoint
     @app.post("/tools/{tool_name}")
     async def call_tool(tool_name: str, request: Request):
-        """Call a tool with parameters"""
+        """Call a tool with parameters, streaming the result as SSE on request"""
         # Parse request body
         try:
             params = await request.json()
         except json.JSONDecodeError:
             params = {}
         
+        if _wants_stream(request):
+            if tool_name not in mcp_server.tools:
+                raise HTTPException(status_code=404, detail=f"Tool not found: {tool_name}")
+            return StreamingResponse(
+                _sse_chunks(mcp_server.stream_tool(tool_name, params)),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"}
+            )
+        
         try:
             # Call the tool
             response = await mcp_server.call_tool(tool_name, params)
@@ -96,6 +112,40 @@ def create_fastapi_app(mcp_server: FastMCP) -> FastAPI:
             )
             return error_response.to_dict()
     
+    # Blob download endpoint for out-of-band binary results
+    @app.get("/blobs/{digest}")
+    async def get_blob(digest: str, request: Request):
+        """Stream a stored blob, honouring a single byte range"""
+        store = mcp_server.blob_store
+        try:
+            info = store.info(digest) if store is not None else None
+        except ValueError:
+            info = None
+        if info is None:
+            raise HTTPException(status_code=404, detail=f"Blob not found: {digest}")
+        
+        start, end = 0, info.size
+        status_code = 200
+        headers = {
+            "Accept-Ranges": "bytes",
+            "ETag": f'"{info.digest}"',
+            "Cache-Control": "public, max-age=31536000, immutable"
+        }
+        
+        range_header = request.headers.get("range")
+        if range_header:
+            start, end = _parse_range(range_header, info.size)
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{info.size}"
+        headers["Content-Length"] = str(end - start)
+        
+        return StreamingResponse(
+            store.iter_chunks(info.digest, start, end),
+            status_code=status_code,
+            media_type=info.mime_type,
+            headers=headers
+        )
+    
     # Get resource endpoint
     @app.get("/resources/{path:path}")
     async def get_resource(path: str):
@@ -122,4 +172,56 @@ def create_fastapi_app(mcp_server: FastMCP) -> FastAPI:
             )
             return error_response.to_dict()
     
-    return app
\ No newline at end of file
+    return app
+
+
+def _wants_stream(request: Request) -> bool:
+    """Check whether a tool call asks for a streamed result."""
+    if request.query_params.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+async def _sse_chunks(chunks):
+    """Encode response chunks as server-sent events, ending with a done event."""
+    async for chunk in chunks:
+        yield f"data: {json.dumps(chunk.to_dict())}\n\n"
+    yield "event: done\ndata: {}\n\n"
+
+
+def _parse_range(header: str, size: int):
+    """
+    Parse a single-range HTTP Range header.
+    
+    Args:
+        header: Range header value, e.g. "bytes=0-1023" or "bytes=-500"
+        size: Size of the resource
+        
+    Returns:
+        Tuple of start offset and end offset (exclusive)
+        
+    Raises:
+        HTTPException: If the range is malformed or not satisfiable
+    """
+    unit, _, spec = header.partition("=")
+    try:
+        if unit.strip() != "bytes" or "," in spec:
+            raise ValueError(header)
+        first, _, last = spec.strip().partition("-")
+        if first:
+            start = int(first)
+            end = int(last) + 1 if last else size
+        else:
+            start = max(size - int(last), 0)
+            end = size
+    except ValueError:
+        raise HTTPException(status_code=416, detail=f"Invalid range: {header}")
+    
+    end = min(end, size)
+    if start >= end:
+        raise HTTPException(
+            status_code=416,
+            detail=f"Range not satisfiable: {header}",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
@@ -18,7 +18,8 @@ from typing import List, Optional, Dict, Any
 from pathlib import Path
 from urllib.parse import urljoin
 
-from .protocol import MCPConnectionError, MCPProtocolError
+from .framing import DEFAULT_MAX_MESSAGE_SIZE, LineFramer, read_frames
+from .protocol import MCPConnectionError, MCPProtocolError, MCPTimeoutError
 
 # Optional HTTP dependencies
 try:
@@ -43,7 +44,9 @@ class StdioTransport:
         command: List[str],
         cwd: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+        max_queued_messages: int = 100
     ):
         """
         Initialize stdio transport.
@@ -53,16 +56,21 @@ class StdioTransport:
             cwd: Working directory for server process
             env: Environment variables for server process
             timeout: Process startup timeout
+            max_message_size: Maximum size of one message in bytes;
+                larger messages are dropped
+            max_queued_messages: Received messages buffered before the
+                transport stops reading from the server
         """
         self.command = command
         self.cwd = cwd
         self.env = env or {}
         self.timeout = timeout
+        self.max_message_size = max_message_size
         
         # Process management
         self.process: Optional[asyncio.subprocess.Process] = None
         self._connected = False
-        self._receive_queue = asyncio.Queue()
+        self._receive_queue = asyncio.Queue(maxsize=max_queued_messages)
         self._reader_task: Optional[asyncio.Task] = None
         
         logger.info(f"Created stdio transport for command: {' '.join(command)}")
@@ -193,58 +201,17 @@ class StdioTransport:
         )
     
     async def _read_stdout(self) -> None:
-        """Read messages from process stdout with proper handling of large JSON responses."""
+        """Read newline-delimited messages from process stdout."""
         logger.debug("Started stdout reader task")
         
         try:
-            buffer = b''
-            max_message_size = 50 * 1024 * 1024  # 50MB limit for large responses like screenshots
-            
-            while self._connected and self.process:
-                try:
-                    # Read data in chunks
-                    chunk = await self.process.stdout.read(65536)  # 64KB chunks
-                    if not chunk:
-                        logger.info("MCP server closed stdout")
-                        break
-                    
-                    buffer += chunk
-                    
-                    # Process complete JSON-RPC messages from buffer
-                    while True:
-                        newline_pos = buffer.find(b'\n')
-                        if newline_pos == -1:
-                            break
-                        
-                        # Extract complete message
-                        message_bytes = buffer[:newline_pos].rstrip(b'\r')
-                        buffer = buffer[newline_pos + 1:]
-                        
-                        # Validate message size
-                        if len(message_bytes) > max_message_size:
-                            logger.error(f"Message too large: {len(message_bytes)} bytes, skipping")
-                            continue
-                        
-                        # Decode and validate as JSON
-                        if message_bytes:
-                            try:
-                                message_text = message_bytes.decode('utf-8')
-                                # Validate it's proper JSON-RPC
-                                import json
-                                json.loads(message_text)  # Validate JSON structure
-                                await self._receive_queue.put(message_bytes)
-                            except (UnicodeDecodeError, json.JSONDecodeError) as e:
-                                logger.warning(f"Invalid message from MCP server: {e}")
-                                continue
-                    
-                    # Check if buffer is getting too large
-                    if len(buffer) > max_message_size:
-                        logger.error("Buffer overflow, clearing incomplete message")
-                        buffer = b''
-                        
-                except Exception as e:
-                    logger.error(f"Error reading stdout: {e}")
-                    break
+            # Messages are parsed once, by the connection; putting them on
+            # the bounded queue blocks this reader when the consumer lags
+            async for message in read_frames(self.process.stdout, self.max_message_size):
+                await self._receive_queue.put(message)
+            logger.info("MCP server closed stdout")
+            # Wake the receiver now rather than letting requests time out
+            await self._receive_queue.put(MCPConnectionError("MCP server closed stdout"))
                 
         except Exception as e:
             logger.error(f"Stdout reader error: {e}")
@@ -329,11 +296,24 @@ class ServerStdioTransport:
     is being run as a subprocess by a client.
     """
     
-    def __init__(self):
-        """Initialize server stdio transport."""
+    def __init__(
+        self,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+        max_queued_messages: int = 100
+    ):
+        """
+        Initialize server stdio transport.
+        
+        Args:
+            max_message_size: Maximum size of one message in bytes;
+                larger messages are dropped
+            max_queued_messages: Received messages buffered before the
+                transport stops reading from stdin
+        """
+        self.max_message_size = max_message_size
         self._connected = False
         self._stdin_reader: Optional[asyncio.Task] = None
-        self._receive_queue = asyncio.Queue()
+        self._receive_queue = asyncio.Queue(maxsize=max_queued_messages)
         
         logger.info("Created server stdio transport")
     
@@ -420,32 +400,21 @@ class ServerStdioTransport:
                 lambda: protocol, sys.stdin
             )
             
+            framer = LineFramer(self.max_message_size)
             try:
+                # Disconnecting cancels this task, so reads need no timeout
                 while self._connected:
-                    # Read line from stdin with timeout
-                    try:
-                        line = await asyncio.wait_for(reader.readline(), timeout=1.0)
-                        
-                        if not line:
-                            # EOF - but only break if we're sure stdin is closed
-                            logger.debug("Received EOF from stdin")
-                            # Small delay to ensure we're not just hitting a temporary EOF
-                            await asyncio.sleep(0.1)
-                            continue
-                        
-                        # Remove newline and decode
-                        try:
-                            message_text = line.rstrip(b'\n\r').decode('utf-8')
-                            if message_text:  # Skip empty lines
-                                message_bytes = message_text.encode('utf-8')
-                                await self._receive_queue.put(message_bytes)
-                        except UnicodeDecodeError as e:
-                            logger.warning(f"Invalid UTF-8 from stdin: {e}")
-                            continue
-                            
-                    except asyncio.TimeoutError:
-                        # Normal timeout, continue loop
-                        continue
+                    chunk = await reader.read(65536)
+                    
+                    if not chunk:
+                        # EOF on a pipe is final: the client has gone away
+                        logger.debug("Received EOF from stdin")
+                        await self._receive_queue.put(MCPConnectionError("stdin closed"))
+                        break
+                    
+                    # Messages are parsed by the server, not here
+                    for message in framer.feed(chunk):
+                        await self._receive_queue.put(message)
                         
             finally:
                 transport.close()
@@ -587,8 +556,16 @@ class HttpMCPTransport:
             # Parse the message to ensure it's valid JSON-RPC
             message_data = json.loads(message.decode('utf-8'))
             
-            # Determine endpoint based on JSON-RPC method
-            endpoint = self._get_endpoint_for_method(message_data.get('method', ''))
+            # Determine endpoint based on JSON-RPC method; a batch goes to
+            # the method's endpoint if all its requests share one
+            if isinstance(message_data, list):
+                endpoints = {
+                    self._get_endpoint_for_method(item.get('method', ''))
+                    for item in message_data
+                }
+                endpoint = endpoints.pop() if len(endpoints) == 1 else '/mcp/rpc'
+            else:
+                endpoint = self._get_endpoint_for_method(message_data.get('method', ''))
             
             # Send HTTP POST request
             async with self._session.post(
@@ -614,6 +591,10 @@ class HttpMCPTransport:
         
         Returns:
             Response message as bytes
+        
+        Raises:
+            MCPTimeoutError: If no response arrives within the timeout; the
+                transport stays usable
         """
         try:
             response = await asyncio.wait_for(
@@ -622,7 +603,7 @@ class HttpMCPTransport:
             )
             return response
         except asyncio.TimeoutError:
-            raise MCPConnectionError("Receive timeout")
+            raise MCPTimeoutError("Receive timeout")
     
     def _get_endpoint_for_method(self, method: str) -> str:
         """Get appropriate endpoint for JSON-RPC method."""
@@ -780,6 +761,11 @@ class WebSocketMCPTransport:
         
         Returns:
             Message as bytes
+        
+        Raises:
+            MCPTimeoutError: If no message arrives within the timeout; the
+                transport stays usable
+            MCPConnectionError: If the WebSocket closed or failed
         """
         try:
             message = await asyncio.wait_for(
@@ -792,7 +778,7 @@ class WebSocketMCPTransport:
             
             return message
         except asyncio.TimeoutError:
-            raise MCPConnectionError("Receive timeout")
+            raise MCPTimeoutError("Receive timeout")
     
     async def _receive_loop(self) -> None:
         """Background task to receive WebSocket messages."""
@@ -810,6 +796,9 @@ class WebSocketMCPTransport:
         except Exception as e:
             logger.error(f"WebSocket receive loop failed: {e}")
             await self._message_queue.put(MCPConnectionError(f"WebSocket receive failed: {e}"))
+        else:
+            # Idle receives only time out, so report the closure to readers
+            await self._message_queue.put(MCPConnectionError("WebSocket closed"))
         finally:
             self._connected = False
 
@@ -0,0 +1,525 @@
+"""
+Compiled argument validation for MCP tools.
+
+A tool's input schema is compiled once, at registration, into a tree of
+small validator closures. Checking a call is then a handful of isinstance
+tests and dict lookups instead of a walk over the schema dict. Validators
+check nested objects and arrays, enums and bounds, fill in schema defaults
+and coerce values where that cannot lose information, such as the string
+"42" for an integer argument.
+
+The same validators are used by FastMCP, MCPServer and agent_flow tools,
+and ``schema_from_signature`` derives the schemas they validate against
+from Python type hints.
+"""
+
+import copy
+import enum
+import inspect
+import math
+import re
+import typing
+from typing import Any, Callable, Dict, List, Optional, Union, get_type_hints
+
+# Compiled validator: returns the validated (possibly coerced) value
+Validator = Callable[[Any], Any]
+
+# JSON type names for error messages
+_JSON_NAMES = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    tuple: "array",
+    dict: "object",
+    type(None): "null"
+}
+
+_BOOLEAN_STRINGS = {"true": True, "false": False}
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a value does not match a compiled schema."""
+
+    def __init__(self, message: str, path: str = ""):
+        """
+        Initialize the error.
+
+        Args:
+            message: What is wrong with the value
+            path: Location of the value, such as "options.items[2]"
+        """
+        self.message = message
+        self.path = path
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        if self.path:
+            return f"Invalid argument {self.path}: {self.message}"
+        return self.message
+
+    def prepend(self, key: Union[str, int]) -> None:
+        """Prefix the path with the key of the enclosing object or array."""
+        if isinstance(key, int):
+            self.path = f"[{key}]{self.path}"
+        elif self.path.startswith("[") or not self.path:
+            self.path = f"{key}{self.path}"
+        else:
+            self.path = f"{key}.{self.path}"
+        self.args = (str(self),)
+
+
+def _describe(value: Any) -> str:
+    """JSON type name of a value for error messages."""
+    return _JSON_NAMES.get(type(value), type(value).__name__)
+
+
+def _accept(value: Any) -> Any:
+    return value
+
+
+def _check_string(value: Any, coerce: bool) -> Any:
+    if isinstance(value, str):
+        return value
+    raise SchemaValidationError(f"expected string, got {_describe(value)}")
+
+
+def _check_integer(value: Any, coerce: bool) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if coerce:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            try:
+                return int(value.strip())
+            except ValueError:
+                pass
+    raise SchemaValidationError(f"expected integer, got {_describe(value)}")
+
+
+def _check_number(value: Any, coerce: bool) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if coerce and isinstance(value, str):
+        text = value.strip()
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            number = float(text)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):
+                return number
+    raise SchemaValidationError(f"expected number, got {_describe(value)}")
+
+
+def _check_boolean(value: Any, coerce: bool) -> Any:
+    if isinstance(value, bool):
+        return value
+    if coerce and isinstance(value, str) and value.strip().lower() in _BOOLEAN_STRINGS:
+        return _BOOLEAN_STRINGS[value.strip().lower()]
+    raise SchemaValidationError(f"expected boolean, got {_describe(value)}")
+
+
+def _check_null(value: Any, coerce: bool) -> Any:
+    if value is None:
+        return value
+    raise SchemaValidationError(f"expected null, got {_describe(value)}")
+
+
+def _check_array(value: Any, coerce: bool) -> Any:
+    if isinstance(value, list):
+        return value
+    if coerce and isinstance(value, tuple):
+        return list(value)
+    raise SchemaValidationError(f"expected array, got {_describe(value)}")
+
+
+def _check_object(value: Any, coerce: bool) -> Any:
+    if isinstance(value, dict):
+        return value
+    raise SchemaValidationError(f"expected object, got {_describe(value)}")
+
+
+_TYPE_CHECKS = {
+    "string": _check_string,
+    "integer": _check_integer,
+    "number": _check_number,
+    "boolean": _check_boolean,
+    "null": _check_null,
+    "array": _check_array,
+    "object": _check_object
+}
+
+
+def compile_schema(schema: Any, coerce: bool = True) -> Validator:
+    """
+    Compile a JSON schema into a validator.
+
+    Supports ``type`` (a name or a list of names), ``properties``,
+    ``required``, ``additionalProperties``, ``default``, ``items``,
+    ``enum``, ``const``, ``anyOf``/``oneOf``, numeric bounds, string and
+    array lengths and ``pattern``. Other keywords are ignored, and a
+    schema that is not a dict accepts any value.
+
+    Args:
+        schema: JSON schema
+        coerce: Convert values where no information is lost: numeric and
+            boolean strings, integral floats for integers and tuples for
+            arrays
+
+    Returns:
+        Function that returns the validated value, with defaults filled in
+        and coercions applied, or raises SchemaValidationError
+    """
+    if not isinstance(schema, dict) or not schema:
+        return _accept
+
+    checks: List[Validator] = []
+
+    if "anyOf" in schema or "oneOf" in schema:
+        checks.append(_compile_any_of(schema.get("anyOf") or schema.get("oneOf"), coerce))
+
+    types = schema.get("type")
+    if isinstance(types, str):
+        types = [types]
+    if types:
+        checks.append(_compile_type(types, coerce))
+
+    if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+        checks.append(_compile_object(schema, coerce))
+    if "items" in schema:
+        checks.append(_compile_items(schema["items"], coerce))
+    checks.extend(_compile_constraints(schema))
+
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(_compile_enum([const], f"expected {const!r}"))
+    if "enum" in schema and isinstance(schema["enum"], list):
+        checks.append(_compile_enum(schema["enum"], f"expected one of {schema['enum']!r}"))
+
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any) -> Any:
+        for check in checks:
+            value = check(value)
+        return value
+
+    return validate
+
+
+def _compile_type(types: List[str], coerce: bool) -> Validator:
+    """Compile a type check for one or more JSON type names."""
+    type_checks = [_TYPE_CHECKS[name] for name in types if name in _TYPE_CHECKS]
+    if len(type_checks) < len(types):
+        # Unknown type names are not checked
+        return _accept
+
+    if len(type_checks) == 1:
+        check = type_checks[0]
+        return lambda value: check(value, coerce)
+
+    expected = " or ".join(types)
+
+    def validate(value: Any) -> Any:
+        # Prefer an exact match before trying coercions
+        for check in type_checks:
+            try:
+                return check(value, False)
+            except SchemaValidationError:
+                pass
+        if coerce:
+            for check in type_checks:
+                try:
+                    return check(value, True)
+                except SchemaValidationError:
+                    pass
+        raise SchemaValidationError(f"expected {expected}, got {_describe(value)}")
+
+    return validate
+
+
+def _compile_object(schema: Dict[str, Any], coerce: bool) -> Validator:
+    """Compile property, required, default and additionalProperties checks."""
+    properties = schema.get("properties") or {}
+    validators = {name: compile_schema(sub, coerce) for name, sub in properties.items()}
+    required = tuple(schema.get("required") or ())
+    defaults = [
+        (name, sub["default"])
+        for name, sub in properties.items()
+        if isinstance(sub, dict) and "default" in sub and name not in required
+    ]
+
+    additional = schema.get("additionalProperties", True)
+    if additional is True:
+        extra: Optional[Validator] = None
+    elif additional is False:
+        extra = False
+    else:
+        extra = compile_schema(additional, coerce)
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+
+        for name in required:
+            if name not in value:
+                raise SchemaValidationError(f"Missing required argument: {name}")
+
+        result = None
+        for name, item in value.items():
+            check = validators.get(name)
+            if check is None:
+                if extra is None:
+                    continue
+                if extra is False:
+                    raise SchemaValidationError(f"Unexpected argument: {name}")
+                check = extra
+            try:
+                checked = check(item)
+            except SchemaValidationError as e:
+                e.prepend(name)
+                raise
+            if checked is not item:
+                if result is None:
+                    result = dict(value)
+                result[name] = checked
+
+        for name, default in defaults:
+            if name not in value:
+                if result is None:
+                    result = dict(value)
+                result[name] = copy.deepcopy(default)
+
+        return value if result is None else result
+
+    return validate
+
+
+def _compile_items(items: Any, coerce: bool) -> Validator:
+    """Compile a check applied to every element of an array."""
+    check = compile_schema(items, coerce)
+    if check is _accept:
+        return _accept
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        result = None
+        for index, item in enumerate(value):
+            try:
+                checked = check(item)
+            except SchemaValidationError as e:
+                e.prepend(index)
+                raise
+            if checked is not item:
+                if result is None:
+                    result = list(value)
+                result[index] = checked
+        return value if result is None else result
+
+    return validate
+
+
+def _compile_any_of(options: Any, coerce: bool) -> Validator:
+    """Compile a check that passes if any of the subschemas matches."""
+    if not isinstance(options, list) or not options:
+        return _accept
+    strict = [compile_schema(option, False) for option in options]
+    loose = [compile_schema(option, True) for option in options] if coerce else []
+
+    def validate(value: Any) -> Any:
+        for check in strict + loose:
+            try:
+                return check(value)
+            except SchemaValidationError:
+                pass
+        raise SchemaValidationError(f"{_describe(value)} value matches none of the allowed schemas")
+
+    return validate
+
+
+def _compile_enum(values: List[Any], message: str) -> Validator:
+    """Compile a membership check."""
+    strings = frozenset(v for v in values if isinstance(v, str))
+
+    def validate(value: Any) -> Any:
+        if isinstance(value, str):
+            if value in strings:
+                return value
+        # True == 1 in Python, but not in JSON
+        elif any(v == value and isinstance(v, bool) == isinstance(value, bool) for v in values):
+            return value
+        raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_constraints(schema: Dict[str, Any]) -> List[Validator]:
+    """Compile numeric bounds, length limits and string patterns."""
+    checks = []
+
+    def bound(keyword: str, fails: Callable[[Any, Any], bool], applies: Callable[[Any], bool],
+              measure: Callable[[Any], Any], description: str) -> None:
+        if keyword not in schema:
+            return
+        limit = schema[keyword]
+
+        def validate(value: Any) -> Any:
+            if applies(value) and fails(measure(value), limit):
+                raise SchemaValidationError(f"{description} {limit}")
+            return value
+
+        checks.append(validate)
+
+    def is_number(value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    def is_string(value: Any) -> bool:
+        return isinstance(value, str)
+
+    def is_array(value: Any) -> bool:
+        return isinstance(value, list)
+
+    bound("minimum", lambda v, lim: v < lim, is_number, _accept, "must be >=")
+    bound("maximum", lambda v, lim: v > lim, is_number, _accept, "must be <=")
+    bound("exclusiveMinimum", lambda v, lim: v <= lim, is_number, _accept, "must be >")
+    bound("exclusiveMaximum", lambda v, lim: v >= lim, is_number, _accept, "must be <")
+    bound("minLength", lambda v, lim: v < lim, is_string, len, "length must be >=")
+    bound("maxLength", lambda v, lim: v > lim, is_string, len, "length must be <=")
+    bound("minItems", lambda v, lim: v < lim, is_array, len, "number of items must be >=")
+    bound("maxItems", lambda v, lim: v > lim, is_array, len, "number of items must be <=")
+
+    if isinstance(schema.get("pattern"), str):
+        pattern = re.compile(schema["pattern"])
+
+        def validate_pattern(value: Any) -> Any:
+            if isinstance(value, str) and pattern.search(value) is None:
+                raise SchemaValidationError(f"does not match pattern {pattern.pattern!r}")
+            return value
+
+        checks.append(validate_pattern)
+
+    return checks
+
+
+def python_type_to_schema(python_type: Any) -> Dict[str, Any]:
+    """
+    Convert a Python type hint to a JSON schema.
+
+    Args:
+        python_type: Type hint, such as int, List[str] or Optional[float]
+
+    Returns:
+        JSON schema; empty (any value) for Any and unsupported types
+    """
+    if python_type is bool:
+        return {"type": "boolean"}
+    if python_type is int:
+        return {"type": "integer"}
+    if python_type is float:
+        return {"type": "number"}
+    if python_type is str:
+        return {"type": "string"}
+    if python_type in (list, tuple, set):
+        return {"type": "array"}
+    if python_type is dict:
+        return {"type": "object"}
+    if inspect.isclass(python_type) and issubclass(python_type, enum.Enum):
+        return {"enum": [member.value for member in python_type]}
+
+    origin = typing.get_origin(python_type)
+    args = typing.get_args(python_type)
+    if origin in (list, tuple, set, frozenset):
+        schema = {"type": "array"}
+        if args and origin is not tuple:
+            schema["items"] = python_type_to_schema(args[0])
+        return schema
+    if origin is dict:
+        schema = {"type": "object"}
+        if len(args) == 2:
+            value_schema = python_type_to_schema(args[1])
+            if value_schema:
+                schema["additionalProperties"] = value_schema
+        return schema
+    if origin is typing.Literal:
+        return {"enum": list(args)}
+    if origin is Union:
+        options = [python_type_to_schema(arg) for arg in args if arg is not type(None)]
+        if any(not option for option in options):
+            return {}
+        if type(None) in args:
+            options.append({"type": "null"})
+        return options[0] if len(options) == 1 else {"anyOf": options}
+    return {}
+
+
+def parse_docstring_params(docstring: Optional[str]) -> Dict[str, str]:
+    """
+    Extract parameter descriptions from a Google-style docstring.
+
+    Args:
+        docstring: Function docstring
+
+    Returns:
+        Mapping of parameter name to description
+    """
+    if not docstring:
+        return {}
+    sections = re.findall(r'Args:(.*?)(?:\n\n|\n\s*Returns:|$)', docstring, re.DOTALL)
+    if not sections:
+        return {}
+    matches = re.findall(r'\s+(\w+)\s*:\s*(.+?)(?=\n\s+\w+\s*:|$)', sections[0], re.DOTALL)
+    return {name: description.strip() for name, description in matches}
+
+
+def schema_from_signature(func: Callable, description_template: str = "") -> Dict[str, Any]:
+    """
+    Build an input schema from a function's signature, type hints and docstring.
+
+    ``*args`` and ``**kwargs`` are not listed as properties; a function
+    taking ``**kwargs`` accepts any additional arguments.
+
+    Args:
+        func: Tool handler
+        description_template: Description for parameters the docstring does
+            not document, formatted with the parameter ``name``
+
+    Returns:
+        JSON schema of the function's keyword arguments
+    """
+    sig = inspect.signature(func)
+    try:
+        type_hints = get_type_hints(func)
+    except Exception:
+        type_hints = {}
+    param_docs = parse_docstring_params(func.__doc__)
+
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+
+    for param_name, param in sig.parameters.items():
+        if param_name in ("self", "cls"):
+            continue
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+
+        prop = python_type_to_schema(type_hints.get(param_name, Any))
+        prop["description"] = param_docs.get(param_name) or description_template.format(name=param_name)
+        schema["properties"][param_name] = prop
+
+        if param.default is inspect.Parameter.empty:
+            schema["required"].append(param_name)
+
+    return schema
@@ -9,12 +9,6 @@ from .http import run_server
 # Import enhanced A2A server
 from .a2a_server import A2AServer
 
-# Import LLM-specific servers
-from .llm.openai import OpenAIA2AServer
-from .llm.ollama import OllamaA2AServer
-from .llm.anthropic import AnthropicA2AServer
-from .llm.bedrock import BedrockA2AServer
-
 # Make everything available at the server level
 __all__ = [
     "BaseA2AServer",
@@ -25,3 +19,16 @@ __all__ = [
     "AnthropicA2AServer",
     "BedrockA2AServer",
 ]
+
+# LLM-specific servers import their provider SDKs, so load them on first use
+_LLM_SERVERS = ("OpenAIA2AServer", "OllamaA2AServer", "AnthropicA2AServer", "BedrockA2AServer")
+
+
+def __getattr__(name):
+    """Load LLM-specific servers on first access (PEP 562)."""
+    if name in _LLM_SERVERS:
+        from . import llm
+        value = getattr(llm, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,7 @@ from .flow import (
 from .steps import (
     WorkflowStep,
     QueryStep,
+    MapStep,
     AutoRouteStep,
     FunctionStep,
     ConditionalBranch,
@@ -22,11 +23,15 @@ from .steps import (
     StepType,
 )
 
+from .template import QueryTemplate
+from .tracing import Tracer, Span
+
 __all__ = [
     'Flow',
     'WorkflowContext',
     'WorkflowStep',
     'QueryStep',
+    'MapStep',
     'AutoRouteStep',
     'FunctionStep',
     'ConditionalBranch',
@@ -34,4 +39,7 @@ __all__ = [
     'ParallelStep',
     'ParallelBuilder',
     'StepType',
+    'QueryTemplate',
+    'Tracer',
+    'Span',
 ]
\ No newline at end of file
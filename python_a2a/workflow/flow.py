@@ -7,7 +7,9 @@ using a fluent interface with method chaining.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Callable, Union, Set
+from collections import ChainMap
+from concurrent.futures import Executor
+from typing import Dict, List, Any, Optional, Callable, Union, Set, Iterable
 import copy
 import uuid
 import time
@@ -16,12 +18,14 @@ from ..client.router import AIAgentRouter
 from .steps import (
     WorkflowStep, 
     QueryStep, 
+    MapStep,
     AutoRouteStep, 
     FunctionStep,
     ConditionalBranch, 
     ConditionStep, 
     ParallelStep
 )
+from .tracing import Tracer, NULL_TRACER
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +33,107 @@ logger = logging.getLogger(__name__)
 class WorkflowContext:
     """Context object for workflow execution."""
     
-    def __init__(self, initial_data: Optional[Dict[str, Any]] = None):
+    # Keys maintained by the context itself, excluded from branch merging
+    RESERVED_KEYS = frozenset({"latest_result"})
+    
+    def __init__(
+        self,
+        initial_data: Optional[Dict[str, Any]] = None,
+        parent: Optional['WorkflowContext'] = None,
+        tracer: Optional[Tracer] = None
+    ):
         """
         Initialize workflow context.
         
         Args:
             initial_data: Optional initial context data
-        """
-        self.data = initial_data or {}
-        self.results = {}
+            parent: Optional parent context to overlay (see ``fork``)
+            tracer: Optional tracer recording step spans, inherited from
+                the parent when not given
+        """
+        self.parent = parent
+        if tracer is None:
+            tracer = parent.tracer if parent is not None else NULL_TRACER
+        self.tracer = tracer
+        if parent is None:
+            self.data = initial_data or {}
+            self.results = {}
+        else:
+            # Reads fall through to the parent, writes stay in the local layer
+            self.data = ChainMap(dict(initial_data or {}), parent.data)
+            self.results = ChainMap({}, parent.results)
         self.history = []
         self.errors = []
         self.start_time = time.time()
     
+    def fork(self) -> 'WorkflowContext':
+        """
+        Create a copy-on-write child context for a parallel branch.
+        
+        The child sees the parent's data and results without copying them.
+        Writes made through the child (``update``, ``add_result`` or item
+        assignment on ``data``) are stored in the child's own layer and
+        only reach the parent through ``merge``. Values are shared, not
+        copied, so steps should replace mutable values rather than
+        mutating them in place.
+        
+        Returns:
+            Child workflow context
+        """
+        return WorkflowContext(parent=self)
+    
+    @property
+    def local_data(self) -> Dict[str, Any]:
+        """Get the data written in this context's own layer."""
+        if self.parent is None:
+            return self.data
+        return self.data.maps[0]
+    
+    @property
+    def local_results(self) -> Dict[str, Any]:
+        """Get the results recorded in this context's own layer."""
+        if self.parent is None:
+            return self.results
+        return self.results.maps[0]
+    
+    def merge(self, branches: List['WorkflowContext'], strict: bool = False) -> None:
+        """
+        Merge forked branch contexts back into this context.
+        
+        Branches are applied in the order given, so the outcome does not
+        depend on which branch finished first: when several branches write
+        the same key, the last branch in the list wins.
+        
+        Args:
+            branches: Child contexts created with ``fork``
+            strict: Raise instead of overriding when two branches write
+                different values to the same key
+            
+        Raises:
+            ValueError: If ``strict`` is set and branches conflict
+        """
+        if strict:
+            writers = {}
+            for index, branch in enumerate(branches):
+                for key, value in branch.local_data.items():
+                    if key in self.RESERVED_KEYS:
+                        continue
+                    if key in writers and writers[key][1] is not value \
+                            and writers[key][1] != value:
+                        raise ValueError(
+                            f"Conflicting writes to context key '{key}' "
+                            f"from parallel branches {writers[key][0]} and {index}"
+                        )
+                    writers[key] = (index, value)
+        
+        for branch in branches:
+            for key, value in branch.local_data.items():
+                if key not in self.RESERVED_KEYS:
+                    self.data[key] = value
+            self.results.update(branch.local_results)
+            self.history.extend(branch.history)
+            self.errors.extend(branch.errors)
+    
     def update(self, key: str, value: Any) -> None:
         """Update context with new data."""
         self.data[key] = value
@@ -71,13 +163,17 @@ class WorkflowContext:
         """Get the most recent result."""
         if not self.results:
             return None
+        if self.parent is not None and self.local_results:
+            return next(iter(reversed(self.local_results.values())))
+        if self.parent is not None:
+            return self.parent.last_result
         return next(iter(reversed(self.results.values())))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert context to a dictionary."""
         return {
-            "data": self.data,
-            "results": self.results,
+            "data": dict(self.data),
+            "results": dict(self.results),
             "history": self.history,
             "errors": self.errors,
             "execution_time": time.time() - self.start_time
@@ -96,7 +192,9 @@ class Flow:
         self, 
         agent_network: 'AgentNetwork',
         router: Optional[AIAgentRouter] = None,
-        name: str = "Workflow"
+        name: str = "Workflow",
+        inputs: Optional[Iterable[str]] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize a workflow.
@@ -105,10 +203,18 @@ class Flow:
             agent_network: Network of available agents
             router: Optional AI router for agent selection
             name: Workflow name
+            inputs: Optional names of the context variables the workflow
+                expects. When given, query templates are validated against
+                them (see ``validate``) before the workflow runs.
+            executor: Executor used for agents without a native async API
+                and for synchronous functions. The caller owns it and shuts
+                it down. Defaults to the shared sync-client executor.
         """
         self.agent_network = agent_network
         self.router = router
         self.name = name
+        self.inputs = set(inputs) if inputs is not None else None
+        self.executor = executor
         self.steps = []
         self.current_branch = self.steps
         self.branch_stack = []
@@ -131,7 +237,45 @@ class Flow:
             query=query,
             agent_network=self.agent_network,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.executor
+        )
+        self.current_branch.append(step)
+        return self
+    
+    def map(
+        self,
+        agent_name: str,
+        items_key: str,
+        query_template: str,
+        max_concurrency: int = 10,
+        **options
+    ) -> 'Flow':
+        """
+        Add a step to ask an agent the same question for every item in a list.
+        
+        Args:
+            agent_name: Name of the agent to query
+            items_key: Context key holding the items to process
+            query_template: Query template, may use ``{item}`` and ``{index}``
+            max_concurrency: Maximum number of concurrent agent queries
+            **options: Additional options for the step (retries, timeout,
+                chunk_size, result_key)
+            
+        Returns:
+            Self for method chaining
+        """
+        step = MapStep(
+            agent_name=agent_name,
+            items_key=items_key,
+            query=query_template,
+            agent_network=self.agent_network,
+            max_concurrency=max_concurrency,
+            chunk_size=options.get('chunk_size'),
+            result_key=options.get('result_key'),
+            retries=options.get('retries', 0),
+            timeout=options.get('timeout'),
+            executor=self.executor
         )
         self.current_branch.append(step)
         return self
@@ -161,7 +305,8 @@ class Flow:
             agent_network=self.agent_network,
             router=self.router,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.executor
         )
         self.current_branch.append(step)
         return self
@@ -189,7 +334,8 @@ class Flow:
             args=args,
             kwargs=kwargs,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.executor
         )
         self.current_branch.append(step)
         return self
@@ -312,39 +458,112 @@ class Flow:
         """
         return ParallelBuilder(self)
     
-    async def run(self, initial_context: Optional[Dict[str, Any]] = None) -> Any:
+    def validate(self, available: Optional[Iterable[str]] = None) -> 'Flow':
+        """
+        Check that every query template only uses defined variables.
+        
+        A variable is defined if it is available up front or produced by an
+        earlier step (``latest_result``, auto-routing info, map results).
+        Values written by custom functions cannot be inferred and must be
+        listed in ``available``. Map step templates are not checked since
+        their item fields are only known at run time.
+        
+        Args:
+            available: Names of the context variables available at the start,
+                defaults to the workflow's declared inputs
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            ValueError: If any template uses an undefined variable
+        """
+        known = set(available if available is not None else (self.inputs or ()))
+        problems = []
+        self._validate_steps(self.steps, known, problems)
+        if problems:
+            raise ValueError(
+                f"Undefined template variables in workflow '{self.name}': "
+                + "; ".join(problems)
+            )
+        return self
+    
+    def _validate_steps(self, steps: List[WorkflowStep], known: Set[str], problems: List[str]) -> None:
+        """Validate templates of a step sequence, adding produced keys to known."""
+        for step in steps:
+            if isinstance(step, ConditionStep):
+                produced = set()
+                for branch_steps in [b.steps for b in step.branches] + [step.else_steps]:
+                    branch_known = set(known)
+                    self._validate_steps(branch_steps, branch_known, problems)
+                    produced |= branch_known
+                known |= produced
+            elif isinstance(step, ParallelStep):
+                produced = set()
+                for branch_step in step.steps:
+                    branch_known = set(known)
+                    self._validate_steps([branch_step], branch_known, problems)
+                    produced |= branch_known
+                known |= produced
+            elif isinstance(step, MapStep):
+                if step.result_key:
+                    known.add(step.result_key)
+            elif isinstance(step, (QueryStep, AutoRouteStep)):
+                missing = step.template.missing(known)
+                if missing:
+                    problems.append(f"step {step.id} uses {', '.join(missing)}")
+                if isinstance(step, AutoRouteStep):
+                    known |= {"selected_agent", "routing_confidence", "conversation_history"}
+            known.add("latest_result")
+    
+    async def run(
+        self,
+        initial_context: Optional[Dict[str, Any]] = None,
+        tracer: Optional[Tracer] = None
+    ) -> Any:
         """
         Execute the workflow.
         
         Args:
             initial_context: Optional initial context data
+            tracer: Optional tracer to record step timing spans in
             
         Returns:
             Result of the workflow
         """
+        # Check templates against the declared inputs
+        if self.inputs is not None:
+            self.validate(self.inputs | set(initial_context or ()))
+        
         # Create workflow context
-        context = WorkflowContext(initial_context)
+        context = WorkflowContext(initial_context, tracer=tracer)
         
         # Execute each step in sequence
         result = None
-        for step in self.steps:
-            try:
-                step_result = await step.execute(context)
-                context.add_result(step.id, step_result)
-                result = step_result
-            except Exception as e:
-                logger.error(f"Error executing workflow step {step.id}: {e}")
-                context.add_error(step.id, e)
-                raise
+        with context.tracer.span("flow", "flow", workflow=self.name, steps=len(self.steps)):
+            for step in self.steps:
+                try:
+                    step_result = await step.execute(context)
+                    context.add_result(step.id, step_result)
+                    result = step_result
+                except Exception as e:
+                    logger.error(f"Error executing workflow step {step.id}: {e}")
+                    context.add_error(step.id, e)
+                    raise
         
         return result
     
-    def run_sync(self, initial_context: Optional[Dict[str, Any]] = None) -> Any:
+    def run_sync(
+        self,
+        initial_context: Optional[Dict[str, Any]] = None,
+        tracer: Optional[Tracer] = None
+    ) -> Any:
         """
         Execute the workflow synchronously.
         
         Args:
             initial_context: Optional initial context data
+            tracer: Optional tracer to record step timing spans in
             
         Returns:
             Result of the workflow
@@ -358,7 +577,7 @@ class Flow:
             asyncio.set_event_loop(loop)
         
         # Run the workflow
-        return loop.run_until_complete(self.run(initial_context))
+        return loop.run_until_complete(self.run(initial_context, tracer))
 
 
 class ParallelBuilder:
@@ -404,7 +623,8 @@ class ParallelBuilder:
             query=query,
             agent_network=self.flow.agent_network,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.flow.executor
         )
         self.current_branch.append(step)
         return self
@@ -434,7 +654,8 @@ class ParallelBuilder:
             agent_network=self.flow.agent_network,
             router=self.flow.router,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.flow.executor
         )
         self.current_branch.append(step)
         return self
@@ -462,17 +683,23 @@ class ParallelBuilder:
             args=args,
             kwargs=kwargs,
             retries=options.get('retries', 0),
-            timeout=options.get('timeout')
+            timeout=options.get('timeout'),
+            executor=self.flow.executor
         )
         self.current_branch.append(step)
         return self
     
-    def end_parallel(self, max_concurrency: Optional[int] = None) -> Flow:
+    def end_parallel(
+        self,
+        max_concurrency: Optional[int] = None,
+        strict_merge: bool = False
+    ) -> Flow:
         """
         End the parallel block and return to the main flow.
         
         Args:
             max_concurrency: Maximum number of branches to execute concurrently
+            strict_merge: Fail if branches write conflicting context values
             
         Returns:
             Parent flow for method chaining
@@ -492,7 +719,11 @@ class ParallelBuilder:
                 steps.extend(branch)
         
         # Create parallel step
-        parallel_step = ParallelStep(steps, max_concurrency=max_concurrency)
+        parallel_step = ParallelStep(
+            steps,
+            max_concurrency=max_concurrency,
+            strict_merge=strict_merge
+        )
         self.flow.current_branch.append(parallel_step)
         
         return self.flow
\ No newline at end of file
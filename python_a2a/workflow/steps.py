@@ -7,13 +7,15 @@ including query steps, function execution steps, and conditional branching steps
 
 import logging
 import asyncio
-import copy
+from collections import ChainMap
 from typing import Dict, List, Any, Optional, Callable, Union, Set
 from enum import Enum
 import uuid
 import time
+from concurrent.futures import Executor
 
-from ..client.base import BaseA2AClient
+from ..client.base import BaseA2AClient, get_sync_executor
+from .template import QueryTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class StepType(str, Enum):
     FUNCTION = "function"
     CONDITION = "condition"
     PARALLEL = "parallel"
+    MAP = "map"
     IF_BRANCH = "if_branch"
     ELSE_BRANCH = "else_branch"
 
@@ -75,7 +78,8 @@ class QueryStep(WorkflowStep):
         agent_network,
         id: Optional[str] = None,
         retries: int = 0,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize a query step.
@@ -87,11 +91,15 @@ class QueryStep(WorkflowStep):
             id: Unique identifier for the step
             retries: Number of retry attempts if the step fails
             timeout: Maximum execution time in seconds
+            executor: Executor for blocking agent or function calls, defaults
+                to the shared sync-client executor
         """
         super().__init__(id, StepType.QUERY, retries, timeout)
         self.agent_name = agent_name
         self.query_template = query
+        self.template = QueryTemplate(query)
         self.agent_network = agent_network
+        self.executor = executor
     
     async def execute(self, context) -> Any:
         """
@@ -104,80 +112,256 @@ class QueryStep(WorkflowStep):
             Agent response
         """
         # Substitute context variables in the query
-        query = self.query_template
-        for key, value in context.data.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in query and isinstance(value, str):
-                query = query.replace(placeholder, value)
+        query = self.template.render(context.data)
         
         # Get the agent
         agent = self.agent_network.get_agent(self.agent_name)
         if not agent:
             raise ValueError(f"Agent '{self.agent_name}' not found in network")
         
-        # Execute the query with retries
-        attempts = 0
-        last_error = None
-        
-        while attempts <= self.retries:
-            try:
-                # Add timeout if specified
-                if self.timeout:
-                    # Create a task with timeout
-                    coro = asyncio.create_task(self._ask_agent(agent, query))
-                    result = await asyncio.wait_for(coro, timeout=self.timeout)
-                else:
-                    # Execute without timeout
-                    result = await self._ask_agent(agent, query)
-                
-                # Store execution info in context history
-                context.add_to_history({
-                    "step_id": self.id,
-                    "step_type": self.type,
-                    "agent": self.agent_name,
-                    "query": query,
-                    "attempt": attempts + 1,
-                    "success": True,
-                    "timestamp": time.time()
-                })
-                
-                return result
-                
-            except Exception as e:
-                attempts += 1
-                last_error = e
-                
-                # Store failed attempt in history
-                context.add_to_history({
-                    "step_id": self.id,
-                    "step_type": self.type,
-                    "agent": self.agent_name,
-                    "query": query,
-                    "attempt": attempts,
-                    "success": False,
-                    "error": str(e),
-                    "timestamp": time.time()
-                })
-                
-                # If we have retries left, wait before retrying
-                if attempts <= self.retries:
-                    # Exponential backoff
-                    await asyncio.sleep(2 ** attempts * 0.1)
-        
-        # If we get here, all attempts failed
-        if last_error:
-            context.add_error(self.id, last_error)
-            raise last_error
+        return await self._run_query(agent, query, context)
+    
+    async def _run_query(
+        self,
+        agent: BaseA2AClient,
+        query: str,
+        context,
+        **history_info
+    ) -> Any:
+        """
+        Send a query to an agent with the step's timeout and retry policy.
+        
+        Args:
+            agent: Agent client to query
+            query: Rendered query text
+            context: Current workflow context
+            **history_info: Extra fields to record in each history entry
+            
+        Returns:
+            Agent response
+        """
+        tracer = context.tracer
+        with tracer.span(
+            "query", self.type.value, step_id=self.id, agent=self.agent_name,
+            query_bytes=len(query), **history_info
+        ) as span:
+            # Execute the query with retries
+            attempts = 0
+            last_error = None
+            
+            while attempts <= self.retries:
+                started = time.perf_counter()
+                try:
+                    with tracer.span(
+                        "agent_call", "agent", step_id=self.id,
+                        agent=self.agent_name, attempt=attempts + 1
+                    ) as call_span:
+                        # Add timeout if specified
+                        if self.timeout:
+                            # Create a task with timeout
+                            coro = asyncio.create_task(self._ask_agent(agent, query))
+                            result = await asyncio.wait_for(coro, timeout=self.timeout)
+                        else:
+                            # Execute without timeout
+                            result = await self._ask_agent(agent, query)
+                        
+                        if tracer.enabled:
+                            call_span.set(response_bytes=len(str(result)))
+                    
+                    # Store execution info in context history
+                    context.add_to_history({
+                        "step_id": self.id,
+                        "step_type": self.type,
+                        "agent": self.agent_name,
+                        "query": query,
+                        **history_info,
+                        "attempt": attempts + 1,
+                        "success": True,
+                        "duration": time.perf_counter() - started,
+                        "timestamp": time.time()
+                    })
+                    
+                    span.set(attempts=attempts + 1)
+                    return result
+                    
+                except Exception as e:
+                    attempts += 1
+                    last_error = e
+                    
+                    # Store failed attempt in history
+                    context.add_to_history({
+                        "step_id": self.id,
+                        "step_type": self.type,
+                        "agent": self.agent_name,
+                        "query": query,
+                        **history_info,
+                        "attempt": attempts,
+                        "success": False,
+                        "error": str(e),
+                        "duration": time.perf_counter() - started,
+                        "timestamp": time.time()
+                    })
+                    
+                    # If we have retries left, wait before retrying
+                    if attempts <= self.retries:
+                        # Exponential backoff
+                        delay = 2 ** attempts * 0.1
+                        with tracer.span("backoff", "retry", step_id=self.id, delay=delay):
+                            await asyncio.sleep(delay)
+            
+            # If we get here, all attempts failed
+            span.set(attempts=attempts)
+            if last_error:
+                context.add_error(self.id, last_error)
+                raise last_error
     
     async def _ask_agent(self, agent: BaseA2AClient, query: str) -> str:
         """Send query to agent and return response."""
-        # If the agent has an async API, use it
-        if hasattr(agent, 'ask_async'):
+        # If the agent has a native async API, use it. Custom agents that
+        # define ask_async without the native_async flag are trusted as well.
+        if hasattr(agent, 'ask_async') and getattr(agent, 'native_async', True):
             return await agent.ask_async(query)
         
         # Otherwise, use the synchronous API in a thread
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, agent.ask, query)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor or get_sync_executor(), agent.ask, query)
+
+
+class MapStep(QueryStep):
+    """Step for querying an agent once per item of a list in the context."""
+    
+    def __init__(
+        self,
+        agent_name: str,
+        items_key: str,
+        query: str,
+        agent_network,
+        max_concurrency: int = 10,
+        chunk_size: Optional[int] = None,
+        result_key: Optional[str] = None,
+        id: Optional[str] = None,
+        retries: int = 0,
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize a map step.
+        
+        The query template may use ``{item}`` and ``{index}`` in addition to
+        the usual context variables. When an item is a dictionary its keys
+        are available as placeholders too, taking precedence over context
+        data.
+        
+        Args:
+            agent_name: Name of the agent to query
+            items_key: Context key holding the items to process
+            query: Query template rendered for each item
+            agent_network: Network of available agents
+            max_concurrency: Number of workers querying the agent at once
+            chunk_size: If set, send items in chunks of this size, one query
+                per chunk with ``{item}`` rendered as one item per line
+            result_key: Optional context key to store the result list under
+            id: Unique identifier for the step
+            retries: Number of retry attempts per item if a query fails
+            timeout: Maximum execution time in seconds per item
+            executor: Executor for blocking agent calls, defaults to the
+                shared sync-client executor
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        super().__init__(agent_name, query, agent_network, id, retries, timeout, executor)
+        self.type = StepType.MAP
+        self.items_key = items_key
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self.result_key = result_key
+    
+    async def execute(self, context) -> List[Any]:
+        """
+        Execute the map step.
+        
+        Items are pulled lazily by a fixed pool of workers, so at most
+        ``max_concurrency`` queries are in flight. Items whose queries still
+        fail after all retries are recorded as errors and yield ``None``.
+        
+        Args:
+            context: Current workflow context
+            
+        Returns:
+            Agent responses, in the same order as the items (or chunks)
+        """
+        if self.items_key not in context.data:
+            raise ValueError(f"Context key '{self.items_key}' not found for map step")
+        items = context.data[self.items_key]
+        
+        # Get the agent
+        agent = self.agent_network.get_agent(self.agent_name)
+        if not agent:
+            raise ValueError(f"Agent '{self.agent_name}' not found in network")
+        
+        work = enumerate(self._chunks(items) if self.chunk_size else items)
+        results = {}
+        
+        async def worker():
+            # Workers share one iterator; this is safe as there is no await
+            # between checking for and taking the next item
+            for index, item in work:
+                try:
+                    query = self._render(context, item, index)
+                except Exception as e:
+                    logger.warning(f"Error rendering map step {self.id} query for item {index}: {e}")
+                    context.add_error(self.id, e)
+                    results[index] = None
+                    continue
+                try:
+                    # _run_query records its own errors in the context
+                    results[index] = await self._run_query(
+                        agent, query, context, index=index,
+                        queue_wait=time.perf_counter() - started)
+                except Exception as e:
+                    logger.warning(f"Error in map step {self.id} for item {index}: {e}")
+                    results[index] = None
+        
+        with context.tracer.span(
+            "map", self.type.value, step_id=self.id, agent=self.agent_name,
+            max_concurrency=self.max_concurrency
+        ) as span:
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+            span.set(items=len(results))
+        
+        ordered = [results[index] for index in range(len(results))]
+        if self.result_key:
+            context.update(self.result_key, ordered)
+        return ordered
+    
+    def _chunks(self, items):
+        """Group items into lists of at most ``chunk_size``."""
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _render(self, context, item: Any, index: int) -> str:
+        """Render the query template for a single item or chunk."""
+        if isinstance(item, list) and self.chunk_size:
+            item_value = "\n".join(str(value) for value in item)
+        else:
+            item_value = item
+        
+        layers = [{"item": item_value, "index": index}]
+        if isinstance(item, dict):
+            layers.append(item)
+        layers.append(context.data)
+        return self.template.render(ChainMap(*layers))
 
 
 class AutoRouteStep(WorkflowStep):
@@ -190,7 +374,8 @@ class AutoRouteStep(WorkflowStep):
         router,
         id: Optional[str] = None,
         retries: int = 0,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize an auto-route step.
@@ -202,11 +387,15 @@ class AutoRouteStep(WorkflowStep):
             id: Unique identifier for the step
             retries: Number of retry attempts if the step fails
             timeout: Maximum execution time in seconds
+            executor: Executor for blocking agent or function calls, defaults
+                to the shared sync-client executor
         """
         super().__init__(id, StepType.QUERY, retries, timeout)
         self.query_template = query
+        self.template = QueryTemplate(query)
         self.agent_network = agent_network
         self.router = router
+        self.executor = executor
     
     async def execute(self, context) -> Any:
         """
@@ -219,17 +408,15 @@ class AutoRouteStep(WorkflowStep):
             Agent response
         """
         # Substitute context variables in the query
-        query = self.query_template
-        for key, value in context.data.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in query and isinstance(value, str):
-                query = query.replace(placeholder, value)
+        query = self.template.render(context.data)
         
         # Get conversation history from context if available
         history = context.data.get("conversation_history", [])
         
         # Route the query to the best agent
-        agent_name, confidence = self.router.route_query(query, history)
+        with context.tracer.span("route", "router", step_id=self.id) as span:
+            agent_name, confidence = self.router.route_query(query, history)
+            span.set(agent=agent_name, confidence=confidence)
         
         # Get the agent
         agent = self.agent_network.get_agent(agent_name)
@@ -243,29 +430,29 @@ class AutoRouteStep(WorkflowStep):
             agent_network=self.agent_network,
             id=self.id,
             retries=self.retries,
-            timeout=self.timeout
+            timeout=self.timeout,
+            executor=self.executor
         )
         
         # Add routing info to context
         context.update("selected_agent", agent_name)
         context.update("routing_confidence", confidence)
         
-        # Execute the query step
-        result = await query_step.execute(context)
-        
-        # Update conversation history
-        if "conversation_history" not in context.data:
-            context.data["conversation_history"] = []
-        
-        context.data["conversation_history"].append({
-            "role": "user",
-            "content": {"text": query}
-        })
-        
-        context.data["conversation_history"].append({
-            "role": "agent",
-            "content": {"text": result if isinstance(result, str) else str(result)}
-        })
+        # Execute the already rendered query with the step's retry policy
+        result = await query_step._run_query(agent, query, context)
+        
+        # Update conversation history (build a new list rather than
+        # appending in place, which would leak into a forked parent context)
+        context.update("conversation_history", list(history) + [
+            {
+                "role": "user",
+                "content": {"text": query}
+            },
+            {
+                "role": "agent",
+                "content": {"text": result if isinstance(result, str) else str(result)}
+            }
+        ])
         
         return result
 
@@ -280,7 +467,8 @@ class FunctionStep(WorkflowStep):
         kwargs: Optional[Dict[str, Any]] = None,
         id: Optional[str] = None,
         retries: int = 0,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize a function step.
@@ -292,11 +480,14 @@ class FunctionStep(WorkflowStep):
             id: Unique identifier for the step
             retries: Number of retry attempts if the step fails
             timeout: Maximum execution time in seconds
+            executor: Executor for blocking agent or function calls, defaults
+                to the shared sync-client executor
         """
         super().__init__(id, StepType.FUNCTION, retries, timeout)
         self.func = func
         self.args = args or []
         self.kwargs = kwargs or {}
+        self.executor = executor
     
     async def execute(self, context) -> Any:
         """
@@ -338,66 +529,81 @@ class FunctionStep(WorkflowStep):
             processed_kwargs["context"] = context
         
         # Execute the function with retries
-        attempts = 0
-        last_error = None
-        
-        while attempts <= self.retries:
-            try:
-                # Check if function is async
-                if asyncio.iscoroutinefunction(self.func):
-                    # Execute with timeout if specified
-                    if self.timeout:
-                        coro = self.func(*processed_args, **processed_kwargs)
-                        result = await asyncio.wait_for(coro, timeout=self.timeout)
-                    else:
-                        result = await self.func(*processed_args, **processed_kwargs)
-                else:
-                    # Run synchronous function in executor
-                    loop = asyncio.get_event_loop()
-                    if self.timeout:
-                        coro = loop.run_in_executor(
-                            None, lambda: self.func(*processed_args, **processed_kwargs))
-                        result = await asyncio.wait_for(coro, timeout=self.timeout)
-                    else:
-                        result = await loop.run_in_executor(
-                            None, lambda: self.func(*processed_args, **processed_kwargs))
-                
-                # Store execution info in context history
-                context.add_to_history({
-                    "step_id": self.id,
-                    "step_type": self.type,
-                    "function": self.func.__name__,
-                    "attempt": attempts + 1,
-                    "success": True,
-                    "timestamp": time.time()
-                })
-                
-                return result
-                
-            except Exception as e:
-                attempts += 1
-                last_error = e
-                
-                # Store failed attempt in history
-                context.add_to_history({
-                    "step_id": self.id,
-                    "step_type": self.type,
-                    "function": self.func.__name__,
-                    "attempt": attempts,
-                    "success": False,
-                    "error": str(e),
-                    "timestamp": time.time()
-                })
-                
-                # If we have retries left, wait before retrying
-                if attempts <= self.retries:
-                    # Exponential backoff
-                    await asyncio.sleep(2 ** attempts * 0.1)
-        
-        # If we get here, all attempts failed
-        if last_error:
-            context.add_error(self.id, last_error)
-            raise last_error
+        tracer = context.tracer
+        with tracer.span(
+            "function", self.type.value, step_id=self.id, function=self.func.__name__
+        ) as span:
+            attempts = 0
+            last_error = None
+            
+            while attempts <= self.retries:
+                started = time.perf_counter()
+                try:
+                    with tracer.span(
+                        "function_call", "function", step_id=self.id, attempt=attempts + 1
+                    ):
+                        # Check if function is async
+                        if asyncio.iscoroutinefunction(self.func):
+                            # Execute with timeout if specified
+                            if self.timeout:
+                                coro = self.func(*processed_args, **processed_kwargs)
+                                result = await asyncio.wait_for(coro, timeout=self.timeout)
+                            else:
+                                result = await self.func(*processed_args, **processed_kwargs)
+                        else:
+                            # Run synchronous function in executor
+                            loop = asyncio.get_running_loop()
+                            executor = self.executor or get_sync_executor()
+                            if self.timeout:
+                                coro = loop.run_in_executor(
+                                    executor, lambda: self.func(*processed_args, **processed_kwargs))
+                                result = await asyncio.wait_for(coro, timeout=self.timeout)
+                            else:
+                                result = await loop.run_in_executor(
+                                    executor, lambda: self.func(*processed_args, **processed_kwargs))
+                    
+                    # Store execution info in context history
+                    context.add_to_history({
+                        "step_id": self.id,
+                        "step_type": self.type,
+                        "function": self.func.__name__,
+                        "attempt": attempts + 1,
+                        "success": True,
+                        "duration": time.perf_counter() - started,
+                        "timestamp": time.time()
+                    })
+                    
+                    span.set(attempts=attempts + 1)
+                    return result
+                    
+                except Exception as e:
+                    attempts += 1
+                    last_error = e
+                    
+                    # Store failed attempt in history
+                    context.add_to_history({
+                        "step_id": self.id,
+                        "step_type": self.type,
+                        "function": self.func.__name__,
+                        "attempt": attempts,
+                        "success": False,
+                        "error": str(e),
+                        "duration": time.perf_counter() - started,
+                        "timestamp": time.time()
+                    })
+                    
+                    # If we have retries left, wait before retrying
+                    if attempts <= self.retries:
+                        # Exponential backoff
+                        delay = 2 ** attempts * 0.1
+                        with tracer.span("backoff", "retry", step_id=self.id, delay=delay):
+                            await asyncio.sleep(delay)
+            
+            # If we get here, all attempts failed
+            span.set(attempts=attempts)
+            if last_error:
+                context.add_error(self.id, last_error)
+                raise last_error
 
 
 class ConditionalBranch:
@@ -446,36 +652,40 @@ class ConditionStep(WorkflowStep):
         Returns:
             Result of the executed branch
         """
-        # Get the latest result from context
-        latest_result = context.last_result
-        
-        # Evaluate each condition
-        for branch in self.branches:
-            try:
-                # Check if condition is met
-                condition_met = branch.condition_func(latest_result)
-                if condition_met:
-                    # Execute branch steps
-                    branch_result = None
-                    for step in branch.steps:
-                        step_result = await step.execute(context)
-                        context.add_result(step.id, step_result)
-                        branch_result = step_result
-                    
-                    return branch_result
-            except Exception as e:
-                # Log condition evaluation error
-                logger.warning(f"Error evaluating condition in step {self.id}: {e}")
-                context.add_error(self.id, e)
-        
-        # If no conditions were met, execute else steps
-        else_result = None
-        for step in self.else_steps:
-            step_result = await step.execute(context)
-            context.add_result(step.id, step_result)
-            else_result = step_result
-        
-        return else_result
+        with context.tracer.span("condition", self.type.value, step_id=self.id) as span:
+            # Get the latest result from context
+            latest_result = context.last_result
+            
+            # Evaluate each condition
+            for index, branch in enumerate(self.branches):
+                try:
+                    # Check if condition is met
+                    condition_met = branch.condition_func(latest_result)
+                    if condition_met:
+                        span.set(branch=index)
+                        
+                        # Execute branch steps
+                        branch_result = None
+                        for step in branch.steps:
+                            step_result = await step.execute(context)
+                            context.add_result(step.id, step_result)
+                            branch_result = step_result
+                        
+                        return branch_result
+                except Exception as e:
+                    # Log condition evaluation error
+                    logger.warning(f"Error evaluating condition in step {self.id}: {e}")
+                    context.add_error(self.id, e)
+            
+            # If no conditions were met, execute else steps
+            span.set(branch="else")
+            else_result = None
+            for step in self.else_steps:
+                step_result = await step.execute(context)
+                context.add_result(step.id, step_result)
+                else_result = step_result
+            
+            return else_result
 
 
 class ParallelStep(WorkflowStep):
@@ -485,7 +695,8 @@ class ParallelStep(WorkflowStep):
         self,
         steps: List[WorkflowStep],
         id: Optional[str] = None,
-        max_concurrency: Optional[int] = None
+        max_concurrency: Optional[int] = None,
+        strict_merge: bool = False
     ):
         """
         Initialize a parallel step.
@@ -494,68 +705,84 @@ class ParallelStep(WorkflowStep):
             steps: Steps to execute in parallel
             id: Unique identifier for the step
             max_concurrency: Maximum number of steps to execute concurrently
+            strict_merge: Fail if branches write conflicting context values
+                instead of letting the later branch win
         """
         super().__init__(id, StepType.PARALLEL)
         self.steps = steps
         self.max_concurrency = max_concurrency
+        self.strict_merge = strict_merge
     
     async def execute(self, context) -> Dict[str, Any]:
         """
         Execute multiple steps in parallel.
         
+        Each branch runs on a copy-on-write fork of the context. Once all
+        branches have finished, the successful ones are merged back in
+        declaration order, so the merged state does not depend on timing.
+        
         Args:
             context: Current workflow context
             
         Returns:
             Dictionary mapping step IDs to results
-        """
-        # Create a new context for each parallel branch
-        contexts = {step.id: copy.deepcopy(context) for step in self.steps}
-        
-        # Execute steps concurrently
-        if self.max_concurrency:
-            # Use semaphore to limit concurrency
-            semaphore = asyncio.Semaphore(self.max_concurrency)
-            
-            async def execute_with_semaphore(step, step_context):
-                async with semaphore:
-                    return await step.execute(step_context)
             
-            tasks = [
-                asyncio.create_task(execute_with_semaphore(step, contexts[step.id]))
-                for step in self.steps
-            ]
-        else:
-            # Execute all steps concurrently
-            tasks = [
-                asyncio.create_task(step.execute(contexts[step.id]))
-                for step in self.steps
-            ]
-        
-        # Wait for all tasks to complete
-        results = {}
-        step_id_map = {id(task): step.id for task, step in zip(tasks, self.steps)}
-        step_map = {id(task): step for task, step in zip(tasks, self.steps)}
-        
-        for completed_task in asyncio.as_completed(tasks):
-            step_id = step_id_map[id(completed_task)]
-            step = step_map[id(completed_task)]
-            try:
-                result = await completed_task
-                results[step_id] = result
-                context.add_result(step_id, result)
+        Raises:
+            ValueError: If ``strict_merge`` is set and branches conflict
+        """
+        tracer = context.tracer
+        
+        # Create a copy-on-write context for each parallel branch
+        contexts = [context.fork() for _ in self.steps]
+        
+        with tracer.span(
+            "parallel", self.type.value, step_id=self.id,
+            branches=len(self.steps), max_concurrency=self.max_concurrency or 0
+        ):
+            # Execute steps concurrently
+            if self.max_concurrency:
+                # Use semaphore to limit concurrency
+                semaphore = asyncio.Semaphore(self.max_concurrency)
                 
-                # Merge step context back into main context
-                for key, value in contexts[step_id].data.items():
-                    if key not in context.data:
-                        context.data[key] = value
+                async def execute_with_semaphore(step, step_context):
+                    with tracer.span("semaphore_wait", "parallel", step_id=step.id):
+                        await semaphore.acquire()
+                    try:
+                        return await step.execute(step_context)
+                    finally:
+                        semaphore.release()
                 
-                # Merge history
-                context.history.extend(contexts[step_id].history)
+                tasks = [
+                    asyncio.create_task(execute_with_semaphore(step, step_context))
+                    for step, step_context in zip(self.steps, contexts)
+                ]
+            else:
+                # Execute all steps concurrently
+                tasks = [
+                    asyncio.create_task(step.execute(step_context))
+                    for step, step_context in zip(self.steps, contexts)
+                ]
+            
+            # Wait for all tasks to complete
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            results = {}
+            completed = []
+            succeeded = []
+            for step, step_context, outcome in zip(self.steps, contexts, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error in parallel step {step.id}: {outcome}")
+                    context.add_error(step.id, outcome)
+                    results[step.id] = None
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error in parallel step {step_id}: {e}")
-                context.add_error(step_id, e)
-                results[step_id] = None
+                results[step.id] = outcome
+                completed.append(step_context)
+                succeeded.append((step.id, outcome))
+            
+            # Merge branch contexts back into the main context
+            context.merge(completed, strict=self.strict_merge)
+            for step_id, result in succeeded:
+                context.add_result(step_id, result)
         
-        return results
\ No newline at end of file
+        return results
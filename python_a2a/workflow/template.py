@@ -0,0 +1,109 @@
+"""
+Query templates for workflow steps.
+
+This module provides a compiled template representation for step queries,
+so placeholders are parsed once when a step is created instead of on
+every execution.
+"""
+
+import json
+import re
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+# A placeholder is an identifier in braces, optionally followed by a format
+# spec: {name}, {price:.2f}, {record:json}. Anything else is literal text.
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)(?::([^{}]*))?\}")
+
+
+class QueryTemplate:
+    """
+    A query template compiled into literal and placeholder segments.
+
+    Placeholders use ``{name}`` syntax. Values are inserted as-is when they
+    are strings and converted with ``str()`` otherwise. An optional format
+    spec after a colon applies typed formatting: ``json`` serializes the
+    value as JSON, and any other spec is passed to ``format()`` (for example
+    ``{score:.2f}``). Placeholders without a matching variable are left in
+    the output unchanged.
+    """
+
+    def __init__(self, template: str):
+        """
+        Compile a query template.
+
+        Args:
+            template: Template text with ``{name}`` placeholders
+        """
+        self.template = template
+        self.segments: List[Union[str, Tuple[str, Optional[str], str]]] = []
+
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(template):
+            if match.start() > position:
+                self.segments.append(template[position:match.start()])
+            self.segments.append((match.group(1), match.group(2), match.group(0)))
+            position = match.end()
+        if position < len(template):
+            self.segments.append(template[position:])
+
+        self.variables = frozenset(
+            segment[0] for segment in self.segments if isinstance(segment, tuple)
+        )
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """
+        Render the template in a single pass.
+
+        Args:
+            variables: Mapping of placeholder names to values
+
+        Returns:
+            Rendered query text
+
+        Raises:
+            ValueError: If a value cannot be formatted with its format spec
+        """
+        if not self.variables:
+            return self.template
+
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            name, spec, original = segment
+            if name not in variables:
+                parts.append(original)
+                continue
+            parts.append(self._format(name, variables[name], spec))
+        return "".join(parts)
+
+    def missing(self, available) -> List[str]:
+        """
+        Get the placeholders that are not among the available names.
+
+        Args:
+            available: Collection of variable names that will be defined
+
+        Returns:
+            Sorted list of missing placeholder names
+        """
+        return sorted(name for name in self.variables if name not in available)
+
+    @staticmethod
+    def _format(name: str, value: Any, spec: Optional[str]) -> str:
+        """Format a single placeholder value."""
+        if spec is None:
+            return value if isinstance(value, str) else str(value)
+        if spec == "json":
+            return json.dumps(value, default=str)
+        try:
+            return format(value, spec)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Cannot format template variable '{name}' with spec '{spec}': {e}"
+            )
+
+    def __repr__(self) -> str:
+        return f"QueryTemplate({self.template!r})"
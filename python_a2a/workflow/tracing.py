@@ -0,0 +1,285 @@
+"""
+Span tracing for workflow executions.
+
+This module records timing spans for flows and their steps (agent calls,
+retry backoff, time spent waiting for a concurrency slot) and exports them
+as Chrome trace or OTLP JSON. Tracing is off unless a ``Tracer`` is passed
+to ``Flow.run``; the default ``NULL_TRACER`` does no work.
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+# Span that is currently open in this task, used to link child spans
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "python_a2a_workflow_span", default=None
+)
+
+
+class Span:
+    """A timed operation within a traced workflow."""
+
+    __slots__ = (
+        "tracer", "name", "category", "span_id", "parent_id",
+        "start", "end", "attributes", "thread", "_token"
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = None
+        self.start = None
+        self.end = None
+        self.attributes = attributes
+        self.thread = None
+        self._token = None
+
+    def set(self, **attributes: Any) -> "Span":
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+        return self
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the span duration in seconds, if it has finished."""
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None and parent.tracer is self.tracer:
+            self.parent_id = parent.span_id
+        self.thread = self.tracer._lane()
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.end = time.perf_counter()
+        if exc is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.tracer._record(self)
+        return False
+
+
+class _NullSpan:
+    """Span that records nothing, returned when tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> "_NullSpan":
+        return self
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Tracer that does nothing, used when tracing is disabled."""
+
+    enabled = False
+
+    def span(self, name: str, category: str = "workflow", **attributes: Any) -> _NullSpan:
+        """Return a no-op span."""
+        return _NULL_SPAN
+
+
+NULL_TRACER = NullTracer()
+
+
+class Tracer:
+    """
+    Collects spans for workflow executions.
+
+    Pass an instance to ``Flow.run`` (or ``run_sync``) and export the
+    recorded spans afterwards with ``to_chrome_trace``, ``to_otlp`` or
+    ``export``.
+    """
+
+    enabled = True
+
+    def __init__(self, service_name: str = "python-a2a-workflow"):
+        """
+        Initialize a tracer.
+
+        Args:
+            service_name: Service name reported in OTLP exports
+        """
+        self.service_name = service_name
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._lanes: Dict[int, int] = {}
+        # Anchor perf_counter readings to wall clock time for exports
+        self._wall_origin = time.time()
+        self._perf_origin = time.perf_counter()
+
+    def span(self, name: str, category: str = "workflow", **attributes: Any) -> Span:
+        """
+        Create a span to be used as a context manager.
+
+        Args:
+            name: Span name
+            category: Span category, such as the step type
+            **attributes: Span attributes
+
+        Returns:
+            The span
+        """
+        return Span(self, name, category, attributes)
+
+    def _lane(self) -> int:
+        """Get a small, stable id for the current asyncio task or thread."""
+        try:
+            key = id(asyncio.current_task())
+        except RuntimeError:
+            key = threading.get_ident()
+        with self._lock:
+            return self._lanes.setdefault(key, len(self._lanes) + 1)
+
+    def _record(self, span: Span) -> None:
+        """Store a finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def _wall_time(self, perf_time: float) -> float:
+        """Convert a perf_counter reading to a Unix timestamp."""
+        return self._wall_origin + (perf_time - self._perf_origin)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize total time and count per span name.
+
+        Returns:
+            Mapping of span name to count and total seconds
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {"count": 0, "total": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration or 0.0
+        return totals
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export the spans in Chrome trace event format.
+
+        The result can be loaded in chrome://tracing or Perfetto.
+
+        Returns:
+            Trace data with a ``traceEvents`` list
+        """
+        events = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start - self._perf_origin) * 1e6,
+                "dur": (span.end - span.start) * 1e6,
+                "pid": os.getpid(),
+                "tid": span.thread,
+                "args": {
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    **_jsonable(span.attributes)
+                }
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Export the spans in OTLP/JSON format.
+
+        Returns:
+            OTLP ``ExportTraceServiceRequest`` data
+        """
+        otlp_spans = []
+        for span in self.spans:
+            otlp_span = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(int(self._wall_time(span.start) * 1e9)),
+                "endTimeUnixNano": str(int(self._wall_time(span.end) * 1e9)),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in {"category": span.category, **span.attributes}.items()
+                ]
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            if "error" in span.attributes:
+                otlp_span["status"] = {"code": 2, "message": str(span.attributes["error"])}
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": self.service_name}}
+                    ]
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "python_a2a.workflow"},
+                    "spans": otlp_spans
+                }]
+            }]
+        }
+
+    def export(self, path: str, format: str = "chrome") -> None:
+        """
+        Write the spans to a JSON file.
+
+        Args:
+            path: Output file path
+            format: "chrome" for Chrome trace events or "otlp" for OTLP/JSON
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format == "chrome":
+            data = self.to_chrome_trace()
+        elif format == "otlp":
+            data = self.to_otlp()
+        else:
+            raise ValueError(f"Unsupported trace format: {format}")
+
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+def _jsonable(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Make attribute values JSON serializable."""
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+        for key, value in attributes.items()
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Convert an attribute value to an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
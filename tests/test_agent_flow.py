@@ -0,0 +1,359 @@
+"""
+Tests for the Agent Flow agent and tool registries.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from python_a2a.agent_flow.models.tool import ToolDefinition, ToolRegistry, ToolStatus
+
+
+class SlowHealthHandler(BaseHTTPRequestHandler):
+    """Health endpoint that takes a while to answer"""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.3
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        status = 200 if self.path == "/up/health" else 503
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def health_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHealthHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_tool_health_checks_run_concurrently_and_are_cached(health_url):
+    """Tools are probed in parallel and on-use checks reuse fresh statuses"""
+    registry = ToolRegistry()
+    tools = [ToolDefinition(name=f"tool{i}", url=f"{health_url}/up") for i in range(8)]
+    tools.append(ToolDefinition(name="down", url=f"{health_url}/down"))
+    for tool in tools:
+        registry.register(tool)
+
+    start = time.monotonic()
+    assert registry.check_all_availability(max_workers=16) == (8, 1)
+    # Nine sequential checks would take 2.7 s
+    assert time.monotonic() - start < 1.5
+    assert tools[-1].status == ToolStatus.UNAVAILABLE
+    assert tools[0].to_dict()["last_checked"] is not None
+
+    start = time.monotonic()
+    assert tools[0].check_availability(max_age=30)
+    assert time.monotonic() - start < 0.1
+
+    # Background refresh keeps the cached statuses current
+    checked = tools[0].last_checked
+    registry.start_refresh(interval=60)
+    deadline = time.monotonic() + 5
+    while tools[0].last_checked == checked and time.monotonic() < deadline:
+        time.sleep(0.05)
+    registry.stop_refresh()
+    assert tools[0].last_checked > checked
+
+
+def test_discovery_streams_agents_and_skips_dead_ports():
+    """Agents are found across hosts; ports without agents are cached"""
+    import asyncio
+    import json
+    import socket
+
+    from python_a2a.agent_flow.models.agent import AgentRegistry
+    from python_a2a.agent_flow.utils.discovery import AgentScanner, expand_targets
+
+    assert expand_targets(["http://localhost", "10.0.0.0/30"]) == [
+        ("http", "localhost"), ("http", "10.0.0.1"), ("http", "10.0.0.2")]
+
+    class CardHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"name": "Finder", "description": "Finds things"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+    # A free port next to the agent to scan as a dead one
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        dead_port = probe.getsockname()[1]
+
+    registry = AgentRegistry()
+    try:
+        agents = registry.discover_agents(["http://127.0.0.1"], (port, port))
+        assert [agent.url for agent in agents] == [f"http://127.0.0.1:{port}"]
+        assert registry.get(agents[0].id).name == "Finder"
+
+        async def first_found():
+            async for agent in registry.discover_agents_async("127.0.0.1", (port, port)):
+                return agent
+
+        assert asyncio.run(first_found()).url == f"http://127.0.0.1:{port}"
+
+        async def discover_in_loop():
+            return registry.discover_agents("http://127.0.0.1", (port, port))
+
+        assert [agent.url for agent in asyncio.run(discover_in_loop())] == [f"http://127.0.0.1:{port}"]
+
+        scanner = registry.scanner
+        assert registry.discover_agents("http://127.0.0.1", (dead_port, dead_port)) == []
+        skipped = scanner.stats["skipped"]
+        registry.discover_agents("http://127.0.0.1", (dead_port, dead_port))
+        assert scanner.stats["skipped"] == skipped + 1
+    finally:
+        server.shutdown()
+
+    # Workers that fail leave the producer blocked on a full queue
+    async def failing_probe(*args):
+        raise OSError("probe failed")
+
+    scanner = AgentScanner(max_concurrency=1)
+    scanner._probe = failing_probe
+
+    async def scan_all():
+        return [item async for item in scanner.scan("127.0.0.1", (1, 100))]
+
+    assert asyncio.run(asyncio.wait_for(scan_all(), 5)) == []
+
+
+def test_remote_tool_execution_times_out_and_retries_idempotent_tools():
+    """Hung servers time out; idempotent tools retry transient failures"""
+    import asyncio
+    import json
+
+    from python_a2a.agent_flow.models.tool import ToolSource
+    from python_a2a.client.sessions import get_session_pool
+
+    calls = {"/flaky": 0, "/write": 0}
+
+    class ToolServerHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            if self.path == "/hang":
+                time.sleep(1)
+            calls[self.path] = calls.get(self.path, 0) + 1
+            status = 503 if calls[self.path] % 2 else 200
+            body = json.dumps({"calls": calls[self.path]}).encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ToolServerHandler)
+    # The hung request's client is gone by the time it answers
+    server.handle_error = lambda request, address: None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+
+    def remote(path, **config):
+        return ToolDefinition(name=path, url=url, tool_path=path,
+                              tool_source=ToolSource.REMOTE, config=config)
+
+    def run_async(tool):
+        async def execute():
+            try:
+                return await tool.execute_async({})
+            finally:
+                await get_session_pool().aclose()
+        return asyncio.run(execute())
+
+    try:
+        flaky = remote("flaky", idempotent=True)
+        assert flaky.execute({}) == {"calls": 2}
+        assert run_async(flaky) == {"calls": 4}
+
+        # Writes are not retried
+        with pytest.raises(RuntimeError, match="503"):
+            remote("write").execute({})
+        assert calls["/write"] == 1
+
+        hung = remote("hang", read_timeout=0.2)
+        start = time.monotonic()
+        with pytest.raises(RuntimeError):
+            hung.execute({})
+        with pytest.raises(RuntimeError):
+            run_async(hung)
+        assert time.monotonic() - start < 1.5
+    finally:
+        server.shutdown()
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_workflow_storage_lists_pages_and_survives_reopen(tmp_path, backend):
+    """Listings are filtered, paginated and newest first, and persist across instances"""
+    from python_a2a.agent_flow.models.workflow import Workflow
+    from python_a2a.agent_flow.storage.workflow_storage import (
+        FileWorkflowStorage, SqliteWorkflowStorage)
+
+    def open_storage():
+        if backend == "file":
+            return FileWorkflowStorage(str(tmp_path / "workflows"))
+        return SqliteWorkflowStorage(str(tmp_path / "workflows.db"))
+
+    storage = open_storage()
+    if backend == "file":
+        # Keep compaction in play
+        storage.COMPACT_SLACK = 3
+    workflows = [Workflow(name=f"Report {i}" if i % 2 else f"Sync_{i}") for i in range(6)]
+    for workflow in workflows:
+        storage.save_workflow(workflow)
+        time.sleep(0.002)
+    workflows[0].description = "edited"
+    storage.save_workflow(workflows[0])
+    assert storage.delete_workflow(workflows[5].id)
+    assert not storage.delete_workflow(workflows[5].id)
+
+    listed = storage.list_workflows()
+    assert [w["id"] for w in listed] == [workflows[i].id for i in (0, 4, 3, 2, 1)]
+    assert listed[0]["description"] == "edited"
+    assert [w["id"] for w in storage.list_workflows(limit=2, offset=1)] == [
+        workflows[4].id, workflows[3].id]
+    assert {w["name"] for w in storage.list_workflows(name="report")} == {"Report 1", "Report 3"}
+    # LIKE wildcards in the filter are matched literally
+    assert [w["name"] for w in storage.list_workflows(name="c_4")] == ["Sync_4"]
+    since = listed[1]["updated_at"]
+    assert len(storage.list_workflows(updated_since=since)) == 2
+
+    # Another instance sees the same data, and writes from it are visible
+    other = open_storage()
+    assert [w["id"] for w in other.list_workflows()] == [w["id"] for w in listed]
+    other.delete_workflow(workflows[0].id)
+    assert len(storage.list_workflows()) == 4
+    assert storage.load_workflow(workflows[1].id).name == "Report 1"
+
+
+def test_file_workflow_storage_follows_compaction_by_another_instance(tmp_path):
+    """A compacted index is read again even when it is not smaller"""
+    from python_a2a.agent_flow.models.workflow import Workflow
+    from python_a2a.agent_flow.storage.workflow_storage import FileWorkflowStorage
+
+    writer = FileWorkflowStorage(str(tmp_path))
+    reader = FileWorkflowStorage(str(tmp_path))
+    writer.COMPACT_SLACK = 2
+    workflows = [Workflow(name=f"Workflow {i}") for i in range(4)]
+    writer.save_workflow(workflows[0])
+    assert [w["id"] for w in reader.list_workflows()] == [workflows[0].id]
+
+    for workflow in workflows[1:]:
+        writer.save_workflow(workflow)
+    writer.delete_workflow(workflows[0].id)
+    writer.delete_workflow(workflows[1].id)
+    # Compacted into two records, no shorter than what the reader has read
+    assert os.path.getsize(tmp_path / "index.jsonl") >= reader._offset
+    assert {w["id"] for w in reader.list_workflows()} == {workflows[2].id, workflows[3].id}
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_workflow_versions_are_stored_as_deltas_between_snapshots(tmp_path, backend):
+    """Every version loads back exactly; old segments are dropped by retention"""
+    from python_a2a.agent_flow.models.workflow import NodeType, Workflow, WorkflowNode
+    from python_a2a.agent_flow.storage.versioning import VersionPolicy
+    from python_a2a.agent_flow.storage.workflow_storage import (
+        FileWorkflowStorage, SqliteWorkflowStorage)
+
+    policy = VersionPolicy(checkpoint_interval=3, keep_last=4)
+    if backend == "file":
+        storage = FileWorkflowStorage(str(tmp_path), versioning=policy)
+    else:
+        storage = SqliteWorkflowStorage(str(tmp_path / "workflows.db"), versioning=policy)
+
+    workflow = Workflow(name="Pipeline")
+    saved = {}
+    for i in range(1, 8):
+        node = workflow.add_node(WorkflowNode(name=f"step {i}", node_type=NodeType.AGENT))
+        if i > 1:
+            workflow.add_edge(previous.id, node.id)
+        if i == 4:
+            workflow.remove_node(previous.id)
+        workflow.description = f"revision {i}"
+        storage.save_workflow(workflow)
+        # Autosaves without changes add no version
+        storage.save_workflow(workflow)
+        saved[i] = workflow.to_dict()
+        previous = node
+
+    versions = storage.list_versions(workflow.id)
+    # Versions 1-3 were dropped with their snapshot; 4 is the oldest snapshot kept
+    assert [v["version"] for v in versions] == [4, 5, 6, 7]
+    assert [v["kind"] for v in versions] == ["snapshot", "delta", "delta", "snapshot"]
+    for number in (4, 5, 6, 7):
+        loaded = storage.load_workflow(workflow.id, version=number).to_dict()
+        for key in ("description", "nodes", "edges"):
+            assert loaded[key] == saved[number][key]
+    assert storage.load_workflow(workflow.id, version=2) is None
+    assert storage.load_workflow(workflow.id).description == "revision 7"
+
+    storage.delete_workflow(workflow.id)
+    assert storage.list_versions(workflow.id) == []
+
+
+def test_execution_progress_streams_as_resumable_server_sent_events(tmp_path):
+    """Node lifecycle events are streamed in order and resume from a sequence"""
+    import json
+
+    pytest.importorskip("flask")
+    from python_a2a.agent_flow.engine.executor import WorkflowExecutor
+    from python_a2a.agent_flow.models.agent import AgentRegistry
+    from python_a2a.agent_flow.models.workflow import NodeType, Workflow, WorkflowNode
+    from python_a2a.agent_flow.server.api import create_app
+    from python_a2a.agent_flow.storage.workflow_storage import FileWorkflowStorage
+
+    workflow = Workflow(name="Echo")
+    source = workflow.add_node(WorkflowNode(name="in", node_type=NodeType.INPUT,
+                                            config={"ui_node_id": "ui-1"}))
+    sink = workflow.add_node(WorkflowNode(name="out", node_type=NodeType.OUTPUT))
+    workflow.add_edge(source.id, sink.id)
+
+    executor = WorkflowExecutor(AgentRegistry(), ToolRegistry())
+    execution_id = executor.execute_workflow(workflow, {"text": "hi"}, wait=False)
+    app = create_app(AgentRegistry(), ToolRegistry(),
+                     FileWorkflowStorage(str(tmp_path)), executor)
+    client = app.test_client()
+
+    # The stream follows the execution as it runs and ends with it
+    runner = threading.Thread(target=executor.get_execution(execution_id).execute_all)
+    response = client.get(f"/api/executions/{execution_id}/events")
+    runner.start()
+    body = response.get_data(as_text=True)
+    runner.join()
+    assert response.mimetype == "text/event-stream"
+
+    events = [json.loads(line[len("data: "):]) for line in body.splitlines()
+              if line.startswith("data: ")]
+    assert [e["seq"] for e in events] == list(range(1, len(events) + 1))
+    assert [(e.get("name"), e["status"]) for e in events] == [
+        (None, "RUNNING"), ("in", "QUEUED"), ("in", "RUNNING"), ("in", "COMPLETED"),
+        ("out", "QUEUED"), ("out", "RUNNING"), ("out", "COMPLETED"), (None, "COMPLETED")]
+    assert events[3]["ui_node_id"] == "ui-1" and events[3]["duration_ms"] >= 0
+
+    # Resuming sends only what came after the last event seen
+    resumed = client.get(f"/api/executions/{execution_id}/events",
+                         headers={"Last-Event-ID": "5"}).get_data(as_text=True)
+    assert [line for line in resumed.splitlines() if line.startswith("id: ")] == [
+        "id: 6", "id: 7", "id: 8"]
+    assert executor.get_execution_events(execution_id, after=7)[0]["type"] == "execution"
+    assert client.get("/api/executions/missing/events").status_code == 404
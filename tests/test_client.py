@@ -137,4 +137,106 @@ class TestA2AClient:
         
         # Should raise an exception
         with pytest.raises(A2AConnectionError):
-            client.send_message(text_message)
\ No newline at end of file
+            client.send_message(text_message)
+    
+    @pytest.mark.asyncio
+    async def test_ask_async_native(self):
+        """Test that ask_async talks to the agent without a thread"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        
+        async def tasks_send(request):
+            data = await request.json()
+            return web.json_response({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": {
+                    "id": data["params"]["id"],
+                    "status": {"state": "completed"},
+                    "artifacts": [{"parts": [{"type": "text", "text": "pong"}]}]
+                }
+            })
+        
+        app = web.Application()
+        app.router.add_post("/tasks/send", tasks_send)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            with patch.object(A2AClient, "_fetch_agent_card", side_effect=Exception):
+                client = A2AClient(str(server.make_url("")))
+            
+            with patch("python_a2a.client.base.run_in_sync_executor") as run_sync:
+                assert await client.ask_async("ping") == "pong"
+                run_sync.assert_not_called()
+        finally:
+            await server.close()
+    
+    def test_pooled_async_sessions(self):
+        """Pooled requests keep the client's settings; closed loops' sessions are released"""
+        import asyncio
+        import time
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from python_a2a.client import HTTPSessionPool
+        
+        pool = HTTPSessionPool(timeout=30)
+        tokens = []
+        
+        async def ask(delay):
+            async def tasks_send(request):
+                tokens.append(request.headers.get("X-Token"))
+                await asyncio.sleep(delay)
+                data = await request.json()
+                return web.json_response({
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "result": {
+                        "id": data["params"]["id"],
+                        "status": {"state": "completed"},
+                        "artifacts": [{"parts": [{"type": "text", "text": "pong"}]}]
+                    }
+                })
+            
+            app = web.Application()
+            app.router.add_post("/tasks/send", tasks_send)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                with patch.object(A2AClient, "_fetch_agent_card", side_effect=Exception):
+                    client = A2AClient(str(server.make_url("")), headers={"X-Token": "secret"},
+                                       timeout=0.2, session_pool=pool)
+                try:
+                    return await client.ask_async("ping"), pool.async_session()
+                except Exception as e:
+                    return e, pool.async_session()
+            finally:
+                await server.close()
+        
+        answer, first = asyncio.run(ask(0))
+        assert answer == "pong" and tokens == ["secret"]
+        
+        start = time.monotonic()
+        answer, second = asyncio.run(ask(5))
+        assert answer != "pong" and time.monotonic() - start < 3
+        assert first.closed and second is not first
+        assert len(pool._async_sessions) == 1
+        pool.close()
+        assert second.closed and not pool._async_sessions
+
+
+def test_set_sync_executor_shuts_down_replaced_pools():
+    """Pools created for set_sync_executor are shut down; given executors are not"""
+    from concurrent.futures import ThreadPoolExecutor
+    from python_a2a.client.base import get_sync_executor, set_sync_executor
+    
+    set_sync_executor(2)
+    created = get_sync_executor()
+    custom = ThreadPoolExecutor(max_workers=1)
+    try:
+        set_sync_executor(custom)
+        with pytest.raises(RuntimeError):
+            created.submit(print)
+        set_sync_executor(None)
+        assert custom.submit(lambda: "still open").result() == "still open"
+    finally:
+        custom.shutdown()
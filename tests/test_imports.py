@@ -0,0 +1,66 @@
+"""
+Tests for the import cost of the python_a2a package.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import python_a2a
+
+# Import-time budget for the package and its models, in microseconds. Eager
+# imports of the servers, MCP transports, LLM SDKs and agent_flow cost
+# seconds; the lazy package stays well under this on a slow CI machine.
+IMPORT_BUDGET_US = 300_000
+
+HEAVY_MODULES = [
+    "flask", "fastapi", "pydantic", "requests", "aiohttp", "openai", "anthropic",
+    "boto3", "langchain_core", "python_a2a.agent_flow", "python_a2a.server",
+]
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True, timeout=120)
+
+
+def test_importing_models_stays_within_budget():
+    """Importing a model loads no servers, SDKs or agent_flow"""
+    result = run_python("-X", "importtime", "-c", (
+        "import json, sys\n"
+        "from python_a2a import Message, Task, A2AError\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    ))
+    assert json.loads(result.stdout) == []
+
+    # Top-level entries of -X importtime: "import time: self | cumulative | name"
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].startswith(" python_a2a"):
+            total += int(fields[1])
+    assert 0 < total < IMPORT_BUDGET_US, f"python_a2a imports took {total} us"
+
+
+def test_public_names_load_on_first_access():
+    """Lazy names resolve to their modules' objects and are then cached"""
+    from python_a2a.client.http import A2AClient
+    from python_a2a.mcp.fastmcp import ContentType
+
+    assert python_a2a.A2AClient is A2AClient
+    assert "A2AClient" in vars(python_a2a)
+    assert python_a2a.MCPContentType is ContentType
+    assert "Message" in dir(python_a2a) and "__all__" in dir(python_a2a)
+    with pytest.raises(AttributeError):
+        python_a2a.NoSuchName
+
+    result = run_python("-c", (
+        "import python_a2a\n"
+        "namespace = {}\n"
+        "exec('from python_a2a import *', namespace)\n"
+        "print(all(name in namespace for name in python_a2a.__all__), "
+        "python_a2a.HAS_LLM_CLIENTS == ('OpenAIA2AClient' in python_a2a.__all__))"
+    ))
+    assert result.stdout.split() == ["True", "True"]
@@ -0,0 +1,119 @@
+"""
+Tests for serving LangChain components as A2A servers.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.runnables import RunnableLambda
+
+from python_a2a.langchain import LangChainRuntime, to_a2a_server
+from python_a2a.langchain.a2a import HAS_LANGCHAIN
+from python_a2a.models import Message, MessageRole, Task, TextContent
+
+
+def make_task(text):
+    return Task(message={"content": {"type": "text", "text": text}, "role": "user"})
+
+
+@pytest.mark.skipif(not HAS_LANGCHAIN, reason="LangChain agents not available")
+def test_tasks_share_one_event_loop_and_worker_pool():
+    """Async components keep loop-bound state; sync ones run in the runtime's pool"""
+    runtime = LangChainRuntime(max_workers=2)
+    loops = []
+
+    async def answer(text):
+        loops.append(asyncio.get_running_loop())
+        return text.upper()
+
+    threads = []
+
+    class Reverser:
+        """Component with only a synchronous invoke"""
+
+        def invoke(self, text, config=None):
+            threads.append(threading.current_thread().name)
+            return text[::-1]
+
+    try:
+        server = to_a2a_server(RunnableLambda(lambda text: text, afunc=answer), runtime=runtime)
+        for text in ("one", "two"):
+            task = server.handle_task(make_task(text))
+            assert task.artifacts[0]["parts"][0]["text"] == text.upper()
+        assert loops[0] is loops[1] is runtime.loop
+
+        # Native async entry from another loop is served on the runtime's loop
+        task = asyncio.run(server.handle_task_async(make_task("three")))
+        assert task.artifacts[0]["parts"][0]["text"] == "THREE"
+        assert loops[-1] is runtime.loop
+
+        reply = server.handle_message(Message(content=TextContent(text="hi"), role=MessageRole.USER))
+        assert reply.content.text == "HI"
+
+        sync_server = to_a2a_server(Reverser(), runtime=runtime)
+        assert sync_server.handle_task(make_task("abc")).artifacts[0]["parts"][0]["text"] == "cba"
+        assert threads and all(name.startswith("langchain-worker") for name in threads)
+
+        async def collect():
+            message = Message(content=TextContent(text="xy"), role=MessageRole.USER)
+            return [chunk async for chunk in sync_server.stream_response(message)]
+
+        assert "".join(chunk["content"] for chunk in asyncio.run(collect())) == "yx"
+    finally:
+        runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_runtime_on_host_loop_runs_natively():
+    """A runtime bound to the host's loop awaits directly and serves other threads"""
+    runtime = LangChainRuntime(loop=asyncio.get_running_loop())
+
+    async def answer(text):
+        return asyncio.get_running_loop()
+
+    assert await runtime.call(answer("x")) is asyncio.get_running_loop()
+    result = await asyncio.to_thread(runtime.run, answer("x"))
+    assert result is asyncio.get_running_loop()
+    with pytest.raises(RuntimeError):
+        runtime.run(answer("x"))
+    runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_invocations_are_batched():
+    """Concurrent requests share one abatch call and get their own results"""
+    from python_a2a.langchain import BatchPolicy
+    from python_a2a.langchain.a2a import InvocableAdapter
+
+    runtime = LangChainRuntime(loop=asyncio.get_running_loop())
+    batches = []
+
+    def shout(text):
+        if text == "bad":
+            raise ValueError("bad input")
+        return text.upper()
+
+    class Shouter(RunnableLambda):
+        async def abatch(self, inputs, config=None, **kwargs):
+            batches.append(list(inputs))
+            return await super().abatch(inputs, config, **kwargs)
+
+    adapter = InvocableAdapter(Shouter(shout), runtime, BatchPolicy(max_batch_size=3, max_wait_ms=50))
+    results = await asyncio.gather(*(adapter.process_message(text) for text in ("a", "b", "c", "d")))
+    assert results == ["A", "B", "C", "D"]
+    # The full batch goes out at once, the rest after the wait window
+    assert [len(batch) for batch in batches] == [3, 1]
+
+    # A failing input only fails its own request
+    results = await asyncio.gather(adapter.process_message("ok"), adapter.process_message("bad"))
+    assert results[0] == "OK" and results[1].startswith("Error:")
+    metrics = adapter.batcher.metrics()
+    assert metrics["batch_sizes"][3] == 1 and metrics["requests"] >= 6
+
+    # Disabled per component
+    assert InvocableAdapter(Shouter(shout), runtime, False).batcher is None
+    runtime.shutdown()
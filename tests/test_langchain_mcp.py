@@ -0,0 +1,83 @@
+"""
+Tests for bridging MCP tools into LangChain.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from python_a2a.client import HTTPSessionPool
+from python_a2a.langchain import clear_tool_listing_cache, to_langchain_tool
+
+
+class ToolHandler(BaseHTTPRequestHandler):
+    """Minimal MCP HTTP server that counts listings and connections"""
+
+    protocol_version = "HTTP/1.1"
+    listings = 0
+    connections = set()
+
+    def setup(self):
+        super().setup()
+        ToolHandler.connections.add(self.client_address)
+
+    def _send(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        ToolHandler.listings += 1
+        self._send([{"name": "echo", "description": "Echo text",
+                     "parameters": [{"name": "text", "type": "string"}]}])
+
+    def do_POST(self):
+        arguments = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._send({"content": [{"type": "text", "text": arguments["text"]}]})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mcp_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ToolHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ToolHandler.listings = 0
+    ToolHandler.connections = set()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    clear_tool_listing_cache()
+
+
+def test_bridged_tools_share_connections_and_listing(mcp_url):
+    """Tool calls reuse pooled connections; listings are cached per URL"""
+    pool = HTTPSessionPool()
+    echo = to_langchain_tool(mcp_url, "echo", session_pool=pool)
+    to_langchain_tool(mcp_url, session_pool=pool)
+    assert ToolHandler.listings == 1
+
+    assert [echo.run(f"hi{i}") for i in range(5)] == [f"hi{i}" for i in range(5)]
+    # The listing and all sync calls went over one kept-alive connection
+    assert len(ToolHandler.connections) == 1
+
+    async def call_async():
+        results = [await echo.arun(f"async{i}") for i in range(3)]
+        await pool.aclose()
+        return results
+
+    assert asyncio.run(call_async()) == ["async0", "async1", "async2"]
+    assert len(ToolHandler.connections) == 2
+
+    clear_tool_listing_cache(mcp_url)
+    to_langchain_tool(mcp_url, "echo", session_pool=pool)
+    assert ToolHandler.listings == 2
+    pool.close()
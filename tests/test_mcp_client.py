@@ -244,4 +244,141 @@ def test_transport_creation():
     
     # Test error when neither provided
     with pytest.raises(ValueError):
-        create_transport()
\ No newline at end of file
+        create_transport()
+
+# Minimal stdio MCP server that answers single requests and batches
+STDIO_SERVER = r'''
+import json, sys
+
+def answer(request):
+    if request.get("method") == "initialize":
+        result = {"protocolVersion": "2024-11-05", "serverInfo": {"name": "stub", "version": "1"}, "capabilities": {}}
+    else:
+        args = request["params"]["arguments"]
+        if "fail" in args:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "failed"}}
+        result = {"content": [{"type": "text", "text": str(args["x"] * 2)}]}
+    return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+for line in sys.stdin:
+    message = json.loads(line)
+    if isinstance(message, list):
+        # Answer a batch in reverse order to exercise matching by id
+        reply = [answer(m) for m in reversed(message) if "id" in m]
+    elif "id" in message:
+        reply = answer(message)
+    else:
+        continue
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+'''
+
+
+@pytest.mark.asyncio
+async def test_call_tools_batch_stdio():
+    """Test batched tool calls over a stdio pipe"""
+    import sys
+    from python_a2a.mcp.client import JSONRPCError
+
+    async with MCPClient(command=[sys.executable, "-c", STDIO_SERVER]) as client:
+        results = await client.call_tools_batch([
+            ("double", {"x": 1}),
+            {"name": "double", "arguments": {"x": 2}},
+            ("double", {"fail": True}),
+        ], return_exceptions=True)
+
+        assert results[:2] == ["2", "4"]
+        assert isinstance(results[2], JSONRPCError)
+
+        with pytest.raises(JSONRPCError):
+            await client.call_tools_batch([("double", {"fail": True})])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced():
+    """Test concurrent calls within the batch window share one batch"""
+    import sys
+
+    client = MCPClient(command=[sys.executable, "-c", STDIO_SERVER], batch_window=0.05)
+    async with client:
+        await client._ensure_connected()
+        results = await asyncio.gather(*(client.call_tool("double", x=i) for i in range(10)))
+
+        assert results == [str(i * 2) for i in range(10)]
+        assert client._batcher.stats["batches"] == 1
+        assert client._batcher.stats["largest_batch"] == 10
+
+
+@pytest.mark.asyncio
+async def test_stdio_messages_over_stream_limit():
+    """Test responses larger than the 64 KB readline limit are received"""
+    import sys
+
+    async with MCPClient(command=[sys.executable, "-c", STDIO_SERVER]) as client:
+        result = await client.call_tool("double", x="ab" * 100000)
+        assert len(result) == 400000
+
+
+def test_line_framer_splits_and_limits_messages():
+    """Test framing across chunk boundaries and dropping oversized lines"""
+    from python_a2a.mcp.framing import LineFramer
+
+    framer = LineFramer(max_message_size=8)
+    assert framer.feed(b'{"a"') == []
+    assert framer.feed(b':1}\r\n\n{"b":2}\n{"c"') == [b'{"a":1}', b'{"b":2}']
+    assert len(framer) == 4
+
+    # A line over the limit is dropped, even when it spans several reads
+    assert framer.feed(b':3}\n0123456789\n') == [b'{"c":3}']
+    assert framer.feed(b'0123456789') == []
+    assert len(framer) == 0
+    assert framer.feed(b'0123\n{"d":4}\n') == [b'{"d":4}']
+    assert framer.stats["messages"] == 4
+    assert framer.stats["dropped"] == 2
+
+
+# MCPServer over stdio with a tool that streams its result
+STREAM_SERVER = r'''
+import asyncio, logging
+logging.disable(logging.CRITICAL)
+from python_a2a.mcp import (MCPCapabilities, MCPConnection, MCPImplementationInfo,
+                            MCPServer, ServerStdioTransport)
+
+server = MCPServer("stream", "1.0.0")
+
+@server.tool()
+async def count(n: int):
+    for i in range(n):
+        yield f"chunk {i};"
+
+async def main():
+    connection = MCPConnection(ServerStdioTransport(), server.handler,
+                               MCPImplementationInfo("stream", "1"), MCPCapabilities(tools={}))
+    server.handler.set_connection(connection)
+    await connection.connect()
+    await connection.wait_closed()
+
+asyncio.run(main())
+'''
+
+
+@pytest.mark.asyncio
+async def test_stream_tool_over_stdio():
+    """Test tool output arrives as progress notifications before the result"""
+    import os
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-c", f"import sys; sys.path.insert(0, {root!r})\n" + STREAM_SERVER]
+    async with MCPClient(command=command) as client:
+        chunks = [chunk async for chunk in client.stream_tool("count", n=3)]
+        assert chunks == ["chunk 0;", "chunk 1;", "chunk 2;"]
+
+        seen = []
+        result = await client.call_tool("count", stream=True, callback=seen.append, n=2)
+        assert result == "chunk 0;chunk 1;"
+        assert seen == ["chunk 0;", "chunk 1;"]
+
+        # Without a progress token the whole result comes in the response
+        assert await client.call_tool("count", n=2) == [
+            {"type": "text", "text": "chunk 0;"}, {"type": "text", "text": "chunk 1;"}]
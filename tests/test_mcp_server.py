@@ -0,0 +1,676 @@
+"""
+Tests for MCP server handler execution and resource routing.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from python_a2a.mcp import FastMCP, MCPServer, ToolExecutor, ToolResultCache
+from python_a2a.mcp.routing import ResourceRouter, URITemplate
+
+
+def square(x: int) -> int:
+    """Module-level so it can be sent to a worker process."""
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_runs_off_event_loop():
+    """Sync tools run in the server's thread pool, not on the loop"""
+    mcp = FastMCP("test")
+    loop_thread = threading.get_ident()
+
+    @mcp.tool()
+    def where() -> str:
+        return "loop" if threading.get_ident() == loop_thread else "worker"
+
+    response = await mcp.call_tool("where", {})
+    assert response.content[0]["text"] == "worker"
+
+
+@pytest.mark.asyncio
+async def test_slow_tool_does_not_block_other_tools():
+    """A blocking tool leaves the loop free for other calls"""
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    def slow() -> str:
+        time.sleep(0.3)
+        return "slow"
+
+    @mcp.tool()
+    async def fast() -> str:
+        return "fast"
+
+    slow_call = asyncio.ensure_future(mcp.call_tool("slow", {}))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    response = await mcp.call_tool("fast", {})
+    assert time.perf_counter() - started < 0.1
+    assert response.content[0]["text"] == "fast"
+    assert (await slow_call).content[0]["text"] == "slow"
+
+
+@pytest.mark.asyncio
+async def test_tool_concurrency_limit_and_metrics():
+    """max_concurrency caps running calls and excess calls are counted as waiting"""
+    mcp = FastMCP("test")
+    running = []
+    peak = []
+
+    @mcp.tool(max_concurrency=2)
+    def work(i: int) -> int:
+        running.append(i)
+        peak.append(len(running))
+        time.sleep(0.05)
+        running.remove(i)
+        return i
+
+    results = await asyncio.gather(*(mcp.call_tool("work", {"i": i}) for i in range(6)))
+
+    assert [r.content[0]["text"] for r in results] == [str(i) for i in range(6)]
+    assert max(peak) <= 2
+
+    stats = mcp.get_metrics()["handlers"]["work"]
+    assert stats["completed"] == 6
+    assert stats["waiting"] == stats["queued"] == stats["running"] == 0
+    assert stats["max_queue_depth"] >= 4
+
+
+def test_tool_concurrency_limit_across_event_loops():
+    """Limits work on every loop a server is used from and follow size changes"""
+    mcp = FastMCP("test")
+    running = []
+    peak = []
+
+    @mcp.tool(max_concurrency=1)
+    def work(i: int) -> int:
+        running.append(i)
+        peak.append(len(running))
+        time.sleep(0.02)
+        running.remove(i)
+        return i
+
+    async def call_all():
+        results = await asyncio.gather(*(mcp.call_tool("work", {"i": i}) for i in range(4)))
+        return [r.content[0]["text"] for r in results]
+
+    for _ in range(2):
+        assert asyncio.run(call_all()) == ["0", "1", "2", "3"]
+    assert max(peak) == 1
+
+    mcp.tools["work"].max_concurrency = 4
+    assert asyncio.run(call_all()) == ["0", "1", "2", "3"]
+    assert max(peak) > 1
+    # Limits of closed loops are dropped
+    assert len(mcp.executor._limits) <= 1
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout():
+    """Calls over the tool's timeout return an error response"""
+    mcp = FastMCP("test")
+
+    @mcp.tool(timeout=0.05)
+    def hang() -> str:
+        time.sleep(0.3)
+        return "done"
+
+    response = await mcp.call_tool("hang", {})
+    assert response.is_error
+    assert "timed out" in response.content[0]["text"]
+    assert mcp.get_metrics()["handlers"]["hang"]["timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_executor():
+    """Tools declared with executor="process" run in the process pool"""
+    executor = ToolExecutor(max_workers=2, process_workers=1)
+    try:
+        assert await executor.run("square", square, {"x": 7}, executor="process") == 49
+    finally:
+        executor.shutdown()
+
+    with pytest.raises(ValueError):
+        await ToolExecutor().run("square", square, {"x": 7}, executor="gpu")
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_tool_options():
+    """MCPServer tools accept the same execution options"""
+    server = MCPServer("test", "1.0.0", max_workers=4)
+
+    @server.tool(timeout=0.05)
+    def hang() -> str:
+        time.sleep(0.3)
+        return "done"
+
+    @server.tool(max_concurrency=1)
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    result = await server.handler._handle_tools_call({"name": "hang", "arguments": {}})
+    assert result["isError"]
+    assert "timed out" in result["content"][0]["text"]
+
+    result = await server.handler._handle_tools_call({"name": "add", "arguments": {"a": 1, "b": 2}})
+    assert not result["isError"]
+    assert server.get_metrics()["handlers"]["add"]["completed"] == 1
+
+
+def test_resource_router_precedence():
+    """Static URIs win over templates, then the first registered template"""
+    router = ResourceRouter()
+    router.add("docs://{name}", "name", URITemplate("docs://{name}"))
+    router.add("docs://readme", "static")
+    router.add("docs://a{rest}", "later", URITemplate("docs://a{rest}"))
+    router.add("docs://{name}/v{version:int}", "versioned", URITemplate("docs://{name}/v{version:int}"))
+
+    assert router.resolve("docs://readme") == ("static", {})
+    assert router.resolve("docs://abc") == ("name", {"name": "abc"})
+    assert router.resolve("docs://guide/v2") == ("versioned", {"name": "guide", "version": "2"})
+    assert router.resolve("docs://a/b/c") is None
+    assert router.resolve("other://x") is None
+
+    router.remove("docs://{name}")
+    assert router.resolve("docs://abc") == ("later", {"rest": "bc"})
+
+
+def test_uri_template_literals_are_escaped():
+    """Regex characters in templates match literally"""
+    template = URITemplate("file://{name}.txt")
+    assert template.match("file://notes.txt") == {"name": "notes"}
+    assert template.match("file://notes_txt") is None
+    assert template.variables == [("name", None)]
+
+
+@pytest.mark.asyncio
+async def test_resource_reads_use_router():
+    """FastMCP and MCPServer resolve static and template resources"""
+    mcp = FastMCP("test")
+
+    @mcp.resource("users://{user_id}/profile")
+    def profile(user_id: str) -> str:
+        return f"profile {user_id}"
+
+    @mcp.resource("users://me/profile")
+    def me() -> str:
+        return "me"
+
+    assert (await mcp.get_resource("users://me/profile")).content[0]["text"] == "me"
+    assert (await mcp.get_resource("users://42/profile")).content[0]["text"] == "profile 42"
+    with pytest.raises(ValueError):
+        await mcp.get_resource("users://42/settings")
+
+    server = MCPServer("test", "1.0.0")
+
+    @server.resource("items://{item_id}")
+    def item(item_id: str) -> str:
+        return f"item {item_id}"
+
+    result = await server.handler._handle_resources_read({"uri": "items://7"})
+    assert result["contents"][0]["uri"] == "items://7"
+    assert server.handler.resources["items://{item_id}"].matches_uri("items://8") == {"item_id": "8"}
+
+
+# Minimal stdio MCP server that reports its pid from a "pid" tool
+POOL_SERVER = r'''
+import json, os, sys, time
+
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    method = message["method"]
+    if method == "initialize":
+        result = {"protocolVersion": "2025-03-26", "serverInfo": {"name": "stub", "version": "1"}, "capabilities": {}}
+    elif method == "tools/call":
+        time.sleep(message["params"]["arguments"].get("delay", 0))
+        result = {"content": [{"type": "text", "text": str(os.getpid())}]}
+    else:
+        result = {}
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\n")
+    sys.stdout.flush()
+'''
+
+
+@pytest.mark.asyncio
+async def test_server_pool_dispatch_restart_and_reap():
+    """Pools scale out under load, restart dead processes and reap idle ones"""
+    import sys
+    from python_a2a.mcp.server_config import ServerConfig, acquire_server_pool, release_server_pool
+
+    config = ServerConfig(command=sys.executable, args=["-c", POOL_SERVER])
+    pool = await acquire_server_pool("stub", config, size=2, min_size=1)
+    shared = await acquire_server_pool("stub", config)
+    try:
+        assert shared is pool
+        assert pool.get_stats()["processes"] == 1
+
+        # A call to a busy process starts a second one; once it is ready,
+        # calls go to the idle process
+        slow = asyncio.ensure_future(pool.call_tool("pid", {"delay": 1.0}))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(pool.call_tool("pid"))
+        for _ in range(50):
+            if pool.get_stats()["ready"] == 2:
+                break
+            await asyncio.sleep(0.05)
+        fast = await pool.call_tool("pid")
+        assert fast["content"][0]["text"] != (await slow)["content"][0]["text"]
+        assert (await queued)["content"][0]["text"] == (await slow)["content"][0]["text"]
+
+        # A killed process is replaced by the health check
+        victim = pool.members[0]
+        await victim.runner.client.connection.transport.disconnect()
+        pool.idle_timeout = 300.0
+        await pool.check_health()
+        assert pool.stats["restarts"] == 1
+        assert pool.get_stats()["ready"] == 2
+
+        # Idle processes above min_size are reaped
+        pool.idle_timeout = 0.0
+        await pool.check_health()
+        assert pool.get_stats()["processes"] == 1
+        assert (await pool.call_tool("pid"))["content"]
+    finally:
+        await release_server_pool(shared)
+        assert pool.get_stats()["users"] == 1
+        await release_server_pool(pool)
+
+    assert pool.members == []
+
+
+@pytest.mark.asyncio
+async def test_server_pool_burst_respects_size(monkeypatch):
+    """Concurrent calls to busy processes never start more than size processes"""
+    from python_a2a.mcp import server_config
+    from python_a2a.mcp.server_config import MCPServerPool, ServerConfig
+
+    started, stopped = [], []
+
+    class FakeRunner:
+        def __init__(self, name, config):
+            self.name = name
+            self.is_running = False
+            self.client = self
+
+        async def start(self):
+            await asyncio.sleep(0.01)
+            started.append(self.name)
+            self.is_running = True
+
+        async def stop(self):
+            stopped.append(self.name)
+            self.is_running = False
+
+        async def call_tool(self, name, arguments, timeout=None):
+            await asyncio.sleep(0.05)
+            return {"content": []}
+
+    monkeypatch.setattr(server_config, "MCPServerRunner", FakeRunner)
+    pool = MCPServerPool("fake", ServerConfig(command="fake"), size=2, min_size=1)
+    await pool.start()
+    try:
+        await asyncio.gather(*(pool.call_tool("t") for _ in range(10)))
+        await asyncio.sleep(0.05)
+        assert len(pool.members) <= 2
+        assert len(started) == 2
+
+        # Dead processes are stopped when they are dropped
+        for member in pool.members:
+            member.runner.is_running = False
+        await pool.call_tool("t")
+        assert len(stopped) == 2 and len(pool.members) == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_large_binary_results_go_out_of_band(tmp_path):
+    """Large images are stored as blobs and returned as resource links"""
+    import base64
+    from fastapi.testclient import TestClient
+    from python_a2a.mcp import BlobStore, image_response, read_blob
+    from python_a2a.mcp.transport import create_fastapi_app
+
+    mcp = FastMCP("test", blob_store=BlobStore(directory=str(tmp_path)), blob_threshold=1024)
+    screenshot = bytes(range(256)) * 64
+
+    @mcp.tool()
+    def capture(small: bool = False):
+        return image_response(screenshot[:100] if small else screenshot, encode=False)
+
+    # Small images stay inline as base64, as MCP content does
+    inline = (await mcp.call_tool("capture", {"small": True})).content
+    assert base64.b64decode(inline[0]["data"]) == screenshot[:100]
+    assert image_response(b"png").content[0]["data"] == base64.b64encode(b"png").decode()
+
+    link = (await mcp.call_tool("capture", {})).to_dict()["content"][0]
+    assert link["type"] == "resource_link"
+    assert link["size"] == len(screenshot)
+    assert link["mimeType"] == "image/png"
+
+    # Same-host reads come straight from the store
+    assert await read_blob(link, store=BlobStore(directory=str(tmp_path))) == screenshot
+    resource = await mcp.get_resource(link["uri"])
+    assert base64.b64decode(resource.content[0]["data"]) == screenshot
+
+    # Remote clients download the bytes in chunks, optionally by range
+    client = TestClient(create_fastapi_app(mcp))
+    digest = link["uri"].rsplit("/", 1)[1]
+    assert client.get(f"/blobs/{digest}").content == screenshot
+    partial = client.get(f"/blobs/{digest}", headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == screenshot[10:20]
+    assert client.get(f"/blobs/{digest}", headers={"Range": "bytes=99999-"}).status_code == 416
+    assert client.get("/blobs/" + "0" * 64).status_code == 404
+
+
+def test_blob_store_dedupes_and_evicts():
+    """Identical payloads are stored once and old blobs are evicted"""
+    from python_a2a.mcp import BlobStore
+
+    store = BlobStore(max_bytes=10)
+    first = store.put(b"abcdef")
+    assert store.put(b"abcdef") == first
+    assert store.size == 6
+
+    second = store.put(b"ghijkl")
+    assert first.uri not in store
+    assert bytes(store.get(second.uri)) == b"ghijkl"
+    assert b"".join(store.iter_chunks(second.digest, 1, 4, chunk_size=2)) == b"hij"
+    assert store.stats["evictions"] == 1
+
+    with pytest.raises(ValueError):
+        store.put(b"x" * 11)
+
+
+def test_compiled_schema_validation():
+    """Compiled validators check nested values, fill defaults and coerce safely"""
+    from python_a2a.mcp.validation import SchemaValidationError, compile_schema
+
+    validate = compile_schema({
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer", "minimum": 1},
+            "mode": {"type": "string", "enum": ["fast", "slow"], "default": "fast"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "options": {
+                "type": "object",
+                "properties": {"verbose": {"type": "boolean"}},
+                "required": ["verbose"]
+            }
+        },
+        "required": ["count"]
+    })
+
+    args = {"count": "3", "options": {"verbose": "true"}}
+    assert validate(args) == {"count": 3, "mode": "fast", "options": {"verbose": True}}
+    assert args == {"count": "3", "options": {"verbose": "true"}}
+
+    valid = {"count": 2, "mode": "slow"}
+    assert validate(valid) is valid
+
+    for bad, message in [
+        ({}, "Missing required argument: count"),
+        ({"count": 0}, "Invalid argument count: must be >= 1"),
+        ({"count": True}, "Invalid argument count: expected integer, got boolean"),
+        ({"count": 1, "mode": "medium"}, "Invalid argument mode: expected one of"),
+        ({"count": 1, "tags": ["a", 2]}, "Invalid argument tags[1]: expected string"),
+        ({"count": 1, "options": {}}, "Invalid argument options: Missing required argument: verbose"),
+    ]:
+        with pytest.raises(SchemaValidationError) as error:
+            validate(bad)
+        assert str(error.value).startswith(message)
+
+
+@pytest.mark.asyncio
+async def test_tool_arguments_validated_before_handler():
+    """FastMCP, MCPServer and agent_flow tools reject bad calls before running them"""
+    from typing import List, Optional
+    from python_a2a.agent_flow.models.tool import ToolDefinition, ToolParameter, ToolSource
+    from python_a2a.mcp.protocol import MCPProtocolError
+
+    calls = []
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    def total(values: List[int], scale: Optional[float] = None) -> int:
+        """Sum values.
+
+        Args:
+            values: Numbers to add
+        """
+        calls.append(values)
+        return sum(values) * (scale or 1)
+
+    schema = mcp.tools["total"].parameters
+    assert schema["properties"]["values"] == {
+        "type": "array", "items": {"type": "integer"}, "description": "Numbers to add"}
+    assert schema["required"] == ["values"]
+
+    assert (await mcp.call_tool("total", {"values": ["1", 2]})).content[0]["text"] == "3"
+    response = await mcp.call_tool("total", {"values": ["x"]})
+    assert response.is_error
+    assert "values[0]" in response.content[0]["text"]
+    assert calls == [[1, 2]]
+
+    server = MCPServer("test", "1.0.0")
+
+    @server.tool()
+    def echo(text: str, **extra) -> str:
+        return text
+
+    assert list(server.handler.tools["echo"].input_schema["properties"]) == ["text"]
+    with pytest.raises(MCPProtocolError, match="expected string"):
+        await server.handler._handle_tools_call({"name": "echo", "arguments": {"text": 5}})
+
+    tool = ToolDefinition(name="add", tool_source=ToolSource.CUSTOM)
+    tool.implementation = lambda a, b: a + b
+    tool.parameters = [ToolParameter("a", "integer"), ToolParameter("b", "integer", required=False, default=10)]
+    assert tool.execute({"a": "5"}) == {"success": True, "result": 15}
+    with pytest.raises(ValueError, match="Missing required argument: a"):
+        tool.execute({})
+
+
+@pytest.mark.asyncio
+async def test_idempotent_tool_results_cached_and_coalesced():
+    """Identical calls share one run, results expire, writes invalidate"""
+    runs = []
+    mcp = FastMCP("test")
+
+    @mcp.tool(cache_ttl=60)
+    async def read(path: str) -> str:
+        runs.append(path)
+        await asyncio.sleep(0.05)
+        if path == "missing":
+            raise FileNotFoundError(path)
+        return f"contents of {path}"
+
+    @mcp.tool(invalidates=["read"])
+    def write(path: str) -> str:
+        return "ok"
+
+    responses = await asyncio.gather(*(mcp.call_tool("read", {"path": "a"}) for _ in range(5)))
+    assert {r.content[0]["text"] for r in responses} == {"contents of a"}
+    assert runs == ["a"]
+    await mcp.call_tool("read", {"path": "a"})
+    assert runs == ["a"]
+    assert mcp.cache.stats["coalesced"] == 4 and mcp.cache.stats["hits"] == 1
+
+    await mcp.call_tool("write", {"path": "a"})
+    await mcp.call_tool("read", {"path": "a"})
+    assert runs == ["a", "a"]
+
+    # Errors are not cached
+    for _ in range(2):
+        assert (await mcp.call_tool("read", {"path": "missing"})).is_error
+    assert runs.count("missing") == 2
+
+    cache = ToolResultCache(ttls={"read": 0.05})
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return len(calls)
+
+    assert await cache.call("read", {"a": 1, "b": 2}, call) == 1
+    assert await cache.call("read", {"b": 2, "a": 1}, call) == 1
+    await asyncio.sleep(0.06)
+    assert await cache.call("read", {"a": 1, "b": 2}, call) == 2
+
+    # Callers get copies, so modifying a result does not corrupt the cache
+    async def listing():
+        return {"files": ["a"]}
+
+    first, second = await asyncio.gather(*(cache.call("read", {}, listing) for _ in range(2)))
+    first["files"].append("b")
+    assert second == {"files": ["a"]}
+    (await cache.call("read", {}, listing))["files"].clear()
+    assert await cache.call("read", {}, listing) == {"files": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_servers_start_concurrently_and_fail_fast():
+    """start_all starts servers at once; a server that dies fails its start at once"""
+    import sys
+    from python_a2a.mcp.connection import MCPConnection
+    from python_a2a.mcp.protocol import MCPCapabilities, MCPConnectionError, MCPImplementationInfo
+    from python_a2a.mcp.server_config import MCPServerManager, ServerConfig
+
+    manager = MCPServerManager()
+    for name in ("a", "b", "c"):
+        manager.add_server(name, ServerConfig(command=sys.executable, args=["-c", POOL_SERVER]))
+    manager.add_server("dead", ServerConfig(command=sys.executable, args=["-c", "import sys; sys.stdin.readline()"]))
+    try:
+        first, second = await asyncio.gather(manager.start_server("a"), manager.start_server("a"))
+        assert first is second
+
+        start = time.monotonic()
+        clients = await manager.start_all()
+        assert sorted(clients) == ["a", "b", "c"]
+        assert time.monotonic() - start < 10
+        pids = await asyncio.gather(*(client.call_tool("pid", {}) for client in clients.values()))
+        assert len({p["content"][0]["text"] for p in pids}) == 3
+    finally:
+        await manager.stop_all()
+    assert manager.list_running() == []
+
+    class QueueTransport:
+        def __init__(self):
+            self.queue = asyncio.Queue()
+
+        async def connect(self):
+            pass
+
+        async def disconnect(self):
+            pass
+
+        async def send(self, message):
+            pass
+
+        async def receive(self):
+            return await self.queue.get()
+
+        def is_connected(self):
+            return True
+
+    info = MCPImplementationInfo(name="test", version="1")
+    connection = MCPConnection(QueueTransport(), None, info, MCPCapabilities())
+    await connection.connect()
+    waiter = asyncio.ensure_future(connection.wait_for_initialization())
+    await asyncio.sleep(0)
+    connection.complete_initialization(info, MCPCapabilities())
+    await asyncio.wait_for(waiter, 0.5)
+    assert connection.is_initialized
+    await connection.disconnect()
+    await asyncio.wait_for(connection.wait_closed(), 0.5)
+
+    # Waiters are released, with an error, when the connection closes first
+    connection = MCPConnection(QueueTransport(), None, info, MCPCapabilities())
+    await connection.connect()
+    waiter = asyncio.ensure_future(connection.wait_for_initialization())
+    await asyncio.sleep(0)
+    await connection.disconnect()
+    with pytest.raises(MCPConnectionError, match="before initialization completed"):
+        await asyncio.wait_for(waiter, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_idle_remote_transport_keeps_connection():
+    """A receive timeout on an idle HTTP transport does not end the connection"""
+    import json
+    from python_a2a.mcp.connection import MCPConnection, MCPConnectionState
+    from python_a2a.mcp.protocol import MCPCapabilities, MCPImplementationInfo
+    from python_a2a.mcp.transports import HttpMCPTransport
+
+    transport = HttpMCPTransport("http://127.0.0.1:1", timeout=0.05)
+    # Connected without a server: the test only feeds the response queue
+    transport._connected = True
+    info = MCPImplementationInfo(name="test", version="1")
+    connection = MCPConnection(transport, None, info, MCPCapabilities())
+    await connection.connect()
+    try:
+        await asyncio.sleep(0.3)
+        assert connection.state != MCPConnectionState.ERROR
+        assert connection.stats["errors"] == 0
+
+        await transport._response_queue.put(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}).encode())
+        await asyncio.sleep(0.1)
+        assert connection.stats["messages_received"] == 1
+    finally:
+        await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_generator_tools_stream_results():
+    """Generator tools stream chunks through FastMCP and the FastAPI app"""
+    from fastapi.testclient import TestClient
+    from python_a2a.mcp.transport import create_fastapi_app
+
+    mcp = FastMCP("test")
+    resume = asyncio.Event()
+
+    @mcp.tool()
+    async def progress(steps: int):
+        yield "started"
+        await resume.wait()
+        for step in range(steps):
+            yield {"step": step}
+
+    @mcp.tool()
+    def lines(count: int):
+        for i in range(count):
+            yield f"line {i}"
+
+    @mcp.tool()
+    def plain() -> str:
+        return "whole"
+
+    # The first chunk arrives while the handler is still running
+    stream = mcp.stream_tool("progress", {"steps": 2})
+    first = await stream.__anext__()
+    assert first.content[0]["text"] == "started"
+    resume.set()
+    rest = [chunk.content[0]["text"] async for chunk in stream]
+    assert rest == ['{"step": 0}', '{"step": 1}']
+
+    merged = await mcp.call_tool("lines", {"count": 3})
+    assert [item["text"] for item in merged.content] == ["line 0", "line 1", "line 2"]
+    assert [c.content for c in [c async for c in mcp.stream_tool("plain", {})]] == [
+        [{"type": "text", "text": "whole"}]]
+    assert mcp.get_metrics()["handlers"]["lines"]["completed"] == 1
+
+    client = TestClient(create_fastapi_app(mcp))
+    response = client.post("/tools/lines?stream=true", json={"count": 2})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [line[6:] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert [json.loads(e)["content"][0]["text"] for e in events[:-1]] == ["line 0", "line 1"]
+    assert response.text.rstrip().endswith("event: done\ndata: {}")
+    assert client.post("/tools/missing", json={}, headers={"Accept": "text/event-stream"}).status_code == 404
+    assert client.post("/tools/lines", json={"count": 2}).json()["content"][1]["text"] == "line 1"
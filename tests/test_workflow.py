@@ -0,0 +1,244 @@
+"""
+Tests for the workflow module.
+"""
+
+import asyncio
+
+import pytest
+
+from python_a2a import AgentNetwork
+from python_a2a.workflow import (
+    Flow, WorkflowContext, ParallelStep, FunctionStep, QueryTemplate, Tracer
+)
+
+
+class EchoAgent:
+    """Minimal agent that echoes queries back"""
+
+    def __init__(self, prefix="Echo"):
+        self.prefix = prefix
+        self.queries = []
+
+    def ask(self, query):
+        self.queries.append(query)
+        return f"{self.prefix}: {query}"
+
+
+@pytest.fixture
+def network():
+    """Fixture for an agent network with two echo agents"""
+    network = AgentNetwork(name="Test Network")
+    network.add("echo", EchoAgent())
+    network.add("shout", EchoAgent(prefix="SHOUT"))
+    return network
+
+
+class TestQueryTemplate:
+    def test_render(self):
+        """Test placeholder substitution and typed formatting"""
+        template = QueryTemplate('Score for {name}: {score:.1f} {tags:json} {missing} {"raw": 1}')
+        assert template.variables == {"name", "score", "tags", "missing"}
+
+        rendered = template.render({"name": "Ann", "score": 9.25, "tags": ["a"], "n": 1})
+        assert rendered == 'Score for Ann: 9.2 ["a"] {missing} {"raw": 1}'
+
+    def test_non_string_values(self):
+        """Test that non-string values are rendered instead of skipped"""
+        assert QueryTemplate("{count} items").render({"count": 3}) == "3 items"
+
+    def test_bad_format_spec(self):
+        """Test that an invalid format spec raises a ValueError"""
+        with pytest.raises(ValueError):
+            QueryTemplate("{name:.2f}").render({"name": "Ann"})
+
+
+class TestFlowValidation:
+    def test_validate_inputs(self, network):
+        """Test that undefined template variables are reported"""
+        flow = Flow(agent_network=network, inputs=["topic"])
+        flow.ask("echo", "Tell me about {topic}").ask("echo", "Summarize {latest_result}")
+        flow.validate()
+
+        flow.ask("echo", "Translate to {language}")
+        with pytest.raises(ValueError, match="language"):
+            flow.validate()
+        with pytest.raises(ValueError):
+            flow.run_sync({"topic": "AI"})
+
+        assert flow.run_sync({"topic": "AI", "language": "French"}).startswith("Echo")
+
+
+class TestWorkflowContext:
+    def test_fork_reads_parent_without_copying(self):
+        """Test that a forked context sees parent data and keeps writes local"""
+        payload = {"large": list(range(1000))}
+        context = WorkflowContext({"payload": payload, "name": "parent"})
+        child = context.fork()
+
+        assert child.data["payload"] is payload
+        child.update("name", "child")
+
+        assert child.data["name"] == "child"
+        assert context.data["name"] == "parent"
+        assert child.local_data == {"name": "child"}
+
+    def test_merge_is_in_branch_order(self):
+        """Test that the last branch in declaration order wins"""
+        context = WorkflowContext({"value": 0})
+        first, second = context.fork(), context.fork()
+        second.update("value", 2)
+        first.update("value", 1)
+
+        context.merge([first, second])
+        assert context.data["value"] == 2
+
+    def test_strict_merge_conflict(self):
+        """Test that strict merging rejects conflicting writes"""
+        context = WorkflowContext()
+        first, second = context.fork(), context.fork()
+        first.update("value", 1)
+        second.update("value", 2)
+
+        with pytest.raises(ValueError):
+            context.merge([first, second], strict=True)
+
+        # Identical writes are not a conflict
+        second.update("value", 1)
+        context.merge([first, second], strict=True)
+        assert context.data["value"] == 1
+
+
+class TestParallelStep:
+    def test_parallel_merge_is_deterministic(self):
+        """Test that the slower branch still wins when declared last"""
+        async def fast(context):
+            context.update("winner", "fast")
+            return "fast"
+
+        async def slow(context):
+            await asyncio.sleep(0.01)
+            context.update("winner", "slow")
+            return "slow"
+
+        step = ParallelStep([FunctionStep(fast), FunctionStep(slow)])
+        context = WorkflowContext()
+        results = asyncio.run(step.execute(context))
+
+        assert list(results.values()) == ["fast", "slow"]
+        assert context.data["winner"] == "slow"
+
+    def test_flow_parallel(self, network):
+        """Test a flow with parallel agent branches"""
+        flow = Flow(agent_network=network)
+        flow.parallel() \
+            .ask("echo", "Hello {name}") \
+            .branch() \
+            .ask("shout", "Hi {name}") \
+            .end_parallel(max_concurrency=2)
+
+        results = flow.run_sync({"name": "World"})
+        assert sorted(results.values()) == ["Echo: Hello World", "SHOUT: Hi World"]
+
+
+class TestMapStep:
+    def test_map_preserves_order(self, network):
+        """Test that map results follow item order despite concurrency"""
+        class SlowFirstAgent(EchoAgent):
+            async def ask_async(self, query):
+                # Earlier items take longer, so they complete last
+                await asyncio.sleep(0.001 * (5 - int(query.split()[-1])))
+                return self.ask(query)
+
+        network.add("slow", SlowFirstAgent())
+        flow = Flow(agent_network=network)
+        flow.map("slow", "numbers", "Number {item}", max_concurrency=3, result_key="echoed")
+
+        results = flow.run_sync({"numbers": [1, 2, 3, 4]})
+        assert results == [f"Echo: Number {n}" for n in [1, 2, 3, 4]]
+
+    def test_map_dict_items_and_chunks(self, network):
+        """Test dictionary item fields and chunked queries"""
+        flow = Flow(agent_network=network)
+        flow.map("echo", "people", "{index}: {name}", max_concurrency=2)
+        results = flow.run_sync({"people": [{"name": "Ann"}, {"name": "Bob"}]})
+        assert results == ["Echo: 0: Ann", "Echo: 1: Bob"]
+
+        flow = Flow(agent_network=network)
+        flow.map("echo", "words", "{item}", chunk_size=2)
+        results = flow.run_sync({"words": ["a", "b", "c"]})
+        assert results == ["Echo: a\nb", "Echo: c"]
+
+    def test_map_failed_item(self, network):
+        """Test that a failing item yields None and records an error"""
+        class FlakyAgent(EchoAgent):
+            def ask(self, query):
+                if "bad" in query:
+                    raise RuntimeError("bad item")
+                return super().ask(query)
+
+        network.add("flaky", FlakyAgent())
+        flow = Flow(agent_network=network)
+        flow.map("flaky", "items", "{item}")
+        results = flow.run_sync({"items": ["good", "bad"]})
+        assert results == ["Echo: good", None]
+
+        # A template error only fails its own item, and is recorded
+        flow = Flow(agent_network=network)
+        flow.map("echo", "scores", "{item:.1f}", max_concurrency=2)
+        step = flow.steps[-1]
+        context = WorkflowContext({"scores": [1.25, "n/a", 3]})
+        results = asyncio.run(step.execute(context))
+        assert results == ["Echo: 1.2", None, "Echo: 3.0"]
+        assert [(e["step_id"], e["error_type"]) for e in context.errors] == [(step.id, "ValueError")]
+
+
+class TestTracing:
+    def test_flow_spans(self, network, tmp_path):
+        """Test that a traced flow records step spans and exports them"""
+        attempts = []
+
+        def flaky(context):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("first attempt fails")
+            return "ok"
+
+        flow = Flow(agent_network=network, name="traced")
+        flow.ask("echo", "Hello") \
+            .execute_function(flaky, retries=1) \
+            .parallel() \
+            .ask("echo", "A") \
+            .branch() \
+            .ask("shout", "B") \
+            .end_parallel(max_concurrency=1)
+
+        tracer = Tracer()
+        flow.run_sync({}, tracer=tracer)
+
+        names = [span.name for span in tracer.spans]
+        for name in ["flow", "query", "agent_call", "function", "backoff",
+                     "parallel", "semaphore_wait"]:
+            assert name in names
+
+        flow_span = next(span for span in tracer.spans if span.name == "flow")
+        backoff = next(span for span in tracer.spans if span.name == "backoff")
+        assert backoff.duration >= 0.2
+        assert all(span.duration <= flow_span.duration for span in tracer.spans)
+
+        path = tmp_path / "trace.json"
+        tracer.export(str(path))
+        import json
+        events = json.loads(path.read_text())["traceEvents"]
+        assert len(events) == len(tracer.spans)
+
+        otlp = tracer.to_otlp()
+        spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert any("parentSpanId" in span for span in spans)
+
+    def test_untraced_history_has_duration(self, network):
+        """Test that history records durations without a tracer"""
+        context = WorkflowContext()
+        step = ParallelStep([FunctionStep(lambda: "done")])
+        asyncio.run(step.execute(context))
+        assert context.history[0]["duration"] >= 0
+